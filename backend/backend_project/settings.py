@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -43,7 +44,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.MetricsMiddleware',  # 요청 계측 (다른 미들웨어의 처리 시간까지 포함하도록 가장 바깥)
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.ResponseCompressionMiddleware',  # 응답 본문을 읽어 압축하므로 다른 미들웨어보다 나중에 실행
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -154,4 +157,223 @@ SESSION_COOKIE_SECURE = False
 
 # 3. CSRF 쿠키도 동일하게 설정 (세션과 맞춰주는 것이 좋음)
 CSRF_COOKIE_SAMESITE = 'None'
-CSRF_COOKIE_SECURE = False
\ No newline at end of file
+CSRF_COOKIE_SECURE = False
+
+# --- 서버 측 데이터셋 저장소 (core/dataset_store.py) ---
+# 업로드/전처리된 DataFrame을 dataset_id로 보관합니다.
+# DIR은 모든 워커가 공유하는 경로여야 합니다. (멀티 워커 지원)
+DATASET_STORE = {
+    'DIR': BASE_DIR / 'dataset_store',
+    'MEMORY_BUDGET_MB': 512,      # 워커별 메모리 캐시 예산 (초과 시 LRU 방출)
+    'TTL_SECONDS': 60 * 60,       # 마지막 접근 후 1시간 지나면 삭제
+}
+
+# --- 데이터셋 버전 그래프 (core/versions.py) ---
+# 전처리 결과를 입력 데이터셋의 자식 버전으로 기록합니다. (되돌리기 / 다시 실행 / 분기)
+# SHARE_COLUMNS: 값이 바뀌지 않은 컬럼은 새로 쓰지 않고 부모 버전의 파일을 공유 (Arrow 형식 데이터셋만)
+# MAX_VERSIONS: 그래프(업로드한 데이터셋 하나)당 버전 수. 넘으면 가장 오래 방문하지 않은 잎 버전부터 삭제
+# 💡 버전 파일도 DATASET_STORE의 TTL로 만료됩니다.
+DATASET_VERSIONS = {
+    'ENABLED': True,
+    'SHARE_COLUMNS': True,
+    'MAX_VERSIONS': 50,
+}
+
+# --- 대용량 CSV 스트리밍 업로드 (core/ingest.py) ---
+# THRESHOLD_MB 이상인 CSV(또는 mode=stream 요청)는 청크 단위로 읽어 컬럼형 파일에 바로 씁니다.
+STREAM_UPLOAD = {
+    'THRESHOLD_MB': 100,
+    'CHUNK_ROWS': 100_000,
+}
+
+# --- 업로드 메모리 최적화 (core/memory.py) ---
+# ENABLED: 업로드한 데이터의 dtype 축소 여부 (요청의 optimize=true/false로 바꿀 수 있습니다)
+# CATEGORY_MAX_RATIO: 고유값 수가 행 수의 이 비율 이하인 문자열 컬럼은 category로 저장
+# ARROW_STRINGS: 나머지 문자열 컬럼을 Arrow 문자열(string[pyarrow])로 저장 (pyarrow 필요)
+# 💡 스트리밍 업로드는 이미 Arrow CSV 리더가 정한 dtype으로 저장하므로 적용하지 않습니다.
+MEMORY_OPTIMIZE = {
+    'ENABLED': os.environ.get('MEMORY_OPTIMIZE', '').lower() in ('true', '1'),
+    'CATEGORY_MAX_RATIO': 0.5,
+    'ARROW_STRINGS': True,
+}
+
+# --- 차트 데이터 집계 (core/charts.py) ---
+# BINS: 히스토그램 구간 수, TOP: 빈도수 차트에 표시할 값 개수, MAX_POINTS: 산점도/선 그래프의 최대 점 개수
+# SAMPLING: 점이 MAX_POINTS개보다 많을 때 축소 방식 ('lttb' 또는 'stratified')
+# (요청의 bins / top / points / sampling 값으로 바꿀 수 있습니다)
+# CACHE_SIZE: 워커별로 기억하는 차트 결과 개수
+CHARTS = {
+    'BINS': 15,
+    'TOP': 20,
+    'MAX_POINTS': 1000,
+    'SAMPLING': 'lttb',
+    'CACHE_SIZE': 512,
+}
+
+# --- 행 구간(페이지) 조회 (core/rows.py) ---
+# DEFAULT_LIMIT / MAX_LIMIT: 한 번에 돌려주는 행 수 (요청의 limit, 최대 MAX_LIMIT)
+# CACHE_SIZE: 워커별로 기억하는 정렬 순서/필터 결과 개수 (행 수만큼의 정수 배열이므로 작게 유지)
+ROWS = {
+    'DEFAULT_LIMIT': 100,
+    'MAX_LIMIT': 1000,
+    'CACHE_SIZE': 32,
+}
+
+# --- 응답 형식 / 전송 압축 (core/renderers.py, core/middleware.py) ---
+# 분석/행 조회 응답은 Accept 헤더에 따라 JSON(기본), MessagePack(msgpack 설치 시), Arrow IPC 스트림으로 보냅니다.
+# COMPRESSION: Accept-Encoding에 있으면 이 순서로 골라 압축 ('zstd'는 pyarrow 필요)
+# MIN_BYTES: 이보다 작은 응답은 압축하지 않음, GZIP_LEVEL / ZSTD_LEVEL: 압축 수준
+RESPONSE_FORMAT = {
+    'COMPRESSION': ('zstd', 'gzip'),
+    'MIN_BYTES': 1024,
+    'GZIP_LEVEL': 6,
+    'ZSTD_LEVEL': 3,
+}
+
+# --- 근사 분위수 모드 (core/sketches.py) ---
+# 요청에 approximate=true를 보내면 정렬 대신 분위수 스케치로 사분위수/이상치를 계산합니다.
+# EPSILON은 순위 기준 허용 오차 (요청의 epsilon 값으로 바꿀 수 있습니다)
+QUANTILE_SKETCH = {
+    'EPSILON': 0.01,
+}
+
+# --- 병렬 컬럼 프로파일링 (core/parallel.py) ---
+# 셀 수(행 x 프로파일링할 컬럼)가 MIN_CELLS 이상이면 컬럼을 프로세스 풀에 나눠 계산합니다.
+# WORKERS가 1 이하이면 항상 직렬로 계산합니다.
+PROFILING = {
+    'WORKERS': int(os.environ.get('PROFILING_WORKERS', min(8, os.cpu_count() or 1))),
+    'MIN_CELLS': 5_000_000,
+}
+
+# --- 전처리 실행 엔진 (core/lazy.py) ---
+# 'auto': Polars가 설치되어 있으면 단계들을 지연 실행 계획으로 묶어 한 번에 실행 (안 되는 경우 pandas)
+# 'pandas': 항상 pandas로 단계별 실행
+PIPELINE = {
+    'ENGINE': os.environ.get('PIPELINE_ENGINE', 'auto'),
+}
+
+# --- 비동기 모델 학습 작업 큐 (core/jobs.py) ---
+# WORKERS: 동시에 학습하는 작업 수, MAX_PENDING: 대기할 수 있는 작업 수 (넘으면 503)
+# COMPARE_WORKERS: 모델 비교 모드(core/compare.py)에서 모델들을 동시에 학습하는 프로세스 수 (1 이하이면 차례로 학습)
+TRAINING = {
+    'WORKERS': int(os.environ.get('TRAINING_WORKERS', 2)),
+    'MAX_PENDING': 20,
+    'COMPARE_WORKERS': int(os.environ.get('TRAINING_COMPARE_WORKERS', min(4, os.cpu_count() or 1))),
+}
+
+# --- 학습용 특성 인코딩 (core/encoding.py) ---
+# METHOD: 범주형 컬럼 인코딩 방식 ('ordinal': 번호, 'onehot': 0/1 컬럼, 'target': 범주별 목표값 평균)
+# RARE_MIN_COUNT: 이 횟수 미만으로 나온 범주는 하나로 묶음 (0이면 묶지 않음)
+# ONEHOT_MAX_CATEGORIES: onehot 방식에서 범주가 이보다 많은 컬럼은 번호로 인코딩
+# (요청의 encoding / rare_min_count 값으로 바꿀 수 있습니다)
+FEATURE_ENCODING = {
+    'METHOD': 'ordinal',
+    'RARE_MIN_COUNT': 0,
+    'ONEHOT_MAX_CATEGORIES': 20,
+}
+
+# --- 큰 데이터 학습 (core/training.py) ---
+# BACKEND: 'auto'(학습 행 수가 THRESHOLDS 이상이면 큰 데이터용 모델), 'exact'(항상 기본 모델), 'scalable'(항상 큰 데이터용 모델)
+# THRESHOLDS: 모델별 기준 학습 행 수 (gb -> HistGradientBoosting, svm -> Nystroem 커널 근사 + 선형 SVM)
+# NYSTROEM_COMPONENTS: 커널 근사에 쓰는 기준점 수 (클수록 정확하지만 느림)
+# SAMPLE_ROWS: 학습에 쓸 최대 행 수 (None이면 전체, 분류는 클래스 비율을 유지하여 뽑음)
+# TIME_BUDGET_SECONDS: 학습 시간 예산 (None이면 제한 없음), MIN_SAMPLE_ROWS: 시간 예산 모드의 첫 표본 행 수
+# (요청의 backend / sample_rows / time_budget 값으로 바꿀 수 있습니다)
+MODEL_SCALING = {
+    'BACKEND': os.environ.get('MODEL_BACKEND', 'auto'),
+    'THRESHOLDS': {'gb': 50_000, 'svm': 20_000},
+    'NYSTROEM_COMPONENTS': 300,
+    'SAMPLE_ROWS': None,
+    'TIME_BUDGET_SECONDS': None,
+    'MIN_SAMPLE_ROWS': 5_000,
+}
+
+# --- 조각 단위 학습 (core/incremental.py, 요청의 incremental=true) ---
+# CHUNK_ROWS: 한 번에 읽어 학습하는 행 수 (메모리 사용량은 이 값에 비례)
+# EPOCHS: 학습 데이터를 반복해서 훑는 횟수 (nb는 1회), TEST_SIZE: 평가 행 비율
+INCREMENTAL_TRAINING = {
+    'CHUNK_ROWS': int(os.environ.get('INCREMENTAL_CHUNK_ROWS', 50_000)),
+    'EPOCHS': 5,
+    'TEST_SIZE': 0.2,
+}
+
+# --- 진행 이벤트 스트림 (core/events.py, /upload/events/ 등) ---
+# WORKERS: 이벤트 스트림 요청의 업로드/전처리를 실행하는 스레드 수 (프로세스별)
+# HEARTBEAT_SECONDS: 이벤트가 없을 때 연결 유지용 주석을 보내는 간격, JOB_POLL_SECONDS: 학습 작업 상태를 읽는 간격
+SERVER_EVENTS = {
+    'WORKERS': int(os.environ.get('SERVER_EVENTS_WORKERS', 4)),
+    'HEARTBEAT_SECONDS': 15,
+    'JOB_POLL_SECONDS': 0.5,
+}
+
+# --- 전처리/학습 결과 캐시 (core/result_cache.py) ---
+# 같은 데이터(컬럼 지문)에 같은 전처리/학습 요청이 오면 저장된 결과(분석 응답, 학습 작업)를 돌려줍니다.
+# PATH: 모든 워커가 공유하는 SQLite 파일, MAX_MB: 전체 크기 상한 (넘으면 가장 오래 사용하지 않은 항목부터 삭제)
+# 💡 요청의 cache=false로 캐시를 건너뛸 수 있습니다.
+RESULT_CACHE = {
+    'ENABLED': os.environ.get('RESULT_CACHE', 'true').lower() in ('true', '1'),
+    'PATH': BASE_DIR / 'result_cache.sqlite3',
+    'MAX_MB': 256,
+}
+
+# --- 하이퍼파라미터 튜닝 (core/tuning.py) ---
+# FOLDS: 교차 검증 fold 수 (요청의 cv 값으로 바꿀 수 있습니다)
+# FACTOR: Successive Halving에서 라운드마다 남기는 후보 비율(1/FACTOR)과 표본 증가 배수
+# MIN_SAMPLES: 첫 라운드의 최소 표본 행 수, N_JOBS: 병렬 평가 프로세스 수 (-1이면 모든 CPU 코어)
+# CACHE_SIZE: 워커별로 기억하는 fold 점수 수 (LRU)
+TUNING = {
+    'FOLDS': 5,
+    'FACTOR': 3,
+    'MIN_SAMPLES': 200,
+    'N_JOBS': int(os.environ.get('TUNING_JOBS', -1)),
+    'CACHE_SIZE': 100_000,
+}
+
+# --- 학습 모델 레지스트리 (core/registry.py) ---
+# DIR은 모든 워커가 공유하는 경로여야 합니다. CACHE_SIZE: 워커별로 메모리에 올려 두는 모델 수 (LRU)
+# PREDICT_BATCH_ROWS: 예측할 때 한 번에 변환/예측하는 행 수
+MODEL_REGISTRY = {
+    'DIR': BASE_DIR / 'model_store',
+    'CACHE_SIZE': 8,
+    'PREDICT_BATCH_ROWS': 100_000,
+}
+
+# --- 요청 계측 (core/metrics.py, GET /api/v1/metrics/ 는 Prometheus 형식) ---
+# ENABLED: 단계별 소요 시간/요청·응답 바이트/최대 RSS 기록 여부
+# SERVER_TIMING: 응답에 Server-Timing 헤더(단계별 시간)를 붙일지 여부 (기본: DEBUG일 때만)
+# RSS_SAMPLE_MS: 처리 중인 요청이 있을 때 프로세스 RSS를 읽는 간격
+# DURATION_BUCKETS: 소요 시간 히스토그램 구간 (초)
+METRICS = {
+    'ENABLED': os.environ.get('METRICS_ENABLED', 'true').lower() in ('true', '1'),
+    'SERVER_TIMING': DEBUG or os.environ.get('SERVER_TIMING', '').lower() in ('true', '1'),
+    'RSS_SAMPLE_MS': 20,
+    'DURATION_BUCKETS': (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300),
+}
+
+# --- 로그 (logging) ---
+# core 모듈의 로그를 콘솔(stderr)로 보냅니다. (오류는 traceback 포함)
+# LOG_LEVEL=DEBUG이면 전처리 단계별 대상 컬럼/행 수 변화까지 기록합니다.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'core': {'handlers': ['console'], 'level': os.environ.get('LOG_LEVEL', 'INFO')},
+    },
+}
+
+# --- 성능 벤치마크 (core/benchmark.py, python manage.py benchmark) ---
+# BASELINE: 단계별 기준 측정값을 저장하는 파일 (--save-baseline으로 갱신)
+# REPEAT: 단계마다 반복 실행 횟수 (소요 시간은 중앙값)
+# TOLERANCE: 측정값별 (허용 비율, 최소 차이). 기준선보다 둘 다 넘게 커지면 성능 저하로 표시
+BENCHMARK = {
+    'BASELINE': BASE_DIR / 'benchmarks' / 'baseline.json',
+    'REPEAT': 3,
+    'TOLERANCE': {
+        'seconds': (0.25, 0.05),
+        'peak_rss_mb': (0.2, 20),
+        'response_bytes': (0.05, 1024),
+    },
+}
@@ -0,0 +1,303 @@
+# backend/core/benchmark.py
+
+"""
+업로드 -> 전처리 -> 학습 성능 벤치마크.
+
+_analyze_dataframe, ProcessDataView, TrainModelView를 바꿨을 때 느려졌는지 확인하기 위한 도구입니다.
+(실행: python manage.py benchmark, core/management/commands/benchmark.py)
+
+- 데이터: 행 수 x 컬럼 수 x 결측치 비율 x 이상치 비율 x 범주 수로 정한 합성 데이터 (seed 고정, 항상 같은 CSV)
+- 실행: Django 테스트 클라이언트로 실제 API(upload/, process/, train/)를 차례로 호출합니다.
+  학습은 작업 큐에서 실행되므로 작업이 끝날 때까지 폴링한 시간까지 잽니다.
+- 측정: 단계별 소요 시간(반복 중 중앙값), 최대 RSS(반복 중 최댓값), 요청/응답 바이트
+  💡 RSS는 이 프로세스만 측정합니다. (병렬 프로파일링/튜닝의 자식 프로세스 메모리는 포함하지 않음)
+- 격리: 반복마다 빈 임시 데이터셋 저장소/모델 레지스트리를 쓰므로 캐시(같은 파일 재업로드, 프로파일 재사용)의
+  영향 없이 매번 처음 요청과 같은 경로를 잽니다. 학습 작업 기록은 테스트 DB(메모리)에 씁니다.
+- 기준선: 결과를 JSON 파일(settings.BENCHMARK['BASELINE'])에 시나리오별로 저장해 두고,
+  다음 실행 결과를 비교하여 허용 범위(TOLERANCE)를 넘게 나빠진 항목을 표시합니다.
+"""
+
+import json
+import os
+import platform
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from . import dataset_store, registry, result_cache
+from .metrics import current_rss
+
+STAGES = ('upload', 'process', 'train')
+# 기준선과 비교하는 측정값 (커질수록 나쁨)
+METRICS = ('seconds', 'peak_rss_mb', 'response_bytes')
+TARGET_COLUMN = 'target'
+
+_API = '/api/v1/'
+# 학습 작업 상태 폴링 간격 (초)
+_POLL_INTERVAL = 0.05
+
+
+class BenchmarkError(RuntimeError):
+    """API가 실패 응답을 돌려주거나 학습 작업이 실패한 경우"""
+
+
+def synthetic_frame(rows, numeric=8, categorical=4, null_rate=0.05, outlier_rate=0.01, cardinality=20, seed=42):
+    """
+    수치형/범주형 컬럼이 섞인 합성 데이터.
+    - row_id: ID 컬럼 (학습에서 제외됨), num_*: 정규분포 값 (outlier_rate 비율은 평균에서 10 표준편차 이상 떨어진 값)
+    - cat_*: 'c0' ~ 'c{cardinality-1}' (앞쪽 범주일수록 자주 나옴), target: num_0/num_1과 cat_0으로 정한 0/1 분류 목표값
+    - 결측치는 목표값과 row_id를 뺀 모든 컬럼에 null_rate 비율로 넣습니다.
+    """
+    rng = np.random.default_rng(seed)
+    numeric_values = []
+    for i in range(numeric):
+        values = rng.normal(loc=i * 10.0, scale=1.0 + i, size=rows)
+        outliers = np.flatnonzero(rng.random(rows) < outlier_rate)
+        values[outliers] += rng.choice([-1.0, 1.0], size=len(outliers)) * rng.uniform(10, 30, len(outliers)) * (1.0 + i)
+        numeric_values.append(values)
+    weights = 1.0 / np.arange(1, cardinality + 1)
+    labels = np.array([f'c{k}' for k in range(cardinality)], dtype=object)
+    categorical_values = [labels[rng.choice(cardinality, size=rows, p=weights / weights.sum())]
+                          for _ in range(categorical)]
+
+    # 목표값은 결측치를 넣기 전의 값으로 정합니다.
+    score = rng.normal(size=rows)
+    if numeric >= 2:
+        score += numeric_values[0] - (numeric_values[1] - 10.0) / 2
+    if categorical:
+        score += np.where(categorical_values[0] == 'c0', 1.0, -0.5)
+
+    columns = {'row_id': np.arange(rows)}
+    for i, values in enumerate(numeric_values):
+        values[rng.random(rows) < null_rate] = np.nan
+        columns[f'num_{i}'] = values
+    for j, values in enumerate(categorical_values):
+        values[rng.random(rows) < null_rate] = None
+        columns[f'cat_{j}'] = values
+    columns[TARGET_COLUMN] = (score > np.median(score)).astype(np.int64)
+    return pd.DataFrame(columns)
+
+
+def scenario_name(rows, numeric, categorical, null_rate, outlier_rate, cardinality):
+    """기준선 파일의 시나리오 이름 (합성 데이터 설정)"""
+    return f"rows={rows},num={numeric},cat={categorical},null={null_rate},outlier={outlier_rate},card={cardinality}"
+
+
+def run(df, stages=STAGES, repeat=3, action='fill_na_mean', model_name='rf', progress=None):
+    """
+    df를 CSV로 업로드한 뒤 stages를 차례로 repeat번 실행하고 단계별 측정값을 반환합니다.
+    반환: {단계: {'seconds', 'peak_rss_mb', 'request_bytes', 'response_bytes', 'runs': [반복별 초]}}
+    """
+    progress = progress or (lambda message: None)
+    payload = df.to_csv(index=False).encode()
+    samples = {stage: [] for stage in stages}
+    with _test_environment():
+        for i in range(repeat):
+            with _isolated_storage():
+                for stage, measurement in _run_once(payload, stages, action, model_name):
+                    samples[stage].append(measurement)
+                    progress(f"[{i + 1}/{repeat}] {stage}: {measurement['seconds']:.3f}s")
+
+    results = {}
+    for stage, runs in samples.items():
+        results[stage] = {
+            'seconds': round(statistics.median(m['seconds'] for m in runs), 4),
+            'peak_rss_mb': round(max(m['peak_rss_mb'] for m in runs), 1),
+            'request_bytes': runs[-1]['request_bytes'],
+            'response_bytes': runs[-1]['response_bytes'],
+            'runs': [round(m['seconds'], 4) for m in runs],
+        }
+    return results
+
+
+def _run_once(payload, stages, action, model_name):
+    """업로드 -> 전처리 -> 학습을 한 번 실행하며 (단계, 측정값)을 차례로 돌려줍니다."""
+    client = Client()
+
+    # 전처리/학습만 재는 경우에도 데이터셋을 만들기 위해 업로드는 항상 합니다.
+    with _measure(len(payload)) as measurement:
+        response = client.post(_API + 'upload/', {'file': SimpleUploadedFile('benchmark.csv', payload)})
+        measurement['response_bytes'] = len(response.content)
+    dataset_id = _checked(response, 'upload')['datasetId']
+    if 'upload' in stages:
+        yield 'upload', measurement
+
+    if 'process' in stages:
+        body = json.dumps({'dataset_id': dataset_id, 'action': action}).encode()
+        with _measure(len(body)) as measurement:
+            response = client.post(_API + 'process/', body, content_type='application/json')
+            measurement['response_bytes'] = len(response.content)
+        # 💡 학습은 실제 사용 흐름처럼 전처리된 데이터셋으로 합니다.
+        dataset_id = _checked(response, 'process')['datasetId']
+        yield 'process', measurement
+
+    if 'train' in stages:
+        body = json.dumps({'dataset_id': dataset_id, 'target': TARGET_COLUMN, 'model_name': model_name}).encode()
+        with _measure(len(body)) as measurement:
+            response = client.post(_API + 'train/', body, content_type='application/json')
+            job = _checked(response, 'train')
+            size = len(response.content)
+            while job['status'] in ('queued', 'running'):
+                time.sleep(_POLL_INTERVAL)
+                response = client.get(f"{_API}train/jobs/{job['jobId']}/")
+                job = _checked(response, 'train')
+            measurement['response_bytes'] = size + len(response.content)
+        if job['status'] != 'succeeded':
+            raise BenchmarkError(f"train: 학습 작업이 끝나지 않았습니다 ({job['status']}): {job.get('error', '')}")
+        yield 'train', measurement
+
+
+def _checked(response, stage):
+    if response.status_code >= 400:
+        try:
+            error = response.json().get('error')
+        except ValueError:
+            error = response.content[:200]
+        raise BenchmarkError(f"{stage}: HTTP {response.status_code} {error}")
+    return response.json()
+
+
+@contextmanager
+def _measure(request_bytes):
+    """with 블록의 소요 시간과 최대 RSS를 측정합니다."""
+    sampler = _RSSSampler()
+    measurement = {'request_bytes': request_bytes, 'response_bytes': 0}
+    sampler.start()
+    start = time.perf_counter()
+    try:
+        yield measurement
+    finally:
+        measurement['seconds'] = time.perf_counter() - start
+        measurement['peak_rss_mb'] = sampler.stop() / 1024 / 1024
+
+
+class _RSSSampler(threading.Thread):
+    """
+    일정 간격으로 이 프로세스의 RSS를 읽어 최댓값을 기록합니다.
+    💡 getrusage의 ru_maxrss는 프로세스 전체 기간의 최댓값이라 단계별로 나눌 수 없으므로 /proc에서 직접 읽습니다.
+       (/proc이 없는 OS에서는 ru_maxrss, core/metrics.current_rss)
+    """
+
+    def __init__(self, interval=0.01):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = current_rss()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.peak = max(self.peak, current_rss())
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        return max(self.peak, current_rss())
+
+
+@contextmanager
+def _test_environment():
+    """테스트 클라이언트용 환경(ALLOWED_HOSTS 등)과 메모리 테스트 DB (학습 작업 기록이 실제 DB에 남지 않도록)"""
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+@contextmanager
+def _isolated_storage():
+    """
+    빈 임시 디렉터리를 데이터셋 저장소/모델 레지스트리/결과 캐시로 씁니다. (끝나면 삭제)
+    💡 결과 캐시를 반복마다 비우지 않으면 두 번째 반복부터 학습이 첫 반복의 작업을 그대로 돌려줍니다.
+    """
+    directory = tempfile.mkdtemp(prefix='benchmark-')
+    store_config = {**settings.DATASET_STORE, 'DIR': os.path.join(directory, 'datasets')}
+    registry_config = {**settings.MODEL_REGISTRY, 'DIR': os.path.join(directory, 'models')}
+    cache_config = {**settings.RESULT_CACHE, 'PATH': os.path.join(directory, 'result_cache.sqlite3')}
+    try:
+        with override_settings(DATASET_STORE=store_config, MODEL_REGISTRY=registry_config, RESULT_CACHE=cache_config):
+            # 싱글톤을 비워 두면 다음 호출에서 바뀐 설정으로 다시 만듭니다.
+            _reset_singletons()
+            yield
+    finally:
+        _reset_singletons()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _reset_singletons():
+    dataset_store._store = None
+    registry._registry = None
+    result_cache._cache = None
+
+
+def environment():
+    """측정 환경 (기준선과 환경이 다르면 비교 결과를 참고만 하도록 함께 저장)"""
+    import sklearn
+    return {
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'sklearn': sklearn.__version__,
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def load_baseline(path):
+    """기준선 파일 (없으면 빈 기준선)"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'environment': None, 'scenarios': {}}
+
+
+def save_baseline(path, baseline, scenario, results):
+    """scenario의 결과를 기준선에 저장합니다. (다른 시나리오의 기준선은 유지)"""
+    baseline = {'environment': environment(), 'scenarios': {**baseline.get('scenarios', {}), scenario: results}}
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2, sort_keys=True)
+    return baseline
+
+
+def compare(results, baseline_results, tolerance):
+    """
+    결과를 기준선과 비교합니다.
+    - tolerance: {측정값: (허용 비율, 최소 차이)}. 기준선보다 비율과 최소 차이를 모두 넘게 커지면 저하
+      💡 최소 차이는 짧은 단계의 측정 잡음(수 ms, 수 MB)을 저하로 보지 않기 위한 값입니다.
+    반환: [{'stage', 'metric', 'baseline', 'current', 'change' (비율), 'regression'}, ...]
+    """
+    rows = []
+    for stage, current in results.items():
+        base = (baseline_results or {}).get(stage)
+        if not base:
+            continue
+        for metric in METRICS:
+            if metric not in base:
+                continue
+            ratio, floor = tolerance[metric]
+            before, after = base[metric], current[metric]
+            change = (after - before) / before if before else 0.0
+            rows.append({
+                'stage': stage,
+                'metric': metric,
+                'baseline': before,
+                'current': after,
+                'change': round(change, 4),
+                'regression': after > before * (1 + ratio) and after - before > floor,
+            })
+    return rows
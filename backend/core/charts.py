@@ -0,0 +1,293 @@
+# backend/core/charts.py
+
+"""
+차트 데이터 집계 (서버 측).
+
+분석 응답의 tableData는 상위 100개 행뿐이므로, 브라우저에서 그 행으로 그린 히스토그램/막대/산점도는
+전체 데이터의 분포와 다릅니다. 차트에 필요한 값만 전체 컬럼으로 계산해서 돌려줍니다.
+
+- histogram: 구간(bin)별 개수 (np.histogram 한 번)
+- counts: 빈도수 상위 N개 + 나머지 합계 (value_counts 한 번)
+- scatter: 두 수치형 컬럼의 점 (최대 MAX_POINTS개로 축소) + 상관계수
+- line: 행 순서대로의 값 (최대 MAX_POINTS개로 축소)
+- correlation: 수치형 컬럼 간 상관계수 행렬
+- 점 축소(sampling)
+  - lttb: Largest-Triangle-Three-Buckets. x 순서로 나눈 구간마다 이웃 점과 만드는 삼각형이 가장 큰 점을 골라
+    봉우리/골짜기 같은 모양을 유지합니다.
+  - stratified: x 값 분위수로 나눈 구간마다 같은 개수의 점을 무작위로 뽑습니다. (밀도가 낮은 구간도 보존)
+- 캐시: (차트 종류, 옵션, 컬럼 지문)을 키로 결과를 기억합니다.
+  컬럼 지문은 프로파일 캐시(core/profile_cache.py)와 같으므로, 전처리로 값이 바뀌지 않은 컬럼의 차트는
+  다음 버전의 데이터셋에서도 다시 계산하지 않습니다. (워커별 LRU + 데이터셋 부가 정보)
+- 설정: settings.CHARTS
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+
+from . import columnar
+from .profile_cache import ColumnLineage, fingerprint
+
+# 차트 종류 -> 결과에 영향을 주는 옵션 (캐시 키에는 이 옵션만 넣습니다)
+KINDS = {
+    'histogram': ('bins',),
+    'counts': ('top',),
+    'scatter': ('max_points', 'sampling'),
+    'line': ('max_points',),
+    'correlation': (),
+}
+SAMPLINGS = ('lttb', 'stratified')
+
+
+class ChartError(ValueError):
+    """차트를 그릴 수 없는 요청 (없는 컬럼, 수치형이 아닌 컬럼 등)"""
+
+
+def chart(store, dataset_id, kind, columns, options):
+    """
+    dataset_id 데이터셋의 차트 데이터를 반환합니다. (캐시에 있으면 캐시의 결과)
+    - columns: 차트에 쓰는 컬럼 목록 (correlation은 비어 있으면 모든 수치형 컬럼)
+    - options: {'bins', 'top', 'max_points', 'sampling'}
+    반환: (결과, 캐시 사용 여부)
+    """
+    if kind not in KINDS:
+        raise ChartError(f"지원하지 않는 차트 종류입니다: {kind} ({', '.join(KINDS)})")
+    options = {name: options[name] for name in KINDS[kind]}
+    lineage = ColumnLineage.load(store, dataset_id)
+    # 💡 correlation의 전체 컬럼 목록은 데이터를 읽어야 알 수 있으므로 데이터셋 단위로 캐시합니다.
+    parts = [lineage.fingerprint_of(col) for col in columns] if columns else [dataset_id]
+    key = fingerprint(kind, sorted(options.items()), *columns, *parts)
+
+    cache = get_chart_cache()
+    result = cache.get(key)
+    if result is None:
+        result = store.get_artifact(dataset_id, f'chart-{key}')
+        if result is not None:
+            cache.put(key, result)
+    if result is not None:
+        return result, True
+
+    df = _load_columns(store, dataset_id, columns)
+    result = build(df, kind, columns, options)
+    cache.put(key, result)
+    store.put_artifact(dataset_id, f'chart-{key}', result)
+    return result, False
+
+
+def build(df, kind, columns, options):
+    """DataFrame으로 차트 데이터를 계산합니다."""
+    if kind not in KINDS:
+        raise ChartError(f"지원하지 않는 차트 종류입니다: {kind} ({', '.join(KINDS)})")
+    missing = [col for col in columns if col not in df.columns]
+    if missing:
+        raise ChartError(f"컬럼을 찾을 수 없습니다: {', '.join(map(str, missing))}")
+
+    if kind == 'histogram':
+        return histogram(df[columns[0]], options['bins'])
+    if kind == 'counts':
+        return value_counts(df[columns[0]], options['top'])
+    if kind == 'scatter':
+        return scatter(df[columns[0]], df[columns[1]], options['max_points'], options['sampling'])
+    if kind == 'line':
+        return line(df[columns[0]], options['max_points'])
+    return correlation(df[columns] if columns else df)
+
+
+def histogram(series, bins):
+    """구간 경계(edges, bins+1개)와 구간별 개수(counts)"""
+    values = _numeric_values(series)
+    finite = values[np.isfinite(values)]
+    if not len(finite):
+        raise ChartError(f"'{series.name}' 컬럼에 수치형 값이 없습니다.")
+    counts, edges = np.histogram(finite, bins=bins)
+    return {
+        "column": series.name,
+        "edges": edges.tolist(),
+        "counts": counts.tolist(),
+        "count": int(len(finite)),
+        "missing": int(len(values) - len(finite)),
+    }
+
+
+def value_counts(series, top):
+    """빈도수 상위 top개 (값은 문자열), 나머지 값들의 개수 합(other), 결측치 개수"""
+    counts = series.value_counts(sort=True, dropna=True)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        counts = counts[counts.to_numpy() > 0]
+    head = counts.iloc[:top]
+    return {
+        "column": series.name,
+        "labels": [str(value) for value in head.index],
+        "counts": head.to_numpy().tolist(),
+        "other": int(counts.iloc[top:].sum()),
+        "distinct": int(len(counts)),
+        "missing": int(series.isna().sum()),
+    }
+
+
+def scatter(x_series, y_series, max_points, sampling='lttb'):
+    """두 컬럼 모두 값이 있는 행의 점 {x, y} (최대 max_points개)와 피어슨 상관계수"""
+    x = _numeric_values(x_series)
+    y = _numeric_values(y_series)
+    valid = np.isfinite(x) & np.isfinite(y)
+    x, y = x[valid], y[valid]
+    if not len(x):
+        raise ChartError(f"'{x_series.name}', '{y_series.name}' 컬럼에 함께 있는 수치형 값이 없습니다.")
+
+    r = _pearson(x, y)
+    order = np.argsort(x, kind='stable')
+    x, y = x[order], y[order]
+    if len(x) > max_points:
+        if sampling == 'stratified':
+            keep = stratified_indices(x, max_points)
+        else:
+            keep = lttb_indices(x, y, max_points)
+        x, y = x[keep], y[keep]
+    return {
+        "columns": [x_series.name, y_series.name],
+        "x": x.tolist(),
+        "y": y.tolist(),
+        "count": int(valid.sum()),
+        "sampled": bool(len(x) < valid.sum()),
+        "pearson": r,
+    }
+
+
+def line(series, max_points):
+    """행 순서(1부터)와 값 (최대 max_points개, LTTB)"""
+    values = _numeric_values(series)
+    positions = np.flatnonzero(np.isfinite(values))
+    if not len(positions):
+        raise ChartError(f"'{series.name}' 컬럼에 수치형 값이 없습니다.")
+    x = (positions + 1).astype(np.float64)
+    y = values[positions]
+    if len(x) > max_points:
+        keep = lttb_indices(x, y, max_points)
+        x, y = x[keep], y[keep]
+    return {
+        "column": series.name,
+        "x": x.astype(np.int64).tolist(),
+        "y": y.tolist(),
+        "count": int(len(positions)),
+        "sampled": bool(len(positions) > max_points),
+    }
+
+
+def correlation(df):
+    """수치형 컬럼 간 피어슨 상관계수 행렬 (값이 없는 칸은 None)"""
+    numeric = [col for col in df.columns
+               if pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col])]
+    if len(numeric) < 2:
+        raise ChartError("상관계수를 계산할 수치형 컬럼이 2개 이상 필요합니다.")
+    matrix = df[numeric].corr().to_numpy()
+    return {
+        "columns": numeric,
+        "matrix": [[None if np.isnan(v) else float(v) for v in row] for row in matrix],
+    }
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets로 고른 점의 위치 (x는 오름차순 정렬되어 있어야 함)
+    첫 점과 마지막 점은 항상 포함하고, 나머지 구간마다 점 하나를 고릅니다.
+    💡 구간 안의 삼각형 넓이는 numpy로 한 번에 계산하므로 파이썬 반복은 구간 수(n_out)만큼입니다.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(min(n, max(n_out, 0)))
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # 다음 구간의 평균 점 (마지막 구간이면 마지막 점)
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_x = x[end:next_end].mean() if next_end > end else x[-1]
+        next_y = y[end:next_end].mean() if next_end > end else y[-1]
+        area = np.abs((x[previous] - next_x) * (y[start:end] - y[previous])
+                      - (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+    return selected
+
+
+def stratified_indices(x, n_out, seed=42):
+    """x 분위수로 나눈 구간(최대 n_out/10개)마다 같은 개수의 점을 무작위로 고른 위치 (x는 오름차순 정렬)"""
+    n = len(x)
+    if n_out >= n:
+        return np.arange(n)
+    n_strata = max(1, n_out // 10)
+    # x가 정렬되어 있으므로 위치를 나누면 분위수 구간이 됩니다.
+    strata = np.arange(n) * n_strata // n
+    quota = n_out // n_strata
+    rng = np.random.default_rng(seed)
+    order = np.lexsort((rng.random(n), strata))
+    starts = np.searchsorted(strata[order], np.arange(n_strata))
+    rank = np.arange(n) - starts[strata[order]]
+    return np.sort(order[rank < quota])
+
+
+def _numeric_values(series):
+    """수치형 컬럼은 그대로, 그 외(숫자 문자열 등)는 숫자로 바꿀 수 있는 값만 float64 배열로"""
+    if pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return pd.to_numeric(series.astype(object), errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _pearson(x, y):
+    if len(x) < 2 or np.std(x) == 0 or np.std(y) == 0:
+        return None
+    return float(np.corrcoef(x, y)[0, 1])
+
+
+def _load_columns(store, dataset_id, columns):
+    """
+    차트에 쓰는 컬럼만 불러옵니다.
+    💡 Arrow 파일이면 필요한 컬럼만 mmap으로 읽고, 데이터셋 전체를 메모리에 올리지 않습니다.
+    """
+    path = store.locate(dataset_id)
+    if path is not None and columnar.is_arrow(path) and columns:
+        names = columnar.open_table(path).schema.names
+        if all(isinstance(col, str) and col in names for col in columns):
+            return columnar.read_frame(path, columns=columns)
+    return store.get(dataset_id)
+
+
+class ChartCache:
+    """차트 결과 캐시 (워커 단위 LRU)"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._results = OrderedDict()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._results:
+                return None
+            self._results.move_to_end(key)
+            return self._results[key]
+
+    def put(self, key, result):
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_chart_cache():
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ChartCache(settings.CHARTS['CACHE_SIZE'])
+    return _cache
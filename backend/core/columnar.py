@@ -0,0 +1,240 @@
+# backend/core/columnar.py
+
+"""
+DataFrame을 컬럼형 파일(Arrow IPC)로 저장/복원하는 유틸리티.
+
+- 저장: 압축하지 않은 Arrow IPC(Feather v2) 파일로 씁니다. dtype이 그대로 보존되므로
+  다시 읽을 때 CSV/Excel 파싱과 타입 추론을 반복하지 않습니다.
+- 복원: 파일을 메모리 매핑(mmap)해서 읽으므로 OS 페이지 캐시를 그대로 활용합니다.
+- pyarrow가 없거나, Arrow로 표현할 수 없는 컬럼(문자열/숫자가 섞인 object 등)이 있으면
+  pickle로 대체 저장합니다.
+- 컬럼 공유(write_delta): 이전 버전과 값이 같은 컬럼은 다시 쓰지 않고, 바뀐 컬럼만 <id>.delta.arrow에 씁니다.
+  각 컬럼이 어느 파일의 어느 필드인지는 매니페스트(<id>.cols, JSON)에 기록하고,
+  open_table()이 두 파일을 mmap해서 하나의 Table로 합칩니다. (데이터 복사 없음)
+  💡 매니페스트는 항상 실제 데이터 파일만 가리키므로(매니페스트 -> 매니페스트 참조 없음) 버전이 깊어져도 한 단계로 읽습니다.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow는 선택 의존성
+    pa = None
+    feather = None
+
+ARROW_SUFFIX = '.arrow'
+PICKLE_SUFFIX = '.pkl'
+MANIFEST_SUFFIX = '.cols'
+DELTA_SUFFIX = '.delta' + ARROW_SUFFIX
+FRAME_SUFFIXES = (ARROW_SUFFIX, PICKLE_SUFFIX, MANIFEST_SUFFIX)
+
+# 💡 Arrow 문자열(string[pyarrow]) 컬럼은 large_string으로 저장되므로, 복원할 때도 파이썬 객체가 아닌
+#    Arrow 문자열로 되돌립니다. (object 문자열 컬럼은 string 타입으로 저장되어 영향 없음)
+_ARROW_STRING_TYPES = {pa.large_string(): pd.StringDtype('pyarrow')} if pa is not None else {}
+
+# 💡 업로드 파싱 규칙('?' -> NaN 등)이 바뀌면 올려서 기존 캐시를 무효화합니다.
+PARSE_VERSION = b'1'
+
+
+def content_hash(file_obj, file_name, variant=b''):
+    """
+    업로드 파일 내용의 해시(32자리 hex)를 계산합니다.
+    파일 형식(확장자)과 파싱 규칙 버전도 함께 섞어서, 같은 바이트라도 해석이 다르면 다른 키가 됩니다.
+    - variant: 같은 파일을 다르게 저장하는 옵션 (예: 메모리 최적화) -> 옵션마다 다른 키
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(PARSE_VERSION)
+    if variant:
+        hasher.update(b':' + variant)
+    hasher.update(os.path.splitext(file_name)[1].lower().encode())
+    for chunk in file_obj.chunks():
+        hasher.update(chunk)
+    file_obj.seek(0)
+    return hasher.hexdigest()
+
+
+def write_frame(df, base_path):
+    """
+    DataFrame을 base_path(확장자 제외)에 저장하고 실제 파일 경로를 반환합니다.
+    다른 워커가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체합니다.
+    """
+    if pa is not None:
+        path = base_path.with_suffix(ARROW_SUFFIX)
+        tmp_path = base_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            table = pa.Table.from_pandas(df)
+            feather.write_feather(table, tmp_path, compression='uncompressed')
+            os.replace(tmp_path, path)
+            return path
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # 타입이 섞인 object 컬럼 등 Arrow로 표현할 수 없는 경우 pickle로 저장
+            _unlink(tmp_path)
+
+    path = base_path.with_suffix(PICKLE_SUFFIX)
+    tmp_path = base_path.with_suffix(f".{os.getpid()}.tmp")
+    df.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_delta(df, base_path, parent_path, shared):
+    """
+    df 중 shared 컬럼은 parent_path(Arrow 파일 또는 매니페스트)의 버퍼를 가리키고, 나머지 컬럼만 새로 써서
+    매니페스트 경로를 반환합니다. 컬럼을 공유할 수 없으면(행 수/컬럼이 다름, pickle 등) None -> write_frame으로 저장
+    💡 shared는 값이 바뀌지 않은 컬럼이어야 합니다. (profile_cache.ColumnLineage.unchanged)
+       인덱스도 부모의 것을 그대로 씁니다. (행이 바뀌는 작업은 모든 컬럼이 바뀌므로 여기로 오지 않음)
+    """
+    if pa is None or parent_path is None or not is_arrow(parent_path) or not shared:
+        return None
+    if not df.columns.is_unique or not all(isinstance(col, str) for col in df.columns):
+        return None
+    shared = set(shared)
+    parent = _Manifest.load(parent_path)
+    if parent.rows != len(df) or not all(col in parent.entries for col in shared):
+        return None
+
+    changed = [col for col in df.columns if col not in shared]
+    delta_path = base_path.with_suffix(DELTA_SUFFIX)
+    delta_metadata = None
+    if changed:
+        tmp_path = base_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            table = pa.Table.from_pandas(df[changed], preserve_index=False)
+            feather.write_feather(table, tmp_path, compression='uncompressed')
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            _unlink(tmp_path)
+            return None
+        os.replace(tmp_path, delta_path)
+        delta_metadata = table.schema.pandas_metadata
+
+    # [필드 이름, 데이터 파일 이름, 그 파일의 필드 이름]
+    entries = [[col, *parent.entries[col]] if col in shared else [col, delta_path.name, col] for col in df.columns]
+    entries += [[field, *parent.entries[field]] for field in parent.index_fields]
+    manifest = {
+        'rows': len(df),
+        'columns': entries,
+        'pandas': parent.merge_metadata(list(df.columns), delta_metadata),
+    }
+    path = base_path.with_suffix(MANIFEST_SUFFIX)
+    tmp_path = base_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_frame(path, columns=None):
+    """
+    write_frame으로 저장한 파일을 DataFrame으로 복원합니다. (Arrow는 mmap으로 읽음)
+    - columns: 일부 컬럼만 읽을 때 컬럼 목록 (Arrow 파일은 나머지 컬럼을 읽지 않음)
+    """
+    if is_arrow(path):
+        table = open_table(path)
+        return table_to_frame(table if columns is None else table.select(columns))
+    df = pd.read_pickle(path)
+    return df if columns is None else df[columns]
+
+
+def table_to_frame(table):
+    """pyarrow.Table(또는 그 일부 행/컬럼)을 write_frame으로 저장하기 전의 dtype 그대로 DataFrame으로 바꿉니다."""
+    return table.to_pandas(types_mapper=_ARROW_STRING_TYPES.get)
+
+
+def open_table(path):
+    """Arrow IPC 파일(또는 매니페스트)을 메모리 매핑하여 pyarrow.Table로 엽니다. (데이터 복사 없음)"""
+    if os.fspath(path).endswith(MANIFEST_SUFFIX):
+        return _Manifest.load(Path(path)).table()
+    source = pa.memory_map(str(path), 'r')
+    return pa.ipc.open_file(source).read_all()
+
+
+def is_arrow(path):
+    """open_table로 열 수 있는 파일(Arrow IPC 또는 매니페스트)인지"""
+    return pa is not None and path.suffix in (ARROW_SUFFIX, MANIFEST_SUFFIX)
+
+
+def footprint(path):
+    """(path가 따로 차지하는 디스크 용량(바이트), 다른 파일과 공유하는 컬럼 목록)"""
+    if path.suffix != MANIFEST_SUFFIX:
+        return path.stat().st_size, []
+    delta_path = path.with_suffix(DELTA_SUFFIX)
+    own_bytes = path.stat().st_size + (delta_path.stat().st_size if delta_path.exists() else 0)
+    manifest = _Manifest.load(path)
+    shared = [name for name, (file_name, _) in manifest.entries.items()
+              if file_name != delta_path.name and name not in manifest.index_fields]
+    return own_bytes, shared
+
+
+def sources(path):
+    """path의 데이터가 들어 있는 파일 목록 (매니페스트면 가리키는 파일들, 아니면 path 자신)"""
+    if path.suffix != MANIFEST_SUFFIX:
+        return [path]
+    return [path.parent / name for name in _Manifest.load(path).files()]
+
+
+def find_frame(base_path):
+    """base_path에 저장된 파일(.arrow 또는 .pkl)을 찾아 반환합니다. 없으면 None."""
+    for suffix in FRAME_SUFFIXES:
+        path = base_path.with_suffix(suffix)
+        if path.exists():
+            return path
+    return None
+
+
+class _Manifest:
+    """매니페스트(또는 Arrow 파일 하나)의 컬럼 -> (파일 이름, 필드 이름) 목록"""
+
+    def __init__(self, directory, rows, entries, metadata):
+        self.directory = directory
+        self.rows = rows
+        # 필드 이름 -> [파일 이름, 그 파일의 필드 이름] (인덱스 필드 포함, 저장 순서대로)
+        self.entries = entries
+        self.metadata = metadata
+
+    @classmethod
+    def load(cls, path):
+        if path.suffix != MANIFEST_SUFFIX:
+            table = open_table(path)
+            entries = {name: [path.name, name] for name in table.schema.names}
+            return cls(path.parent, table.num_rows, entries, table.schema.pandas_metadata)
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        entries = {name: [file_name, field] for name, file_name, field in manifest['columns']}
+        return cls(path.parent, manifest['rows'], entries, manifest['pandas'])
+
+    @property
+    def index_fields(self):
+        return [field for field in (self.metadata or {}).get('index_columns', []) if isinstance(field, str)]
+
+    def files(self):
+        return list(dict.fromkeys(name for name, _ in self.entries.values()))
+
+    def table(self):
+        tables = {name: open_table(self.directory / name) for name in self.files()}
+        arrays = [tables[name].column(field) for name, field in self.entries.values()]
+        fields = [tables[name].schema.field(field).with_name(key)
+                  for key, (name, field) in self.entries.items()]
+        metadata = {b'pandas': json.dumps(self.metadata).encode()} if self.metadata else None
+        return pa.Table.from_arrays(arrays, schema=pa.schema(fields, metadata=metadata))
+
+    def merge_metadata(self, columns, delta_metadata):
+        """공유 컬럼/인덱스는 부모의, 새로 쓴 컬럼은 delta 파일의 pandas 메타데이터로 합칩니다."""
+        if not self.metadata:
+            return None
+        described = {column['field_name']: column for column in self.metadata['columns']}
+        for column in (delta_metadata or {}).get('columns', []):
+            described[column['field_name']] = column
+        return dict(self.metadata, columns=[described[field] for field in columns + self.index_fields])
+
+
+def _unlink(path):
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,179 @@
+# backend/core/compare.py
+
+"""
+여러 모델 비교 학습 (리더보드).
+
+rf / gb / linear / svm을 비교하려고 /train/을 모델마다 따로 요청하면 전처리(대체/인코딩/분리)를 매번 다시 합니다.
+비교 모드는 학습 데이터를 training.prepare로 한 번만 준비하고, 요청한 모델들을 동시에 학습합니다.
+
+- 학습/평가 행렬(X_train, X_test, y_train)을 공유 메모리(multiprocessing.shared_memory)에 한 번만 복사합니다.
+  프로세스 풀의 워커는 같은 메모리를 복사 없이 numpy 배열로 열어 모델 하나씩 학습합니다.
+  (GIL 때문에 스레드로는 여러 모델의 학습이 동시에 돌지 않습니다)
+- 모델마다 성능 지표와 학습(fit)/예측(predict) 시간을 재서 점수(회귀: R2, 분류: 정확도) 순으로 정렬합니다.
+- 워커가 1개 이하이거나, 프로세스 풀을 쓸 수 없거나, 공유 메모리에 넣을 수 없는 목표 변수(object 등)이면
+  현재 스레드에서 차례로 학습합니다.
+- 큰 데이터: 모델마다 학습 행 수로 모델 방식(training.resolve_backend)을 정하고, 리더보드에 실제로 쓴 모델을 기록합니다.
+  sample_rows를 주면 모든 모델이 같은 표본(training.sample_order의 앞부분)으로 학습합니다. (시간 예산은 단일 모델 학습만)
+- 설정: settings.TRAINING['COMPARE_WORKERS'], settings.MODEL_SCALING
+"""
+
+import time
+from concurrent.futures import as_completed
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+import numpy as np
+from django.conf import settings
+
+from .parallel import ProcessPool
+from .training import (
+    FittedModel, build_model, estimator_name, evaluate, prepare, resolve_backend, sample_order, scaling_options,
+)
+
+_pool = ProcessPool()
+
+
+def compare(df, target_col, model_names, progress=None, encoding=None, scaling=None):
+    """
+    model_names의 모델들을 같은 학습/평가 데이터로 학습하여 비교합니다.
+    반환: (결과(리더보드), {모델 이름: FittedModel})
+    💡 progress 콜백이 예외(작업 취소)를 발생시키면 아직 시작하지 않은 모델은 학습하지 않습니다.
+    """
+    progress = progress or (lambda percent, message: None)
+    data = prepare(df, target_col, progress, encoding)
+
+    arrays = {
+        'X_train': data.X_train.to_numpy(dtype=np.float64),
+        'X_test': data.X_test.to_numpy(dtype=np.float64),
+        'y_train': np.asarray(data.y_train),
+    }
+    scaling = scaling_options(scaling)
+    train_rows = len(data.X_train)
+    if scaling['sample_rows'] and scaling['sample_rows'] < train_rows:
+        rows = sample_order(arrays['y_train'], data.is_regression)[:scaling['sample_rows']]
+        arrays['X_train'], arrays['y_train'] = arrays['X_train'][rows], arrays['y_train'][rows]
+    backends = {model_name: resolve_backend(model_name, train_rows, scaling['backend']) for model_name in model_names}
+    progress(20, f"모델 {len(model_names)}개 학습 중")
+
+    workers = min(settings.TRAINING['COMPARE_WORKERS'], len(model_names))
+    executor = _get_executor(settings.TRAINING['COMPARE_WORKERS']) if workers > 1 else None
+    if executor is None or any(array.dtype == object for array in arrays.values()):
+        outcomes = _fit_serial(arrays, backends, data.is_regression, progress)
+    else:
+        try:
+            outcomes = _fit_parallel(executor, arrays, backends, data.is_regression, progress)
+        except (BrokenProcessPool, OSError):
+            _pool.reset()
+            outcomes = _fit_serial(arrays, backends, data.is_regression, progress)
+
+    progress(90, "평가 중")
+    task = "regression" if data.is_regression else "classification"
+    target_classes = data.le_y.classes_ if data.le_y is not None else None
+    leaderboard, fitted_models = [], {}
+    for model_name in model_names:
+        outcome = outcomes[model_name]
+        if 'error' in outcome:
+            leaderboard.append({"model": model_name, "error": outcome['error']})
+            continue
+        metrics, score = evaluate(data.is_regression, data.y_test, outcome['y_pred'])
+        leaderboard.append({
+            "model": model_name,
+            "metrics": metrics,
+            "score": float(score),
+            "fitSeconds": round(outcome['fit_seconds'], 4),
+            "predictSeconds": round(outcome['predict_seconds'], 4),
+            "backend": {"name": backends[model_name], "estimator": estimator_name(outcome['model'])},
+        })
+        fitted_models[model_name] = FittedModel(outcome['model'], data.preprocessor, target_col, task,
+                                                target_classes=target_classes)
+
+    # 점수가 높은 순 (실패한 모델은 맨 뒤)
+    leaderboard.sort(key=lambda row: row.get('score', float('-inf')), reverse=True)
+    for rank, row in enumerate(leaderboard, start=1):
+        row['rank'] = rank
+
+    result_data = {
+        "type": task,
+        "mode": "compare",
+        "target": target_col,
+        "trainRows": train_rows,
+        "sampleRows": len(arrays['X_train']),
+        "testRows": len(data.X_test),
+        "encoding": data.preprocessor.summary(),
+        "best": leaderboard[0]['model'] if 'score' in leaderboard[0] else None,
+        "leaderboard": leaderboard,
+    }
+    return result_data, fitted_models
+
+
+def _fit_serial(arrays, backends, is_regression, progress):
+    outcomes = {}
+    for done, (model_name, backend) in enumerate(backends.items(), start=1):
+        outcomes[model_name] = _fit_one(arrays, model_name, backend, is_regression)
+        progress(20 + 65 * done / len(backends), f"모델 학습 중 ({done}/{len(backends)})")
+    return outcomes
+
+
+def _fit_parallel(executor, arrays, backends, is_regression, progress):
+    blocks = {}
+    try:
+        # 💡 행렬을 공유 메모리에 한 번만 복사하고, 워커에는 공유 메모리 이름/모양/dtype만 넘깁니다.
+        specs = {}
+        for key, array in arrays.items():
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            blocks[key] = block
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+            specs[key] = (block.name, array.shape, array.dtype.str)
+
+        futures = {executor.submit(_fit_shared_task, specs, model_name, backend, is_regression): model_name
+                   for model_name, backend in backends.items()}
+        outcomes = {}
+        try:
+            for done, future in enumerate(as_completed(futures), start=1):
+                outcomes[futures[future]] = future.result()
+                progress(20 + 65 * done / len(backends), f"모델 학습 중 ({done}/{len(backends)})")
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return outcomes
+    finally:
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+
+def _fit_shared_task(specs, model_name, backend, is_regression):
+    """(워커 프로세스) 공유 메모리의 행렬로 모델 하나를 학습합니다."""
+    blocks = {key: shared_memory.SharedMemory(name=name) for key, (name, _, _) in specs.items()}
+    try:
+        arrays = {key: np.ndarray(shape, dtype=np.dtype(dtype), buffer=blocks[key].buf)
+                  for key, (_, shape, dtype) in specs.items()}
+        return _fit_one(arrays, model_name, backend, is_regression)
+    finally:
+        # 배열(메모리 뷰)을 먼저 놓아야 공유 메모리를 닫을 수 있습니다.
+        arrays = None
+        for block in blocks.values():
+            block.close()
+
+
+def _fit_one(arrays, model_name, backend, is_regression):
+    """모델 하나를 학습/예측하고 {'model', 'y_pred', 'fit_seconds', 'predict_seconds'} (실패하면 {'error'})"""
+    try:
+        model = build_model(model_name, is_regression, backend=backend)
+        start = time.perf_counter()
+        model.fit(arrays['X_train'], arrays['y_train'])
+        fit_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        y_pred = model.predict(arrays['X_test'])
+        predict_seconds = time.perf_counter() - start
+    except Exception as e:
+        return {'error': f"{type(e).__name__}: {e}"}
+    return {'model': model, 'y_pred': y_pred, 'fit_seconds': fit_seconds, 'predict_seconds': predict_seconds}
+
+
+def _get_executor(workers):
+    if workers <= 1:
+        return None
+    return _pool.get(workers)
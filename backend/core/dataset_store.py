@@ -0,0 +1,337 @@
+# backend/core/dataset_store.py
+
+"""
+서버 측 데이터셋 저장소.
+
+업로드/전처리 결과 DataFrame을 dataset_id로 보관하여, 브라우저가 전체 데이터를
+JSON으로 주고받지 않고 ID만 전달하도록 합니다.
+
+- 메모리: 워커(프로세스)별 LRU 캐시. 메모리 예산(MEMORY_BUDGET_MB)을 넘으면
+  가장 오래 사용하지 않은 데이터셋부터 메모리에서 내립니다.
+- 디스크: 모든 워커가 공유하는 원본 저장소. 다른 워커가 만든 데이터셋도
+  디스크에서 읽어올 수 있으므로 멀티 워커 환경에서도 동작합니다.
+  파일은 컬럼형(Arrow IPC)으로 저장하고 mmap으로 읽습니다. (core/columnar.py)
+- TTL: 마지막 접근 후 TTL_SECONDS가 지나면 메모리/디스크에서 모두 삭제합니다.
+- 버전(core/versions.py): 전처리 결과는 부모 데이터셋과 값이 같은 컬럼을 다시 쓰지 않고 부모 파일을 가리킵니다.
+  (columnar.write_delta) 💡 데이터셋에 접근하면 가리키는 파일과 조상(부모, 부모의 부모 ...) 데이터셋도 함께 touch하므로,
+  자식 버전을 쓰는 동안 부모 파일이나 되돌아갈 버전이 먼저 만료되지 않습니다.
+"""
+
+import os
+import pickle
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+
+from django.conf import settings
+
+from . import columnar
+
+_DATASET_ID_RE = re.compile(r'^[0-9a-f]{32}$')
+# 부모 데이터셋 ID를 기록하는 부가 정보 이름
+_PARENT = 'parent'
+
+
+class DatasetNotFound(KeyError):
+    """dataset_id에 해당하는 데이터셋이 없거나 TTL이 지나 삭제된 경우"""
+
+
+class DatasetStore:
+    def __init__(self, directory, memory_budget_bytes, ttl_seconds):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.memory_budget_bytes = memory_budget_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        # dataset_id -> [df, nbytes, last_access]
+        self._entries = OrderedDict()
+        self._memory_used = 0
+        self._last_sweep = 0.0
+        # dataset_id -> 조상 데이터셋을 마지막으로 touch한 시각
+        self._ancestors_touched = {}
+
+    # --- 공개 API ---
+    def put(self, df, dataset_id=None, parent=None, shared=()):
+        """
+        DataFrame을 저장하고 dataset_id를 반환합니다.
+        dataset_id를 지정하면(예: 업로드 파일의 내용 해시) 그 ID로 저장합니다.
+        - parent / shared: df를 만든 데이터셋과, 그 데이터셋에서 값이 바뀌지 않은 컬럼 목록
+          (해당 컬럼은 새로 쓰지 않고 부모 파일의 버퍼를 공유합니다. parent는 접근할 때 함께 touch)
+        """
+        dataset_id = dataset_id or uuid.uuid4().hex
+        self._write(dataset_id, df, parent, shared)
+        if parent:
+            self.put_artifact(dataset_id, _PARENT, parent)
+        self._remember(dataset_id, df)
+        self._sweep_expired()
+        return dataset_id
+
+    def get(self, dataset_id):
+        """
+        dataset_id의 DataFrame을 반환합니다.
+        💡 반환된 DataFrame은 캐시와 공유되므로 inplace 수정을 하면 안 됩니다.
+        """
+        if not dataset_id or not _DATASET_ID_RE.match(str(dataset_id)):
+            raise DatasetNotFound(dataset_id)
+
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(dataset_id)
+            if entry is not None:
+                if now - entry[2] > self.ttl_seconds:
+                    self._forget_locked(dataset_id)
+                    entry = None
+                else:
+                    entry[2] = now
+                    self._entries.move_to_end(dataset_id)
+
+        path = self._find(dataset_id)
+        if entry is not None:
+            if path is not None:
+                self._touch(path, now)
+                self._touch_ancestors(dataset_id, now)
+            return entry[0]
+
+        # 메모리에 없으면 디스크(다른 워커가 저장했을 수 있음)에서 복원
+        try:
+            mtime = path.stat().st_mtime
+        except (AttributeError, FileNotFoundError):
+            raise DatasetNotFound(dataset_id)
+
+        if now - mtime > self.ttl_seconds:
+            self._unlink(path)
+            raise DatasetNotFound(dataset_id)
+
+        df = self._read(path)
+        self._touch(path, now)
+        self._touch_ancestors(dataset_id, now)
+        self._remember(dataset_id, df)
+        return df
+
+    def locate(self, dataset_id):
+        """
+        만료되지 않은 데이터셋 파일 경로를 반환합니다. 없으면 None.
+        (대용량 데이터셋을 메모리에 올리지 않고 파일만 확인할 때 사용)
+        """
+        if not dataset_id or not _DATASET_ID_RE.match(str(dataset_id)):
+            return None
+        path = self._find(dataset_id)
+        if path is None:
+            return None
+
+        now = time.time()
+        try:
+            if now - path.stat().st_mtime > self.ttl_seconds:
+                self._unlink(path)
+                return None
+        except FileNotFoundError:
+            return None
+        self._touch(path, now)
+        self._touch_ancestors(dataset_id, now)
+        return path
+
+    def exists(self, dataset_id):
+        """만료되지 않은 데이터셋인지 확인합니다. (locate와 달리 접근 시각을 바꾸지 않음)"""
+        if not dataset_id or not _DATASET_ID_RE.match(str(dataset_id)):
+            return False
+        path = self._find(dataset_id)
+        try:
+            return path is not None and time.time() - path.stat().st_mtime <= self.ttl_seconds
+        except FileNotFoundError:
+            return False
+
+    def accessed_at(self, dataset_id):
+        """데이터셋에 마지막으로 접근한 시각 (get/locate가 touch하는 파일 수정 시각, time.time() 기준). 없으면 None"""
+        path = self._find(dataset_id) if dataset_id and _DATASET_ID_RE.match(str(dataset_id)) else None
+        try:
+            return path.stat().st_mtime if path is not None else None
+        except FileNotFoundError:
+            return None
+
+    def arrow_path(self, dataset_id):
+        """스트리밍 업로드가 Arrow IPC 파일을 직접 써 넣을 경로를 반환합니다."""
+        if not _DATASET_ID_RE.match(str(dataset_id)):
+            raise DatasetNotFound(dataset_id)
+        return (self.directory / dataset_id).with_suffix(columnar.ARROW_SUFFIX)
+
+    def footprint(self, dataset_id):
+        """(데이터셋이 따로 차지하는 디스크 용량(바이트), 부모 데이터셋과 공유하는 컬럼 목록). 없으면 None"""
+        path = self._find(dataset_id)
+        try:
+            return columnar.footprint(path) if path is not None else None
+        except FileNotFoundError:
+            return None
+
+    def delete(self, dataset_id):
+        with self._lock:
+            self._forget_locked(dataset_id)
+        if _DATASET_ID_RE.match(str(dataset_id)):
+            for path in self.directory.glob(f"{dataset_id}.*"):
+                self._unlink(path)
+
+    # --- 데이터셋에 딸린 부가 정보 (분위수 스케치 등) ---
+    def put_artifact(self, dataset_id, name, obj):
+        """데이터셋과 함께 보관할 부가 정보를 저장합니다. (데이터셋과 같은 TTL로 정리)"""
+        if not _DATASET_ID_RE.match(str(dataset_id)):
+            raise DatasetNotFound(dataset_id)
+        path = self._artifact_path(dataset_id, name)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def get_artifact(self, dataset_id, name, default=None):
+        """put_artifact로 저장한 부가 정보를 반환합니다. 없거나 만료되었으면 default."""
+        if not dataset_id or not _DATASET_ID_RE.match(str(dataset_id)):
+            return default
+        path = self._artifact_path(dataset_id, name)
+        now = time.time()
+        try:
+            if now - path.stat().st_mtime > self.ttl_seconds:
+                self._unlink(path)
+                return default
+            with open(path, 'rb') as f:
+                obj = pickle.load(f)
+        except FileNotFoundError:
+            return default
+        self._touch(path, now)
+        return obj
+
+    def _artifact_path(self, dataset_id, name):
+        return self.directory / f"{dataset_id}.{name}{columnar.PICKLE_SUFFIX}"
+
+    # --- 메모리(LRU) 관리 ---
+    def _remember(self, dataset_id, df):
+        nbytes = int(df.memory_usage(deep=True).sum())
+        # 예산보다 큰 데이터셋은 메모리에 올리지 않고 디스크에서만 읽습니다.
+        if nbytes > self.memory_budget_bytes:
+            return
+
+        with self._lock:
+            self._forget_locked(dataset_id)
+            self._entries[dataset_id] = [df, nbytes, time.time()]
+            self._memory_used += nbytes
+
+            while self._memory_used > self.memory_budget_bytes and self._entries:
+                _, (_, evicted_bytes, _) = self._entries.popitem(last=False)
+                self._memory_used -= evicted_bytes
+
+    def _forget_locked(self, dataset_id):
+        entry = self._entries.pop(dataset_id, None)
+        if entry is not None:
+            self._memory_used -= entry[1]
+
+    # --- 디스크 관리 ---
+    def _find(self, dataset_id):
+        return columnar.find_frame(self.directory / dataset_id)
+
+    def _write(self, dataset_id, df, parent=None, shared=()):
+        base_path = self.directory / dataset_id
+        path = None
+        if parent and shared:
+            path = columnar.write_delta(df, base_path, self._find(parent), shared)
+        if path is None:
+            path = columnar.write_frame(df, base_path)
+            self._unlink(base_path.with_suffix(columnar.DELTA_SUFFIX))
+        # 형식이 바뀐 경우(.pkl <-> .arrow <-> .cols) 이전 파일이 남지 않도록 정리
+        for suffix in columnar.FRAME_SUFFIXES:
+            if suffix != path.suffix:
+                self._unlink(path.with_suffix(suffix))
+        self._touch(path, time.time())
+
+    def _read(self, path):
+        try:
+            return columnar.read_frame(path)
+        except FileNotFoundError:
+            raise DatasetNotFound(path.stem)
+
+    def _sweep_expired(self):
+        """TTL이 지난 데이터셋 파일을 정리합니다. (TTL의 1/10 주기로만 실행)"""
+        now = time.time()
+        if now - self._last_sweep < self.ttl_seconds / 10:
+            return
+        self._last_sweep = now
+
+        with self._lock:
+            expired = [k for k, v in self._entries.items() if now - v[2] > self.ttl_seconds]
+            for dataset_id in expired:
+                self._forget_locked(dataset_id)
+            self._ancestors_touched = {k: t for k, t in self._ancestors_touched.items()
+                                       if now - t <= self.ttl_seconds}
+
+        for path in self.directory.iterdir():
+            if path.suffix not in columnar.FRAME_SUFFIXES:
+                continue
+            try:
+                if now - path.stat().st_mtime > self.ttl_seconds:
+                    self._unlink(path)
+            except FileNotFoundError:
+                pass
+
+    def _touch_ancestors(self, dataset_id, now):
+        """
+        dataset_id의 조상 데이터셋(put의 parent를 따라 올라감) 파일의 접근 시각도 갱신합니다.
+        💡 조상은 TTL의 1/10이 지나기 전에는 다시 touch하지 않습니다. (자주 읽는 데이터셋마다 부모 기록을 읽지 않도록)
+        """
+        with self._lock:
+            if now - self._ancestors_touched.get(dataset_id, 0.0) < self.ttl_seconds / 10:
+                return
+            self._ancestors_touched[dataset_id] = now
+
+        seen = {dataset_id}
+        while True:
+            link = self._artifact_path(dataset_id, _PARENT)
+            try:
+                with open(link, 'rb') as f:
+                    parent = pickle.load(f)
+            except FileNotFoundError:
+                return
+            self._touch(link, now)
+            path = self._find(parent)
+            try:
+                # 이미 만료된 조상은 되살리지 않습니다.
+                if parent in seen or path is None or now - path.stat().st_mtime > self.ttl_seconds:
+                    return
+            except FileNotFoundError:
+                return
+            self._touch(path, now)
+            seen.add(parent)
+            dataset_id = parent
+
+    @staticmethod
+    def _touch(path, now):
+        try:
+            for source in {path, *columnar.sources(path)}:
+                os.utime(source, (now, now))
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _unlink(path):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_dataset_store():
+    """settings.DATASET_STORE 설정으로 만든 워커 단위 싱글톤 저장소를 반환합니다."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                config = settings.DATASET_STORE
+                _store = DatasetStore(
+                    directory=config['DIR'],
+                    memory_budget_bytes=config['MEMORY_BUDGET_MB'] * 1024 * 1024,
+                    ttl_seconds=config['TTL_SECONDS'],
+                )
+    return _store
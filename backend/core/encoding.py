@@ -0,0 +1,304 @@
+# backend/core/encoding.py
+
+"""
+학습용 특성(feature) 전처리.
+
+TrainModelView의 전처리(ID 컬럼 제거 -> 결측치 대체 -> 범주형 컬럼 인코딩)를 fit/transform으로 나눈 것입니다.
+학습할 때 계산한 값(대체값, 범주 목록, 목표 평균)을 기억해 두므로, 예측할 때 새 데이터에 학습 때와 똑같이 적용할 수 있습니다.
+(모델 레지스트리(core/registry.py)에 모델과 함께 저장됩니다)
+
+- 결측치: 수치형은 평균, 그 외는 최빈값 (평균은 모든 수치형 컬럼을 한 번에 계산)
+- 범주형(object, category, string) 컬럼: 문자열로 바꾼 값의 정렬 순서 번호 (LabelEncoder와 같은 번호). 학습 때 없던 값은 -1
+  💡 컬럼 전체를 astype(str)로 복사하지 않고, factorize로 고유값만 문자열로 바꿔 번호를 매깁니다.
+  💡 번호 컬럼은 pandas category dtype(값: -1 ~ 범주 수-1)으로 저장하므로 int64 대신 int8/int16 크기의 메모리만 씁니다.
+- 인코딩 방식(method)
+  - ordinal: 범주 번호 (기본)
+  - onehot: 범주 수가 onehot_max_categories 이하인 컬럼은 범주마다 0/1 컬럼 ("컬럼=값"), 나머지는 번호
+  - target: 범주별 목표값 평균 (sklearn TargetEncoder). 💡 학습 행(fit_rows)의 목표값만 쓰고,
+    학습 행 자신은 교차 적합(cross fitting)한 값으로 바꾸므로 자기 목표값이 특성에 새어 들어가지 않습니다.
+- 희귀 범주: 학습 데이터에 rare_min_count번 미만 나온 값은 하나의 범주(RARE_CATEGORY)로 묶습니다.
+  예측할 때 학습 때 없던 값도 이 범주로 처리합니다.
+- 조각 단위 학습(core/incremental.py): fit_chunks로 데이터 조각들을 한 번 훑어 대체값/범주 목록을 계산합니다. (ordinal / onehot)
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import KFold, StratifiedKFold
+from sklearn.preprocessing import TargetEncoder
+
+from .memory import fill_missing, widen_floats
+
+# 희귀 범주를 묶은 범주의 이름
+RARE_CATEGORY = '__rare__'
+METHODS = ('ordinal', 'onehot', 'target')
+
+
+class EncodingError(ValueError):
+    """예측 데이터가 학습 때의 컬럼 구성과 맞지 않거나, 인코딩 설정이 잘못된 경우"""
+
+
+def id_like_columns(columns):
+    """ID처럼 보이는 컬럼 (학습에서 제외)"""
+    return [c for c in columns if 'ID' in c or 'id' in c or 'nbr' in c]
+
+
+class TabularPreprocessor:
+    def __init__(self, method='ordinal', rare_min_count=0, onehot_max_categories=20):
+        if method not in METHODS:
+            raise EncodingError(f"지원하지 않는 인코딩 방식입니다: {method} ({', '.join(METHODS)})")
+        self.method = method
+        self.rare_min_count = rare_min_count
+        self.onehot_max_categories = onehot_max_categories
+
+        self.feature_columns = []
+        self.fill_values = {}
+        # 범주형 컬럼 -> 정렬된 범주 목록 (번호 = 목록의 위치)
+        self.categories = {}
+        # 희귀 범주를 묶은 컬럼 -> RARE_CATEGORY의 번호
+        self.rare_codes = {}
+        self.onehot_columns = []
+        self.target_columns = []
+        self.target_encoder = None
+        # 모델 입력 컬럼 (onehot/target 인코딩은 컬럼 수가 달라짐)
+        self.output_columns = []
+
+    def __setstate__(self, state):
+        # 💡 이전 버전으로 저장된 모델(번호 인코딩만 지원)도 그대로 불러올 수 있게 기본값을 채웁니다.
+        self.__dict__.update({
+            'method': 'ordinal', 'rare_min_count': 0, 'onehot_max_categories': 20, 'rare_codes': {},
+            'onehot_columns': [], 'target_columns': [], 'target_encoder': None, 'output_columns': None,
+        })
+        self.__dict__.update(state)
+
+    def fit_transform(self, X, y=None, fit_rows=None, is_regression=False):
+        """
+        X(목표 컬럼을 뺀 특성 DataFrame)로 대체값/범주 목록을 계산하고 변환한 DataFrame을 반환합니다.
+        - y, fit_rows, is_regression: target 인코딩에만 사용 (fit_rows: 목표 평균을 계산할 행 위치, 기본은 전체)
+        """
+        self.feature_columns = list(X.columns)
+        X = widen_floats(X)
+        null_counts = X.isnull().sum()
+        self.fill_values = {}
+        numeric = [col for col in X.columns if pd.api.types.is_numeric_dtype(X[col])]
+        if numeric:
+            # 💡 결측치가 없는 컬럼도 대체값을 계산해 둡니다. (예측 데이터에는 결측치가 있을 수 있음)
+            self.fill_values.update(X[numeric].mean().to_dict())
+        for col in X.columns:
+            if col not in self.fill_values:
+                value = self._mode(X[col], required=null_counts[col] > 0)
+                if value is not None:
+                    self.fill_values[col] = value
+        X = self._fill(X, null_counts)
+
+        self.categories = {}
+        self.rare_codes = {}
+        codes = {}
+        for col in X.select_dtypes(include=['object', 'category', 'string']).columns:
+            codes[col] = self._fit_codes(col, X[col])
+
+        self.onehot_columns = []
+        self.target_columns = []
+        self.target_encoder = None
+        encoded = None
+        if self.method == 'onehot':
+            self.onehot_columns = [col for col in codes if len(self.categories[col]) <= self.onehot_max_categories]
+        elif self.method == 'target' and codes:
+            if y is None:
+                raise EncodingError("target 인코딩에는 목표값이 필요합니다.")
+            self.target_columns = list(codes)
+            encoded = self._fit_target(codes, np.asarray(y), fit_rows, is_regression)
+
+        out = self._assemble(X, codes, encoded)
+        self.output_columns = list(out.columns)
+        return out
+
+    def fit_chunks(self, chunks):
+        """
+        fit_transform의 조각 단위 버전: X 조각(DataFrame)들을 한 번 훑어 대체값/범주 목록만 계산합니다. (변환은 transform)
+        💡 조각마다 합계/개수/값별 개수만 더해 두므로 메모리는 조각 크기와 범주 수에만 비례합니다.
+        (target 인코딩은 교차 적합에 전체 데이터가 필요하므로 지원하지 않음)
+        """
+        if self.method == 'target':
+            raise EncodingError("조각 단위 학습에서는 target 인코딩을 쓸 수 없습니다.")
+        empty, numeric, categorical = None, [], []
+        sums, counts, null_counts, value_counts = None, None, None, {}
+        for X in chunks:
+            X = widen_floats(X)
+            if empty is None:
+                empty = X.iloc[:0]
+                numeric = [col for col in X.columns if pd.api.types.is_numeric_dtype(X[col])]
+                categorical = list(X.select_dtypes(include=['object', 'category', 'string']).columns)
+                sums = pd.Series(0.0, index=numeric)
+                counts = pd.Series(0, index=numeric)
+                null_counts = pd.Series(0, index=X.columns)
+            sums += X[numeric].sum()
+            counts += X[numeric].count()
+            null_counts += X.isnull().sum()
+            for col in X.columns:
+                if col in sums.index:
+                    continue
+                part = X[col].value_counts()
+                part = part[part > 0]
+                part.index = part.index.astype(object)
+                value_counts[col] = part if col not in value_counts else value_counts[col].add(part, fill_value=0)
+        if empty is None:
+            raise EncodingError("학습할 데이터가 없습니다.")
+
+        self.feature_columns = list(empty.columns)
+        self.fill_values = (sums / counts.where(counts > 0)).to_dict()
+        for col, found in value_counts.items():
+            if len(found):
+                # 가장 많이 나온 값 (같으면 정렬 순서로 앞선 값: Series.mode와 같음)
+                self.fill_values[col] = min(found.index[found == found.max()], key=str)
+
+        self.categories = {}
+        self.rare_codes = {}
+        for col in categorical:
+            found = value_counts.get(col, pd.Series(dtype=np.float64))
+            labels = found.groupby(found.index.map(str)).sum()
+            if null_counts[col] > 0:
+                fill = str(self.fill_values.get(col, np.nan))
+                labels = labels.add(pd.Series({fill: null_counts[col]}), fill_value=0)
+            self._fit_categories(col, np.array(labels.index, dtype=object), labels.to_numpy())
+
+        self.onehot_columns = []
+        self.target_columns = []
+        self.target_encoder = None
+        if self.method == 'onehot':
+            self.onehot_columns = [col for col in categorical if len(self.categories[col]) <= self.onehot_max_categories]
+        self.output_columns = list(self.transform(empty).columns)
+        return self
+
+    def _fit_categories(self, col, labels, label_counts):
+        """정렬된 범주 목록(labels)과 범주별 개수로 희귀 범주를 묶어 categories[col]을 정합니다. (fit_chunks)"""
+        categories = labels
+        if self.rare_min_count > 1 and len(categories):
+            rare = label_counts < self.rare_min_count
+            if rare.any():
+                categories = np.unique(np.append(categories[~rare], RARE_CATEGORY).astype(object))
+                self.rare_codes[col] = int(np.searchsorted(categories, RARE_CATEGORY))
+        self.categories[col] = categories
+
+    def transform(self, df):
+        """학습 때와 같은 전처리를 df에 적용하여 모델 입력 DataFrame을 반환합니다."""
+        missing = [col for col in self.feature_columns if col not in df.columns]
+        if missing:
+            raise EncodingError(f"학습에 사용한 컬럼이 없습니다: {', '.join(map(str, missing))}")
+
+        X = widen_floats(df[self.feature_columns])
+        X = self._fill(X, X.isnull().sum())
+        codes = {col: self._codes(col, X[col]) for col in self.categories}
+        encoded = None
+        if self.target_columns:
+            encoded = self.target_encoder.transform(np.column_stack([codes[col] for col in self.target_columns]))
+        return self._assemble(X, codes, encoded)
+
+    def summary(self):
+        """학습 결과에 표시할 인코딩 요약"""
+        return {
+            "method": self.method,
+            "features": len(self.output_columns or self.feature_columns),
+            "categorical": len(self.categories),
+            "rareBuckets": sorted(self.rare_codes),
+        }
+
+    def _fill(self, X, null_counts):
+        fills = {col: value for col, value in self.fill_values.items() if null_counts.get(col, 0) > 0}
+        return fill_missing(X, fills) if fills else X
+
+    def _fit_codes(self, col, series):
+        """값 -> 범주 번호. rare_min_count 미만으로 나온 값은 RARE_CATEGORY로 묶습니다."""
+        raw_codes, uniques = pd.factorize(series, use_na_sentinel=False)
+        labels = np.array([str(value) for value in uniques], dtype=object)
+        categories, label_codes = np.unique(labels, return_inverse=True)
+        codes = label_codes[raw_codes]
+
+        if self.rare_min_count > 1 and len(categories):
+            rare = np.bincount(codes, minlength=len(categories)) < self.rare_min_count
+            if rare.any():
+                kept = np.unique(np.append(categories[~rare], RARE_CATEGORY).astype(object))
+                rare_code = int(np.searchsorted(kept, RARE_CATEGORY))
+                remap = np.where(rare, rare_code, np.searchsorted(kept, categories))
+                categories, codes = kept, remap[codes]
+                self.rare_codes[col] = rare_code
+
+        self.categories[col] = categories
+        return codes.astype(np.int64)
+
+    def _codes(self, col, series):
+        """학습 때의 범주 목록으로 번호를 매깁니다. (없던 값: 희귀 범주가 있으면 그 번호, 아니면 -1)"""
+        categories = self.categories[col]
+        raw_codes, uniques = pd.factorize(series, use_na_sentinel=False)
+        labels = np.array([str(value) for value in uniques], dtype=object)
+        unseen = self.rare_codes.get(col, -1)
+        if not len(categories):
+            return np.full(len(series), unseen, dtype=np.int64)
+        positions = np.minimum(np.searchsorted(categories, labels), len(categories) - 1)
+        found = categories[positions] == labels
+        return np.where(found, positions, unseen).astype(np.int64)[raw_codes]
+
+    def _fit_target(self, codes, y, fit_rows, is_regression):
+        if is_regression:
+            target_type = 'continuous'
+        else:
+            target_type = 'binary' if len(np.unique(y)) <= 2 else 'multiclass'
+        matrix = np.column_stack([codes[col] for col in self.target_columns])
+        rows = np.arange(len(matrix)) if fit_rows is None else np.asarray(fit_rows)
+
+        # 교차 적합 fold 수: 기본 5, 데이터가 작으면 줄임 (분류는 가장 많은 클래스의 행 수까지)
+        folds = min(5, len(rows) if is_regression else np.unique(y[rows], return_counts=True)[1].max())
+        if folds < 2:
+            raise EncodingError("target 인코딩을 하기에는 학습 데이터가 너무 적습니다.")
+        splitter = (KFold if is_regression else StratifiedKFold)(n_splits=folds, shuffle=True, random_state=42)
+        self.target_encoder = TargetEncoder(target_type=target_type, cv=splitter)
+        # 💡 학습 행은 교차 적합한 값(fit_transform)을, 나머지 행은 학습 행 전체의 평균(transform)을 씁니다.
+        fitted = self.target_encoder.fit_transform(matrix[rows], y[rows])
+        encoded = np.empty((len(matrix), fitted.shape[1]))
+        encoded[rows] = fitted
+        others = np.setdiff1d(np.arange(len(matrix)), rows)
+        if len(others):
+            encoded[others] = self.target_encoder.transform(matrix[others])
+        return encoded
+
+    def _assemble(self, X, codes, target_encoded):
+        """원래 컬럼 순서대로 모델 입력 컬럼을 만듭니다."""
+        onehot = set(self.onehot_columns)
+        target_names = self._target_names()
+        columns = {}
+        # target_encoded의 열은 target_columns 순서(= 원래 컬럼 순서)대로 나옵니다.
+        target_position = 0
+        for col in self.feature_columns:
+            if col in self.target_columns:
+                for name in target_names[col]:
+                    columns[name] = target_encoded[:, target_position]
+                    target_position += 1
+            elif col in onehot:
+                for k, category in enumerate(self.categories[col]):
+                    columns[f"{col}={category}"] = (codes[col] == k).astype(np.uint8)
+            elif col in codes:
+                columns[col] = _as_category(codes[col], len(self.categories[col]))
+            else:
+                columns[col] = X[col]
+        return pd.DataFrame(columns, index=X.index)
+
+    def _target_names(self):
+        """target 인코딩 컬럼 -> 출력 컬럼 이름 (다중 분류는 클래스마다 하나씩)"""
+        if not self.target_columns:
+            return {}
+        per_column = len(self.target_encoder.get_feature_names_out()) // len(self.target_columns)
+        if per_column == 1:
+            return {col: [col] for col in self.target_columns}
+        return {col: [f"{col}_{cls}" for cls in self.target_encoder.classes_] for col in self.target_columns}
+
+    @staticmethod
+    def _mode(series, required):
+        """최빈값. (값이 하나도 없는 컬럼은 required일 때만 오류)"""
+        modes = series.mode()
+        if required:
+            return modes[0]
+        return modes.iloc[0] if len(modes) else None
+
+
+def _as_category(codes, n_categories):
+    """번호 배열을 category dtype으로 (값은 번호 그대로 -1 ~ n-1, 내부 저장은 가장 작은 정수형)"""
+    return pd.Categorical.from_codes(codes + 1, categories=pd.RangeIndex(-1, n_categories))
@@ -0,0 +1,175 @@
+# backend/core/events.py
+
+"""
+진행 이벤트 스트림 (Server-Sent Events, text/event-stream).
+
+기존 뷰(FileUploadView 등)는 결과가 다 만들어질 때까지 워커 스레드를 붙잡고, 클라이언트는 끝날 때까지 아무것도 받지 못합니다.
+비동기 엔드포인트(/upload/events/, /process/events/, /train/events/, core/views.py)는 같은 요청 본문을 받아
+기존 뷰를 실행 풀(executor)에서 돌리고, 그동안 진행 이벤트를 흘려보낸 뒤 마지막에 기존 뷰의 응답 본문을 보냅니다.
+
+- 이벤트 (data는 한 줄 JSON)
+  stage: 단계 시작/끝 {name, seconds} (core/metrics.py의 parse / ingest / profile / action / serialize ... 단계)
+  progress: 읽은 바이트(bytes, totalBytes), 처리한 행(rows), 프로파일링한 컬럼(columns, totalColumns),
+            학습 진행률(percent, message: 학습한 나무 수 등)
+  result: {status, body: 기존 뷰의 응답 본문}, error: {status, error} (학습 작업 실패는 {error, body: 작업 상태})
+- 동기 코드는 emit(event, **data)로 이벤트를 보냅니다. 이벤트 스트림이 없는 요청(기존 뷰)에서는 아무것도 하지 않습니다.
+  💡 스트림은 contextvars로 전달하므로 함수 인자로 넘기지 않아도 됩니다. (core/metrics.py의 범위와 같은 방식)
+- 💡 ASGI 서버(backend_project/asgi.py)에서는 이벤트를 기다리는 동안 스레드를 쓰지 않으므로,
+  느린 클라이언트가 많아도 실행 풀의 WORKERS개 스레드만 CPU 작업을 합니다. (WSGI에서도 동작하지만 요청마다 스레드 하나)
+- 학습은 작업 큐(core/jobs.py)가 실행하므로 작업 상태(TrainingJob)를 JOB_POLL_SECONDS 간격으로 읽어 바뀔 때마다 보냅니다.
+  (다른 워커 프로세스의 작업도 볼 수 있음)
+- HEARTBEAT_SECONDS 동안 보낼 이벤트가 없으면 주석(: keepalive)을 보내 프록시가 연결을 끊지 않게 합니다.
+- 설정: settings.SERVER_EVENTS
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.http import StreamingHttpResponse
+
+logger = logging.getLogger(__name__)
+
+_listener = contextvars.ContextVar('event_listener', default=None)
+_KEEPALIVE = ": keepalive\n\n"
+_DONE = object()
+
+
+def emit(event, **data):
+    """현재 요청의 이벤트 스트림에 이벤트를 보냅니다. (스트림이 없으면 아무것도 하지 않음)"""
+    listener = _listener.get()
+    if listener is not None:
+        listener(event, data)
+
+
+def format_event(event, data):
+    """SSE 형식의 이벤트 하나"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+def event_stream_response(events):
+    """(이벤트 이름, data) 비동기 생성기 -> text/event-stream 응답 (None은 keepalive)"""
+    async def body():
+        async for item in events:
+            yield _KEEPALIVE if item is None else format_event(*item)
+
+    response = StreamingHttpResponse(body(), content_type='text/event-stream; charset=utf-8')
+    response['Cache-Control'] = 'no-cache'
+    # 💡 nginx 등 리버스 프록시가 이벤트를 모아서 보내지 않도록 합니다.
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+async def run_view(view, request, **kwargs):
+    """
+    동기 뷰(DRF APIView.as_view())를 실행 풀에서 실행하면서, 그동안 emit된 이벤트와 마지막 결과(result / error)를 내보냅니다.
+    💡 뷰의 응답은 이벤트 스트림이 아니라 JSON으로 만들도록 Accept 헤더를 바꿔서 실행합니다.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+
+    def listener(event, data):
+        loop.call_soon_threadsafe(queue.put_nowait, (event, data))
+
+    def call():
+        request.META['HTTP_ACCEPT'] = 'application/json'
+        try:
+            response = view(request, **kwargs)
+            if hasattr(response, 'render'):
+                response.render()
+            return response
+        finally:
+            # 실행 풀 스레드에서는 요청 종료 신호가 없으므로 DB 연결을 직접 정리합니다.
+            close_old_connections()
+
+    # 요청의 계측 범위(core/metrics.py)도 함께 넘어가도록 현재 컨텍스트를 복사해서 실행합니다.
+    # 💡 MetricsMiddleware가 스트림 본문을 보내는 동안 범위를 다시 열어 두므로(metrics.resume), 이 생성기 안에서는
+    #    요청의 범위가 현재 범위입니다. (응답을 돌려준 시점에 범위가 닫히면 단계가 endpoint="none"으로 기록됨)
+    context = contextvars.copy_context()
+    context.run(_listener.set, listener)
+    future = loop.run_in_executor(_get_executor(), context.run, call)
+    future.add_done_callback(lambda _: queue.put_nowait((_DONE, None)))
+
+    async for item in _with_heartbeat(queue):
+        if item is not None and item[0] is _DONE:
+            break
+        yield item
+
+    try:
+        response = future.result()
+    except Exception as e:
+        logger.exception("이벤트 스트림 요청 처리 중 오류: %s", request.path)
+        yield 'error', {'status': 500, 'error': f"요청 처리 중 오류 발생: {str(e)}"}
+        return
+    try:
+        body = json.loads(response.content)
+    except ValueError:
+        body = response.content.decode('utf-8', errors='replace')
+    if response.status_code >= 400:
+        error = body.get('error') if isinstance(body, dict) else None
+        yield 'error', {'status': response.status_code, 'error': error or body}
+    else:
+        yield 'result', {'status': response.status_code, 'body': body}
+
+
+async def job_events(job_id):
+    """학습 작업의 상태/진행률이 바뀔 때마다 progress 이벤트를, 끝나면 result(또는 error) 이벤트를 내보냅니다."""
+    # 💡 이 모듈은 프로세스 풀 워커(core/parallel.py 등)에서도 import되므로 모델은 여기서 불러옵니다.
+    from .models import TrainingJob
+
+    config = settings.SERVER_EVENTS
+    last = None
+    last_sent = time.monotonic()
+    while True:
+        job = await sync_to_async(TrainingJob.objects.filter(pk=job_id).first)()
+        if job is None:
+            yield 'error', {'status': 404, 'error': "학습 작업을 찾을 수 없습니다."}
+            return
+        state = (job.status, job.progress, job.message)
+        if state != last:
+            last = state
+            last_sent = time.monotonic()
+            yield 'progress', {'jobId': str(job.id), 'status': job.status,
+                               'percent': job.progress, 'message': job.message}
+        if job.status in (TrainingJob.SUCCEEDED, TrainingJob.FAILED, TrainingJob.CANCELLED):
+            if job.status == TrainingJob.SUCCEEDED:
+                yield 'result', {'status': 200, 'body': job.to_dict()}
+            else:
+                yield 'error', {'error': job.error or job.message, 'body': job.to_dict()}
+            return
+        if time.monotonic() - last_sent >= config['HEARTBEAT_SECONDS']:
+            last_sent = time.monotonic()
+            yield None
+        await asyncio.sleep(config['JOB_POLL_SECONDS'])
+
+
+async def _with_heartbeat(queue):
+    """큐의 항목을 내보내고, HEARTBEAT_SECONDS 동안 아무 항목이 없으면 None(keepalive)을 내보냅니다."""
+    heartbeat = settings.SERVER_EVENTS['HEARTBEAT_SECONDS']
+    while True:
+        try:
+            yield await asyncio.wait_for(queue.get(), timeout=heartbeat)
+        except asyncio.TimeoutError:
+            yield None
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """이벤트 스트림 요청의 동기 뷰를 실행하는 스레드 풀 (워커 단위 싱글톤)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=settings.SERVER_EVENTS['WORKERS'],
+                                               thread_name_prefix='event-view')
+    return _executor
@@ -0,0 +1,268 @@
+# backend/core/incremental.py
+
+"""
+조각 단위(out-of-core) 학습.
+
+기본 학습(core/training.py)은 데이터셋 전체를 DataFrame으로 불러온 뒤 인코딩한 X, 학습/평가용 X_train/X_test를
+따로 만들기 때문에 메모리보다 큰 데이터셋은 학습할 수 없습니다.
+조각 단위 학습은 저장된 Arrow 파일(메모리 매핑)에서 CHUNK_ROWS행씩 읽어 partial_fit을 지원하는 모델로 학습합니다.
+메모리는 조각 크기(와 범주형 컬럼의 범주 수)에만 비례합니다.
+
+- 모델: sgd(SGDClassifier(로지스틱 손실) / SGDRegressor), nb(GaussianNB, 분류만), mlp(MLPClassifier / MLPRegressor,
+  조각 안에서 미니배치 단위로 학습)
+- 진행 순서 (데이터를 여러 번 훑음)
+  1. 통계: 목표 변수의 타입/클래스, 특성 대체값/범주 목록 (TabularPreprocessor.fit_chunks)
+  2. 표준화: 학습 행으로 StandardScaler.partial_fit (SGD/MLP는 특성의 크기에 민감)
+  3. 학습: EPOCHS번 반복. 조각마다 학습 행을 섞어 partial_fit
+  4. 평가: 평가 행의 예측으로 정확도 / R2, MSE를 조각마다 누적 (예측값을 모아 두지 않음)
+- 평가 행(holdout): 행 번호로 정한 난수가 TEST_SIZE 미만인 행. 💡 조각 크기와 관계없이 매번 같은 행이 평가 행입니다.
+- 학습된 모델은 Pipeline(StandardScaler, 모델)로 저장되므로 예측(PredictView)은 기본 학습 모델과 같습니다.
+- 설정: settings.INCREMENTAL_TRAINING
+"""
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from sklearn.linear_model import SGDClassifier, SGDRegressor
+from sklearn.naive_bayes import GaussianNB
+from sklearn.neural_network import MLPClassifier, MLPRegressor
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+from . import columnar
+from .encoding import TabularPreprocessor, id_like_columns
+from .metrics import stage
+from .training import FittedModel, TrainingError, describe, encoding_options, estimator_name, metric_summary
+
+MODELS = ('sgd', 'nb', 'mlp')
+
+# 결과에 보여 줄 실제값/예측값 샘플 수 (training.describe와 같음)
+_SAMPLE_SIZE = 10
+# 수치형 목표 변수를 분류로 볼 최대 고유값 수 (training.prepare와 같음)
+_MAX_CLASSES = 20
+
+
+def train(path, target_col, model_name='sgd', progress=None, encoding=None):
+    """
+    path(저장된 데이터셋 파일)로 model_name 모델을 조각 단위로 학습합니다.
+    반환: (training.train과 같은 형식의 결과 + 조각 정보(incremental), FittedModel)
+    """
+    progress = progress or (lambda percent, message: None)
+    if model_name not in MODELS:
+        raise TrainingError(f"조각 단위 학습을 지원하지 않는 모델입니다: {model_name} ({', '.join(MODELS)})")
+    if not columnar.is_arrow(path):
+        raise TrainingError("조각 단위 학습은 Arrow 형식으로 저장된 데이터셋만 지원합니다.")
+    config = settings.INCREMENTAL_TRAINING
+    table = columnar.open_table(path)
+    if target_col not in table.schema.names:
+        raise TrainingError(f"목표 컬럼 '{target_col}'을 찾을 수 없습니다.")
+    columns = [col for col in table.schema.names if col not in id_like_columns(table.schema.names) or col == target_col]
+    reader = _ChunkReader(table.select(columns), target_col, config['CHUNK_ROWS'], config['TEST_SIZE'])
+
+    # 1. 목표 변수 / 특성 통계
+    progress(5, "데이터 통계 계산 중")
+    target = _TargetStats(target_col)
+    preprocessor = TabularPreprocessor(**encoding_options(encoding))
+    with stage('encode'):
+        preprocessor.fit_chunks(target.observe(chunk) for chunk in reader.frames(progress, 5, 15))
+    is_regression, le_y, classes = target.resolve()
+    if not is_regression and len(classes) < 2:
+        raise TrainingError("분류 학습에는 목표 변수의 값이 두 종류 이상 필요합니다.")
+    if is_regression and model_name == 'nb':
+        raise TrainingError("나이브 베이즈(nb)는 분류 문제에만 쓸 수 있습니다.")
+
+    # 2. 표준화 (학습 행)
+    scaler = StandardScaler()
+    train_rows = test_rows = 0
+    for X, y, holdout in reader.batches(preprocessor, le_y, progress, 15, 20, "특성 표준화 중"):
+        train_rows += int((~holdout).sum())
+        test_rows += int(holdout.sum())
+        if (~holdout).any():
+            scaler.partial_fit(X[~holdout])
+    if not train_rows or not test_rows:
+        raise TrainingError("학습 행 또는 평가 행이 없습니다. 데이터가 너무 적습니다.")
+
+    # 3. 학습
+    model = build_model(model_name, is_regression)
+    rng = np.random.RandomState(42)
+    epochs = 1 if model_name == 'nb' else config['EPOCHS']
+    # 💡 조각을 읽고 인코딩하는 시간은 batches()의 encode 단계에 들어가므로, fit/predict 단계는 조각마다 학습/예측만 잽니다.
+    for epoch in range(epochs):
+        start = 20 + 65 * epoch / epochs
+        # 💡 회차마다 조각 순서도 섞습니다. (조각 안의 행은 아래에서 섞음)
+        order = rng.permutation(reader.chunk_count)
+        for X, y, holdout in reader.batches(preprocessor, le_y, progress, start, start + 65 / epochs,
+                                            f"모델 학습 중 ({epoch + 1}/{epochs}회차)", order):
+            rows = np.flatnonzero(~holdout)
+            if not len(rows):
+                continue
+            rows = rng.permutation(rows)
+            with stage('fit'):
+                X_train = scaler.transform(X[rows])
+                if classes is not None:
+                    model.partial_fit(X_train, y[rows], classes=classes)
+                else:
+                    model.partial_fit(X_train, y[rows])
+
+    # 4. 평가 (평가 행)
+    score = _HoldoutScore(is_regression)
+    for X, y, holdout in reader.batches(preprocessor, le_y, progress, 85, 95, "평가 중"):
+        if holdout.any():
+            with stage('predict'):
+                y_pred = model.predict(scaler.transform(X[holdout]))
+            score.update(y[holdout], y_pred)
+
+    metrics, value = score.result()
+    result_data = {
+        "type": "regression" if is_regression else "classification",
+        "model": model_name,
+        "mode": "incremental",
+        "metrics": metrics,
+        "encoding": preprocessor.summary(),
+        "backend": {
+            "name": "incremental",
+            "estimator": estimator_name(model),
+            "trainRows": train_rows,
+            "sampleRows": train_rows,
+            "timeBudget": None,
+        },
+        "incremental": {
+            "chunkRows": config['CHUNK_ROWS'],
+            "chunks": reader.chunk_count,
+            "epochs": epochs,
+            "testRows": test_rows,
+        },
+    }
+    describe(result_data, model, preprocessor.output_columns, target_col, value,
+             np.asarray(score.actual), np.asarray(score.predicted), le_y)
+
+    pipeline = Pipeline([('scale', scaler), ('model', model)])
+    fitted = FittedModel(pipeline, preprocessor, target_col, result_data["type"],
+                         target_classes=le_y.classes_ if le_y is not None else None)
+    return result_data, fitted
+
+
+def build_model(model_name, is_regression):
+    """model_name(sgd / nb / mlp)에 해당하는 partial_fit 지원 모델"""
+    if model_name == 'nb':
+        return GaussianNB()
+    if model_name == 'mlp':
+        if is_regression:
+            return MLPRegressor(hidden_layer_sizes=(64,), random_state=42)
+        return MLPClassifier(hidden_layer_sizes=(64,), random_state=42)
+    if is_regression:
+        return SGDRegressor(random_state=42)
+    # 💡 로지스틱 손실이면 predict_proba를 쓸 수 있습니다.
+    return SGDClassifier(loss='log_loss', random_state=42)
+
+
+class _ChunkReader:
+    """Arrow 테이블을 chunk_rows행씩 DataFrame으로 읽습니다. (조각마다 필요한 행만 메모리에 올림)"""
+
+    def __init__(self, table, target_col, chunk_rows, test_size):
+        self.table = table
+        self.target_col = target_col
+        self.chunk_rows = chunk_rows
+        self.test_size = test_size
+        self.chunk_count = max(1, -(-table.num_rows // chunk_rows))
+
+    def frames(self, progress, start, end, message="데이터 통계 계산 중", order=None):
+        """목표값이 없는 행을 뺀 조각 DataFrame (목표 컬럼 포함, 인덱스는 데이터셋의 행 번호). order: 조각 순서"""
+        order = range(self.chunk_count) if order is None else order
+        for i, chunk in enumerate(order):
+            progress(start + (end - start) * i / self.chunk_count, f"{message} ({i + 1}/{self.chunk_count})")
+            offset = int(chunk) * self.chunk_rows
+            df = columnar.table_to_frame(self.table.slice(offset, self.chunk_rows))
+            df.index = pd.RangeIndex(offset, offset + len(df))
+            yield df[df[self.target_col].notna()]
+
+    def batches(self, preprocessor, le_y, progress, start, end, message, order=None):
+        """조각마다 (인코딩한 특성 행렬, 목표값 배열, 평가 행 여부)"""
+        for df in self.frames(progress, start, end, message, order):
+            with stage('encode'):
+                X = preprocessor.transform(df).to_numpy(dtype=np.float64)
+            y = df[self.target_col]
+            y = le_y.transform(y.astype(str)) if le_y is not None else y.to_numpy()
+            yield X, y, self.holdout(df.index.to_numpy())
+
+    def holdout(self, rows):
+        """행 번호 -> 평가 행 여부 (행 번호로 시드를 정한 난수라서 조각 크기와 관계없음)"""
+        hashed = (rows.astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15)) >> np.uint64(11)
+        return hashed / float(2 ** 53) < self.test_size
+
+
+class _TargetStats:
+    """통계 단계에서 목표 변수의 타입(회귀/분류)과 클래스 목록을 모읍니다. (training.prepare와 같은 기준)"""
+
+    def __init__(self, target_col):
+        self.target_col = target_col
+        self.numeric = None
+        self.is_float = False
+        self.values = set()
+
+    def observe(self, df):
+        """df에서 목표 컬럼을 꺼내 기록하고, 특성 컬럼만 남은 df를 반환합니다."""
+        y = df.pop(self.target_col)
+        if self.numeric is None:
+            self.numeric = pd.api.types.is_numeric_dtype(y)
+            self.is_float = pd.api.types.is_float_dtype(y)
+        if not self.numeric:
+            self.values.update(y.astype(str).unique())
+        elif len(self.values) <= _MAX_CLASSES:
+            self.values.update(y.unique().tolist())
+        return df
+
+    def resolve(self):
+        """
+        (회귀 여부, 문자열 목표값의 LabelEncoder 또는 None, 분류 클래스 목록 또는 None)
+        💡 partial_fit은 첫 조각에 모든 클래스가 없을 수 있으므로 클래스 목록을 미리 넘겨야 합니다.
+        """
+        if self.numeric and (self.is_float or len(self.values) > _MAX_CLASSES):
+            return True, None, None
+        if self.numeric:
+            return False, None, np.array(sorted(self.values))
+        le_y = LabelEncoder()
+        le_y.classes_ = np.array(sorted(self.values), dtype=object)
+        return False, le_y, np.arange(len(le_y.classes_))
+
+
+class _HoldoutScore:
+    """평가 행의 점수를 조각마다 누적합니다. (회귀: R2, MSE / 분류: 정확도)"""
+
+    def __init__(self, is_regression):
+        self.is_regression = is_regression
+        self.count = 0
+        self.correct = 0
+        self.squared_error = 0.0
+        # 목표값의 평균/편차제곱합 (Welford 방식으로 조각마다 합침)
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.actual = []
+        self.predicted = []
+
+    def update(self, y, y_pred):
+        if len(self.actual) < _SAMPLE_SIZE:
+            take = _SAMPLE_SIZE - len(self.actual)
+            self.actual.extend(y[:take])
+            self.predicted.extend(y_pred[:take])
+        n = len(y)
+        if self.is_regression:
+            self.squared_error += float(np.sum((y - y_pred) ** 2))
+            mean = float(np.mean(y))
+            m2 = float(np.sum((y - mean) ** 2))
+            delta = mean - self.mean
+            total = self.count + n
+            self.mean += delta * n / total
+            self.m2 += m2 + delta ** 2 * self.count * n / total
+        else:
+            self.correct += int(np.sum(y == y_pred))
+        self.count += n
+
+    def result(self):
+        """(표시용 성능 지표, 점수)"""
+        if self.is_regression:
+            mse = self.squared_error / self.count
+            r2 = 1 - self.squared_error / self.m2 if self.m2 > 0 else 0.0
+            return metric_summary(True, r2, mse), r2
+        accuracy = self.correct / self.count
+        return metric_summary(False, accuracy), accuracy
@@ -0,0 +1,174 @@
+# backend/core/ingest.py
+
+"""
+대용량 CSV 스트리밍 업로드.
+
+파일 전체를 메모리에 올리지 않고 청크 단위로 읽어 컬럼형(Arrow IPC) 파일에 바로 쓰고,
+기초 통계량/품질 정보도 청크마다 누적 계산합니다. 메모리 사용량은 파일 크기가 아니라
+청크 크기(STREAM_CHUNK_ROWS)에 비례합니다.
+
+💡 첫 번째 청크로 컬럼 타입을 확정합니다.
+   - 정수 컬럼은 이후 청크에 결측치가 나올 수 있으므로 실수(float64)로 저장합니다.
+   - 수치형으로 확정된 컬럼에 이후 숫자가 아닌 값이 나오면 결측치(NaN)로 처리합니다.
+   - 첫 청크에서 값이 모두 비어 있던 컬럼은 문자열 컬럼으로 저장합니다.
+"""
+
+import codecs
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import columnar, events
+from .columnar import pa
+from .profiling import NUMERIC, build_analysis, merge_profiles, profile_chunk, quantile_summary
+
+ENCODING_SAMPLE_BYTES = 64 * 1024
+PREVIEW_ROWS = 100
+
+
+def detect_encoding(file_buffer, sample_size=ENCODING_SAMPLE_BYTES):
+    """
+    파일 앞부분 샘플만 디코딩해서 인코딩(utf-8 / cp949)을 판별합니다.
+    (전체를 utf-8로 파싱했다가 실패하면 cp949로 다시 파싱하던 방식 대체)
+    """
+    position = file_buffer.tell()
+    sample = file_buffer.read(sample_size)
+    file_buffer.seek(position)
+
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    try:
+        # final=False: 샘플 끝에서 잘린 멀티바이트 문자는 오류로 보지 않습니다.
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'cp949'
+
+
+def stream_csv(file_buffer, path, chunk_rows, epsilon=None):
+    """
+    CSV를 chunk_rows 행씩 읽어 path(Arrow IPC 파일)에 쓰고, (분석 결과 dict, 컬럼 프로파일 목록)을 반환합니다.
+    샘플 뒤쪽에서 utf-8이 아닌 바이트가 나오면 cp949로 한 번 다시 읽습니다.
+    epsilon을 지정하면 분위수 스케치를 청크마다 누적하므로 컬럼을 다시 읽지 않습니다.
+    """
+    encoding = detect_encoding(file_buffer)
+    try:
+        preview, profiles, total_rows = _stream_csv(file_buffer, path, chunk_rows, encoding, epsilon)
+    except UnicodeDecodeError:
+        if encoding == 'cp949':
+            raise
+        file_buffer.seek(0)
+        preview, profiles, total_rows = _stream_csv(file_buffer, path, chunk_rows, 'cp949', epsilon)
+    return _finish_analysis(path, preview, profiles, total_rows), profiles
+
+
+def analyze_arrow_file(path, chunk_rows, epsilon=None):
+    """
+    이미 저장된 Arrow IPC 파일을 레코드 배치 단위로 읽어 (분석 결과, 컬럼 프로파일 목록)을 만듭니다.
+    (같은 대용량 파일을 다시 올린 경우, 전체를 메모리에 올리지 않고 통계만 다시 계산)
+    """
+    table = columnar.open_table(path)
+    preview = None
+    profiles = None
+    rows = 0
+    for batch in table.to_batches(max_chunksize=chunk_rows):
+        chunk = batch.to_pandas()
+        if preview is None:
+            preview = chunk.head(PREVIEW_ROWS)
+        profiles = merge_profiles(profiles, profile_chunk(chunk, epsilon))
+        rows += len(chunk)
+        events.emit('progress', stage='profile', rows=rows, totalRows=table.num_rows)
+    if preview is None:
+        preview = table.schema.empty_table().to_pandas()
+        profiles = profile_chunk(preview, epsilon)
+    return _finish_analysis(path, preview, profiles, table.num_rows), profiles
+
+
+def _stream_csv(file_buffer, path, chunk_rows, encoding, epsilon):
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    writer = None
+    schema = None
+    profiles = None
+    preview = None
+    total_rows = 0
+
+    try:
+        reader = pd.read_csv(file_buffer, encoding=encoding, chunksize=chunk_rows)
+        for chunk in reader:
+            # 💡 [수정 1] 데이터셋 특화 전처리: '?'를 NaN(결측치)으로 변환
+            chunk = chunk.replace('?', np.nan)
+
+            if schema is None:
+                schema = _infer_schema(chunk)
+                writer = pa.ipc.new_file(str(tmp_path), schema)
+                preview = chunk.head(PREVIEW_ROWS)
+
+            chunk = _conform_chunk(chunk, schema)
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+            profiles = merge_profiles(profiles, profile_chunk(chunk, epsilon))
+            total_rows += len(chunk)
+            # 💡 이벤트 스트림 요청이면 청크마다 읽은 바이트/처리한 행 수를 보냅니다. (core/events.py)
+            events.emit('progress', stage='ingest', bytes=file_buffer.tell(), rows=total_rows)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        columnar._unlink(tmp_path)
+        raise
+
+    if writer is None:
+        raise ValueError("CSV 파일에 데이터가 없습니다.")
+    writer.close()
+    os.replace(tmp_path, path)
+    return preview, profiles, total_rows
+
+
+def _finish_analysis(path, preview, profiles, total_rows):
+    # 스케치가 없으면(정확 모드) 사분위수/이상치는 컬럼 하나씩 mmap으로 다시 읽어 계산합니다.
+    # (한 번에 메모리에 올라가는 양은 컬럼 하나 분량)
+    table = columnar.open_table(path)
+    quantiles = {}
+    for profile in profiles:
+        summary = profile.quantile_summary()
+        if summary is None and profile.kind == NUMERIC:
+            values = table.column(profile.name).to_numpy(zero_copy_only=False)
+            summary = quantile_summary(values)
+        elif summary is None and pa.types.is_string(table.schema.field(profile.name).type):
+            values = pd.to_numeric(table.column(profile.name).to_pandas(), errors='coerce')
+            summary = quantile_summary(values.to_numpy())
+        if summary is not None:
+            quantiles[profile.name] = summary
+
+    return build_analysis(preview, profiles, quantiles, total_rows)
+
+
+def _infer_schema(chunk):
+    """첫 청크의 타입으로 전체 파일의 Arrow 스키마를 정합니다."""
+    fields = []
+    for col in chunk.columns:
+        series = chunk[col]
+        if pd.api.types.is_bool_dtype(series):
+            arrow_type = pa.bool_()
+        elif pd.api.types.is_numeric_dtype(series) and series.notna().any():
+            arrow_type = pa.float64()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(str(col), arrow_type))
+    return pa.schema(fields)
+
+
+def _conform_chunk(chunk, schema):
+    """청크의 각 컬럼을 확정된 스키마 타입에 맞춥니다."""
+    chunk.columns = schema.names
+    for field in schema:
+        series = chunk[field.name]
+        if pa.types.is_floating(field.type):
+            if not pd.api.types.is_float_dtype(series):
+                chunk[field.name] = pd.to_numeric(series, errors='coerce').astype(np.float64)
+        elif pa.types.is_boolean(field.type):
+            if not pd.api.types.is_bool_dtype(series):
+                chunk[field.name] = series.map({True: True, False: False, 'True': True, 'False': False}).astype('boolean')
+        elif pd.api.types.infer_dtype(series, skipna=True) not in ('string', 'empty'):
+            chunk[field.name] = series.astype(object).where(series.isna(), series.astype(str))
+    return chunk
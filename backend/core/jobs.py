@@ -0,0 +1,215 @@
+# backend/core/jobs.py
+
+"""
+학습 작업 큐 (비동기 모델 학습).
+
+SVM/GradientBoosting을 큰 데이터로 학습하면 수 분이 걸리므로, 요청 스레드에서 학습하지 않고
+작업(TrainingJob)만 만들어 작업 ID를 바로 돌려줍니다.
+
+- 실행: 크기가 제한된 프로세스 내 스레드 풀(settings.TRAINING['WORKERS'])에서 차례로 실행합니다.
+  대기 작업이 MAX_PENDING개를 넘으면 QueueFull. (업로드/미리보기 요청 스레드는 학습을 기다리지 않음)
+- 상태: 상태/진행률/결과를 TrainingJob 행(SQLite)에 기록하므로 다른 요청에서 폴링할 수 있습니다.
+- 취소: 대기 중인 작업은 바로 취소되고, 실행 중인 작업은 다음 진행률 보고 시점에 멈춥니다.
+  💡 sklearn의 fit 한 번(SVM, 선형 모델)은 중간에 멈출 수 없으므로 그 fit이 끝난 뒤 취소됩니다.
+- 학습된 모델은 모델 레지스트리(core/registry.py)에 저장되고, 결과에 modelId/modelVersion이 붙습니다.
+  (비교 모드(core/compare.py)는 리더보드의 모델마다)
+- 서버가 재시작되면 메모리의 큐는 사라지므로, 끝나지 않은 채 남은 작업은 조회할 때 실패로 표시합니다.
+"""
+
+import os
+import socket
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.utils import timezone
+
+from . import compare, incremental, metrics, training, tuning
+from .models import TrainingJob
+from .registry import get_model_registry
+
+logger = logging.getLogger(__name__)
+
+# 진행률을 DB에 기록하는 최소 간격 (초)
+_PROGRESS_INTERVAL = 0.5
+_OWNER = f"{socket.gethostname()}:{os.getpid()}"
+
+_executor = None
+_lock = threading.Lock()
+# 이 프로세스에서 대기/실행 중인 작업: job_id -> (Future, 취소 Event)
+_active = {}
+
+
+class QueueFull(Exception):
+    """대기 중인 학습 작업이 너무 많은 경우"""
+
+
+class JobCancelled(Exception):
+    """작업이 취소되어 학습을 중단함"""
+
+
+def submit(load_dataframe, params):
+    """
+    학습 작업을 큐에 넣고 TrainingJob을 반환합니다.
+    - load_dataframe: 워커 스레드에서 학습할 DataFrame을 불러오는 함수 (불러올 수 없으면 TrainingError)
+    - params: {'dataset_id', 'target', 'model_name'} (튜닝 모드는 'tune', 'cv' 추가)
+              또는 비교 모드 {'dataset_id', 'target', 'models'}. 특성 인코딩 설정은 'encoding',
+              큰 데이터 학습 설정(backend / sample_rows / time_budget)은 'scaling' (선택)
+              조각 단위 학습 모드는 'incremental' 추가 (load_dataframe이 DataFrame 대신 데이터셋 파일 경로를 반환)
+    """
+    config = settings.TRAINING
+    with _lock:
+        if len(_active) >= config['WORKERS'] + config['MAX_PENDING']:
+            raise QueueFull()
+        job = TrainingJob.objects.create(params=params, owner=_OWNER, message="대기 중")
+        cancel_event = threading.Event()
+        future = _get_executor(config['WORKERS']).submit(_run, job.id, load_dataframe, params, cancel_event)
+        _active[job.id] = (future, cancel_event)
+    return job
+
+
+def get(job_id):
+    """TrainingJob을 반환합니다. (없으면 TrainingJob.DoesNotExist)"""
+    job = TrainingJob.objects.get(pk=job_id)
+    if job.status in TrainingJob.ACTIVE_STATUSES and _is_orphan(job):
+        _finish(job.id, TrainingJob.FAILED, error="서버가 재시작되어 학습이 중단되었습니다. 다시 요청해주세요.")
+        job.refresh_from_db()
+    return job
+
+
+def cancel(job_id):
+    """작업 취소를 요청하고 TrainingJob을 반환합니다. 이미 끝난 작업은 그대로 반환합니다."""
+    job = get(job_id)
+    if job.status not in TrainingJob.ACTIVE_STATUSES:
+        return job
+
+    TrainingJob.objects.filter(pk=job.id).update(cancel_requested=True, message="취소 요청됨")
+    with _lock:
+        future, cancel_event = _active.get(job.id, (None, None))
+        if cancel_event is not None:
+            cancel_event.set()
+        # 아직 시작하지 않은 작업은 큐에서 바로 뺍니다.
+        if future is not None and future.cancel():
+            _active.pop(job.id, None)
+            _finish(job.id, TrainingJob.CANCELLED, message="취소됨")
+    job.refresh_from_db()
+    return job
+
+
+@metrics.scope('training')
+def _run(job_id, load_dataframe, params, cancel_event):
+    """
+    (워커 스레드) 작업 하나를 실행하고 결과/오류를 기록합니다.
+    💡 요청과 별개의 계측 범위(endpoint="training")에서 인코딩/학습/평가 시간을 잽니다. (core/metrics.py)
+    """
+    close_old_connections()
+    try:
+        if cancel_event.is_set():
+            raise JobCancelled()
+        TrainingJob.objects.filter(pk=job_id).update(
+            status=TrainingJob.RUNNING, started_at=timezone.now(), message="데이터 불러오는 중")
+
+        with metrics.stage('load'):
+            df = load_dataframe()
+        reporter = _ProgressReporter(job_id, cancel_event)
+        registry = get_model_registry()
+        if params.get('models'):
+            # 비교 모드: 여러 모델을 한 번에 학습하고, 학습에 성공한 모델을 모두 레지스트리에 저장합니다.
+            result, fitted_models = compare.compare(df, params['target'], params['models'], progress=reporter,
+                                                    encoding=params.get('encoding'), scaling=params.get('scaling'))
+            for row in result['leaderboard']:
+                fitted = fitted_models.get(row['model'])
+                if fitted is None:
+                    continue
+                model_params = {'dataset_id': params['dataset_id'], 'target': params['target'],
+                                'model_name': row['model'], 'encoding': params.get('encoding'),
+                                'scaling': params.get('scaling')}
+                entry = registry.register(fitted, model_params, row['metrics'], job_id=job_id)
+                row.update(modelId=str(entry.id), modelVersion=entry.version)
+        else:
+            if params.get('incremental'):
+                # 조각 단위 학습 모드: 데이터셋 파일을 조각씩 읽어 학습합니다. (df는 파일 경로)
+                result, fitted = incremental.train(df, params['target'], params['model_name'], progress=reporter,
+                                                   encoding=params.get('encoding'))
+            elif params.get('tune'):
+                # 튜닝 모드: 교차 검증으로 하이퍼파라미터를 고른 뒤 그 설정으로 학습합니다.
+                result, fitted = tuning.tune(df, params['target'], params['model_name'],
+                                             folds=params.get('cv'), progress=reporter, encoding=params.get('encoding'),
+                                             scaling=params.get('scaling'))
+                params = dict(params, model_params=result['bestParams'])
+            else:
+                result, fitted = training.train(df, params['target'], params['model_name'], progress=reporter,
+                                                encoding=params.get('encoding'), scaling=params.get('scaling'))
+            # 💡 학습된 모델은 레지스트리에 저장하여 다시 학습하지 않고 예측(PredictView)에 사용합니다.
+            entry = registry.register(fitted, params, result['metrics'], job_id=job_id)
+            result.update(modelId=str(entry.id), modelVersion=entry.version)
+        _finish(job_id, TrainingJob.SUCCEEDED, message="완료", result=result)
+
+    except JobCancelled:
+        _finish(job_id, TrainingJob.CANCELLED, message="취소됨")
+    except training.TrainingError as e:
+        _finish(job_id, TrainingJob.FAILED, error=str(e))
+    except Exception as e:
+        logger.exception("학습 작업 %s 실패", job_id)
+        _finish(job_id, TrainingJob.FAILED, error=f"학습 중 오류 발생: {str(e)}")
+    finally:
+        with _lock:
+            _active.pop(job_id, None)
+        # 워커 스레드의 DB 연결은 요청/응답 주기 밖에 있으므로 직접 닫습니다.
+        connection.close()
+
+
+class _ProgressReporter:
+    """training.train의 progress 콜백: 진행률을 기록하고, 취소 요청이 있으면 JobCancelled를 발생시킵니다."""
+
+    def __init__(self, job_id, cancel_event):
+        self.job_id = job_id
+        self.cancel_event = cancel_event
+        self.last_write = 0.0
+
+    def __call__(self, percent, message):
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+        # 💡 부스팅 단계마다 호출되므로 SQLite 쓰기는 일정 간격으로만 합니다.
+        now = time.monotonic()
+        if now - self.last_write >= _PROGRESS_INTERVAL:
+            self.last_write = now
+            TrainingJob.objects.filter(pk=self.job_id).update(progress=int(percent), message=message)
+
+
+def _finish(job_id, status, message='', error='', result=None):
+    fields = {'status': status, 'message': message, 'error': error, 'finished_at': timezone.now()}
+    if status == TrainingJob.SUCCEEDED:
+        fields.update(progress=100, result=result)
+    TrainingJob.objects.filter(pk=job_id).update(**fields)
+
+
+def _is_orphan(job):
+    """
+    이 서버에서 실행하던 프로세스가 사라진(재시작된) 작업인지 확인합니다.
+    💡 다른 호스트/다른 살아 있는 프로세스의 작업은 그 프로세스가 실행 중일 수 있으므로 건드리지 않습니다.
+    """
+    host, _, pid = job.owner.rpartition(':')
+    if host != socket.gethostname() or not pid.isdigit():
+        return False
+    if job.owner == _OWNER:
+        return job.id not in _active
+    if os.name != 'posix':
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        return False
+    return False
+
+
+def _get_executor(workers):
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='training')
+    return _executor
@@ -0,0 +1,384 @@
+# backend/core/lazy.py
+
+"""
+지연 실행(lazy) 전처리 엔진 (Polars).
+
+preprocessing.run(pandas 엔진)은 Stage마다 새 DataFrame을 만들고, cap_outliers는 컬럼마다
+임시 배열을 만듭니다. Polars가 설치되어 있으면 파이프라인 단계들을 LazyFrame 논리 계획으로
+쌓아 두었다가, 결과가 필요한 시점(미리보기/프로파일링)에 collect() 한 번으로 실행합니다.
+
+- 입력: 저장소의 Arrow IPC 파일을 scan_ipc로 읽습니다. pandas DataFrame을 만들지 않습니다.
+  (컬럼을 공유하는 버전의 매니페스트는 mmap한 Table을 복사 없이 넘겨받습니다. core/columnar.py)
+- drop_na / drop_outliers -> filter, fill_na -> coalesce(fill_null), cap_outliers -> when/then으로
+  변환되고, 조건 합치기/pushdown 같은 계획 최적화와 멀티스레드 실행은 Polars가 합니다.
+- 결과 의미는 pandas 엔진과 같습니다. (수치형 변환 여부는 pd.to_numeric 기준으로 판정)
+- 메모리 최적화(core/memory.py)한 데이터셋: category / Arrow 문자열 컬럼은 계획 안에서 문자열 컬럼으로 다루고
+  결과를 원래 dtype으로 되돌립니다. int8~int32 / float32 컬럼은 Polars에서도 같은 dtype입니다.
+- Polars가 없거나 계획으로 표현할 수 없는 데이터/단계(날짜 컬럼, 문자열 컬럼을 숫자로
+  채우기 등)는 Unsupported를 발생시키고, 호출 측에서 pandas 엔진으로 실행합니다.
+"""
+
+import logging
+
+import pandas as pd
+
+from . import columnar, metrics
+from .preprocessing import FILL, FILTER, PipelineError, plan, stage_key
+
+try:
+    import polars as pl
+except ImportError:  # polars는 선택 의존성
+    pl = None
+
+logger = logging.getLogger(__name__)
+
+# 행 번호 컬럼 (삭제된 행을 찾고 pandas 인덱스를 복원할 때 사용)
+# 💡 데이터에 같은 이름의 컬럼이 있으면 겹치지 않을 때까지 앞뒤에 '_'를 붙입니다. (_Layout.row_column)
+ROW_COLUMN = '__row__'
+# pandas 메타데이터의 컬럼 타입 중 Polars와 주고받아도 dtype이 그대로 유지되는 것
+# (메모리 최적화(core/memory.py)로 줄인 int8/int16/int32/float32 포함)
+_SUPPORTED_PANDAS_TYPES = {'int64', 'int32', 'int16', 'int8', 'float64', 'float32', 'bool', 'unicode', 'empty'}
+# 계획 안에서는 문자열 컬럼으로 다루고, 결과를 pandas로 바꿀 때 원래 dtype으로 되돌리는 타입
+# (category, Arrow 문자열(string[pyarrow]은 pandas_type이 object이고 large_string으로 저장됨))
+_RESTORED_PANDAS_TYPES = {'categorical', 'object'}
+
+
+class Unsupported(Exception):
+    """지연 실행 계획으로 표현할 수 없는 파이프라인 (pandas 엔진으로 대체)"""
+
+
+def available():
+    return pl is not None and columnar.pa is not None
+
+
+def run(path, steps, lineage=None):
+    """
+    path(Arrow IPC 파일)에 저장된 데이터셋에 단계들을 적용한 pandas DataFrame을 반환합니다.
+    lineage에는 성공한 경우에만 바뀐 컬럼/삭제된 행을 기록합니다. (Unsupported면 기록 없음)
+    """
+    if not available() or path is None or not columnar.is_arrow(path):
+        raise Unsupported()
+
+    layout = _Layout(path)
+    source = _scan(path, layout)
+    frame = source.with_row_index(layout.row_column)
+    records = []
+    frame, dtypes, null_counts = _normalize(frame, layout, records)
+    for kind, stage_steps in plan(steps):
+        if kind == FILL:
+            frame = _plan_fill(frame, stage_steps, layout, dtypes, null_counts, records)
+        elif kind == FILTER:
+            frame = _plan_filter(frame, stage_steps, layout, dtypes)
+        else:
+            frame, dtypes = _plan_cap_outliers(frame, stage_steps[0], layout, dtypes, records)
+
+    # 💡 여기서 처음으로 데이터를 읽고 계산합니다. (계획 전체를 한 번에 최적화/실행)
+    #    수치형 변환도 같은 계획 안에서 실행되므로 coerce 단계를 따로 재지 않습니다.
+    with metrics.stage('action'):
+        try:
+            result = frame.collect()
+        except pl.exceptions.PolarsError:
+            # 예: 정수 변환 규칙이 pandas와 다른 값 -> pandas 엔진으로 다시 실행
+            raise Unsupported()
+        rows = result.get_column(layout.row_column)
+        df = layout.to_pandas(result, dropped=len(result) < layout.num_rows)
+    logger.debug("지연 실행 완료 (%s): %d -> %d", ', '.join(step.action for step in steps), layout.num_rows, len(df))
+
+    if lineage is not None:
+        for columns, key in records:
+            if isinstance(columns, dict):
+                # cap_outliers: {컬럼명: 값이 잘렸는지 나타내는 임시 컬럼 (None이면 dtype이 바뀐 컬럼)}
+                columns = [col for col, flag in columns.items() if flag is None or _flag(result, flag)]
+            lineage.change(columns, key)
+        if len(result) < layout.num_rows:
+            removed = (source.with_row_index(layout.row_column)
+                       .filter(~pl.col(layout.row_column).is_in(rows.implode()))
+                       .select(layout.columns).collect().to_pandas())
+            lineage.drop_rows(removed, stage_key(steps, None))
+    return df
+
+
+def _flag(result, name):
+    """집계 결과를 모든 행에 붙인 임시 컬럼의 값 (남은 행이 없으면 알 수 없으므로 True)"""
+    return result.is_empty() or bool(result.get_column(name)[0])
+
+
+def _scan(path, layout):
+    categorical = layout.categorical
+    if path.suffix == columnar.ARROW_SUFFIX and not categorical:
+        return pl.scan_ipc(path)
+    table = columnar.open_table(path)
+    # 💡 category 컬럼은 계획 안에서 문자열 컬럼으로 다룹니다. (결과는 _Layout.to_pandas에서 category로 되돌림)
+    #    pandas가 저장한 사전 번호(결측치는 -1)는 Polars가 읽지 못하므로 Arrow에서 문자열로 풀어서 넘깁니다.
+    for col in categorical:
+        table = table.set_column(table.schema.get_field_index(col), col, table.column(col).cast(columnar.pa.string()))
+    return pl.from_arrow(table, rechunk=False).lazy()
+
+
+class _Layout:
+    """Arrow 파일의 pandas 메타데이터 (컬럼명/인덱스). 지원하지 않는 구성이면 Unsupported."""
+
+    def __init__(self, path):
+        table = columnar.open_table(path)
+        schema = table.schema
+        metadata = schema.pandas_metadata or {}
+        self.num_rows = table.num_rows
+
+        index_columns = metadata.get('index_columns', [])
+        if len(index_columns) > 1:
+            raise Unsupported()
+        self.index = index_columns[0] if index_columns else {'kind': 'range', 'start': 0, 'step': 1, 'name': None}
+
+        self.columns = []
+        self.index_name = None
+        # 결과에서 원래 dtype으로 되돌릴 컬럼: 컬럼명 -> pandas dtype (category는 원래 범주 목록 포함)
+        self.restore = {}
+        for column in metadata.get('columns', []):
+            field_name = column['field_name']
+            if isinstance(self.index, str) and field_name == self.index:
+                self.index_name = column['name']
+                continue
+            # 컬럼명이 문자열이 아니거나(숫자 등) dtype이 바뀌는 컬럼은 지원하지 않습니다.
+            if column['name'] != field_name:
+                raise Unsupported()
+            if column['pandas_type'] in _RESTORED_PANDAS_TYPES:
+                arrow_type, types = schema.field(field_name).type, columnar.pa.types
+                if not (types.is_dictionary(arrow_type) and types.is_string(arrow_type.value_type)
+                        or types.is_large_string(arrow_type)):
+                    raise Unsupported()
+                self.restore[field_name] = None
+            elif column['pandas_type'] not in _SUPPORTED_PANDAS_TYPES:
+                raise Unsupported()
+            self.columns.append(field_name)
+        if not self.columns or isinstance(self.index, str) and self.index not in schema.names:
+            raise Unsupported()
+        if self.restore:
+            # 💡 0행 테이블도 사전(범주 목록)은 그대로 있으므로, 데이터를 읽지 않고 원래 dtype을 얻습니다.
+            empty = columnar.table_to_frame(table.select(list(self.restore)).slice(0, 0))
+            self.restore = empty.dtypes.to_dict()
+
+        self.row_column = ROW_COLUMN
+        while self.row_column in schema.names:
+            self.row_column = f"_{self.row_column}_"
+
+    @property
+    def categorical(self):
+        return [col for col, dtype in self.restore.items() if isinstance(dtype, pd.CategoricalDtype)]
+
+    def to_pandas(self, result, dropped):
+        df = result.select(self.columns).to_pandas()
+        for col, dtype in self.restore.items():
+            if result.schema[col] != pl.String:
+                continue  # 수치형으로 바뀐 컬럼
+            if isinstance(dtype, pd.CategoricalDtype):
+                # pandas 엔진(memory.fill_missing)처럼 채운 값 중 범주에 없는 값은 범주 끝에 추가합니다.
+                values = df[col].dropna().unique()
+                added = [value for value in values if value not in dtype.categories]
+                dtype = pd.CategoricalDtype(dtype.categories.append(pd.Index(added, dtype=object)), dtype.ordered)
+            df[col] = df[col].astype(dtype)
+        if isinstance(self.index, str):
+            # 💡 pd.Index(Series, name=None)는 Series 이름(__index_level_0__)을 그대로 쓰므로 이름을 따로 지정합니다.
+            df.index = pd.Index(result.get_column(self.index).to_pandas()).rename(self.index_name)
+        elif not dropped:
+            df.index = pd.RangeIndex(self.index['start'], self.index['start'] + len(df) * self.index['step'],
+                                     self.index['step'], name=self.index.get('name'))
+        else:
+            rows = result.get_column(self.row_column).to_numpy().astype('int64')
+            df.index = pd.Index(self.index['start'] + rows * self.index['step'], name=self.index.get('name'))
+        return df
+
+
+def _missing(name, dtype):
+    expr = pl.col(name).is_null()
+    return expr | pl.col(name).is_nan() if dtype.is_float() else expr
+
+
+def _normalize(frame, layout, records):
+    """
+    preprocessing.normalize_columns와 같은 변환: 빈 문자열 / '?' -> null, 모든 값이 숫자인 문자열 컬럼은 수치형으로.
+    💡 숫자 여부는 한 번의 집계로 후보 컬럼만 고른 뒤, 후보 컬럼의 고유값을 pd.to_numeric으로 확인합니다.
+       (Polars와 pandas의 숫자 파싱 규칙이 조금 다르므로 결과 dtype은 pandas 기준을 따릅니다)
+    """
+    schema = frame.collect_schema()
+    dtypes = {col: schema[col] for col in layout.columns}
+    text_cols = [col for col in layout.columns if dtypes[col] == pl.String]
+
+    cleaned = {col: pl.when(pl.col(col).is_in(['', '?'])).then(None).otherwise(pl.col(col)) for col in text_cols}
+    # 컬럼별 결측치 수와 문자열 컬럼의 숫자 변환 후보 여부를 집계 한 번으로 구합니다.
+    checks = [pl.col(col).null_count().alias(f"{col}\0nulls") for col in layout.columns]
+    for col in text_cols:
+        checks.append(pl.col(col).is_in(['', '?']).any().alias(f"{col}\0blank"))
+        checks.append(cleaned[col].is_not_null().sum().alias(f"{col}\0valid"))
+        checks.append(cleaned[col].str.strip_chars().cast(pl.Float64, strict=False)
+                      .is_not_null().sum().alias(f"{col}\0numeric"))
+    stats = frame.select(checks).collect().row(0, named=True)
+    # 정규화 후의 결측치 수 (빈 문자열 / '?'도 결측치)
+    null_counts = {col: stats[f"{col}\0nulls"] for col in layout.columns}
+    null_counts.update({col: layout.num_rows - stats[f"{col}\0valid"] for col in text_cols})
+
+    exprs = {}
+    for col in layout.columns:
+        if dtypes[col] == pl.Null:
+            # 값이 모두 비어 있는 컬럼은 pd.to_numeric으로 float64(NaN) 컬럼이 됩니다.
+            exprs[col] = pl.col(col).cast(pl.Float64)
+            dtypes[col] = pl.Float64
+            continue
+        if col not in cleaned:
+            continue
+
+        target = None
+        if stats[f"{col}\0valid"] == stats[f"{col}\0numeric"]:
+            target = _numeric_dtype(frame, cleaned[col], has_nulls=null_counts[col] > 0)
+        if target is not None:
+            exprs[col] = cleaned[col].str.strip_chars().cast(target)
+            dtypes[col] = target
+        elif stats[f"{col}\0blank"]:
+            exprs[col] = cleaned[col]
+
+    if exprs:
+        frame = frame.with_columns(expr.alias(col) for col, expr in exprs.items())
+    records.append((list(exprs), 'normalize'))
+    return frame, dtypes, null_counts
+
+
+def _numeric_dtype(frame, cleaned, has_nulls):
+    """후보 컬럼의 고유값을 pd.to_numeric으로 변환해 보고, 변환되면 Polars dtype을 반환합니다. (안 되면 None)"""
+    uniques = frame.select(cleaned.drop_nulls().unique()).collect().to_series().to_list()
+    try:
+        converted = pd.to_numeric(pd.Series(uniques, dtype=object))
+    except (ValueError, TypeError):
+        return None
+    if pd.api.types.is_float_dtype(converted) or (has_nulls and len(uniques)) or not len(uniques):
+        return pl.Float64
+    if converted.dtype == 'int64':
+        return pl.Int64
+    raise Unsupported()  # uint64 등
+
+
+def _numeric_columns(layout, dtypes, columns):
+    """pandas select_dtypes(include=[np.number])와 같은 기준의 수치형 컬럼 (bool 제외)"""
+    numeric = [col for col in layout.columns if dtypes[col].is_numeric()]
+    if columns is None:
+        return numeric
+    _check_columns(layout, columns)
+    not_numeric = [col for col in columns if col not in numeric]
+    if not_numeric:
+        raise PipelineError(f"수치형 컬럼이 아닙니다: {', '.join(map(str, not_numeric))}")
+    return list(columns)
+
+
+def _check_columns(layout, columns):
+    missing = [col for col in columns if col not in layout.columns]
+    if missing:
+        raise PipelineError(f"컬럼을 찾을 수 없습니다: {', '.join(map(str, missing))}")
+
+
+def _plan_fill(frame, steps, layout, dtypes, null_counts, records):
+    """채우기 단계들 -> 컬럼마다 coalesce(값, 1번째 단계 값, 2번째 단계 값, ...) 하나 (먼저 나온 단계 우선)"""
+    candidates = {}
+    for step in steps:
+        strategies = step.strategy if isinstance(step.strategy, dict) else None
+        if strategies is not None:
+            columns = list(strategies)
+            _check_columns(layout, columns)
+        elif step.strategy in ('mean', 'median'):
+            columns = _numeric_columns(layout, dtypes, step.columns)
+        else:
+            columns = step.columns or layout.columns
+            _check_columns(layout, columns)
+
+        for col in columns:
+            # 결측치가 없는 컬럼은 채울 값이 없습니다. (정수 컬럼이 실수로 바뀌지 않도록 건너뜀)
+            if not null_counts[col]:
+                continue
+            strategy = strategies[col] if strategies is not None else step.strategy
+            candidates.setdefault(col, []).append(_fill_expr(col, dtypes[col], strategy, step.value))
+
+    if candidates:
+        frame = frame.with_columns(pl.coalesce([pl.col(col), *exprs]).alias(col) for col, exprs in candidates.items())
+    records.append((list(candidates), stage_key(steps, None)))
+    return frame
+
+
+def _fill_expr(col, dtype, strategy, constant):
+    if strategy in ('mean', 'median'):
+        if not dtype.is_numeric():
+            raise PipelineError(f"'{col}' 컬럼은 수치형이 아니라 {strategy}로 채울 수 없습니다.")
+        return pl.col(col).mean() if strategy == 'mean' else pl.col(col).median()
+    if strategy == 'mode':
+        # pandas mode()[0]처럼 최빈값이 여러 개면 가장 작은 값
+        return pl.col(col).drop_nulls().mode().sort().first()
+
+    value = 0 if strategy == 'zero' else constant
+    # 문자열 컬럼을 숫자로 채우면 pandas에서는 타입이 섞인 object 컬럼이 되므로 pandas 엔진에 맡깁니다.
+    if dtype == pl.String and not isinstance(value, str):
+        raise Unsupported()
+    if dtype.is_numeric() and (isinstance(value, bool) or not isinstance(value, (int, float))) or dtype == pl.Boolean:
+        raise Unsupported()
+    return pl.lit(value).cast(pl.Float64 if dtype.is_numeric() else dtype)
+
+
+def _with_iqr_bounds(frame, columns, iqr_multiplier):
+    """
+    컬럼별 IQR 하한/상한(Q1 - k*IQR, Q3 + k*IQR)을 임시 컬럼으로 붙입니다. 반환: (frame, {컬럼명: (하한, 상한)})
+    💡 경계값 식을 비교마다 그대로 쓰면 Polars가 분위수(정렬)를 여러 번 계산하므로, 컬럼마다 한 번만 계산해 둡니다.
+    """
+    quartiles, bounds, names = [], [], {}
+    for col in columns:
+        x = pl.col(col).cast(pl.Float64)
+        quartiles.append(x.quantile(0.25, interpolation='linear').alias(f"__q1__{col}"))
+        quartiles.append(x.quantile(0.75, interpolation='linear').alias(f"__q3__{col}"))
+        q1, q3 = pl.col(f"__q1__{col}"), pl.col(f"__q3__{col}")
+        bounds.append((q1 - iqr_multiplier * (q3 - q1)).alias(f"__lower__{col}"))
+        bounds.append((q3 + iqr_multiplier * (q3 - q1)).alias(f"__upper__{col}"))
+        names[col] = (pl.col(f"__lower__{col}"), pl.col(f"__upper__{col}"))
+    frame = frame.with_columns(quartiles).with_columns(bounds)
+    return frame.drop([f"__{q}__{col}" for col in columns for q in ('q1', 'q3')]), names
+
+
+def _drop_bounds(frame, bounds):
+    return frame.drop([f"__{side}__{col}" for col in bounds for side in ('lower', 'upper')])
+
+
+def _plan_filter(frame, steps, layout, dtypes):
+    """행 삭제 단계들 -> filter 연속 (drop_outliers의 IQR 기준은 앞 filter를 통과한 행으로 계산됨)"""
+    for step in steps:
+        if step.action == 'drop_na':
+            columns = step.columns or layout.columns
+            _check_columns(layout, columns)
+            frame = frame.filter(pl.all_horizontal([~_missing(col, dtypes[col]) for col in columns]))
+            continue
+
+        numeric_cols = _numeric_columns(layout, dtypes, step.columns)
+        if not numeric_cols:
+            continue
+        frame, bounds = _with_iqr_bounds(frame, numeric_cols, step.iqr_multiplier)
+        conditions = [((pl.col(col) < lower) | (pl.col(col) > upper)).fill_null(False)
+                      for col, (lower, upper) in bounds.items()]
+        frame = _drop_bounds(frame.filter(~pl.any_horizontal(conditions)), bounds)
+    return frame
+
+
+def _plan_cap_outliers(frame, step, layout, dtypes, records):
+    """윈저라이징 (Capping): 컬럼마다 when/then 한 번 (pandas와 같이 결과는 float64)"""
+    numeric_cols = _numeric_columns(layout, dtypes, step.columns)
+    # 💡 pandas 엔진처럼 값이 잘린 컬럼(또는 정수 -> 실수로 dtype이 바뀐 컬럼)만 바뀐 것으로 기록합니다.
+    #    값이 잘렸는지는 실행 전에는 알 수 없으므로, 같은 계획 안에서 집계한 임시 컬럼으로 실행 후에 확인합니다.
+    flags = {}
+    if numeric_cols:
+        frame, bounds = _with_iqr_bounds(frame, numeric_cols, step.iqr_multiplier)
+        exprs = []
+        for col, (lower, upper) in bounds.items():
+            x = pl.col(col).cast(pl.Float64)
+            capped = pl.when(x < lower).then(lower).otherwise(x)
+            exprs.append(pl.when(capped > upper).then(upper).otherwise(capped).alias(col))
+            if dtypes[col] == pl.Float64:
+                flags[col] = f"__capped{len(records)}__{col}"
+                exprs.append(((x < lower) | (x > upper)).any().alias(flags[col]))
+            else:
+                flags[col] = None
+        frame = _drop_bounds(frame.with_columns(exprs), bounds)
+
+    dtypes = dict(dtypes, **{col: pl.Float64 for col in numeric_cols})
+    records.append((flags, stage_key([step], None)))
+    return frame, dtypes
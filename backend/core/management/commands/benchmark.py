@@ -0,0 +1,97 @@
+# backend/core/management/commands/benchmark.py
+
+"""
+업로드 -> 전처리 -> 학습 성능 벤치마크 (core/benchmark.py)
+
+    python manage.py benchmark --rows 10000 100000              # 기준선과 비교 (저하가 있으면 종료 코드 1)
+    python manage.py benchmark --rows 100000 --save-baseline    # 이번 결과를 기준선으로 저장
+    python manage.py benchmark --stages upload process --null-rate 0.2 --cardinality 1000
+"""
+
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core import benchmark
+
+
+class Command(BaseCommand):
+    help = "합성 데이터로 업로드/전처리/학습 API의 소요 시간, 최대 RSS, 응답 크기를 측정하고 기준선과 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=[10_000],
+                            help="합성 데이터 행 수 (여러 개를 주면 크기별로 차례로 측정)")
+        parser.add_argument('--numeric', type=int, default=8, help="수치형 컬럼 수")
+        parser.add_argument('--categorical', type=int, default=4, help="범주형 컬럼 수")
+        parser.add_argument('--null-rate', type=float, default=0.05, help="결측치 비율")
+        parser.add_argument('--outlier-rate', type=float, default=0.01, help="이상치 비율")
+        parser.add_argument('--cardinality', type=int, default=20, help="범주형 컬럼의 범주 수")
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--stages', nargs='+', choices=benchmark.STAGES, default=list(benchmark.STAGES))
+        parser.add_argument('--repeat', type=int, default=settings.BENCHMARK['REPEAT'])
+        parser.add_argument('--action', default='fill_na_mean', help="전처리 단계 (process/ 의 action)")
+        parser.add_argument('--model', default='rf', help="학습 모델 (train/ 의 model_name)")
+        parser.add_argument('--baseline', default=str(settings.BENCHMARK['BASELINE']), help="기준선 파일 경로")
+        parser.add_argument('--save-baseline', action='store_true', help="이번 결과를 기준선으로 저장 (비교하지 않음)")
+        parser.add_argument('--output', help="측정 결과를 JSON으로 저장할 경로")
+
+    def handle(self, *args, **options):
+        if options['repeat'] < 1:
+            raise CommandError("반복 횟수(--repeat)는 1 이상이어야 합니다.")
+        baseline = benchmark.load_baseline(options['baseline'])
+        if not options['save_baseline'] and baseline['environment'] not in (None, benchmark.environment()):
+            self.stderr.write(self.style.WARNING(
+                f"기준선과 측정 환경이 다릅니다. 비교 결과는 참고만 하세요. (기준선: {baseline['environment']})"))
+
+        report = {}
+        regressions = []
+        for rows in options['rows']:
+            spec = dict(rows=rows, numeric=options['numeric'], categorical=options['categorical'],
+                        null_rate=options['null_rate'], outlier_rate=options['outlier_rate'],
+                        cardinality=options['cardinality'])
+            scenario = benchmark.scenario_name(**spec)
+            self.stdout.write(self.style.MIGRATE_HEADING(scenario))
+            df = benchmark.synthetic_frame(**spec, seed=options['seed'])
+            try:
+                results = benchmark.run(df, stages=options['stages'], repeat=options['repeat'],
+                                        action=options['action'], model_name=options['model'],
+                                        progress=lambda message: self.stdout.write(f"  {message}"))
+            except benchmark.BenchmarkError as e:
+                raise CommandError(str(e))
+            report[scenario] = results
+            self._print_results(results)
+
+            if options['save_baseline']:
+                baseline = benchmark.save_baseline(options['baseline'], baseline, scenario, results)
+                continue
+            scenario_baseline = baseline['scenarios'].get(scenario)
+            if scenario_baseline is None:
+                self.stdout.write("  기준선이 없습니다. (--save-baseline으로 저장)")
+                continue
+            rows_compared = benchmark.compare(results, scenario_baseline, settings.BENCHMARK['TOLERANCE'])
+            self._print_comparison(rows_compared)
+            regressions.extend(dict(row, scenario=scenario) for row in rows_compared if row['regression'])
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump({'environment': benchmark.environment(), 'scenarios': report}, f,
+                          ensure_ascii=False, indent=2)
+        if options['save_baseline']:
+            self.stdout.write(self.style.SUCCESS(f"기준선을 저장했습니다: {options['baseline']}"))
+        if regressions:
+            raise CommandError(f"성능 저하 {len(regressions)}건: " + ", ".join(
+                f"{row['scenario']} {row['stage']}.{row['metric']} {row['change']:+.1%}" for row in regressions))
+
+    def _print_results(self, results):
+        self.stdout.write(f"  {'stage':<8} {'seconds':>9} {'peak RSS':>11} {'request':>12} {'response':>12}")
+        for stage, result in results.items():
+            self.stdout.write(
+                f"  {stage:<8} {result['seconds']:>9.3f} {result['peak_rss_mb']:>8.1f} MB "
+                f"{result['request_bytes']:>12,} {result['response_bytes']:>12,}")
+
+    def _print_comparison(self, rows):
+        for row in rows:
+            line = (f"  {row['stage']}.{row['metric']}: {row['baseline']} -> {row['current']} "
+                    f"({row['change']:+.1%})")
+            self.stdout.write(self.style.ERROR(line + " 저하") if row['regression'] else line)
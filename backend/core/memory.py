@@ -0,0 +1,132 @@
+# backend/core/memory.py
+
+"""
+업로드 데이터의 메모리 최적화 (dtype 축소).
+
+read_csv/read_excel/read_json은 정수를 int64, 실수를 float64, 문자열을 파이썬 객체(object)로 읽습니다.
+저장소의 DataFrame은 워커마다 메모리(LRU)에 올라가므로, 값은 그대로 두고 dtype만 작게 바꿉니다.
+
+- 정수: 값 범위에 맞는 가장 작은 정수형 (int8/int16/int32)
+- 실수: 결측치가 없고 모든 값이 float32로 정확히 표현될 때만 float32 (값이 바뀌는 축소는 하지 않음)
+  💡 결측치가 있는 컬럼은 float64로 둡니다. 평균/중앙값으로 채운 값이 float32로 반올림되면 원본 업로드의 결과와 달라집니다.
+     (float32 컬럼의 통계는 float64로 넓혀서 계산합니다. preprocessing.py, encoding.py)
+- 문자열(object) 컬럼
+  - 고유값 비율이 CATEGORY_MAX_RATIO 이하이면 category (값은 한 번만 저장하고 행마다 정수 번호)
+  - 나머지는 Arrow 문자열(string[pyarrow]): 파이썬 객체 대신 연속된 버퍼에 저장
+  💡 숫자로 바뀔 수 있는 문자열 컬럼(전처리에서 수치형으로 변환됨)과 문자열이 아닌 값이 섞인 컬럼은 그대로 둡니다.
+- 설정: settings.MEMORY_OPTIMIZE (요청의 optimize=true/false가 ENABLED보다 우선)
+"""
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+
+try:
+    import pyarrow  # noqa: F401  (string[pyarrow] dtype에 필요)
+    ARROW_STRING = pd.StringDtype('pyarrow')
+except ImportError:  # pyarrow는 선택 의존성
+    ARROW_STRING = None
+
+
+def enabled(value=None):
+    """요청 값(optimize)이 있으면 그 값, 없으면 settings.MEMORY_OPTIMIZE['ENABLED']"""
+    if value is None or value == '':
+        return settings.MEMORY_OPTIMIZE['ENABLED']
+    return str(value).lower() in ('true', '1')
+
+
+def memory_bytes(df):
+    """DataFrame이 차지하는 메모리 (문자열 객체 포함, 바이트)"""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def optimize_frame(df):
+    """
+    dtype을 축소한 새 DataFrame과 보고서를 반환합니다.
+    보고서: {'before', 'after' (바이트), 'reduction' (줄어든 비율 %), 'columns': {컬럼명: {'from', 'to'}}}
+    """
+    config = settings.MEMORY_OPTIMIZE
+    before = memory_bytes(df)
+    # 💡 원본(공유될 수 있는 객체)은 건드리지 않고, 바뀐 컬럼만 교체한 얕은 복사본을 만듭니다.
+    df = df.copy(deep=False)
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        optimized = _optimize_column(series, config)
+        if optimized is not series:
+            df[col] = optimized
+            columns[str(col)] = {'from': str(series.dtype), 'to': str(optimized.dtype)}
+
+    after = memory_bytes(df)
+    report = {
+        'before': before,
+        'after': after,
+        'reduction': round(100 * (1 - after / before), 1) if before else 0.0,
+        'columns': columns,
+    }
+    return df, report
+
+
+def _optimize_column(series, config):
+    """축소한 컬럼 (바꿀 수 없으면 series 그대로)"""
+    if pd.api.types.is_bool_dtype(series):
+        return series
+    if pd.api.types.is_integer_dtype(series) and series.dtype.kind in 'iu':
+        # 💡 부호 없는 정수(uint)로는 바꾸지 않습니다. (이상치 처리의 음수 경계값과 비교/클리핑할 때 dtype이 달라짐)
+        optimized = pd.to_numeric(series, downcast='integer')
+        return optimized if optimized.dtype.itemsize < series.dtype.itemsize else series
+    if series.dtype == np.float64:
+        values = series.to_numpy()
+        if np.isnan(values).any():
+            return series
+        finite = np.isfinite(values)
+        # float32 범위를 넘는 값은 inf가 되므로, 다시 float64로 바꿨을 때 같은 값인지로 확인합니다.
+        narrowed = values.astype(np.float32)
+        if np.array_equal(narrowed[finite].astype(np.float64), values[finite]):
+            return series.astype(np.float32)
+        return series
+    if series.dtype == object:
+        return _optimize_strings(series, config)
+    return series
+
+
+def _optimize_strings(series, config):
+    values = series.dropna()
+    if not len(values) or pd.api.types.infer_dtype(values, skipna=False) != 'string':
+        return series
+
+    # 💡 고유값만 검사합니다. (숫자로 바뀔 수 있는 값이 하나라도 있으면 전처리에서 수치형으로 변환될 수 있음)
+    uniques = pd.unique(values)
+    if pd.to_numeric(pd.Series(uniques, dtype=object), errors='coerce').notna().any():
+        return series
+
+    if len(uniques) <= config['CATEGORY_MAX_RATIO'] * len(series):
+        return series.astype('category')
+    if ARROW_STRING is not None and config['ARROW_STRINGS']:
+        return series.astype(ARROW_STRING)
+    return series
+
+
+def widen_floats(data):
+    """float32 컬럼(메모리 최적화된 데이터셋)을 float64로 바꾼 DataFrame/Series (통계를 원본 업로드와 같게 계산)"""
+    if isinstance(data, pd.Series):
+        return data.astype(np.float64) if data.dtype == np.float32 else data
+    narrow = {col: np.float64 for col, dtype in data.dtypes.items() if dtype == np.float32}
+    return data.astype(narrow) if narrow else data
+
+
+def fill_missing(df, values):
+    """
+    df.fillna(values)와 같지만, category 컬럼은 채울 값을 범주에 먼저 추가합니다.
+    (category 컬럼은 범주에 없는 값으로 채우면 TypeError)
+    """
+    extended = {}
+    for col, value in values.items():
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype) and value not in series.cat.categories:
+            extended[col] = series.cat.add_categories([value])
+    if extended:
+        df = df.copy(deep=False)
+        for col, series in extended.items():
+            df[col] = series
+    return df.fillna(values)
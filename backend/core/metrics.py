@@ -0,0 +1,317 @@
+# backend/core/metrics.py
+
+"""
+요청 단계별 소요 시간 / 메모리 계측 (Prometheus 형식).
+
+뷰에서 시간이 어디에 쓰이는지 보려면 지금까지는 print 출력과 traceback밖에 없었습니다.
+요청(또는 학습 작업)마다 단계별 소요 시간, 요청/응답 바이트, 최대 RSS를 기록하고
+Prometheus 텍스트 형식(GET /api/v1/metrics/)으로 내보냅니다.
+
+- 단계: with stage('profile'): ... 로 감싼 구간의 시간 (같은 단계가 여러 번이면 합계)
+  parse(파일 읽기), ingest(스트리밍 업로드), coerce(수치형 변환), action(전처리 단계), profile(통계 계산),
+  serialize(응답 직렬화), compress(전송 압축), load(학습 데이터 불러오기), encode(특성 인코딩), fit(모델 학습), predict(예측)
+- 범위(scope): MetricsMiddleware가 요청마다, 학습 작업 큐(core/jobs.py)가 작업마다 엽니다.
+  범위 밖(다른 스레드 등)의 단계는 endpoint="none"으로 기록합니다.
+  스트리밍 응답(이벤트 스트림)의 범위는 본문을 다 보낸 뒤에 기록합니다.
+  💡 범위는 contextvars로 전달하므로 함수 인자로 넘기지 않아도 되고, 동시에 처리되는 요청끼리 섞이지 않습니다.
+- 메모리: 범위가 열려 있는 동안 한 개의 감시 스레드가 RSS_SAMPLE_MS 간격으로 프로세스 RSS를 읽어 범위별 최댓값을 기록합니다.
+  (동시에 처리되는 요청이 있으면 그 요청의 메모리도 포함된 프로세스 전체 값)
+- Server-Timing: settings.METRICS['SERVER_TIMING']이면 응답 헤더에 단계별 시간을 붙입니다. (브라우저 개발자 도구)
+- 진행 이벤트: 이벤트 스트림 요청(core/events.py)이면 단계가 시작/끝날 때 stage 이벤트를 보냅니다.
+- 지표는 워커(프로세스)별로 모읍니다. (Prometheus가 워커마다 수집)
+"""
+
+import contextvars
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from . import events
+
+try:
+    import resource
+except ImportError:  # Windows에는 resource 모듈이 없음
+    resource = None
+
+_PREFIX = 'dap_'
+_RSS_BUCKETS = tuple(2 ** n * 1024 * 1024 for n in range(6, 15))  # 64MB ~ 16GB
+
+
+class Counter:
+    def __init__(self, name, help_text, labels):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, label_values, (), value) for label_values, value in sorted(self._values.items())]
+
+
+class Histogram:
+    def __init__(self, name, help_text, labels, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # 레이블 값 -> [구간별 개수, 합계, 개수]
+        self._values = {}
+
+    def observe(self, label_values, value):
+        with self._lock:
+            entry = self._values.get(label_values)
+            if entry is None:
+                entry = self._values[label_values] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][i] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, (list(counts), total, count)) for key, (counts, total, count) in self._values.items())
+        samples = []
+        for label_values, (counts, total, count) in items:
+            for bound, bucket_count in zip(self.buckets, counts):
+                samples.append((f'{self.name}_bucket', label_values, (('le', _format_value(bound)),), bucket_count))
+            samples.append((f'{self.name}_bucket', label_values, (('le', '+Inf'),), count))
+            samples.append((f'{self.name}_sum', label_values, (), total))
+            samples.append((f'{self.name}_count', label_values, (), count))
+        return samples
+
+
+class MetricsRegistry:
+    """이 프로세스의 지표 모음"""
+
+    def __init__(self, duration_buckets):
+        self.requests = Counter(f'{_PREFIX}requests_total', "처리한 요청 수", ('endpoint', 'method', 'status'))
+        self.request_duration = Histogram(f'{_PREFIX}request_duration_seconds', "요청 처리 시간 (초)",
+                                          ('endpoint',), duration_buckets)
+        self.stage_duration = Histogram(f'{_PREFIX}stage_duration_seconds', "요청/작업의 단계별 소요 시간 (초)",
+                                        ('endpoint', 'stage'), duration_buckets)
+        self.bytes_in = Counter(f'{_PREFIX}request_bytes_total', "요청 본문 바이트", ('endpoint',))
+        self.bytes_out = Counter(f'{_PREFIX}response_bytes_total', "응답 본문 바이트 (압축 후)", ('endpoint',))
+        self.peak_rss = Histogram(f'{_PREFIX}peak_rss_bytes', "요청/작업 처리 중 프로세스 최대 RSS (바이트)",
+                                  ('endpoint',), _RSS_BUCKETS)
+        self.cache_requests = Counter(f'{_PREFIX}result_cache_requests_total',
+                                      "전처리/학습 결과 캐시 조회 수 (core/result_cache.py)", ('kind', 'result'))
+
+    def record(self, timings):
+        """끝난 범위(요청/작업)의 측정값을 지표에 더합니다."""
+        endpoint = (timings.endpoint,)
+        for name, seconds in timings.stages.items():
+            self.stage_duration.observe((timings.endpoint, name), seconds)
+        if timings.status is not None:
+            self.requests.inc((timings.endpoint, timings.method, str(timings.status)))
+            self.request_duration.observe(endpoint, timings.elapsed)
+            self.bytes_in.inc(endpoint, timings.bytes_in)
+            self.bytes_out.inc(endpoint, timings.bytes_out)
+        if timings.peak_rss:
+            self.peak_rss.observe(endpoint, timings.peak_rss)
+
+    def render(self):
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        lines = []
+        for metric in (self.requests, self.request_duration, self.stage_duration,
+                       self.bytes_in, self.bytes_out, self.peak_rss, self.cache_requests):
+            lines.append(f'# HELP {metric.name} {metric.help_text}')
+            lines.append(f"# TYPE {metric.name} {'histogram' if isinstance(metric, Histogram) else 'counter'}")
+            for name, label_values, extra, value in metric.samples():
+                labels = tuple(zip(metric.labels, label_values)) + extra
+                label_text = ','.join(f'{key}="{_escape(value)}"' for key, value in labels)
+                lines.append(f'{name}{{{label_text}}} {_format_value(value)}')
+        rss = current_rss()
+        lines.append(f'# HELP {_PREFIX}process_rss_bytes 현재 프로세스 RSS (바이트)')
+        lines.append(f'# TYPE {_PREFIX}process_rss_bytes gauge')
+        lines.append(f'{_PREFIX}process_rss_bytes {rss}')
+        return '\n'.join(lines) + '\n'
+
+
+class Timings:
+    """범위(요청 하나 또는 학습 작업 하나)의 측정값"""
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        # 단계 이름 -> 합계 (초). 처음 기록된 순서대로
+        self.stages = {}
+        self.peak_rss = 0
+        self.method = ''
+        self.status = None
+        self.bytes_in = 0
+        self.bytes_out = 0
+        # True이면 범위가 끝나도 기록하지 않고 finish()를 기다립니다. (스트리밍 응답)
+        self.deferred = False
+
+    def add(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def server_timing(self):
+        """Server-Timing 헤더 값 (밀리초)"""
+        entries = [f'{name};dur={seconds * 1000:.1f}' for name, seconds in self.stages.items()]
+        entries.append(f'total;dur={self.elapsed * 1000:.1f}')
+        return ', '.join(entries)
+
+
+_current = contextvars.ContextVar('metrics_timings', default=None)
+
+
+@contextmanager
+def scope(endpoint):
+    """
+    요청/작업 하나의 측정 범위. 끝나면 지표에 기록합니다. (계측이 꺼져 있으면 None)
+    💡 범위 안에서 timings.deferred = True로 바꾸면 기록을 미루고, resume()으로 다시 열었다가 finish()로 기록합니다.
+       (스트리밍 응답은 본문을 보내는 동안에도 뷰가 실행되므로, core/middleware.py)
+    """
+    if not settings.METRICS['ENABLED']:
+        yield None
+        return
+    timings = Timings(endpoint)
+    token = _current.set(timings)
+    _get_watcher().add(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+        if not timings.deferred:
+            finish(timings)
+
+
+@contextmanager
+def resume(timings):
+    """기록을 미룬 범위(timings)를 with 블록 동안 다시 현재 범위로 씁니다."""
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+def finish(timings):
+    """범위를 끝내고 지표에 기록합니다."""
+    _get_watcher().remove(timings)
+    timings.elapsed = time.perf_counter() - timings.started
+    get_metrics().record(timings)
+
+
+@contextmanager
+def stage(name):
+    """with 블록의 소요 시간을 현재 범위의 name 단계에 더합니다."""
+    start = time.perf_counter()
+    events.emit('stage', name=name)
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        events.emit('stage', name=name, seconds=round(elapsed, 4))
+        timings = _current.get()
+        if timings is not None:
+            timings.add(name, elapsed)
+        elif settings.METRICS['ENABLED']:
+            get_metrics().stage_duration.observe(('none', name), elapsed)
+
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def current_rss():
+    """현재 프로세스의 RSS (바이트). /proc이 없으면 ru_maxrss(최댓값), Windows는 0"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        if resource is None:
+            return 0
+        # macOS는 바이트, Linux는 KB 단위
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class _RSSWatcher:
+    """
+    열려 있는 범위들의 최대 RSS를 기록하는 감시 스레드.
+    💡 요청마다 스레드를 만들지 않고, 범위가 하나라도 열려 있을 때만 스레드 하나가 RSS를 읽습니다.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._active = set()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def add(self, timings):
+        timings.peak_rss = current_rss()
+        with self._lock:
+            self._active.add(timings)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='metrics-rss', daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def remove(self, timings):
+        with self._lock:
+            self._active.discard(timings)
+        timings.peak_rss = max(timings.peak_rss, current_rss())
+
+    def _run(self):
+        while True:
+            with self._lock:
+                active = list(self._active)
+            if not active:
+                # 열린 범위가 없으면 다음 범위가 열릴 때까지 잠듭니다.
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            rss = current_rss()
+            for timings in active:
+                if rss > timings.peak_rss:
+                    timings.peak_rss = rss
+            time.sleep(self.interval)
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else repr(value)
+    return str(value)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+_metrics = None
+_watcher = None
+_lock = threading.Lock()
+
+
+def get_metrics():
+    """settings.METRICS 설정으로 만든 워커 단위 싱글톤 지표 모음을 반환합니다."""
+    global _metrics
+    if _metrics is None:
+        with _lock:
+            if _metrics is None:
+                _metrics = MetricsRegistry(settings.METRICS['DURATION_BUCKETS'])
+    return _metrics
+
+
+def _get_watcher():
+    global _watcher
+    if _watcher is None:
+        with _lock:
+            if _watcher is None:
+                _watcher = _RSSWatcher(settings.METRICS['RSS_SAMPLE_MS'] / 1000)
+    return _watcher
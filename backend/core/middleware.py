@@ -0,0 +1,199 @@
+# backend/core/middleware.py
+
+"""
+응답 전송 압축 (Content-Encoding: zstd / gzip)과 요청 계측.
+
+분석/행 조회 응답은 같은 컬럼 이름과 값이 반복되는 표라서 압축이 잘 됩니다.
+요청의 Accept-Encoding에서 클라이언트가 받을 수 있는 방식 중 settings.RESPONSE_FORMAT['COMPRESSION'] 순서로
+먼저 나오는 방식으로 압축합니다.
+
+- zstd: gzip보다 압축/해제가 빠름. pyarrow의 zstd 코덱을 사용합니다. (표준 zstd 프레임, pyarrow가 없으면 건너뜀)
+- gzip: 표준 라이브러리 (모든 브라우저 지원)
+- MIN_BYTES보다 작은 응답, 압축 대상이 아닌 형식(JSON/MessagePack/Arrow 외), 스트리밍 응답은 그대로 보냅니다.
+- MetricsMiddleware: 요청마다 계측 범위(core/metrics.py)를 열고, 요청/응답 바이트와 Server-Timing 헤더를 기록합니다.
+- 💡 두 미들웨어 모두 동기/비동기 요청을 처리합니다. (ASGI에서 비동기 뷰(core/events.py)가 스레드를 쓰지 않도록)
+"""
+
+import gzip
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+from . import metrics
+from .columnar import pa
+
+# 압축할 응답 형식 (Content-Type의 미디어 타입)
+COMPRESSIBLE_TYPES = (
+    'application/json',
+    'application/msgpack',
+    'application/vnd.apache.arrow.stream',
+    'text/html',
+)
+
+
+def _zstd(body, config):
+    return pa.Codec('zstd', compression_level=config['ZSTD_LEVEL']).compress(body, asbytes=True)
+
+
+def _gzip(body, config):
+    return gzip.compress(body, compresslevel=config['GZIP_LEVEL'], mtime=0)
+
+
+_COMPRESSORS = {'gzip': _gzip}
+if pa is not None and pa.Codec.is_available('zstd'):
+    _COMPRESSORS['zstd'] = _zstd
+
+
+def accepted_encodings(header):
+    """Accept-Encoding 헤더 -> 받을 수 있는 인코딩 이름 집합 (q=0은 제외)"""
+    accepted = set()
+    for item in header.split(','):
+        name, _, params = item.strip().partition(';')
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name and quality > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def choose_encoding(header, preferred):
+    """preferred 순서대로, 클라이언트가 받을 수 있고 서버가 지원하는 첫 번째 인코딩 (없으면 None)"""
+    accepted = accepted_encodings(header or '')
+    for name in preferred:
+        if name in _COMPRESSORS and (name in accepted or '*' in accepted):
+            return name
+    return None
+
+
+class ResponseCompressionMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        response = self.get_response(request)
+        return self.compress(request, response)
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        return self.compress(request, response)
+
+    def compress(self, request, response):
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        if response.streaming or response.has_header('Content-Encoding') or content_type not in COMPRESSIBLE_TYPES:
+            return response
+        # 💡 같은 URL이라도 Accept-Encoding에 따라 본문이 달라지므로 캐시가 구분하도록 알립니다.
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        config = settings.RESPONSE_FORMAT
+        if len(response.content) < config['MIN_BYTES']:
+            return response
+        encoding = choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING'), config['COMPRESSION'])
+        if encoding is None:
+            return response
+
+        with metrics.stage('compress'):
+            compressed = _COMPRESSORS[encoding](response.content, config)
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+        return response
+
+
+class MetricsMiddleware:
+    """
+    요청 하나를 계측 범위로 감쌉니다. (압축까지 포함하도록 다른 미들웨어보다 바깥에 둡니다)
+    💡 endpoint 레이블은 URL 이름(file-upload 등)을 씁니다. (URL 경로를 쓰면 ID마다 레이블이 생김)
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        with metrics.scope('other') as timings:
+            response = self.get_response(request)
+            if timings is not None:
+                self.record(request, response, timings)
+        return response
+
+    async def __acall__(self, request):
+        with metrics.scope('other') as timings:
+            response = await self.get_response(request)
+            if timings is not None:
+                self.record(request, response, timings)
+        return response
+
+    def record(self, request, response, timings):
+        """요청/응답 정보를 범위에 기록하고 Server-Timing 헤더를 붙입니다."""
+        match = getattr(request, 'resolver_match', None)
+        timings.endpoint = (match.url_name if match else None) or 'other'
+        timings.method = request.method
+        timings.status = response.status_code
+        try:
+            timings.bytes_in = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            timings.bytes_in = 0
+        if not response.streaming:
+            timings.bytes_out = len(response.content)
+        else:
+            # 💡 스트리밍 응답(이벤트 스트림 등)은 본문을 보내는 동안 뷰가 실행되므로, 다 보낸 뒤에 기록합니다.
+            timings.deferred = True
+            content = response.streaming_content
+            if response.is_async:
+                response.streaming_content = self._astream(content, timings)
+            else:
+                response.streaming_content = self._stream(content, timings)
+        if settings.METRICS['SERVER_TIMING']:
+            timings.elapsed = time.perf_counter() - timings.started
+            response['Server-Timing'] = timings.server_timing()
+            # 다른 출처(Vue 개발 서버)의 페이지에서도 브라우저가 단계별 시간을 보여 주도록 허용합니다.
+            origin = request.META.get('HTTP_ORIGIN')
+            if origin and origin in getattr(settings, 'CORS_ALLOWED_ORIGINS', ()):
+                response['Timing-Allow-Origin'] = origin
+
+    @staticmethod
+    def _stream(content, timings):
+        """본문을 보내는 동안 요청의 계측 범위를 열어 두고, 다 보내면(또는 연결이 끊기면) 기록합니다."""
+        try:
+            with metrics.resume(timings):
+                for chunk in content:
+                    timings.bytes_out += len(chunk)
+                    yield chunk
+        finally:
+            metrics.finish(timings)
+
+    @staticmethod
+    async def _astream(content, timings):
+        """_stream의 비동기 버전"""
+        try:
+            with metrics.resume(timings):
+                async for chunk in content:
+                    timings.bytes_out += len(chunk)
+                    yield chunk
+        finally:
+            metrics.finish(timings)
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:09
+
+import django.db.models.deletion
+import rest_framework.utils.encoders
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrainedModel',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(db_index=True, max_length=255)),
+                ('version', models.PositiveIntegerField()),
+                ('task', models.CharField(max_length=16)),
+                ('params', models.JSONField(default=dict)),
+                ('metrics', models.JSONField(default=dict, encoder=rest_framework.utils.encoders.JSONEncoder)),
+                ('feature_columns', models.JSONField(default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('job', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='models', to='core.trainingjob')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'constraints': [models.UniqueConstraint(fields=('name', 'version'), name='unique_model_version')],
+            },
+        ),
+    ]
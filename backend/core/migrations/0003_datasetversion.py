@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_trainedmodel'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DatasetVersion',
+            fields=[
+                ('id', models.CharField(max_length=32, primary_key=True, serialize=False)),
+                ('root', models.CharField(db_index=True, max_length=32)),
+                ('action', models.JSONField(blank=True, null=True)),
+                ('changed_columns', models.JSONField(default=list)),
+                ('shared_columns', models.PositiveIntegerField(default=0)),
+                ('rows', models.PositiveIntegerField(blank=True, null=True)),
+                ('own_bytes', models.BigIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('visited_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('parent', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='children', to='core.datasetversion')),
+            ],
+            options={
+                'ordering': ['created_at'],
+            },
+        ),
+    ]
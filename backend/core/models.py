@@ -1,3 +1,142 @@
+import uuid
+
 from django.db import models
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class TrainingJob(models.Model):
+    """
+    비동기 모델 학습 작업 (core/jobs.py).
+    💡 상태/진행률/결과를 DB(SQLite)에 기록하므로 학습을 요청한 요청이 끝난 뒤에도 다른 요청에서 조회할 수 있습니다.
+    """
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+    STATUS_CHOICES = [
+        (QUEUED, '대기 중'),
+        (RUNNING, '실행 중'),
+        (SUCCEEDED, '완료'),
+        (FAILED, '실패'),
+        (CANCELLED, '취소됨'),
+    ]
+    ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=QUEUED, db_index=True)
+    # 학습 요청 파라미터 (dataset_id, target, model_name 또는 비교 모드의 models)
+    params = models.JSONField(default=dict)
+    progress = models.PositiveSmallIntegerField(default=0)
+    message = models.CharField(max_length=200, blank=True)
+    # 💡 학습 결과에는 numpy 값이 섞여 있으므로 DRF의 JSONEncoder로 저장합니다.
+    result = models.JSONField(null=True, blank=True, encoder=JSONEncoder)
+    error = models.TextField(blank=True)
+    cancel_requested = models.BooleanField(default=False)
+    # 작업을 실행하는 서버 프로세스 ("호스트:PID")
+    owner = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.id} ({self.status})"
+
+    def to_dict(self):
+        """API 응답용 dict (결과는 완료된 경우에만 포함)"""
+        data = {
+            'jobId': str(self.id),
+            'status': self.status,
+            'progress': self.progress,
+            'message': self.message,
+            'params': self.params,
+            'createdAt': self.created_at.isoformat() if self.created_at else None,
+            'startedAt': self.started_at.isoformat() if self.started_at else None,
+            'finishedAt': self.finished_at.isoformat() if self.finished_at else None,
+        }
+        if self.status == self.SUCCEEDED:
+            data['result'] = self.result
+        if self.error:
+            data['error'] = self.error
+        return data
+
+
+class TrainedModel(models.Model):
+    """
+    모델 레지스트리에 저장된 학습 모델 (core/registry.py).
+    💡 모델/전처리 상태는 파일(joblib)로 저장하고, 여기에는 버전과 메타데이터만 기록합니다.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # 같은 (모델 종류, 목표 컬럼)으로 학습할 때마다 버전이 1씩 올라갑니다.
+    name = models.CharField(max_length=255, db_index=True)
+    version = models.PositiveIntegerField()
+    task = models.CharField(max_length=16)  # regression / classification
+    params = models.JSONField(default=dict)
+    metrics = models.JSONField(default=dict, encoder=JSONEncoder)
+    feature_columns = models.JSONField(default=list)
+    job = models.ForeignKey(TrainingJob, null=True, blank=True, on_delete=models.SET_NULL, related_name='models')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        constraints = [models.UniqueConstraint(fields=['name', 'version'], name='unique_model_version')]
+
+    def __str__(self):
+        return f"{self.name} v{self.version}"
+
+    def to_dict(self):
+        return {
+            'modelId': str(self.id),
+            'name': self.name,
+            'version': self.version,
+            'task': self.task,
+            'params': self.params,
+            'metrics': self.metrics,
+            'featureColumns': self.feature_columns,
+            'jobId': str(self.job_id) if self.job_id else None,
+            'createdAt': self.created_at.isoformat() if self.created_at else None,
+        }
+
+
+class DatasetVersion(models.Model):
+    """
+    데이터셋 버전 그래프의 노드 (core/versions.py).
+    💡 전처리 결과마다 노드 하나를 만들고 부모(입력 데이터셋)를 가리킵니다. 데이터 자체는 저장소(core/dataset_store.py)에 있습니다.
+    """
+    # 저장소의 dataset_id
+    id = models.CharField(primary_key=True, max_length=32)
+    # 업로드한 데이터셋(그래프의 뿌리)의 dataset_id
+    root = models.CharField(max_length=32, db_index=True)
+    parent = models.ForeignKey('self', null=True, blank=True, on_delete=models.CASCADE, related_name='children')
+    # 부모에서 이 버전을 만든 작업 (작업 이름 또는 파이프라인 단계 목록)
+    action = models.JSONField(null=True, blank=True)
+    changed_columns = models.JSONField(default=list)
+    shared_columns = models.PositiveIntegerField(default=0)
+    # 행 수 (뿌리 버전은 기록하지 않음)
+    rows = models.PositiveIntegerField(null=True, blank=True)
+    # 이 버전만 따로 차지하는 디스크 용량 (부모와 공유하는 컬럼 제외)
+    own_bytes = models.BigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # 마지막으로 만들거나 되돌아온 시각 (redo 대상 선택, 정리 순서)
+    visited_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ['created_at']
+
+    def __str__(self):
+        return f"{self.id} ({self.root})"
 
-# Create your models here.
+    def to_dict(self):
+        return {
+            'versionId': self.id,
+            'parentId': self.parent_id,
+            'action': self.action,
+            'changedColumns': self.changed_columns,
+            'sharedColumns': self.shared_columns,
+            'rows': self.rows,
+            'ownBytes': self.own_bytes,
+            'createdAt': self.created_at.isoformat() if self.created_at else None,
+        }
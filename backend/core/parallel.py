@@ -0,0 +1,119 @@
+# backend/core/parallel.py
+
+"""
+컬럼 단위 병렬 프로파일링 (프로세스 풀).
+
+컬럼 프로파일은 서로 독립적이므로 컬럼을 여러 프로세스에 나눠 계산합니다.
+(GIL 때문에 스레드로는 value_counts/정렬이 동시에 돌지 않습니다)
+
+- 데이터 전달: DataFrame을 pickle로 넘기지 않고, 저장소에 있는 데이터셋의 Arrow IPC 파일
+  경로만 넘깁니다. 각 워커는 파일을 mmap으로 열어 자기가 맡은 컬럼만 읽으므로 컬럼 버퍼가
+  복사되지 않고 OS 페이지 캐시를 모든 워커가 공유합니다.
+- 직렬 실행: 작은 DataFrame(셀 수 < MIN_CELLS), 컬럼이 하나뿐인 경우, Arrow 파일이 없는
+  경우(pickle로 저장된 데이터셋), 프로세스 풀을 쓸 수 없는 경우에는 기존처럼 직렬로 계산합니다.
+- 프로세스 풀(ProcessPool)은 모델 비교 학습(core/compare.py)에서도 씁니다. (풀은 따로)
+- 설정: settings.PROFILING (WORKERS, MIN_CELLS)
+"""
+
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+
+from . import columnar
+
+# 워커 프로세스에서 마지막으로 연 Arrow 테이블 (같은 파일의 여러 컬럼을 처리할 때 재사용)
+_worker_table = (None, None)
+
+
+class ParallelProfiler:
+    """Arrow IPC 파일(source)에 저장된 DataFrame의 컬럼들을 프로세스 풀에서 프로파일링합니다."""
+
+    def __init__(self, source, workers, min_cells):
+        self.source = str(source)
+        self.workers = workers
+        self.min_cells = min_cells
+
+    def profile_columns(self, df, positions, epsilon=None):
+        """positions 위치의 컬럼들을 프로파일링하여 [(ColumnProfile, 요약), ...]을 같은 순서로 반환합니다."""
+        from .profiling import profile_column
+
+        executor = None
+        if len(positions) >= 2 and len(df) * len(positions) >= self.min_cells:
+            executor = _pool.get(self.workers)
+        if executor is None:
+            return [profile_column(df.iloc[:, i], name=df.columns[i], epsilon=epsilon) for i in positions]
+
+        tasks = [(self.source, i, df.columns[i], epsilon) for i in positions]
+        # 워커당 4묶음 정도로 나눠서, 느린 컬럼(고유값이 많은 문자열 등)이 한쪽에 몰리지 않게 합니다.
+        chunksize = max(1, len(tasks) // (self.workers * 4))
+        try:
+            return list(executor.map(_profile_column_task, tasks, chunksize=chunksize))
+        except (BrokenProcessPool, OSError):
+            _pool.reset()
+            return [profile_column(df.iloc[:, i], name=df.columns[i], epsilon=epsilon) for i in positions]
+
+
+def profiler_for(source):
+    """
+    source(DatasetStore.locate로 찾은 데이터셋 파일)를 병렬로 프로파일링할 ParallelProfiler를 반환합니다.
+    워커가 1개 이하이거나 Arrow 파일이 아니면 None (직렬 계산).
+    💡 실제로 프로파일링할 컬럼 수/행 수가 작으면 profile_columns()에서 직렬로 계산합니다.
+    """
+    config = settings.PROFILING
+    if config['WORKERS'] <= 1:
+        return None
+    if source is None or not columnar.is_arrow(source):
+        return None
+    return ParallelProfiler(source, config['WORKERS'], config['MIN_CELLS'])
+
+
+def _profile_column_task(task):
+    """(워커 프로세스) Arrow 파일에서 컬럼 하나를 읽어 프로파일링합니다."""
+    global _worker_table
+    from .profiling import profile_column
+
+    path, position, name, epsilon = task
+    if _worker_table[0] != path:
+        _worker_table = (path, columnar.open_table(path))
+    # select().to_pandas()는 pandas 메타데이터로 dtype(Int64, category, 시간대 등)을 그대로 복원합니다.
+    series = _worker_table[1].select([position]).to_pandas().iloc[:, 0]
+    return profile_column(series, name=name, epsilon=epsilon)
+
+
+class ProcessPool:
+    """
+    spawn 방식 프로세스 풀 (워커 단위 싱글톤). 처음 get()할 때 만들고, 프로세스가 끝날 때 정리합니다.
+    컬럼 프로파일링(이 모듈)과 모델 비교 학습(core/compare.py)이 각자 하나씩 씁니다.
+    """
+
+    def __init__(self):
+        self.executor = None
+        self._lock = threading.Lock()
+        atexit.register(self.reset)
+
+    def get(self, workers):
+        """workers개 워커의 ProcessPoolExecutor. 프로세스 풀을 쓸 수 없으면 None (직렬 실행)"""
+        if self.executor is None:
+            with self._lock:
+                if self.executor is None:
+                    try:
+                        # 💡 fork는 요청 처리 스레드/락 상태까지 복제하므로 spawn으로 새 인터프리터를 띄웁니다.
+                        self.executor = ProcessPoolExecutor(
+                            max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+                    except (OSError, NotImplementedError):
+                        return None
+        return self.executor
+
+    def reset(self):
+        """풀을 닫습니다. (워커가 죽은 풀(BrokenProcessPool)은 버리고 다음 get()에서 새로 만듦)"""
+        with self._lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+
+
+_pool = ProcessPool()
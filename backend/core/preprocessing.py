@@ -0,0 +1,367 @@
+# backend/core/preprocessing.py
+
+"""
+전처리 파이프라인.
+
+ProcessDataView(작업 1개)와 PipelineView(작업 여러 개)가 같은 코드로 전처리를 실행합니다.
+
+- parse_steps: 요청의 단계 목록을 Step으로 해석합니다. (잘못된 단계는 PipelineError)
+- plan: 이어지는 단계 중 한 번에 실행할 수 있는 것들을 하나의 Stage로 묶습니다.
+  - 결측치 채우기 단계들 -> 컬럼별 채울 값을 모아 fillna 한 번 (먼저 나온 단계가 우선)
+  - 행 삭제 단계들(drop_na, drop_outliers) -> 남길 행 조건(mask)만 누적하고 마지막에 한 번만 걸러냄
+- run: 빈 문자열/'?' 치환과 수치형 변환을 시작할 때 한 번만 하고, Stage를 차례로 실행합니다.
+  프로파일링은 파이프라인이 끝난 뒤 한 번만 합니다. (views._dataset_response)
+- Polars가 설치되어 있으면 같은 단계들을 지연 실행 계획으로 한 번에 실행합니다. (core/lazy.py)
+  여기의 pandas 엔진은 그 계획으로 표현할 수 없는 경우와 근사 모드에서 사용합니다.
+
+💡 각 Stage는 값이 바뀐 컬럼/삭제된 행을 lineage(profile_cache.ColumnLineage)에 기록하므로,
+   바뀌지 않은 컬럼의 프로파일은 이전 데이터셋에서 재사용됩니다.
+"""
+
+import json
+import logging
+
+import numpy as np
+import pandas as pd
+
+from . import metrics
+from .memory import fill_missing, widen_floats
+from .sketches import QuantileSketch
+
+logger = logging.getLogger(__name__)
+
+FILL = 'fill'
+FILTER = 'filter'
+TRANSFORM = 'transform'
+
+FILL_STRATEGIES = ('mean', 'median', 'mode', 'zero', 'constant')
+DEFAULT_IQR_MULTIPLIER = 1.5
+
+# 기존 단일 작업 이름 -> 파이프라인 단계
+LEGACY_ACTIONS = {
+    'drop_na': {'action': 'drop_na'},
+    'fill_na_mean': {'action': 'fill_na', 'strategy': 'mean'},
+    'fill_na_median': {'action': 'fill_na', 'strategy': 'median'},
+    'fill_na_mode': {'action': 'fill_na', 'strategy': 'mode'},
+    'fill_na_zero': {'action': 'fill_na', 'strategy': 'zero'},
+    'drop_outliers': {'action': 'drop_outliers'},
+    'cap_outliers': {'action': 'cap_outliers'},
+}
+
+_STEP_KINDS = {'drop_na': FILTER, 'drop_outliers': FILTER, 'fill_na': FILL, 'cap_outliers': TRANSFORM}
+
+
+class PipelineError(ValueError):
+    """요청한 단계 목록이 잘못된 경우 (400 응답)"""
+
+
+class Step:
+    """
+    전처리 단계 하나.
+    - action: drop_na / fill_na / drop_outliers / cap_outliers
+    - columns: 대상 컬럼 목록 (None이면 작업별 기본 대상)
+    - strategy: fill_na의 채우기 방식. 문자열 하나 또는 {컬럼명: 방식} (컬럼별 방식)
+    - value: strategy가 'constant'일 때 채울 값
+    - iqr_multiplier: 이상치 기준 (Q1 - k*IQR, Q3 + k*IQR)의 k
+    """
+
+    def __init__(self, action, columns=None, strategy=None, value=None, iqr_multiplier=DEFAULT_IQR_MULTIPLIER):
+        self.action = action
+        self.kind = _STEP_KINDS[action]
+        self.columns = columns
+        self.strategy = strategy
+        self.value = value
+        self.iqr_multiplier = iqr_multiplier
+
+    @property
+    def key(self):
+        """컬럼 지문에 섞을 단계 식별자 (같은 단계면 항상 같은 값)"""
+        return json.dumps([self.action, self.columns, self.strategy, self.value, self.iqr_multiplier],
+                          sort_keys=True, default=str, ensure_ascii=False)
+
+
+def parse_action(action):
+    """ProcessDataView의 action 이름을 단계 목록으로 변환합니다."""
+    if action not in LEGACY_ACTIONS:
+        raise PipelineError("알 수 없는 작업 요청입니다.")
+    return parse_steps([LEGACY_ACTIONS[action]])
+
+
+def parse_steps(specs):
+    """
+    요청의 단계 목록을 Step 목록으로 변환합니다.
+    각 단계는 {'action': ...} dict이며, 기존 작업 이름(fill_na_mean 등)도 문자열로 쓸 수 있습니다.
+    """
+    if not isinstance(specs, list) or not specs:
+        raise PipelineError("전처리 단계(steps) 목록이 비어 있습니다.")
+
+    steps = []
+    for i, spec in enumerate(specs, start=1):
+        if isinstance(spec, str):
+            spec = LEGACY_ACTIONS.get(spec, {'action': spec})
+        if not isinstance(spec, dict):
+            raise PipelineError(f"{i}번째 단계의 형식이 올바르지 않습니다.")
+        if spec.get('action') in LEGACY_ACTIONS:
+            spec = {**spec, **LEGACY_ACTIONS[spec['action']]}
+
+        action = spec.get('action')
+        if action not in _STEP_KINDS:
+            raise PipelineError(f"{i}번째 단계: 알 수 없는 작업 '{action}'입니다.")
+
+        columns = spec.get('columns')
+        if columns is not None and (not isinstance(columns, list) or not columns):
+            raise PipelineError(f"{i}번째 단계: columns는 컬럼명 목록이어야 합니다.")
+
+        strategy = spec.get('strategy')
+        if action == 'fill_na':
+            strategies = strategy.values() if isinstance(strategy, dict) else [strategy]
+            for name in strategies:
+                if name not in FILL_STRATEGIES:
+                    raise PipelineError(
+                        f"{i}번째 단계: 채우기 방식은 {', '.join(FILL_STRATEGIES)} 중 하나여야 합니다.")
+            if 'constant' in strategies and spec.get('value') is None:
+                raise PipelineError(f"{i}번째 단계: constant 방식은 value가 필요합니다.")
+
+        try:
+            iqr_multiplier = float(spec.get('iqr_multiplier', DEFAULT_IQR_MULTIPLIER))
+        except (TypeError, ValueError):
+            raise PipelineError(f"{i}번째 단계: iqr_multiplier는 숫자여야 합니다.")
+        if iqr_multiplier <= 0:
+            raise PipelineError(f"{i}번째 단계: iqr_multiplier는 0보다 커야 합니다.")
+
+        steps.append(Step(action, columns=columns, strategy=strategy, value=spec.get('value'),
+                          iqr_multiplier=iqr_multiplier))
+    return steps
+
+
+def plan(steps):
+    """같은 종류(채우기/행 삭제)로 이어지는 단계를 하나의 Stage로 묶습니다. 반환: [(종류, [Step, ...]), ...]"""
+    stages = []
+    for step in steps:
+        if stages and step.kind != TRANSFORM and stages[-1][0] == step.kind:
+            stages[-1][1].append(step)
+        else:
+            stages.append((step.kind, [step]))
+    return stages
+
+
+def normalize_columns(df, lineage=None):
+    """
+    빈 문자열 / '?'를 NaN으로 바꾸고 수치형 변환을 시도한 새 DataFrame을 반환합니다.
+    💡 이미 수치형인 컬럼은 바뀔 값이 없으므로 건너뛰고, 실제로 바뀐 컬럼만 lineage에 기록합니다.
+    """
+    # 💡 저장소의 DataFrame은 공유 객체이므로 복사본의 컬럼만 교체합니다.
+    df = df.copy(deep=False)
+    changed = []
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_numeric_dtype(series):
+            continue
+        modified = False
+        if not pd.api.types.is_datetime64_any_dtype(series) and series.isin(["", "?"]).any():
+            series = series.replace(["", "?"], np.nan)
+            modified = True
+        try:
+            series = pd.to_numeric(series)
+            modified = True
+        except (ValueError, TypeError):
+            pass
+        if modified:
+            df[col] = series
+            changed.append(col)
+
+    if lineage is not None:
+        lineage.change(changed, 'normalize')
+    return df
+
+
+def iqr_bounds(df, numeric_cols, iqr_multiplier=DEFAULT_IQR_MULTIPLIER, sketches=None, epsilon=None):
+    """
+    수치형 컬럼별 IQR 하한/상한(Q1 - k*IQR, Q3 + k*IQR)을 계산합니다.
+    💡 근사 모드(epsilon)면 저장된 분위수 스케치(sketches: 컬럼명 -> 상태)를 재사용하여
+       컬럼 전체를 다시 정렬하지 않습니다.
+    """
+    if epsilon is None:
+        values = widen_floats(df[numeric_cols])
+        Q1 = values.quantile(0.25)
+        Q3 = values.quantile(0.75)
+    else:
+        sketches = sketches or {}
+        q1, q3 = {}, {}
+        for col in numeric_cols:
+            state = sketches.get(col)
+            if state is not None and state['epsilon'] <= epsilon:
+                sketch = QuantileSketch.from_state(state)
+            else:
+                sketch = QuantileSketch(epsilon).update(df[col].to_numpy(dtype=np.float64, na_value=np.nan))
+            q1[col], q3[col] = sketch.quantiles([0.25, 0.75])
+        Q1 = pd.Series(q1, index=numeric_cols, dtype=np.float64)
+        Q3 = pd.Series(q3, index=numeric_cols, dtype=np.float64)
+
+    IQR = Q3 - Q1
+    return Q1 - iqr_multiplier * IQR, Q3 + iqr_multiplier * IQR
+
+
+def run(df, steps, lineage=None, sketches=None, epsilon=None):
+    """
+    단계 목록을 실행한 새 DataFrame을 반환합니다.
+    - lineage: 값이 바뀐 컬럼/삭제된 행을 기록할 ColumnLineage (없으면 기록하지 않음)
+    - sketches: 입력 데이터셋의 분위수 스케치 (근사 모드에서 이상치 기준 계산에 재사용)
+    """
+    with metrics.stage('coerce'):
+        df = normalize_columns(df, lineage)
+    context = _Context(lineage, sketches, epsilon)
+    with metrics.stage('action'):
+        for kind, stage_steps in plan(steps):
+            if kind == FILL:
+                df = _run_fill(df, stage_steps, context)
+            elif kind == FILTER:
+                df = _run_filter(df, stage_steps, context)
+            else:
+                df = _run_cap_outliers(df, stage_steps[0], context)
+    return df
+
+
+class _Context:
+    def __init__(self, lineage, sketches, epsilon):
+        self.lineage = lineage
+        self.epsilon = epsilon
+        # 입력 데이터셋에서 값이 바뀌지 않은 컬럼의 스케치만 재사용할 수 있습니다.
+        self.sketches = dict(sketches or {})
+        if lineage is not None:
+            for col in lineage.changed:
+                self.sketches.pop(col, None)
+
+    def changed(self, columns, steps):
+        for col in columns:
+            self.sketches.pop(col, None)
+        if self.lineage is not None:
+            self.lineage.change(columns, stage_key(steps, self.epsilon))
+
+    def dropped(self, removed, steps):
+        if len(removed):
+            self.sketches = {}
+        if self.lineage is not None:
+            self.lineage.drop_rows(removed, stage_key(steps, self.epsilon))
+
+
+def stage_key(steps, epsilon):
+    return f"{'|'.join(step.key for step in steps)}:{epsilon}"
+
+
+def _target_columns(df, columns, numeric_only):
+    """단계의 대상 컬럼 (columns를 지정하지 않으면 수치형 컬럼 또는 전체 컬럼)"""
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    if columns is None:
+        return list(numeric_cols) if numeric_only else list(df.columns)
+
+    missing = [col for col in columns if col not in df.columns]
+    if missing:
+        raise PipelineError(f"컬럼을 찾을 수 없습니다: {', '.join(map(str, missing))}")
+    if numeric_only:
+        not_numeric = [col for col in columns if col not in numeric_cols]
+        if not_numeric:
+            raise PipelineError(f"수치형 컬럼이 아닙니다: {', '.join(map(str, not_numeric))}")
+    return list(columns)
+
+
+def _run_fill(df, steps, context):
+    """
+    결측치 채우기 단계들을 fillna 한 번으로 실행합니다.
+    채울 값은 컬럼 자신의 값으로만 정해지므로, 먼저 나온 단계가 채운 컬럼은 뒤 단계에서 건너뜁니다.
+    """
+    null_counts = df.isna().sum()
+    fill_values = {}
+    for step in steps:
+        # 컬럼별 방식({컬럼명: 방식})이면 그 컬럼들이 대상입니다.
+        strategies = step.strategy if isinstance(step.strategy, dict) else None
+        if strategies is not None:
+            columns = _target_columns(df, list(strategies), numeric_only=False)
+        else:
+            columns = _target_columns(df, step.columns, numeric_only=step.strategy in ('mean', 'median'))
+
+        for col in columns:
+            if col in fill_values or null_counts[col] == 0:
+                continue
+            strategy = strategies[col] if strategies is not None else step.strategy
+            value = _fill_value(df[col], strategy, step.value)
+            if value is not None:
+                fill_values[col] = value
+
+    if fill_values:
+        df = fill_missing(df, fill_values)
+    logger.debug("결측치 대체 완료 (대상 컬럼): %s", list(fill_values))
+    context.changed(list(fill_values), steps)
+    return df
+
+
+def _fill_value(series, strategy, constant):
+    """컬럼을 채울 값. 채울 수 없으면(수치형이 아닌 컬럼의 평균, 값이 하나도 없는 컬럼 등) None"""
+    if strategy in ('mean', 'median'):
+        if not pd.api.types.is_numeric_dtype(series):
+            raise PipelineError(f"'{series.name}' 컬럼은 수치형이 아니라 {strategy}로 채울 수 없습니다.")
+        series = widen_floats(series)
+        value = series.mean() if strategy == 'mean' else series.median()
+    elif strategy == 'mode':
+        # 최빈값이 여러 개일 수 있으므로 첫 번째([0])를 선택
+        modes = series.mode()
+        value = modes.iloc[0] if len(modes) else None
+    elif strategy == 'zero':
+        value = 0
+    else:
+        value = constant
+    if value is None or (np.isscalar(value) and pd.isna(value)):
+        return None
+    return value
+
+
+def _run_filter(df, steps, context):
+    """
+    행 삭제 단계들을 실행합니다. 각 단계는 남길 행 조건(keep)만 좁혀 가고,
+    실제로 행을 걸러 새 DataFrame을 만드는 것은 마지막에 한 번뿐입니다.
+    """
+    keep = pd.Series(True, index=df.index)
+    for step in steps:
+        if step.action == 'drop_na':
+            columns = _target_columns(df, step.columns, numeric_only=False)
+            keep &= df[columns].notna().all(axis=1).to_numpy()
+            continue
+
+        # drop_outliers: 앞 단계에서 남은 행만으로 IQR 기준을 계산합니다.
+        numeric_cols = _target_columns(df, step.columns, numeric_only=True)
+        remaining = df if keep.all() else df.loc[keep.to_numpy(), numeric_cols]
+        sketches = context.sketches if remaining is df else None
+        lower_bound, upper_bound = iqr_bounds(remaining, numeric_cols, step.iqr_multiplier, sketches, context.epsilon)
+        # 조건: (값 < Lower) 또는 (값 > Upper) 인 데이터가 하나라도 있는 행 제거
+        outlier_condition = ((df[numeric_cols] < lower_bound) | (df[numeric_cols] > upper_bound)).any(axis=1)
+        keep &= ~outlier_condition.to_numpy()
+
+    mask = keep.to_numpy()
+    removed = df[~mask]
+    original_rows = len(df)
+    df = df[mask]
+    logger.debug("행 제거 (%s): %d -> %d", ', '.join(step.action for step in steps), original_rows, len(df))
+    context.dropped(removed, steps)
+    return df
+
+
+def _run_cap_outliers(df, step, context):
+    """윈저라이징 (Capping): 이상치를 상한값/하한값으로 대체"""
+    numeric_cols = _target_columns(df, step.columns, numeric_only=True)
+    lower_bound, upper_bound = iqr_bounds(df, numeric_cols, step.iqr_multiplier, context.sketches, context.epsilon)
+
+    capped_cols = []
+    for col in numeric_cols:
+        before = df[col]
+        # 💡 float64 복사본 하나에 제자리(copyto)로 치환합니다. (np.where 두 번은 임시 배열을 두 번 만듦)
+        values = before.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        # 하한값보다 작은 값은 하한값으로 치환
+        np.copyto(values, lower_bound[col], where=values < lower_bound[col])
+        # 상한값보다 큰 값은 상한값으로 치환
+        np.copyto(values, upper_bound[col], where=values > upper_bound[col])
+        df[col] = values
+        if df[col].dtype != before.dtype or not df[col].equals(before):
+            capped_cols.append(col)
+    logger.debug("이상치 윈저라이징(Capping) 완료: %s", capped_cols)
+    context.changed(capped_cols, [step])
+    return df
@@ -0,0 +1,101 @@
+# backend/core/profile_cache.py
+
+"""
+컬럼 프로파일 캐시 (증분 재프로파일링).
+
+전처리 작업 하나가 값을 바꾸는 컬럼은 보통 일부뿐입니다. 데이터셋마다 컬럼별 프로파일과
+컬럼 지문(fingerprint)을 'profiles' 부가 정보로 저장해 두고, 다음 버전에서는 값이 바뀌지
+않은 컬럼의 프로파일을 그대로 재사용합니다.
+
+- 지문: 업로드 데이터셋은 (dataset_id, 컬럼명)으로, 전처리 결과는 (이전 지문, 작업 이름)으로
+  만듭니다. 값이 바뀌지 않은 컬럼은 이전 지문을 그대로 물려받으므로, 컬럼 값을 다시 읽어
+  해시하지 않고도 같은 내용인지 알 수 있습니다.
+- 행 삭제 작업(drop_na, drop_outliers): 삭제된 행만 프로파일링해서 이전 프로파일에서 뺍니다.
+  (profiling.reprofile_frame 참고)
+"""
+
+import hashlib
+
+import pandas as pd
+
+ARTIFACT_NAME = 'profiles'
+
+
+def fingerprint(*parts):
+    """지문 재료(문자열로 변환 가능한 값)들로 32자리 hex 지문을 만듭니다."""
+    hasher = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        hasher.update(str(part).encode())
+        hasher.update(b'\0')
+    return hasher.hexdigest()
+
+
+class ColumnLineage:
+    """
+    데이터셋 하나를 만드는 동안 컬럼이 어떻게 바뀌었는지 기록합니다.
+    - change(): 값이 바뀐 컬럼 (이전 프로파일 재사용 불가)
+    - drop_rows(): 행 삭제 (이전 프로파일에서 삭제된 행을 빼서 갱신)
+    """
+
+    def __init__(self, parent_id, parent_columns=None):
+        self.parent_id = parent_id
+        # 컬럼명 -> {'fingerprint', 'epsilon', 'profile', 'summary'}
+        self.parent_columns = parent_columns or {}
+        self.fingerprints = {}
+        self.changed = set()
+        self.removed = None
+
+    @classmethod
+    def load(cls, store, parent_id):
+        """parent_id 데이터셋에 저장된 프로파일 캐시에서 시작합니다. (없으면 빈 캐시)"""
+        return cls(parent_id, store.get_artifact(parent_id, ARTIFACT_NAME))
+
+    def fingerprint_of(self, col):
+        fp = self.fingerprints.get(col)
+        if fp is None:
+            entry = self.parent_columns.get(col)
+            fp = entry['fingerprint'] if entry else fingerprint(self.parent_id, col)
+        return fp
+
+    def change(self, columns, step):
+        for col in columns:
+            self.fingerprints[col] = fingerprint(self.fingerprint_of(col), step)
+            self.changed.add(col)
+
+    def drop_rows(self, removed, step):
+        """
+        removed: 삭제된 행(DataFrame). 삭제된 행이 없으면 지문도 그대로 둡니다.
+        여러 번 삭제하면 삭제된 행을 모두 모읍니다. (값이 바뀐 컬럼은 어차피 다시 계산하므로,
+        바뀌지 않은 컬럼 기준으로는 모은 행이 곧 이전 데이터셋에서 빠진 행입니다)
+        """
+        if not len(removed):
+            return
+        for col in removed.columns:
+            self.fingerprints[col] = fingerprint(self.fingerprint_of(col), step)
+        self.removed = removed if self.removed is None else pd.concat([self.removed, removed])
+
+    def unchanged(self, columns):
+        """값과 행이 이전 데이터셋과 같은 컬럼 (이전 데이터셋의 버퍼를 그대로 공유할 수 있음)"""
+        return [col for col in columns if col not in self.fingerprints]
+
+    def reusable(self, epsilon):
+        """값이 바뀌지 않은 컬럼의 이전 프로파일: 컬럼명 -> (ColumnProfile, 사분위수 요약)"""
+        return {
+            col: (entry['profile'], entry['summary'])
+            for col, entry in self.parent_columns.items()
+            if col not in self.changed and entry['epsilon'] == epsilon
+        }
+
+
+def save(store, dataset_id, lineage, profiles, quantiles, epsilon):
+    """dataset_id의 컬럼별 프로파일을 지문과 함께 저장합니다. (다음 전처리 결과에서 재사용)"""
+    columns = {
+        p.name: {
+            'fingerprint': lineage.fingerprint_of(p.name),
+            'epsilon': epsilon,
+            'profile': p,
+            'summary': quantiles.get(p.name),
+        }
+        for p in profiles
+    }
+    store.put_artifact(dataset_id, ARTIFACT_NAME, columns)
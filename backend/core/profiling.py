@@ -0,0 +1,550 @@
+# backend/core/profiling.py
+
+"""
+컬럼 단위 통계(프로파일) 계산 엔진.
+
+_analyze_dataframe이 만드는 기초 통계량(describe)과 데이터 품질(결측치/이상치) 정보를
+청크 단위로 누적 계산할 수 있도록 만든 모듈입니다.
+
+- ColumnProfile: 컬럼 하나의 부분 통계(개수, 평균/분산, 최소/최대, 결측치, 빈도수).
+  청크마다 만든 뒤 merge()로 합칠 수 있습니다. (청크/병렬 프로파일링)
+- profile_frame: DataFrame 전체를 컬럼당 한 번의 벡터 연산으로 프로파일링합니다.
+  (describe + isnull + df.copy() + to_numeric + quantile 반복을 대체)
+  profiler(core/parallel.py)를 넘기면 컬럼들을 프로세스 풀에 나눠 계산합니다.
+- quantile_summary: 정렬 한 번으로 사분위수와 IQR 이상치 개수를 함께 구합니다.
+- epsilon을 지정하면 정렬 대신 근사 분위수 스케치(core/sketches.py)를 사용합니다.
+  스케치도 청크별로 merge되므로 스트리밍 업로드에서 컬럼을 다시 읽지 않아도 됩니다.
+- reprofile_frame: 이전 버전의 프로파일을 재사용하여 바뀐 컬럼만 다시 프로파일링합니다.
+  행이 삭제된 경우 삭제된 행의 통계만 빼서 갱신합니다. (ColumnProfile.subtract)
+- build_analysis: 프로파일을 프론트엔드가 쓰는 table/stats/quality 표(SplitFrame)로 변환합니다.
+  표는 응답 형식(JSON/MessagePack/Arrow, core/renderers.py)이 정해진 뒤에 한 번만 직렬화됩니다.
+"""
+
+import copy
+import json
+
+import numpy as np
+import pandas as pd
+
+from . import events
+from .sketches import QuantileSketch
+
+# 범주형 컬럼의 빈도수를 정확히 추적할 최대 고유값 개수 (넘으면 상위값만 유지)
+MAX_TRACKED_CATEGORIES = 100_000
+# 고유값 개수 추정(KMV sketch)에 사용할 최소 해시 개수
+DISTINCT_SKETCH_SIZE = 4096
+
+NUMERIC = 'numeric'
+DATETIME = 'datetime'
+CATEGORICAL = 'categorical'
+
+# describe()가 컬럼 종류별로 만드는 통계 행
+_STATS_ROWS = {
+    CATEGORICAL: ['count', 'unique', 'top', 'freq'],
+    DATETIME: ['count', 'mean', 'min', '25%', '50%', '75%', 'max'],
+    NUMERIC: ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'],
+}
+
+
+def column_kind(series):
+    """describe()와 같은 기준으로 컬럼 종류를 판별합니다. (bool은 범주형)"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return DATETIME
+    if pd.api.types.is_bool_dtype(series) or not pd.api.types.is_numeric_dtype(series):
+        return CATEGORICAL
+    return NUMERIC
+
+
+def _float_values(series):
+    """컬럼 값을 float64 배열로 변환합니다. (결측치는 NaN, 날짜는 ns 단위 정수값)"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        values = series.array.asi8.astype(np.float64)
+        values[series.isna().to_numpy()] = np.nan
+        return values
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+class ColumnProfile:
+    """컬럼 하나의 (부분) 통계. 같은 컬럼의 다른 청크 프로파일과 merge()할 수 있습니다."""
+
+    def __init__(self, name, kind, is_numeric_dtype, epsilon=None):
+        self.name = name
+        self.kind = kind
+        # Data Type 행 표시용 (pd.api.types.is_numeric_dtype 기준, bool 포함)
+        self.is_numeric_dtype = is_numeric_dtype
+        self.rows = 0
+        self.nulls = 0
+
+        # 수치형: 개수/평균/편차제곱합(M2)/최소/최대 (Chan 병렬 분산 공식으로 병합)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+
+        # 범주형: 빈도수(정확) + 고유값 개수 추정용 최소 해시(KMV)
+        self.value_counts = {}
+        self.truncated = False
+        self.distinct_hashes = np.empty(0, dtype=np.uint64)
+        # 범주형이지만 숫자로 변환 가능한 값의 개수 (이상치 계산 대상 여부 판단용)
+        self.numeric_like = 0
+
+        # 근사 모드: 수치 값(범주형은 숫자로 변환된 값)의 분위수 스케치
+        self.sketch = QuantileSketch(epsilon) if epsilon else None
+
+    @classmethod
+    def from_series(cls, series, name=None, epsilon=None):
+        profile = cls(
+            name if name is not None else series.name,
+            column_kind(series),
+            pd.api.types.is_numeric_dtype(series),
+            epsilon=epsilon,
+        )
+        profile.update(series)
+        return profile
+
+    def update(self, series):
+        """청크 하나의 값을 반영합니다."""
+        if self.kind != CATEGORICAL:
+            values = _float_values(series)
+            valid = values[~np.isnan(values)]
+            self.rows += len(values)
+            self.nulls += len(values) - len(valid)
+            if len(valid):
+                self._add_moments(valid, float(valid.min()), float(valid.max()))
+                if self.sketch is not None:
+                    self.sketch.update(valid)
+            return
+
+        self.rows += len(series)
+        # value_counts 한 번으로 결측치/빈도수/고유값/숫자 변환 가능 여부를 모두 구합니다.
+        counts = series.value_counts(sort=True, dropna=True)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # category 컬럼은 한 번도 나오지 않은 범주도 0개로 세므로 뺍니다.
+            counts = counts[counts.to_numpy() > 0]
+        count = int(counts.sum())
+        self.nulls += len(series) - count
+        self.count += count
+
+        if self.truncated:
+            self._update_distinct(_hash_values(counts.index))
+        for key, value in zip(counts.index, counts.to_numpy()):
+            self.value_counts[key] = self.value_counts.get(key, 0) + int(value)
+        self._truncate_value_counts()
+
+        if pd.api.types.is_timedelta64_dtype(series):
+            self.numeric_like += count
+        elif not pd.api.types.is_bool_dtype(series):
+            # 고유값만 숫자로 변환해 보면 되므로 전체 컬럼을 변환하지 않습니다.
+            numeric_keys = pd.to_numeric(pd.Series(counts.index, dtype=object), errors='coerce').notna().to_numpy()
+            numeric_like = int(counts.to_numpy()[numeric_keys].sum())
+            self.numeric_like += numeric_like
+            if numeric_like and self.sketch is not None:
+                self.sketch.update(pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan))
+
+    def update_sorted(self, values):
+        """
+        정렬된 수치형 값(NaN은 뒤쪽)을 반영합니다.
+        정렬된 배열에서는 최소/최대가 양 끝 값이므로 평균/편차제곱합만 추가로 계산합니다.
+        """
+        n_valid = int(np.searchsorted(values, np.nan, side='left'))
+        self.rows += len(values)
+        self.nulls += len(values) - n_valid
+        valid = values[:n_valid]
+        if n_valid:
+            self._add_moments(valid, float(valid[0]), float(valid[-1]))
+        return valid
+
+    def merge(self, other):
+        """같은 컬럼의 다른 부분 프로파일을 합칩니다."""
+        self.rows += other.rows
+        self.nulls += other.nulls
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+        if self.kind != CATEGORICAL:
+            if other.count:
+                self._merge_moments(other.count, other.mean, other.m2, other.min, other.max)
+            return self
+
+        if self.truncated or other.truncated:
+            self.distinct_hashes = self._distinct_sketch()
+            self._update_distinct(other._distinct_sketch())
+            self.truncated = True
+        for key, value in other.value_counts.items():
+            self.value_counts[key] = self.value_counts.get(key, 0) + value
+        self.count += other.count
+        self.numeric_like += other.numeric_like
+        self._truncate_value_counts()
+        return self
+
+    def subtract(self, removed):
+        """
+        삭제된 행의 부분 프로파일(removed)을 뺀 새 프로파일을 반환합니다.
+        결측치/빈도수는 정확히 뺄 수 있지만, 값이 삭제된 수치형 컬럼(최소/최대/사분위수),
+        빈도수가 잘린 컬럼, 스케치가 있는 컬럼은 남은 값을 알 수 없으므로 None을 반환합니다.
+        (빈도수가 같은 최빈값이 여러 개면 describe()와 다른 값이 top으로 선택될 수 있습니다)
+        """
+        if removed.count and (self.kind != CATEGORICAL or self.truncated):
+            return None
+        if removed.numeric_like and self.sketch is not None:
+            return None
+
+        result = copy.copy(self)
+        result.rows -= removed.rows
+        result.nulls -= removed.nulls
+        if not removed.count:
+            return result
+
+        result.value_counts = dict(self.value_counts)
+        for key, value in removed.value_counts.items():
+            remaining = result.value_counts.get(key, 0) - value
+            if remaining < 0:
+                return None
+            if remaining:
+                result.value_counts[key] = remaining
+            else:
+                del result.value_counts[key]
+        result.count -= removed.count
+        result.numeric_like -= removed.numeric_like
+        return result
+
+    # --- 결과 값 ---
+    def quantile_summary(self):
+        """
+        누적된 정보만으로 구할 수 있는 사분위수/이상치 요약을 반환합니다.
+        (스케치가 없는 수치형 컬럼은 원본 값이 필요하므로 None)
+        """
+        if self.kind == CATEGORICAL:
+            if self.is_numeric_dtype:  # bool 컬럼은 이상치 계산 대상이 아님
+                return None
+            if self.numeric_like == 0:
+                # 숫자로 변환되는 값이 하나도 없으면 이상치도 없습니다.
+                return {'25%': np.nan, '50%': np.nan, '75%': np.nan, 'outliers': 0}
+        if self.sketch is None:
+            return None
+        return sketch_summary(self.sketch)
+
+    @property
+    def std(self):
+        return np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+
+    @property
+    def unique(self):
+        if not self.truncated:
+            return len(self.value_counts)
+        # KMV 추정: k번째로 작은 해시값으로 전체 고유값 개수를 추정
+        k = len(self.distinct_hashes)
+        if k < DISTINCT_SKETCH_SIZE:
+            return k
+        return int((k - 1) / (float(self.distinct_hashes[-1]) / 2.0 ** 64))
+
+    @property
+    def top(self):
+        if not self.value_counts:
+            return np.nan, np.nan
+        key = max(self.value_counts, key=self.value_counts.get)
+        return key, self.value_counts[key]
+
+    # --- 내부 구현 ---
+    def _add_moments(self, valid, min_value, max_value):
+        chunk_mean = float(valid.mean())
+        deviation = valid - chunk_mean
+        self._merge_moments(len(valid), chunk_mean, float(np.dot(deviation, deviation)), min_value, max_value)
+
+    def _merge_moments(self, n_b, mean_b, m2_b, min_b, max_b):
+        n_a = self.count
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * n_a * n_b / n
+        self.count = n
+        self.min = min_b if np.isnan(self.min) else min(self.min, min_b)
+        self.max = max_b if np.isnan(self.max) else max(self.max, max_b)
+
+    def _distinct_sketch(self):
+        """고유값 개수 추정용 최소 해시 목록 (잘리기 전이면 빈도수 키에서 바로 계산)"""
+        if self.truncated:
+            return self.distinct_hashes
+        hashes = np.unique(_hash_values(list(self.value_counts)))
+        return hashes[:DISTINCT_SKETCH_SIZE]
+
+    def _update_distinct(self, hashes):
+        merged = np.union1d(self.distinct_hashes, hashes)
+        self.distinct_hashes = merged[:DISTINCT_SKETCH_SIZE]
+
+    def _truncate_value_counts(self):
+        if len(self.value_counts) <= MAX_TRACKED_CATEGORIES:
+            return
+        # 고유값이 너무 많으면 상위 절반만 남겨 메모리를 제한합니다. (top/freq는 근사값)
+        self.distinct_hashes = self._distinct_sketch()
+        keep = sorted(self.value_counts.items(), key=lambda kv: kv[1], reverse=True)
+        self.value_counts = dict(keep[:MAX_TRACKED_CATEGORIES // 2])
+        self.truncated = True
+
+
+def _hash_values(values):
+    return pd.util.hash_pandas_object(pd.Series(values, dtype=object), index=False).to_numpy()
+
+
+def profile_column(series, name=None, epsilon=None):
+    """
+    컬럼 하나를 프로파일링하여 (ColumnProfile, 사분위수/이상치 요약)을 반환합니다.
+    - 수치형/날짜형: 한 번 정렬한 배열로 최소/최대/평균/표준편차/사분위수/이상치를 모두 계산
+    - 범주형: value_counts 한 번으로 빈도수/결측치를 계산하고, 숫자로 변환 가능한 값이
+      있을 때만 변환해서 이상치를 계산 (bool 컬럼은 이상치 계산 대상 아님)
+    - epsilon 지정 시: 정렬 대신 분위수 스케치로 사분위수/이상치를 근사 계산
+    """
+    profile = ColumnProfile(
+        name if name is not None else series.name,
+        column_kind(series),
+        pd.api.types.is_numeric_dtype(series),
+        epsilon=epsilon,
+    )
+    if profile.kind != CATEGORICAL and epsilon is None:
+        valid = profile.update_sorted(np.sort(_float_values(series)))
+        return profile, quantile_summary(valid, presorted=True)
+
+    profile.update(series)
+    return profile, _complete_summary(profile, series)
+
+
+def _complete_summary(profile, series):
+    summary = profile.quantile_summary()
+    if summary is None and profile.kind == CATEGORICAL and not profile.is_numeric_dtype:
+        # 숫자로 변환 가능한 값이 섞인 범주형 컬럼: 변환한 값으로 정확한 사분위수 계산
+        summary = quantile_summary(pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan))
+    return summary
+
+
+def profile_frame(df, epsilon=None, profiler=None):
+    """
+    DataFrame의 모든 컬럼을 프로파일링하여 (프로파일 목록, 컬럼명 -> 사분위수 요약)을 반환합니다.
+    profiler: 컬럼 묶음을 대신 계산할 객체 (parallel.ParallelProfiler). None이면 직렬 계산
+    """
+    profiles = []
+    quantiles = {}
+    results = _profile_positions(df, range(len(df.columns)), epsilon, profiler)
+    for col, (profile, summary) in zip(df.columns, results):
+        profiles.append(profile)
+        if summary is not None:
+            quantiles[col] = summary
+    return profiles, quantiles
+
+
+def _profile_positions(df, positions, epsilon, profiler):
+    positions = list(positions)
+    if profiler is not None:
+        return profiler.profile_columns(df, positions, epsilon)
+    results = []
+    for i in positions:
+        results.append(profile_column(df.iloc[:, i], name=df.columns[i], epsilon=epsilon))
+        # 이벤트 스트림 요청(core/events.py)이면 컬럼마다 진행 상황을 보냅니다.
+        events.emit('progress', stage='profile', rows=len(df), columns=len(results), totalColumns=len(positions))
+    return results
+
+
+def reprofile_frame(df, cached, epsilon=None, removed=None, profiler=None):
+    """
+    이전 버전의 프로파일을 재사용하여 바뀐 컬럼만 다시 프로파일링합니다.
+
+    - cached: 컬럼명 -> (ColumnProfile, 사분위수 요약). 값이 바뀌지 않은 컬럼의 이전 프로파일
+    - removed: 이전 버전에서 삭제된 행(DataFrame). 지정하면 cached 프로파일에서 삭제된 행의
+      통계를 빼서 갱신하고, 뺄 수 없는 컬럼만 다시 계산합니다.
+    - profiler: profile_frame과 같음
+    반환: (프로파일 목록, 컬럼명 -> 사분위수 요약, 다시 계산한 컬럼 목록)
+    """
+    # 컬럼명이 중복되거나, 삭제된 행이 남은 행보다 많으면 처음부터 계산하는 편이 낫습니다.
+    if not df.columns.is_unique or (removed is not None and len(removed) >= len(df)):
+        cached = {}
+
+    results = []
+    pending = []
+    for i, col in enumerate(df.columns):
+        series = df.iloc[:, i]
+        result = None
+        entry = cached.get(col)
+        if entry is not None and entry[0].kind == column_kind(series) \
+                and entry[0].is_numeric_dtype == pd.api.types.is_numeric_dtype(series):
+            result = entry if removed is None else _subtract_rows(entry, removed[col], series)
+        if result is None:
+            pending.append(i)
+        results.append(result)
+
+    # 재사용할 수 없는 컬럼만 모아서 한 번에 계산합니다. (profiler가 있으면 병렬)
+    for i, result in zip(pending, _profile_positions(df, pending, epsilon, profiler)):
+        results[i] = result
+
+    profiles = []
+    quantiles = {}
+    for col, (profile, summary) in zip(df.columns, results):
+        profiles.append(profile)
+        if summary is not None:
+            quantiles[col] = summary
+    return profiles, quantiles, [df.columns[i] for i in pending]
+
+
+def _subtract_rows(entry, removed_series, series):
+    """(프로파일, 요약)에서 삭제된 행을 뺍니다. 뺄 수 없으면 None."""
+    profile, summary = entry
+    removed = ColumnProfile.from_series(removed_series, name=profile.name)
+    updated = profile.subtract(removed)
+    if updated is None:
+        return None
+    # 삭제된 행에 (숫자로 변환되는) 값이 없으면 사분위수/이상치 개수도 그대로입니다.
+    if removed.count and removed.numeric_like:
+        summary = _complete_summary(updated, series)
+    return updated, summary
+
+
+def profile_chunk(df, epsilon=None):
+    """청크 하나의 부분 프로파일 목록을 만듭니다. (merge_profiles로 누적)"""
+    return [ColumnProfile.from_series(df.iloc[:, i], name=col, epsilon=epsilon) for i, col in enumerate(df.columns)]
+
+
+def merge_profiles(profiles, other_profiles):
+    """컬럼 순서가 같은 두 부분 프로파일 목록을 합칩니다. (profiles가 None이면 other를 그대로 사용)"""
+    if profiles is None:
+        return other_profiles
+    for profile, other in zip(profiles, other_profiles):
+        profile.merge(other)
+    return profiles
+
+
+def quantile_summary(values, iqr_multiplier=1.5, presorted=False):
+    """
+    NaN을 제외한 값을 한 번 정렬해서 사분위수(25/50/75%)와 IQR 이상치 개수를 함께 구합니다.
+    (pandas quantile과 같은 linear 보간, presorted=True면 이미 정렬된 NaN 없는 배열)
+    """
+    if not presorted:
+        values = np.asarray(values, dtype=np.float64)
+        values = np.sort(values[~np.isnan(values)])
+    n = len(values)
+    if n == 0:
+        return {'25%': np.nan, '50%': np.nan, '75%': np.nan, 'outliers': 0}
+
+    quantiles = {}
+    for label, q in (('25%', 0.25), ('50%', 0.5), ('75%', 0.75)):
+        position = q * (n - 1)
+        lower = int(np.floor(position))
+        upper = min(lower + 1, n - 1)
+        quantiles[label] = values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+    iqr = quantiles['75%'] - quantiles['25%']
+    lower_bound = quantiles['25%'] - iqr_multiplier * iqr
+    upper_bound = quantiles['75%'] + iqr_multiplier * iqr
+    inside = np.searchsorted(values, upper_bound, side='right') - np.searchsorted(values, lower_bound, side='left')
+    quantiles['outliers'] = int(n - inside)
+    return quantiles
+
+
+def sketch_summary(sketch, iqr_multiplier=1.5):
+    """quantile_summary와 같은 형식의 결과를 분위수 스케치로 근사 계산합니다."""
+    q1, q2, q3 = sketch.quantiles([0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    outliers = sketch.count_outside(q1 - iqr_multiplier * iqr, q3 + iqr_multiplier * iqr)
+    return {'25%': q1, '50%': q2, '75%': q3, 'outliers': outliers}
+
+
+class SplitFrame:
+    """
+    응답에 넣을 표 (orient='split' 형식의 DataFrame).
+    💡 여기서 JSON 문자열로 만들면 MessagePack/Arrow 응답에서 문자열을 한 번 더 감싸게 되므로,
+       직렬화는 렌더러(core/renderers.py)가 응답 형식을 정한 뒤에 합니다.
+    - na_rep: 화면에 표시할 결측치 문자열 (JSON/MessagePack만 적용, Arrow는 null 그대로)
+    """
+
+    def __init__(self, df, na_rep=None):
+        self.df = df
+        self.na_rep = na_rep
+
+    def to_json(self):
+        """지금까지의 응답과 같은 to_json(orient='split') 문자열"""
+        df = self.df
+        if self.na_rep is not None:
+            df = df.astype(object).where(pd.notnull(df), self.na_rep)
+        return df.to_json(orient='split', force_ascii=False)
+
+    def to_split(self):
+        """{'columns', 'index', 'data'} (값은 JSON 응답과 같음: 결측치 -> null 또는 na_rep, 날짜 -> epoch ms)"""
+        return json.loads(self.to_json())
+
+
+def table_frame(df):
+    """미리보기 테이블 (orient='split', 결측치는 '-')"""
+    return SplitFrame(df, na_rep='-')
+
+
+def build_analysis(preview_df, profiles, quantiles, total_rows):
+    """
+    프로파일 결과를 _analyze_dataframe과 같은 형식(table/stats/quality 표)으로 변환합니다.
+
+    - preview_df: 미리보기용 상위 행
+    - profiles: 컬럼 순서대로 된 ColumnProfile 목록
+    - quantiles: 컬럼명 -> quantile_summary 결과 (이상치 계산 대상이 아닌 컬럼은 없음)
+    """
+    # --- 1. 미리보기 테이블 ---
+    preview_table = table_frame(preview_df)
+
+    # --- 2. 기초 통계량 (describe(include='all')와 같은 행 구성) ---
+    columns = [p.name for p in profiles]
+    # describe()처럼 행 개수가 적은 종류부터 행 이름을 합칩니다.
+    rows = []
+    for kind_rows in sorted((_STATS_ROWS[p.kind] for p in profiles), key=len):
+        rows.extend(row for row in kind_rows if row not in rows)
+
+    stats = {}
+    for p in profiles:
+        if p.kind == NUMERIC:
+            q = quantiles.get(p.name, {})
+            stats[p.name] = {
+                'count': float(p.count), 'mean': p.mean if p.count else np.nan, 'std': p.std,
+                'min': p.min, '25%': q.get('25%', np.nan), '50%': q.get('50%', np.nan),
+                '75%': q.get('75%', np.nan), 'max': p.max,
+            }
+        elif p.kind == DATETIME:
+            q = quantiles.get(p.name, {})
+            values = {'mean': p.mean if p.count else np.nan, 'min': p.min, 'max': p.max,
+                      '25%': q.get('25%', np.nan), '50%': q.get('50%', np.nan), '75%': q.get('75%', np.nan)}
+            stats[p.name] = {'count': p.count}
+            stats[p.name].update({k: pd.NaT if np.isnan(v) else pd.Timestamp(round(v)) for k, v in values.items()})
+        else:
+            top, freq = p.top
+            stats[p.name] = {'count': p.count, 'unique': p.unique, 'top': top, 'freq': freq}
+
+    stats_df = pd.DataFrame(stats, index=rows, columns=columns)
+    dtype_df = pd.DataFrame(
+        [{p.name: 'Numeric (수치형)' if p.is_numeric_dtype else 'Categorical (범주형)' for p in profiles}],
+        index=['Data Type'],
+    )
+    stats_df = pd.concat([dtype_df, stats_df]).reset_index()
+    stats_df.rename(columns={'index': '구분'}, inplace=True)
+    stats_df = stats_df.astype(object).where(pd.notnull(stats_df), '-')
+
+    # --- 3. 데이터 품질 ---
+    missing_counts = pd.Series({p.name: p.nulls for p in profiles}, index=columns, dtype=np.int64)
+    if total_rows > 0:
+        missing_percent = (missing_counts / total_rows * 100).round(2)
+    else:
+        missing_percent = pd.Series(0.0, index=columns)
+
+    outlier_counts = pd.Series('-', index=columns, dtype=object)
+    outlier_percent = pd.Series('-', index=columns, dtype=object)
+    for name, q in quantiles.items():
+        outlier_counts[name] = q['outliers']
+        outlier_percent[name] = round(q['outliers'] / total_rows * 100, 2) if total_rows > 0 else 0.0
+
+    quality_df = pd.DataFrame({
+        '결측치 개수': missing_counts,
+        '결측치 비율(%)': missing_percent,
+        '이상치 개수': outlier_counts,
+        '이상치 비율(%)': outlier_percent
+    })
+    quality_df = quality_df.transpose().reset_index()
+    quality_df.rename(columns={'index': '구분'}, inplace=True)
+    quality_df = quality_df.astype(object).where(pd.notnull(quality_df), '-')
+
+    return {
+        'tableData': preview_table,
+        'statsData': SplitFrame(stats_df),
+        'qualityData': SplitFrame(quality_df)
+    }
@@ -0,0 +1,120 @@
+# backend/core/registry.py
+
+"""
+학습 모델 레지스트리.
+
+학습 작업(core/jobs.py)이 끝나면 학습된 모델과 전처리 상태(training.FittedModel)를 버전 ID와 함께 저장합니다.
+예측 요청(PredictView)은 다시 학습하지 않고 저장된 모델로 바로 예측합니다.
+
+- 디스크: settings.MODEL_REGISTRY['DIR']에 <model_id>.joblib 파일로 저장 (모든 워커가 공유)
+- DB: TrainedModel 행에 이름(모델 종류:목표 컬럼), 버전, 성능 지표, 특성 컬럼을 기록
+- 메모리: 워커(프로세스)별 LRU 캐시 (CACHE_SIZE개). 자주 쓰는 모델은 파일을 다시 읽지 않습니다.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import joblib
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Max
+
+from .models import TrainedModel
+
+
+class ModelNotFound(KeyError):
+    """model_id에 해당하는 모델이 없거나 모델 파일이 사라진 경우"""
+
+
+class ModelRegistry:
+    def __init__(self, directory, cache_size):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.cache_size = cache_size
+
+        self._lock = threading.Lock()
+        # model_id -> FittedModel
+        self._cache = OrderedDict()
+
+    def register(self, fitted, params, metrics, job_id=None):
+        """fitted(training.FittedModel)를 새 버전으로 저장하고 TrainedModel을 반환합니다."""
+        name = f"{params.get('model_name')}:{fitted.target}"
+        entry = TrainedModel(name=name, task=fitted.task, params=params, metrics=metrics,
+                             feature_columns=fitted.preprocessor.feature_columns, job_id=job_id)
+
+        path = self._path(entry.id)
+        tmp_path = path.with_suffix('.tmp')
+        joblib.dump(fitted, tmp_path)
+        os.replace(tmp_path, path)
+
+        # 💡 같은 이름을 동시에 등록하면 버전이 겹칠 수 있으므로, 겹치면 다음 버전으로 다시 시도합니다.
+        for _ in range(5):
+            entry.version = (TrainedModel.objects.filter(name=name).aggregate(v=Max('version'))['v'] or 0) + 1
+            try:
+                with transaction.atomic():
+                    entry.save(force_insert=True)
+                break
+            except IntegrityError:
+                continue
+        else:
+            path.unlink(missing_ok=True)
+            raise RuntimeError(f"모델 버전을 정하지 못했습니다: {name}")
+
+        self._remember(entry.id, fitted)
+        return entry
+
+    def get(self, model_id):
+        """(TrainedModel, FittedModel)을 반환합니다. 없으면 ModelNotFound."""
+        try:
+            entry = TrainedModel.objects.get(pk=model_id)
+        except TrainedModel.DoesNotExist:
+            raise ModelNotFound(model_id)
+
+        with self._lock:
+            fitted = self._cache.get(entry.id)
+            if fitted is not None:
+                self._cache.move_to_end(entry.id)
+                return entry, fitted
+
+        try:
+            fitted = joblib.load(self._path(entry.id))
+        except FileNotFoundError:
+            raise ModelNotFound(model_id)
+        self._remember(entry.id, fitted)
+        return entry, fitted
+
+    def delete(self, model_id):
+        """모델 메타데이터와 파일을 지웁니다. 없는(이미 지운) 모델이면 ModelNotFound."""
+        with self._lock:
+            self._cache.pop(model_id, None)
+        deleted, _ = TrainedModel.objects.filter(pk=model_id).delete()
+        self._path(model_id).unlink(missing_ok=True)
+        if not deleted:
+            raise ModelNotFound(model_id)
+
+    def _path(self, model_id):
+        return self.directory / f"{model_id.hex}.joblib"
+
+    def _remember(self, model_id, fitted):
+        with self._lock:
+            self._cache[model_id] = fitted
+            self._cache.move_to_end(model_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry():
+    """settings.MODEL_REGISTRY 설정으로 만든 워커 단위 싱글톤 레지스트리를 반환합니다."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                config = settings.MODEL_REGISTRY
+                _registry = ModelRegistry(directory=config['DIR'], cache_size=config['CACHE_SIZE'])
+    return _registry
@@ -0,0 +1,149 @@
+# backend/core/renderers.py
+
+"""
+데이터 응답의 직렬화 형식 (DRF 렌더러).
+
+분석/전처리/행 조회 응답의 표(tableData 등)는 지금까지 to_json(orient='split') 문자열을 다시 JSON 응답에
+넣었기 때문에, 같은 값을 두 번 인코딩하고 브라우저도 JSON.parse를 두 번 해야 했습니다.
+표는 SplitFrame(core/profiling.py)으로 응답에 넣어 두고, 요청의 Accept 헤더(또는 ?format=)에 맞는 형식으로
+한 번만 직렬화합니다.
+
+- JSON (application/json, 기본): 지금까지와 똑같은 응답 (표는 split JSON 문자열)
+- MessagePack (application/msgpack, ?format=msgpack): 표를 문자열이 아닌 {'columns', 'index', 'data'} 값으로
+  💡 msgpack 패키지가 설치된 경우에만 사용할 수 있습니다. (선택 의존성)
+- Arrow IPC 스트림 (application/vnd.apache.arrow.stream, ?format=arrow): 본문은 주 표(tableData)의 Arrow 레코드 배치,
+  나머지 응답 필드는 스키마 메타데이터의 'response'에 JSON으로 넣습니다. (주 표 이름은 'frame')
+  💡 결측치는 '-' 대신 null, 숫자/날짜 컬럼은 문자열이 아닌 원래 타입 그대로 보냅니다.
+- 전송 압축(gzip/zstd)은 형식과 관계없이 core/middleware.py가 처리합니다.
+"""
+
+import datetime
+import json
+
+import numpy as np
+import pandas as pd
+from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from . import metrics
+from .columnar import pa
+from .profiling import SplitFrame
+
+try:
+    import msgpack
+except ImportError:  # msgpack은 선택 의존성
+    msgpack = None
+
+# Arrow 응답의 본문으로 보낼 표 (없으면 응답의 첫 번째 표)
+PRIMARY_FRAME = 'tableData'
+
+
+class FrameJSONEncoder(JSONEncoder):
+    """SplitFrame을 지금까지의 응답과 같은 split JSON 문자열로 인코딩합니다."""
+
+    def default(self, obj):
+        if isinstance(obj, SplitFrame):
+            return obj.to_json()
+        return super().default(obj)
+
+
+class FrameJSONRenderer(JSONRenderer):
+    encoder_class = FrameJSONEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with metrics.stage('serialize'):
+            return super().render(data, accepted_media_type, renderer_context)
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    @metrics.stage('serialize')
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=_native, use_bin_type=True)
+
+
+class ArrowIPCRenderer(BaseRenderer):
+    media_type = 'application/vnd.apache.arrow.stream'
+    format = 'arrow'
+    charset = None
+    render_style = 'binary'
+
+    @metrics.stage('serialize')
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if not isinstance(data, dict):
+            data = {'data': data}
+        name = _primary_frame(data)
+        table = arrow_table(data[name].df) if name is not None else pa.table({})
+        rest = {key: value for key, value in data.items() if key != name}
+        metadata = {
+            b'frame': (name or '').encode(),
+            b'response': json.dumps(rest, default=_native, ensure_ascii=False).encode(),
+        }
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **metadata})
+
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+
+def arrow_table(df):
+    """
+    DataFrame을 인덱스(행 번호)까지 포함한 pyarrow.Table로 바꿉니다.
+    💡 문자열/숫자가 섞인 object 컬럼은 Arrow로 표현할 수 없으므로 그 컬럼만 문자열로 바꿉니다. (결측치는 null 유지)
+    """
+    try:
+        return pa.Table.from_pandas(df, preserve_index=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        df = df.copy(deep=False)
+        for col in df.columns:
+            if df[col].dtype == object:
+                df[col] = df[col].astype(str).where(df[col].notna())
+        return pa.Table.from_pandas(df, preserve_index=True)
+
+
+def _primary_frame(data):
+    if isinstance(data.get(PRIMARY_FRAME), SplitFrame):
+        return PRIMARY_FRAME
+    return next((key for key, value in data.items() if isinstance(value, SplitFrame)), None)
+
+
+def _native(obj):
+    """MessagePack/JSON이 모르는 값 -> 기본 타입 (표는 split 값, 날짜는 epoch ms: to_json과 같음)"""
+    if isinstance(obj, SplitFrame):
+        return obj.to_split()
+    if obj is pd.NaT:
+        return None
+    if isinstance(obj, pd.Timestamp):
+        return int(obj.value // 1_000_000)
+    if isinstance(obj, datetime.datetime):
+        return int(obj.timestamp() * 1000)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def data_renderers():
+    """표가 들어 있는 응답에 쓸 렌더러 목록 (설치된 선택 의존성에 따라)"""
+    renderers = [FrameJSONRenderer]
+    if msgpack is not None:
+        renderers.append(MessagePackRenderer)
+    if pa is not None:
+        renderers.append(ArrowIPCRenderer)
+    renderers.append(BrowsableAPIRenderer)
+    return tuple(renderers)
+
+
+DATA_RENDERERS = data_renderers()
@@ -0,0 +1,147 @@
+# backend/core/result_cache.py
+
+"""
+전처리/학습 결과 캐시 (같은 데이터 + 같은 요청 -> 이전 결과).
+
+사용자가 같은 버튼(같은 데이터셋에 cap_outliers, 같은 목표 컬럼/모델로 학습 등)을 반복해서 누르면
+지금까지는 매번 처음부터 다시 계산했습니다. 결과를 데이터셋 지문 + 정규화한 요청 파라미터로 저장해 두고 재사용합니다.
+
+- 데이터셋 지문: 컬럼 지문(core/profile_cache.py)으로 만듭니다. 데이터를 다시 읽어 해시하지 않고,
+  dataset_id가 달라도 같은 업로드에 같은 전처리를 거친 데이터셋이면 같은 지문이 됩니다.
+  (프로파일 캐시가 없는 데이터셋(스트리밍 업로드)은 dataset_id, 즉 업로드 파일의 내용 해시)
+- 전처리(ProcessDataView / PipelineView): 결과 데이터셋의 분석 응답을 저장합니다.
+  결과 데이터셋이 저장소에 남아 있을 때만 사용합니다. (버전 그래프에서도 같은 자식 버전으로 이동, core/versions.py)
+- 학습(TrainModelView): 학습 작업 ID를 저장합니다. 같은 요청이 다시 오면 새 작업을 만들지 않고
+  그 작업을 돌려줍니다. (완료된 작업은 200, 아직 실행 중인 작업은 202. 실패/취소된 작업이나 모델이 삭제된 작업은 다시 학습)
+- 저장: SQLite 파일 하나 (모든 워커가 공유). 전체 크기가 MAX_MB를 넘으면 가장 오래 사용하지 않은 항목부터 지웁니다.
+- 적중/실패 횟수: dap_result_cache_requests_total{kind, result="hit"|"miss"} (GET /api/v1/metrics/)
+- 요청의 cache=false이면 캐시를 읽지 않고 다시 계산합니다. (결과는 저장)
+- 설정: settings.RESULT_CACHE
+"""
+
+import json
+import pickle
+import sqlite3
+import threading
+import time
+
+from django.conf import settings
+
+from . import metrics
+from .profile_cache import ColumnLineage, fingerprint
+
+PROCESS = 'process'
+TRAIN = 'train'
+
+# 💡 캐시에 넣는 값의 형식이나 키를 만드는 규칙이 바뀌면 올려서 기존 항목을 무효화합니다.
+_KEY_VERSION = 1
+
+
+def enabled(request=None):
+    """캐시를 읽을지 (설정이 켜져 있고, 요청이 cache=false가 아닌 경우)"""
+    if not settings.RESULT_CACHE['ENABLED']:
+        return False
+    return request is None or str(request.data.get('cache', '')).lower() not in ('false', '0')
+
+
+def dataset_key(store, dataset_id, lineage=None):
+    """데이터셋 내용의 지문 (lineage: 이미 불러온 dataset_id의 프로파일 캐시)"""
+    columns = (lineage or ColumnLineage.load(store, dataset_id)).parent_columns
+    if not columns:
+        return dataset_id
+    return fingerprint(*(f"{col}={entry['fingerprint']}" for col, entry in columns.items()))
+
+
+def process_key(data_key, steps, epsilon):
+    return fingerprint(_KEY_VERSION, PROCESS, data_key, epsilon, *[step.key for step in steps])
+
+
+def train_key(data_key, params):
+    """params: 학습 작업 파라미터 (dataset_id는 데이터셋 지문으로 대신하므로 제외)"""
+    params = {name: value for name, value in params.items() if name != 'dataset_id'}
+    return fingerprint(_KEY_VERSION, TRAIN, data_key, json.dumps(params, sort_keys=True, default=str))
+
+
+class ResultCache:
+    def __init__(self, path, max_bytes):
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        # 💡 sqlite3 연결은 스레드 사이에 공유할 수 없으므로 스레드마다 엽니다.
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, kind TEXT NOT NULL, value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+    def get(self, key):
+        """저장된 값을 반환합니다. 없으면 None"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        return None if row is None else pickle.loads(row[0])
+
+    def put(self, kind, key, value):
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            return
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO entries (key, kind, value, size, accessed) VALUES (?, ?, ?, ?, ?)",
+                         (key, kind, blob, len(blob), time.time()))
+            self._evict(conn)
+
+    def _evict(self, conn):
+        """전체 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 항목부터 지웁니다."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            # 💡 WAL 모드: 다른 워커가 쓰는 동안에도 읽기가 막히지 않습니다.
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+
+def lookup(kind, key, resolve=None):
+    """
+    캐시에서 값을 찾고 적중/실패 횟수를 기록합니다. 없으면 None
+    - resolve: 저장된 값 -> 돌려줄 값. 더 이상 쓸 수 없으면(결과 데이터셋 만료 등) None을 반환하는 함수 (실패로 기록)
+    """
+    value = get_result_cache().get(key)
+    if value is not None and resolve is not None:
+        value = resolve(value)
+    if settings.METRICS['ENABLED']:
+        metrics.get_metrics().cache_requests.inc((kind, 'miss' if value is None else 'hit'))
+    return value
+
+
+def save(kind, key, value):
+    get_result_cache().put(kind, key, value)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache():
+    """settings.RESULT_CACHE 설정으로 만든 워커 단위 싱글톤 캐시를 반환합니다."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                config = settings.RESULT_CACHE
+                _cache = ResultCache(config['PATH'], config['MAX_MB'] * 1024 * 1024)
+    return _cache
@@ -0,0 +1,257 @@
+# backend/core/rows.py
+
+"""
+데이터셋 행 구간(페이지) 조회.
+
+분석 응답의 미리보기는 상위 100개 행뿐이고, 전체 데이터(fullData)를 받으면 브라우저가 멈춥니다.
+저장소의 데이터셋에서 요청한 구간(offset, limit)의 행만 잘라서 돌려줍니다.
+
+- 정렬: 컬럼별 정렬 순서(행 위치의 순열)를 한 번만 계산해 두고, 페이지마다 그 순열의 구간만 씁니다.
+  (결측치는 오름차순/내림차순 모두 맨 뒤, 같은 값은 원래 행 순서)
+- 필터: 조건마다 전체 컬럼을 한 번의 벡터 연산으로 비교해 남길 행을 정하고,
+  (정렬, 필터) 조합의 최종 행 위치를 기억해 두므로 다음 페이지는 구간만 잘라 읽습니다.
+- 읽기: Arrow 파일이면 필요한 행만 take로 읽습니다. (데이터셋 전체를 메모리에 올리지 않음)
+- 캐시: 정렬 순서는 데이터셋 부가 정보로도 저장하므로 다른 워커도 다시 정렬하지 않습니다.
+  (워커별 LRU: settings.ROWS['CACHE_SIZE'])
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+
+from . import columnar
+from .profile_cache import fingerprint
+from .profiling import table_frame
+
+# 필터 연산자 (대소 비교는 수치형 컬럼만)
+OPERATORS = ('==', '!=', '<', '<=', '>', '>=', 'contains', 'isnull', 'notnull')
+_COMPARISONS = ('<', '<=', '>', '>=')
+
+
+class RowQueryError(ValueError):
+    """잘못된 정렬/필터 요청 (없는 컬럼, 지원하지 않는 연산자 등)"""
+
+
+def window(store, dataset_id, offset=0, limit=100, sort=None, descending=False, filters=None):
+    """
+    정렬/필터를 적용한 행 중 [offset, offset + limit) 구간을 반환합니다.
+    반환: {'tableData' (미리보기와 같은 표, 인덱스는 데이터셋의 행 인덱스), 'total', 'matched', 'offset', 'limit'}
+    - filters: [{'column', 'op', 'value'}, ...] (모든 조건을 만족하는 행)
+    """
+    source = _Source(store, dataset_id)
+    filters = filters or []
+    _validate(source, sort, filters)
+
+    positions = _positions(source, sort, descending, filters)
+    if positions is None:
+        # 정렬/필터가 없으면 행 위치 배열을 만들지 않습니다.
+        matched = source.num_rows
+        page = np.arange(min(offset, matched), min(offset + limit, matched))
+    else:
+        matched = len(positions)
+        page = positions[offset:offset + limit]
+
+    df = source.take(page)
+    return {
+        'tableData': table_frame(df),
+        'total': source.num_rows,
+        'matched': int(matched),
+        'offset': offset,
+        'limit': limit,
+    }
+
+
+def _validate(source, sort, filters):
+    columns = set(source.columns)
+    if sort is not None and sort not in columns:
+        raise RowQueryError(f"정렬할 컬럼을 찾을 수 없습니다: {sort}")
+    for condition in filters:
+        if not isinstance(condition, dict):
+            raise RowQueryError("필터는 {column, op, value} 형식이어야 합니다.")
+        if condition.get('column') not in columns:
+            raise RowQueryError(f"필터 컬럼을 찾을 수 없습니다: {condition.get('column')}")
+        if condition.get('op', '==') not in OPERATORS:
+            raise RowQueryError(f"지원하지 않는 필터 연산자입니다: {condition.get('op')} ({', '.join(OPERATORS)})")
+
+
+def _positions(source, sort, descending, filters):
+    """정렬/필터를 적용한 행 위치 배열 (정렬/필터가 모두 없으면 None)"""
+    if sort is None and not filters:
+        return None
+    key = fingerprint(source.dataset_id, sort, descending, *[
+        (c['column'], c.get('op', '=='), c.get('value')) for c in filters])
+    cache = get_row_cache()
+    positions = cache.get(key)
+    if positions is not None:
+        return positions
+
+    positions = sort_order(source, sort, descending) if sort is not None else None
+    if filters:
+        mask = np.ones(source.num_rows, dtype=bool)
+        for condition in filters:
+            mask &= _condition_mask(source.column(condition['column']), condition)
+        positions = np.flatnonzero(mask) if positions is None else positions[mask[positions]]
+    positions = _compact(positions)
+    cache.put(key, positions)
+    return positions
+
+
+def sort_order(source, column, descending=False):
+    """
+    column으로 정렬한 행 위치 순열 (결측치는 맨 뒤, 같은 값은 원래 순서)
+    💡 데이터셋 부가 정보로 저장해 두고, 워커 캐시에 없으면 다시 정렬하지 않고 불러옵니다.
+    """
+    name = f"sort-{fingerprint(column, descending)}"
+    key = fingerprint(source.dataset_id, name)
+    cache = get_row_cache()
+    order = cache.get(key)
+    if order is None:
+        order = source.store.get_artifact(source.dataset_id, name)
+    if order is None:
+        order = _compact(_argsort(source.column(column), descending))
+        source.store.put_artifact(source.dataset_id, name, order)
+    cache.put(key, order)
+    return order
+
+
+def _argsort(series, descending):
+    series = series.reset_index(drop=True)
+    try:
+        ordered = series.sort_values(ascending=not descending, kind='stable', na_position='last')
+    except TypeError:
+        # 문자열/숫자가 섞인 컬럼은 문자열로 비교합니다.
+        text = series.astype(str).where(series.notna())
+        ordered = text.sort_values(ascending=not descending, kind='stable', na_position='last')
+    return ordered.index.to_numpy()
+
+
+def _condition_mask(series, condition):
+    op = condition.get('op', '==')
+    value = condition.get('value')
+    if op == 'isnull':
+        return series.isna().to_numpy()
+    if op == 'notnull':
+        return series.notna().to_numpy()
+    if op == 'contains':
+        text = series.astype(str).where(series.notna(), '')
+        return text.str.contains(str(value), case=False, regex=False).to_numpy()
+
+    numeric = pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+    if numeric:
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            raise RowQueryError(f"'{series.name}' 컬럼은 수치형이므로 필터 값도 숫자여야 합니다: {value}")
+    elif op in _COMPARISONS:
+        raise RowQueryError(f"'{series.name}' 컬럼은 수치형이 아니라 {op} 조건을 쓸 수 없습니다.")
+    else:
+        # 범주형 값은 미리보기에 보이는 문자열 그대로 비교합니다.
+        series = series.astype(str).where(series.notna())
+        value = str(value)
+
+    if op == '==':
+        result = series == value
+    elif op == '!=':
+        result = series != value
+    elif op == '<':
+        result = series < value
+    elif op == '<=':
+        result = series <= value
+    elif op == '>':
+        result = series > value
+    else:
+        result = series >= value
+    return result.fillna(False).to_numpy(dtype=bool)
+
+
+def _compact(positions):
+    """행 위치 배열을 int32로 (20억 행 미만이면 메모리 절반)"""
+    if positions is not None and positions.dtype != np.int32 and len(positions) < np.iinfo(np.int32).max:
+        return positions.astype(np.int32)
+    return positions
+
+
+class _Source:
+    """
+    데이터셋을 읽는 방법: Arrow 파일이면 컬럼/행 단위로 mmap에서 읽고, 아니면 저장소의 DataFrame을 씁니다.
+    (데이터셋이 없으면 DatasetNotFound)
+    """
+
+    def __init__(self, store, dataset_id):
+        self.store = store
+        self.dataset_id = dataset_id
+        path = store.locate(dataset_id)
+        self.table = None
+        self.df = None
+        if path is not None and columnar.is_arrow(path):
+            self.table = columnar.open_table(path)
+            self.columns = _pandas_columns(self.table)
+            self.num_rows = self.table.num_rows
+            # RangeIndex는 파일에 값이 없으므로 잘라 읽은 행의 인덱스를 직접 계산합니다.
+            index_columns = (self.table.schema.pandas_metadata or {}).get('index_columns', [])
+            self.range_index = index_columns[0] if len(index_columns) == 1 and isinstance(index_columns[0], dict) \
+                else None
+        else:
+            self.df = store.get(dataset_id)
+            self.columns = list(self.df.columns)
+            self.num_rows = len(self.df)
+
+    def column(self, name):
+        if self.table is not None:
+            return columnar.table_to_frame(self.table.select([name]))[name]
+        return self.df[name]
+
+    def take(self, positions):
+        if self.table is None:
+            return self.df.iloc[positions]
+        df = columnar.table_to_frame(self.table.take(positions))
+        if self.range_index is not None:
+            start, step = self.range_index['start'], self.range_index['step']
+            df.index = pd.Index(start + np.asarray(positions, dtype=np.int64) * step, name=self.range_index.get('name'))
+        return df
+
+
+def _pandas_columns(table):
+    """pandas 메타데이터의 컬럼 이름 (인덱스로 저장된 컬럼 제외)"""
+    metadata = table.schema.pandas_metadata or {}
+    index_columns = {col for col in metadata.get('index_columns', []) if isinstance(col, str)}
+    return [col for col in table.schema.names if col not in index_columns]
+
+
+class RowCache:
+    """정렬 순서 / 필터 결과 행 위치 캐시 (워커 단위 LRU)"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, positions):
+        with self._lock:
+            self._entries[key] = positions
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_row_cache():
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = RowCache(settings.ROWS['CACHE_SIZE'])
+    return _cache
@@ -0,0 +1,149 @@
+# backend/core/sketches.py
+
+"""
+병합 가능한 근사 분위수 스케치 (KLL 방식).
+
+전체 컬럼을 정렬하지 않고도 분위수(사분위수)와 IQR 이상치 개수를 정해진 오차 안에서
+추정합니다. 청크별/워커별로 만든 스케치를 merge()로 합칠 수 있고, 크기가 작아서
+데이터셋과 함께 저장해 두었다가 이후 전처리(이상치 제거/대체)에서 다시 쓸 수 있습니다.
+
+- epsilon: 순위(rank) 기준 허용 오차. 0.01이면 "25% 지점"이 실제 24~26% 사이 값일 수 있습니다.
+- 레벨 h에 있는 값은 원본 값 2^h개를 대표합니다. 레벨이 용량을 넘으면 정렬 후
+  하나 걸러 하나씩(시작 위치는 무작위) 다음 레벨로 올려 보냅니다. (compaction)
+"""
+
+import numpy as np
+
+# 큰 배열을 넣을 때 한 번에 정렬하는 블록 크기 (캐시에 들어가는 크기로 나눠 정렬)
+_BLOCK_SIZE = 1 << 16
+# 레벨이 내려갈수록 용량이 줄어드는 비율 (KLL 논문의 c)
+_CAPACITY_DECAY = 2.0 / 3.0
+
+
+def sketch_size(epsilon):
+    """허용 오차(epsilon)에 맞는 KLL 파라미터 k (k=200이면 약 1% 오차)"""
+    return max(8, int(np.ceil(1.7 / epsilon)))
+
+
+class QuantileSketch:
+    def __init__(self, epsilon=0.01, seed=None):
+        self.epsilon = epsilon
+        self.k = sketch_size(epsilon)
+        self.n = 0
+        self.min = np.nan
+        self.max = np.nan
+        self.levels = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    # --- 값 추가 / 병합 ---
+    def update(self, values):
+        """값 배열을 추가합니다. (NaN은 무시)"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return self
+
+        self.n += len(values)
+        self.min = np.nanmin([self.min, values.min()])
+        self.max = np.nanmax([self.max, values.max()])
+
+        for start in range(0, len(values), _BLOCK_SIZE):
+            block = np.sort(values[start:start + _BLOCK_SIZE])
+            # 정렬된 블록은 하나 걸러 뽑아도 정렬 상태가 유지되므로,
+            # k개 이하가 될 때까지 여러 레벨을 한 번에 압축합니다.
+            level = 0
+            while len(block) > self.k:
+                block = block[self._rng.integers(2)::2]
+                level += 1
+            self._add(level, block)
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """다른 스케치(같은 epsilon)의 내용을 합칩니다."""
+        if other.n == 0:
+            return self
+        self.n += other.n
+        self.min = np.nanmin([self.min, other.min])
+        self.max = np.nanmax([self.max, other.max])
+        for level, items in enumerate(other.levels):
+            if len(items):
+                self._add(level, items)
+        self._compress()
+        return self
+
+    # --- 조회 ---
+    def quantiles(self, qs):
+        """분위수 목록(0~1)에 해당하는 근사값을 반환합니다."""
+        if self.n == 0:
+            return np.full(len(qs), np.nan)
+        items, cumulative = self._sorted_items()
+        total = cumulative[-1]
+        result = []
+        for q in qs:
+            if q <= 0:
+                result.append(self.min)
+            elif q >= 1:
+                result.append(self.max)
+            else:
+                index = min(int(np.searchsorted(cumulative, q * total, side='left')), len(items) - 1)
+                result.append(items[index])
+        return np.asarray(result, dtype=np.float64)
+
+    def count_outside(self, lower, upper):
+        """lower보다 작거나 upper보다 큰 값의 개수를 추정합니다."""
+        if self.n == 0:
+            return 0
+        items, cumulative = self._sorted_items()
+        below = np.searchsorted(items, lower, side='left')
+        above = np.searchsorted(items, upper, side='right')
+        weight_below = cumulative[below - 1] if below > 0 else 0
+        weight_above = cumulative[-1] - (cumulative[above - 1] if above > 0 else 0)
+        # 블록 압축은 가중치를 기대값으로만 보존하므로 전체 개수(n)에 맞춰 보정합니다.
+        return int(round((weight_below + weight_above) * self.n / cumulative[-1]))
+
+    # --- 저장용 ---
+    def to_state(self):
+        return {'epsilon': self.epsilon, 'n': self.n, 'min': self.min, 'max': self.max,
+                'levels': [items.copy() for items in self.levels]}
+
+    @classmethod
+    def from_state(cls, state):
+        sketch = cls(epsilon=state['epsilon'])
+        sketch.n = state['n']
+        sketch.min = state['min']
+        sketch.max = state['max']
+        sketch.levels = [np.asarray(items, dtype=np.float64) for items in state['levels']]
+        return sketch
+
+    # --- 내부 구현 ---
+    def _capacity(self, level):
+        depth = len(self.levels) - 1 - level
+        return max(2, int(np.ceil(self.k * _CAPACITY_DECAY ** depth)))
+
+    def _add(self, level, items):
+        while len(self.levels) <= level:
+            self.levels.append(np.empty(0, dtype=np.float64))
+        self.levels[level] = np.concatenate([self.levels[level], items])
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) <= self._capacity(level):
+                level += 1
+                continue
+            items = np.sort(items)
+            # 홀수 개면 하나는 현재 레벨에 남기고 나머지 짝수 개만 압축합니다.
+            keep = items[:len(items) % 2]
+            promoted = items[len(keep):][self._rng.integers(2)::2]
+            self.levels[level] = keep
+            self._add(level + 1, promoted)
+            # 레벨이 늘어나면 아래 레벨 용량이 줄어들 수 있으므로 처음부터 다시 확인
+            level = 0
+
+    def _sorted_items(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(v), 2.0 ** h) for h, v in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        return items[order], np.cumsum(weights[order])
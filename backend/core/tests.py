@@ -1,3 +1,1609 @@
-from django.test import TestCase
+import contextlib
+import gzip
+import io
+import json
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from unittest import mock, skipIf
 
-# Create your tests here.
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from . import (
+    benchmark, charts, columnar, compare, dataset_store, encoding, events, incremental, ingest, jobs, memory, metrics,
+    middleware, parallel, preprocessing, profiling, registry, renderers, result_cache, rows, training, tuning, views,
+)
+from .models import DatasetVersion, TrainedModel, TrainingJob
+from .registry import get_model_registry
+from .sketches import QuantileSketch
+
+
+def _reset_singletons():
+    """워커 단위 싱글톤(저장소/캐시)을 비워 테스트마다 현재 설정으로 다시 만들게 합니다."""
+    dataset_store._store = None
+    metrics._metrics = None
+    registry._registry = None
+    result_cache._cache = None
+    rows._cache = None
+    charts._cache = None
+    tuning._cache = None
+
+
+def _sample_frame(rows=400, seed=0):
+    """결측치/이상치/범주형 컬럼이 섞인 작은 분류용 데이터"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'age': rng.normal(40, 12, rows).round(1),
+        'income': rng.lognormal(10, 0.6, rows).round(2),
+        'score': rng.integers(0, 100, rows).astype(float),
+        'city': rng.choice(['Seoul', 'Busan', 'Incheon', 'Daegu'], rows),
+        'target': rng.choice(['yes', 'no'], rows),
+    })
+    df.loc[rng.choice(rows, rows // 10, replace=False), 'age'] = np.nan
+    df.loc[rng.choice(rows, rows // 20, replace=False), 'income'] = np.nan
+    df.loc[rng.choice(rows, 5, replace=False), 'income'] = 1e7
+    return df
+
+
+class StoreTestMixin:
+    """
+    데이터셋 저장소 / 모델 레지스트리 / 결과 캐시를 테스트마다 임시 디렉터리에 만듭니다.
+    (API 요청 도우미: upload / process / post)
+    """
+
+    def setUp(self):
+        super().setUp()
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp, ignore_errors=True)
+        override = override_settings(
+            DATASET_STORE=dict(settings.DATASET_STORE, DIR=tmp / 'datasets'),
+            MODEL_REGISTRY=dict(settings.MODEL_REGISTRY, DIR=tmp / 'models'),
+            RESULT_CACHE=dict(settings.RESULT_CACHE, PATH=tmp / 'result_cache.sqlite3'),
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+        _reset_singletons()
+        self.addCleanup(_reset_singletons)
+        self.tmp = tmp
+        self.client = APIClient()
+
+    def post(self, name, data, **kwargs):
+        return self.client.post(reverse(name), data, format='json', **kwargs)
+
+    def upload(self, df, **data):
+        """df를 CSV 파일로 업로드하고 응답 본문을 반환합니다."""
+        file_obj = SimpleUploadedFile('data.csv', df.to_csv(index=False).encode(), content_type='text/csv')
+        response = self.client.post(reverse('file-upload'), dict(data, file=file_obj), format='multipart')
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def process(self, dataset_id, action, **data):
+        response = self.post('process-data', dict(data, dataset_id=dataset_id, action=action))
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+
+class JobTestMixin(StoreTestMixin):
+    """학습 작업 큐(core/jobs.py)를 쓰는 테스트. 워커 스레드가 DB를 쓰므로 TransactionTestCase와 함께 사용"""
+
+    def setUp(self):
+        super().setUp()
+        # 작업 풀은 처음 만들 때의 WORKERS 설정을 쓰므로 테스트마다 새로 만듭니다.
+        self.shutdown_workers()
+        self.addCleanup(self.shutdown_workers)
+
+    def shutdown_workers(self):
+        if jobs._executor is not None:
+            jobs._executor.shutdown(wait=True, cancel_futures=True)
+            jobs._executor = None
+
+    def train(self, status=202, **data):
+        response = self.post('train-model', data)
+        self.assertEqual(response.status_code, status, response.content)
+        return response.json()
+
+    def wait_for_job(self, job_id, timeout=60):
+        """작업이 끝날 때까지 상태 API를 폴링하고 마지막 응답을 반환합니다."""
+        deadline = time.monotonic() + timeout
+        while True:
+            data = self.client.get(reverse('train-job', args=[job_id])).json()
+            if data['status'] not in TrainingJob.ACTIVE_STATUSES:
+                return data
+            self.assertLess(time.monotonic(), deadline, f"학습 작업이 끝나지 않음: {data}")
+            time.sleep(0.05)
+
+
+class QuantileSketchTests(TestCase):
+    def test_quantiles_within_epsilon(self):
+        rng = np.random.default_rng(1)
+        values = np.concatenate([rng.normal(0, 1, 150_000), rng.exponential(5, 50_000)])
+        qs = [0.01, 0.25, 0.5, 0.75, 0.99]
+        for epsilon in (0.05, 0.01):
+            sketch = QuantileSketch(epsilon=epsilon, seed=7)
+            sketch.update(values)
+            ranks = np.searchsorted(np.sort(values), sketch.quantiles(qs)) / len(values)
+            for q, rank in zip(qs, ranks):
+                self.assertLessEqual(abs(rank - q), epsilon, f"epsilon={epsilon}, q={q}")
+
+    def test_merged_sketch_matches_single_pass(self):
+        rng = np.random.default_rng(2)
+        values = rng.uniform(0, 1000, 120_000)
+        merged = QuantileSketch(epsilon=0.01, seed=1)
+        for chunk in np.array_split(values, 6):
+            part = QuantileSketch(epsilon=0.01, seed=2)
+            part.update(chunk)
+            merged.merge(part)
+        self.assertEqual(merged.n, len(values))
+        self.assertEqual((merged.min, merged.max), (values.min(), values.max()))
+        ranks = np.searchsorted(np.sort(values), merged.quantiles([0.25, 0.5, 0.75])) / len(values)
+        np.testing.assert_allclose(ranks, [0.25, 0.5, 0.75], atol=0.01)
+
+    def test_state_round_trip(self):
+        sketch = QuantileSketch(epsilon=0.02, seed=3)
+        sketch.update(np.arange(50_000, dtype=float))
+        restored = QuantileSketch.from_state(sketch.to_state())
+        np.testing.assert_array_equal(restored.quantiles([0.1, 0.5, 0.9]), sketch.quantiles([0.1, 0.5, 0.9]))
+
+
+class ApproximateQuantileApiTests(StoreTestMixin, TestCase):
+    def test_approximate_mode_reports_epsilon(self):
+        data = self.upload(_sample_frame(), approximate='true', epsilon='0.05')
+        self.assertEqual(data['quantileMode'], 'approximate')
+        self.assertEqual(data['quantileEpsilon'], 0.05)
+        self.assertEqual(self.upload(_sample_frame())['quantileMode'], 'exact')
+
+    def test_invalid_epsilon_is_rejected(self):
+        dataset_id = self.upload(_sample_frame())['datasetId']
+        for epsilon in ('abc', 0, -0.1, 1, 2.5):
+            response = self.post('process-data', {'dataset_id': dataset_id, 'action': 'cap_outliers',
+                                                  'approximate': True, 'epsilon': epsilon})
+            self.assertEqual(response.status_code, 400, epsilon)
+            self.assertIn('epsilon', response.json()['error'])
+
+
+class PipelineEngineTests(StoreTestMixin, TestCase):
+    """Polars 지연 실행 엔진(core/lazy.py)과 pandas 엔진이 같은 결과를 내는지"""
+
+    def run_engine(self, engine, dataset_id, action):
+        with self.settings(PIPELINE={'ENGINE': engine}):
+            data = self.process(dataset_id, action, cache=False)
+        self.assertEqual(data['engine'], 'polars' if engine == 'auto' else 'pandas')
+        store = dataset_store.get_dataset_store()
+        return data, store.get(data['datasetId']), result_cache.dataset_key(store, data['datasetId'])
+
+    def assert_same_result(self, dataset_id, action):
+        polars_data, polars_df, polars_key = self.run_engine('auto', dataset_id, action)
+        pandas_data, pandas_df, pandas_key = self.run_engine('pandas', dataset_id, action)
+        pd.testing.assert_frame_equal(polars_df, pandas_df, check_index_type=False)
+        self.assertEqual(polars_data['reprofiledColumns'], pandas_data['reprofiledColumns'])
+        self.assertEqual(polars_data['statsData'], pandas_data['statsData'])
+        self.assertEqual(polars_data['qualityData'], pandas_data['qualityData'])
+        # 컬럼 지문이 같아야 이후 요청의 결과 캐시 키도 엔진과 상관없이 같습니다.
+        self.assertEqual(polars_key, pandas_key)
+
+    def test_actions_match_pandas_engine(self):
+        dataset_id = self.upload(_sample_frame())['datasetId']
+        for action in preprocessing.LEGACY_ACTIONS:
+            with self.subTest(action=action):
+                self.assert_same_result(dataset_id, action)
+
+    def test_optimized_dtypes_match_pandas_engine(self):
+        # 메모리 최적화한 데이터셋(int8 / float32 / category / string[pyarrow])도 Polars 엔진으로 실행합니다.
+        rng = np.random.default_rng(2)
+        df = _sample_frame().assign(
+            level=rng.integers(0, 5, 400),
+            height=np.round(rng.normal(170, 20, 400) * 4) / 4,
+            name=[f'user{i}' for i in range(400)],
+        )
+        df.loc[:3, 'height'] = [400.0, 410.25, -90.5, 395.75]
+        df.loc[rng.choice(400, 30, replace=False), 'city'] = None
+        df.loc[rng.choice(400, 5, replace=False), 'city'] = '?'
+        df.loc[rng.choice(400, 20, replace=False), 'name'] = None
+        data = self.upload(df, optimize='true')
+        self.assertEqual(data['memory']['columns']['level']['to'], 'int8')
+        self.assertEqual(data['memory']['columns']['height']['to'], 'float32')
+        self.assertEqual(data['memory']['columns']['city']['to'], 'category')
+        self.assertEqual(data['memory']['columns']['name']['to'], 'string')
+        # 💡 fill_na_zero는 문자열 컬럼을 숫자로 채우므로 원본 업로드와 같이 pandas 엔진으로 실행됩니다.
+        for action in set(preprocessing.LEGACY_ACTIONS) - {'fill_na_zero'}:
+            with self.subTest(action=action):
+                self.assert_same_result(data['datasetId'], action)
+        _, result, _ = self.run_engine('auto', data['datasetId'], 'fill_na_mode')
+        self.assertEqual((result['city'].dtype, result['name'].dtype), ('category', memory.ARROW_STRING))
+        self.assertEqual(result['city'].isna().sum(), 0)
+
+    def test_cap_outliers_records_only_capped_columns(self):
+        dataset_id = self.upload(_sample_frame())['datasetId']
+        data, _, _ = self.run_engine('auto', dataset_id, 'cap_outliers')
+        self.assertIn('income', data['reprofiledColumns'])
+        self.assertNotIn('score', data['reprofiledColumns'])
+
+    def test_row_index_column_name_does_not_collide(self):
+        df = _sample_frame().assign(__row__=lambda d: np.arange(len(d))[::-1])
+        dataset_id = self.upload(df)['datasetId']
+        data, result, _ = self.run_engine('auto', dataset_id, 'drop_na')
+        expected = df.dropna()
+        self.assertEqual(data['engine'], 'polars')
+        self.assertEqual(list(result.index), list(expected.index))
+        self.assertEqual(list(result['__row__']), list(expected['__row__']))
+
+    def test_index_after_dropped_rows_keeps_its_name(self):
+        dataset_id = self.upload(_sample_frame())['datasetId']
+        dropped = self.process(dataset_id, 'drop_outliers')['datasetId']
+        for name in (None, 'row_id'):
+            if name is not None:
+                store = dataset_store.get_dataset_store()
+                dropped = store.put(store.get(dropped).rename_axis(name))
+            with self.subTest(name=name):
+                _, result, _ = self.run_engine('auto', dropped, 'cap_outliers')
+                self.assertEqual(result.index.name, name)
+
+
+class ModelRegistryTests(StoreTestMixin, TestCase):
+    def register(self, df, model_name='rf'):
+        result, fitted = training.train(df, 'target', model_name)
+        return get_model_registry().register(fitted, {'model_name': model_name, 'target': 'target'},
+                                             result['metrics'])
+
+    def test_versions_increase_per_name(self):
+        df = _sample_frame()
+        first, second = self.register(df), self.register(df)
+        other = self.register(df, 'linear')
+        self.assertEqual((first.name, first.version, second.version), ('rf:target', 1, 2))
+        self.assertEqual((other.name, other.version), ('linear:target', 1))
+
+    def test_predict_uses_stored_model(self):
+        df = _sample_frame()
+        entry = self.register(df)
+        dataset_id = self.upload(df.drop(columns='target'))['datasetId']
+        get_model_registry()._cache.clear()  # 파일에서 다시 읽어도 같은 결과
+
+        response = self.post('predict', {'model_id': str(entry.id), 'dataset_id': dataset_id})
+        self.assertEqual(response.status_code, 200, response.content)
+        data = response.json()
+        _, fitted = get_model_registry().get(entry.id)
+        self.assertEqual(data['rows'], len(df))
+        self.assertEqual(data['predictions'], fitted.predict(df.drop(columns='target'), 64).tolist())
+        self.assertTrue(set(data['predictions']) <= {'yes', 'no'})
+
+    def test_delete_missing_model_returns_404(self):
+        entry = self.register(_sample_frame())
+        url = reverse('model-detail', args=[entry.id])
+        self.assertEqual(self.client.delete(url).status_code, 204)
+        self.assertFalse(TrainedModel.objects.filter(pk=entry.id).exists())
+
+        for response in (self.client.delete(url), self.client.get(url)):
+            self.assertEqual(response.status_code, 404)
+            self.assertIn('error', response.json())
+        response = self.post('predict', {'model_id': str(entry.id), 'dataset_id': 'missing'})
+        self.assertEqual(response.status_code, 404)
+
+
+class MemoryOptimizeTests(StoreTestMixin, TestCase):
+    def frame(self):
+        # float32로 정확히 표현되는 값 (0.25 단위)만 있어서 결측치가 없는 컬럼은 float32로 축소됩니다.
+        rng = np.random.default_rng(5)
+        df = pd.DataFrame({
+            'level': rng.integers(0, 5, 600),
+            'weight': np.round(rng.normal(60, 15, 600) * 4) / 4,
+            'height': np.round(rng.normal(170, 20, 600) * 4) / 4,
+            'city': rng.choice(['Seoul', 'Busan', 'Incheon'], 600),
+        })
+        df.loc[rng.choice(600, 60, replace=False), 'weight'] = np.nan
+        df.loc[:4, 'height'] = [400.0, 410.25, -90.5, 395.75, 420.0]
+        return df
+
+    def test_downcast_keeps_values_and_float64_for_missing(self):
+        df = self.frame()
+        optimized, report = memory.optimize_frame(df)
+        self.assertEqual(optimized['level'].dtype, np.int8)
+        self.assertEqual(optimized['height'].dtype, np.float32)
+        self.assertEqual(optimized['weight'].dtype, np.float64)
+        self.assertEqual(optimized['city'].dtype, 'category')
+        self.assertNotIn('weight', report['columns'])
+        self.assertLess(report['after'], report['before'])
+        pd.testing.assert_frame_equal(optimized, df, check_dtype=False, check_categorical=False, check_exact=True)
+
+    def test_processing_matches_raw_upload(self):
+        df = self.frame()
+        raw_id = self.upload(df, optimize='false')['datasetId']
+        optimized = self.upload(df, optimize='true')
+        self.assertIn('memory', optimized)
+        store = dataset_store.get_dataset_store()
+        for action in ('fill_na_mean', 'fill_na_median', 'cap_outliers', 'drop_outliers'):
+            with self.subTest(action=action):
+                raw = self.process(raw_id, action)
+                small = self.process(optimized['datasetId'], action)
+                pd.testing.assert_frame_equal(store.get(small['datasetId']), store.get(raw['datasetId']),
+                                              check_dtype=False, check_categorical=False, check_exact=True)
+                self.assertEqual(small['statsData'], raw['statsData'])
+
+
+class MetricsTests(StoreTestMixin, TestCase):
+    def test_request_stages_are_exported(self):
+        dataset_id = self.upload(_sample_frame())['datasetId']
+        with self.settings(METRICS=dict(settings.METRICS, SERVER_TIMING=True), PIPELINE={'ENGINE': 'pandas'}):
+            response = self.post('process-data', {'dataset_id': dataset_id, 'action': 'fill_na_mean'})
+        self.assertEqual(response.status_code, 200)
+        for name in ('coerce', 'action', 'profile', 'total'):
+            self.assertIn(f'{name};dur=', response['Server-Timing'])
+
+        text = self.client.get(reverse('metrics')).content.decode()
+        self.assertIn('dap_requests_total{endpoint="process-data",method="POST",status="200"} 1', text)
+        self.assertIn('dap_requests_total{endpoint="file-upload",method="POST",status="200"} 1', text)
+        for name in ('coerce', 'action', 'profile'):
+            self.assertIn(f'dap_stage_duration_seconds_count{{endpoint="process-data",stage="{name}"}} 1', text)
+        self.assertIn('dap_peak_rss_bytes_count{endpoint="process-data"} 1', text)
+
+    def test_preprocessing_logs_instead_of_printing(self):
+        df = preprocessing.normalize_columns(_sample_frame())
+        with self.assertLogs('core.preprocessing', level='DEBUG') as logs:
+            preprocessing.run(df, preprocessing.parse_action('drop_na'))
+        self.assertIn('행 제거 (drop_na): 400 ->', logs.output[0])
+
+
+class ServerEventsTests(JobTestMixin, TransactionTestCase):
+    """진행 이벤트 스트림 (core/events.py). 뷰를 다른 스레드에서 실행하므로 TransactionTestCase"""
+
+    def stream(self, name, data):
+        """이벤트 스트림 요청을 끝까지 읽어 (이벤트 이름, data) 목록을 반환합니다. (keepalive 주석 제외)"""
+        async def collect():
+            response = await AsyncClient().post(reverse(name), data, content_type='application/json')
+            self.assertEqual(response['Content-Type'], 'text/event-stream; charset=utf-8')
+            return b''.join([chunk async for chunk in response.streaming_content]).decode()
+
+        items = []
+        for block in async_to_sync(collect)().split('\n\n'):
+            lines = dict(line.split(': ', 1) for line in block.splitlines() if not line.startswith(':'))
+            if lines:
+                items.append((lines['event'], json.loads(lines['data'])))
+        return items
+
+    def test_process_streams_stages_then_result(self):
+        dataset_id = self.upload(_sample_frame())['datasetId']
+        items = self.stream('process-data-events', {'dataset_id': dataset_id, 'action': 'fill_na_median'})
+        stages = {data['name'] for event, data in items if event == 'stage' and 'seconds' in data}
+        self.assertTrue({'action', 'profile'} <= stages, stages)
+        event, data = items[-1]
+        self.assertEqual((event, data['status']), ('result', 200))
+        self.assertIn('datasetId', data['body'])
+
+        # 본문을 만드는 동안 실행된 단계도 이 요청의 지표로 기록합니다.
+        text = self.client.get(reverse('metrics')).content.decode()
+        for name in ('action', 'profile', 'serialize'):
+            self.assertIn(f'dap_stage_duration_seconds_count{{endpoint="process-data-events",stage="{name}"}} 1', text)
+        self.assertNotIn('endpoint="none"', text)
+        collected = metrics.get_metrics()
+        bytes_out = {labels: value for _, labels, _, value in collected.bytes_out.samples()}
+        self.assertGreater(bytes_out[('process-data-events',)], 0)
+        # 요청 시간은 응답 헤더까지가 아니라 스트림이 끝날 때까지
+        sums = {(name, labels): value for name, labels, _, value in
+                collected.request_duration.samples() + collected.stage_duration.samples() if name.endswith('_sum')}
+        self.assertGreaterEqual(sums[('dap_request_duration_seconds_sum', ('process-data-events',))],
+                                sums[('dap_stage_duration_seconds_sum', ('process-data-events', 'action'))])
+
+    def test_process_error_is_an_event(self):
+        items = self.stream('process-data-events', {'dataset_id': 'missing', 'action': 'unknown'})
+        self.assertEqual(items[-1], ('error', {'status': 400, 'error': "알 수 없는 작업 요청입니다."}))
+
+    def test_train_streams_job_progress(self):
+        dataset_id = self.upload(_sample_frame())['datasetId']
+        with self.settings(SERVER_EVENTS=dict(settings.SERVER_EVENTS, JOB_POLL_SECONDS=0.05)):
+            items = self.stream('train-model-events', {'dataset_id': dataset_id, 'target': 'target',
+                                                       'model_name': 'rf'})
+        progress = [data['percent'] for event, data in items if event == 'progress']
+        self.assertEqual(progress, sorted(progress))
+        event, data = items[-1]
+        self.assertEqual(event, 'result')
+        self.assertEqual(data['body']['status'], 'succeeded')
+        self.assertIn('modelId', data['body']['result'])
+
+    def test_train_result_without_job_is_passed_through(self):
+        async def run_view(view, request):
+            yield 'stage', {'name': 'load'}
+            yield 'result', {'status': 200, 'body': {'models': []}}
+
+        async def collect():
+            return [item async for item in views._train_events(None)]
+
+        with mock.patch.object(events, 'run_view', run_view):
+            items = async_to_sync(collect)()
+        self.assertEqual(items[-1], ('result', {'status': 200, 'body': {'models': []}}))
+
+    def test_view_exception_is_logged_and_reported(self):
+        def broken_view(request):
+            raise RuntimeError("boom")
+
+        async def collect():
+            return [item async for item in events.run_view(broken_view, mock.Mock(META={}, path='/x/'))]
+
+        with self.assertLogs('core.events', level='ERROR') as logs:
+            items = async_to_sync(collect)()
+        self.assertEqual(items[-1], ('error', {'status': 500, 'error': "요청 처리 중 오류 발생: boom"}))
+        self.assertIn('RuntimeError: boom', logs.output[0])
+
+
+class DatasetVersionTests(StoreTestMixin, TestCase):
+    def checkout(self, dataset_id, to, status=200):
+        response = self.post('version-checkout', {'dataset_id': dataset_id, 'to': to})
+        self.assertEqual(response.status_code, status, response.content)
+        return response.json()
+
+    def test_undo_redo_and_branches(self):
+        root = self.upload(_sample_frame())['datasetId']
+        filled = self.process(root, 'fill_na_mean')['datasetId']
+        capped = self.process(filled, 'cap_outliers')['datasetId']
+
+        self.assertEqual(self.checkout(capped, 'undo')['datasetId'], filled)
+        self.assertEqual(self.checkout(filled, 'undo')['datasetId'], root)
+        self.assertEqual(self.checkout(root, 'redo')['datasetId'], filled)
+        self.assertEqual(self.checkout(filled, 'redo')['datasetId'], capped)
+        self.checkout(root, 'undo', status=400)
+        self.checkout(capped, 'redo', status=400)
+
+        # 같은 버전에서 다른 작업을 하면 형제 버전이 생기고, redo는 가장 최근 버전으로 갑니다.
+        branch = self.process(root, 'fill_na_median')
+        graph = branch['versions']
+        self.assertEqual((graph['rootId'], graph['undoId']), (root, root))
+        self.assertEqual(self.checkout(branch['datasetId'], 'undo')['versions']['redoId'], branch['datasetId'])
+        self.assertEqual(self.checkout(root, filled)['versions']['redoId'], capped)
+        self.assertEqual(self.checkout(filled, 'undo')['versions']['redoId'], filled)
+        self.checkout(root, 'not-a-version', status=400)
+
+    def test_unchanged_columns_share_parent_buffers(self):
+        df = _sample_frame()
+        root = self.upload(df)['datasetId']
+        data = self.process(root, 'fill_na_mean')
+        node = {v['versionId']: v for v in data['versions']['versions']}[data['datasetId']]
+        self.assertEqual(sorted(node['changedColumns']), ['age', 'income'])
+        self.assertEqual(node['sharedColumns'], 3)
+
+        store = dataset_store.get_dataset_store()
+        root_bytes, _ = store.footprint(root)
+        self.assertLess(node['ownBytes'], root_bytes)
+        expected = preprocessing.run(store.get(root), preprocessing.parse_action('fill_na_mean'))
+        _reset_singletons()  # 메모리 캐시가 아니라 매니페스트로 다시 읽기
+        pd.testing.assert_frame_equal(dataset_store.get_dataset_store().get(data['datasetId']), expected)
+
+    def test_prune_removes_least_recently_visited_leaves(self):
+        root = self.upload(_sample_frame())['datasetId']
+        with self.settings(DATASET_VERSIONS=dict(settings.DATASET_VERSIONS, MAX_VERSIONS=3)):
+            first = self.process(root, 'fill_na_mean')['datasetId']
+            second = self.process(root, 'fill_na_median')['datasetId']
+            self.checkout(first, 'undo')
+            self.checkout(root, first)  # second가 가장 오래 방문하지 않은 잎
+            third = self.process(root, 'cap_outliers')['datasetId']
+
+        store = dataset_store.get_dataset_store()
+        self.assertEqual(set(DatasetVersion.objects.values_list('id', flat=True)), {root, first, third})
+        self.assertFalse(store.exists(second))
+        self.assertTrue(store.exists(first) and store.exists(root))
+
+    def test_prune_keeps_leaves_that_are_read(self):
+        root = self.upload(_sample_frame())['datasetId']
+        with self.settings(DATASET_VERSIONS=dict(settings.DATASET_VERSIONS, MAX_VERSIONS=3)):
+            first = self.process(root, 'fill_na_mean')['datasetId']
+            second = self.process(root, 'fill_na_median')['datasetId']
+            # 다른 사용자가 first를 체크아웃 없이 읽기만 하는 경우 (행 조회)
+            response = self.post('row-window', {'dataset_id': first, 'limit': 10})
+            self.assertEqual(response.status_code, 200, response.content)
+            third = self.process(root, 'cap_outliers')['datasetId']
+
+        self.assertEqual(set(DatasetVersion.objects.values_list('id', flat=True)), {root, first, third})
+        self.assertFalse(dataset_store.get_dataset_store().exists(second))
+
+    def test_reading_a_version_keeps_its_ancestors_alive(self):
+        root = self.upload(_sample_frame())['datasetId']
+        dropped = self.process(root, 'drop_na')['datasetId']  # 컬럼을 공유하지 않는 버전
+        capped = self.process(dropped, 'cap_outliers')['datasetId']
+        other = self.upload(_sample_frame(seed=1))['datasetId']
+        store = dataset_store.get_dataset_store()
+        now = time.time()
+        _reset_singletons()  # 조상 touch 주기를 처음부터 (다른 워커에서 읽는 경우)
+
+        # TTL의 0.9배가 지난 뒤 자식 버전만 읽고, TTL의 1.5배 시점에 확인합니다.
+        with mock.patch.object(dataset_store.time, 'time', return_value=now + store.ttl_seconds * 0.9):
+            response = self.post('row-window', {'dataset_id': capped, 'limit': 10})
+            self.assertEqual(response.status_code, 200, response.content)
+        with mock.patch.object(dataset_store.time, 'time', return_value=now + store.ttl_seconds * 1.5):
+            store = dataset_store.get_dataset_store()
+            self.assertTrue(all(store.exists(dataset_id) for dataset_id in (root, dropped, capped)))
+            self.assertFalse(store.exists(other))
+            self.assertEqual(self.checkout(capped, 'undo')['datasetId'], dropped)
+
+
+class DatasetStoreTests(TestCase):
+    def setUp(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp, ignore_errors=True)
+        self.directory = Path(tmp)
+
+    def make_store(self, memory_budget_bytes=10 * 1024 * 1024, ttl_seconds=60):
+        return dataset_store.DatasetStore(self.directory, memory_budget_bytes, ttl_seconds)
+
+    def test_put_get_round_trip_across_workers(self):
+        df = _sample_frame()
+        dataset_id = self.make_store().put(df)
+        # 다른 워커(메모리 캐시가 빈 저장소)도 디스크에서 같은 데이터를 읽습니다.
+        pd.testing.assert_frame_equal(self.make_store().get(dataset_id), df)
+
+    def test_memory_budget_evicts_least_recently_used(self):
+        df = _sample_frame()
+        store = self.make_store(memory_budget_bytes=int(memory.memory_bytes(df) * 2.5))
+        first, second = store.put(df), store.put(df)
+        store.get(first)
+        third = store.put(df)
+        self.assertEqual(list(store._entries), [first, third])
+        self.assertLessEqual(store._memory_used, store.memory_budget_bytes)
+        pd.testing.assert_frame_equal(store.get(second), df)
+
+    def test_expired_and_invalid_ids_are_not_found(self):
+        store = self.make_store(ttl_seconds=60)
+        dataset_id = store.put(_sample_frame())
+        with mock.patch.object(dataset_store.time, 'time', return_value=time.time() + 61):
+            with self.assertRaises(dataset_store.DatasetNotFound):
+                store.get(dataset_id)
+            self.assertIsNone(store.locate(dataset_id))
+        self.assertFalse(list(self.directory.glob(f"{dataset_id}.*")))
+        for dataset_id in (None, '', '../etc/passwd', 'A' * 32):
+            with self.assertRaises(dataset_store.DatasetNotFound):
+                store.get(dataset_id)
+
+
+class DatasetSessionApiTests(StoreTestMixin, TestCase):
+    def test_responses_carry_dataset_ids_not_data(self):
+        upload = self.upload(_sample_frame())
+        self.assertNotIn('fullData', upload)
+        data = self.process(upload['datasetId'], 'drop_na')
+        self.assertNotIn('fullData', data)
+        self.assertEqual(len(dataset_store.get_dataset_store().get(data['datasetId'])), len(_sample_frame().dropna()))
+
+    def test_legacy_dataframe_requests_still_work(self):
+        df = _sample_frame()
+        response = self.post('process-data', {'dataframe': df.to_json(orient='split'), 'action': 'drop_na'})
+        self.assertEqual(response.status_code, 200)
+        full = json.loads(response.json()['fullData'])
+        self.assertEqual(len(full['data']), len(df.dropna()))
+
+    def test_unknown_dataset_returns_404(self):
+        response = self.post('process-data', {'dataset_id': 'f' * 32, 'action': 'drop_na'})
+        self.assertEqual(response.status_code, 404)
+        self.assertIn('error', response.json())
+
+
+class ColumnarCacheTests(StoreTestMixin, TestCase):
+    def test_repeat_upload_reuses_parsed_file(self):
+        df = _sample_frame()
+        first = self.upload(df)
+        store = dataset_store.get_dataset_store()
+        self.assertEqual(store.locate(first['datasetId']).suffix, columnar.ARROW_SUFFIX)
+
+        _reset_singletons()  # 메모리 캐시가 없는 다른 워커
+        with mock.patch.object(views, '_parse_upload', side_effect=AssertionError("다시 파싱함")):
+            second = self.upload(df)
+        self.assertEqual(second['datasetId'], first['datasetId'])
+        self.assertEqual(second['statsData'], first['statsData'])
+        self.assertNotEqual(self.upload(_sample_frame(seed=1))['datasetId'], first['datasetId'])
+
+    def test_content_hash_depends_on_type_and_variant(self):
+        def digest(name, variant=b''):
+            return columnar.content_hash(SimpleUploadedFile(name, b'a,b\n1,2\n'), name, variant)
+
+        self.assertEqual(digest('x.csv'), digest('y.CSV'))
+        self.assertNotEqual(digest('x.csv'), digest('x.xlsx'))
+        self.assertNotEqual(digest('x.csv'), digest('x.csv', b'optimized'))
+
+    def test_round_trip_preserves_dtypes(self):
+        df = pd.DataFrame({
+            'i': pd.array([1, None, 3], dtype='Int64'),
+            'f': [0.5, np.nan, 2.0],
+            'when': pd.to_datetime(['2024-01-01', None, '2024-03-01']),
+            'cat': pd.Categorical(['a', 'b', 'a']),
+            'text': pd.array(['x', None, 'z'], dtype=memory.ARROW_STRING),
+            'flag': [True, False, True],
+        }, index=pd.Index([10, 20, 30], name='row'))
+        path = columnar.write_frame(df, self.tmp / 'frame')
+        self.assertEqual(path.suffix, columnar.ARROW_SUFFIX)
+        pd.testing.assert_frame_equal(columnar.read_frame(path), df)
+        # 일부 컬럼만 읽으면 인덱스 없이 위치 순서로 돌려줍니다.
+        pd.testing.assert_frame_equal(columnar.read_frame(path, columns=['f', 'cat']),
+                                      df[['f', 'cat']].reset_index(drop=True))
+
+    def test_mixed_object_columns_fall_back_to_pickle(self):
+        df = pd.DataFrame({'mixed': [1, 'a', 2.5]})
+        path = columnar.write_frame(df, self.tmp / 'mixed')
+        self.assertEqual(path.suffix, columnar.PICKLE_SUFFIX)
+        pd.testing.assert_frame_equal(columnar.read_frame(path), df)
+
+
+class StreamingUploadTests(StoreTestMixin, TestCase):
+    def test_stream_mode_matches_in_memory_analysis(self):
+        df = _sample_frame(rows=1000)
+        with override_settings(STREAM_UPLOAD=dict(settings.STREAM_UPLOAD, CHUNK_ROWS=128)):
+            streamed = self.upload(df, mode='stream', optimize='false')
+        loaded = self.upload(df, optimize='false')
+        self.assertEqual(streamed['ingestMode'], 'stream')
+        self.assertNotIn('ingestMode', loaded)
+        self.assertEqual(streamed['qualityData'], loaded['qualityData'])
+        self.assertEqual(streamed['tableData'], loaded['tableData'])
+        # 청크별 평균/분산을 합치므로 마지막 자릿수 정도의 차이는 있을 수 있습니다.
+        streamed_stats = pd.read_json(io.StringIO(streamed['statsData']), orient='split')
+        loaded_stats = pd.read_json(io.StringIO(loaded['statsData']), orient='split')
+        pd.testing.assert_frame_equal(streamed_stats, loaded_stats, rtol=1e-9)
+
+    def test_later_chunks_follow_first_chunk_schema(self):
+        csv = "n,label\n1,a\n2,b\n3,?\nx,c\n,d\n"
+        path = self.tmp / 'stream.arrow'
+        analysis, profiles = ingest.stream_csv(io.BytesIO(csv.encode()), path, chunk_rows=2)
+        table = columnar.open_table(path)
+        self.assertEqual(str(table.schema.field('n').type), 'double')
+        self.assertEqual(table.column('n').to_pylist()[:3], [1.0, 2.0, 3.0])
+        self.assertEqual([p.nulls for p in profiles], [2, 1])
+        self.assertEqual(table.num_rows, 5)
+
+    def test_encoding_is_detected_from_a_sample(self):
+        text = "도시,값\n서울,1\n부산,2\n"
+        for encoding, expected in (('utf-8', 'utf-8'), ('utf-8-sig', 'utf-8-sig'), ('cp949', 'cp949')):
+            buffer = io.BytesIO(text.encode(encoding))
+            self.assertEqual(ingest.detect_encoding(buffer), expected)
+            self.assertEqual(buffer.tell(), 0)
+
+        path = self.tmp / 'cp949.arrow'
+        ingest.stream_csv(io.BytesIO(text.encode('cp949')), path, chunk_rows=1)
+        self.assertEqual(columnar.open_table(path).column('도시').to_pylist(), ['서울', '부산'])
+
+
+class ProfilingTests(TestCase):
+    def setUp(self):
+        df = _sample_frame(rows=600)
+        df['when'] = pd.date_range('2024-01-01', periods=len(df), freq='h')
+        df['flag'] = df['score'] > 50
+        df['mixed'] = np.where(np.arange(len(df)) % 7 == 0, 'n/a', (np.arange(len(df)) % 30).astype(str))
+        self.df = df
+
+    def test_profile_matches_describe(self):
+        profiles, quantiles = profiling.profile_frame(self.df)
+        by_name = {p.name: p for p in profiles}
+        for col in ('age', 'income', 'score'):
+            expected = self.df[col].describe()
+            p = by_name[col]
+            self.assertEqual(p.count, expected['count'])
+            np.testing.assert_allclose([p.mean, p.std, p.min, p.max],
+                                       expected[['mean', 'std', 'min', 'max']].to_numpy(dtype=float), rtol=1e-12)
+            np.testing.assert_allclose([quantiles[col][q] for q in ('25%', '50%', '75%')],
+                                       expected[['25%', '50%', '75%']].to_numpy(dtype=float))
+            self.assertEqual(p.nulls, self.df[col].isna().sum())
+
+        q1, q3 = self.df['income'].quantile([0.25, 0.75])
+        iqr = q3 - q1
+        outliers = ((self.df['income'] < q1 - 1.5 * iqr) | (self.df['income'] > q3 + 1.5 * iqr)).sum()
+        self.assertEqual(quantiles['income']['outliers'], outliers)
+
+        city = self.df['city'].describe()
+        self.assertEqual((by_name['city'].count, by_name['city'].unique), (city['count'], city['unique']))
+        self.assertEqual(by_name['city'].top, (city['top'], city['freq']))
+        self.assertNotIn('flag', quantiles)
+        # 숫자로 변환 가능한 값이 섞인 범주형 컬럼은 변환한 값으로 사분위수를 구합니다.
+        mixed = pd.to_numeric(self.df['mixed'], errors='coerce')
+        self.assertEqual(quantiles['mixed']['50%'], mixed.median())
+
+    def test_chunk_profiles_merge_to_whole(self):
+        whole, _ = profiling.profile_frame(self.df)
+        merged = None
+        for start in range(0, len(self.df), 170):
+            merged = profiling.merge_profiles(merged, profiling.profile_chunk(self.df.iloc[start:start + 170]))
+        for expected, p in zip(whole, merged):
+            self.assertEqual((p.name, p.kind, p.rows, p.nulls, p.count), (expected.name, expected.kind, expected.rows,
+                                                                          expected.nulls, expected.count))
+            if p.kind == profiling.CATEGORICAL:
+                self.assertEqual((p.value_counts, p.numeric_like), (expected.value_counts, expected.numeric_like))
+            else:
+                np.testing.assert_allclose([p.mean, p.std, p.min, p.max],
+                                           [expected.mean, expected.std, expected.min, expected.max], rtol=1e-9)
+
+    def test_quantile_summary_matches_pandas_interpolation(self):
+        rng = np.random.default_rng(5)
+        for n in (1, 2, 7, 1000):
+            values = rng.normal(size=n)
+            summary = profiling.quantile_summary(np.append(values, np.nan))
+            expected = pd.Series(values).quantile([0.25, 0.5, 0.75]).to_numpy()
+            np.testing.assert_allclose([summary['25%'], summary['50%'], summary['75%']], expected)
+        self.assertEqual(profiling.quantile_summary([np.nan])['outliers'], 0)
+
+
+class IncrementalProfilingTests(StoreTestMixin, TestCase):
+    def assertMatchesFullProfile(self, data):
+        df = dataset_store.get_dataset_store().get(data['datasetId'])
+        full = views._analyze_dataframe(df)
+        self.assertEqual(data['statsData'], full['statsData'].to_json())
+        self.assertEqual(data['qualityData'], full['qualityData'].to_json())
+
+    def test_only_changed_columns_are_reprofiled(self):
+        dataset_id = self.upload(_sample_frame(), optimize='false')['datasetId']
+
+        filled = self.process(dataset_id, 'fill_na_mean')
+        self.assertEqual(sorted(filled['reprofiledColumns']), ['age', 'income'])
+        self.assertMatchesFullProfile(filled)
+
+        capped = self.process(filled['datasetId'], 'cap_outliers')
+        self.assertNotIn('city', capped['reprofiledColumns'])
+        self.assertIn('income', capped['reprofiledColumns'])
+        self.assertMatchesFullProfile(capped)
+
+    def test_dropped_rows_are_subtracted_from_cached_profiles(self):
+        dataset_id = self.upload(_sample_frame(), optimize='false')['datasetId']
+        dropped = self.process(dataset_id, 'drop_na')
+        # 범주형 컬럼은 삭제된 행의 빈도수만 빼서 갱신합니다.
+        self.assertNotIn('city', dropped['reprofiledColumns'])
+        self.assertNotIn('target', dropped['reprofiledColumns'])
+        self.assertMatchesFullProfile(dropped)
+
+
+class ParallelProfilingTests(TestCase):
+    def setUp(self):
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp, ignore_errors=True)
+        self.df = _sample_frame(rows=2000)
+        self.df['when'] = pd.date_range('2024-01-01', periods=len(self.df), freq='min')
+        self.path = columnar.write_frame(self.df, tmp / 'wide')
+
+    def test_process_pool_matches_serial(self):
+        self.addCleanup(parallel._pool.reset)
+        profiler = parallel.ParallelProfiler(self.path, workers=2, min_cells=0)
+        serial = profiling.profile_frame(self.df)
+        sharded = profiling.profile_frame(self.df, profiler=profiler)
+        self.assertIsNotNone(parallel._pool.executor)
+        pd.testing.assert_frame_equal(pd.DataFrame(sharded[1]), pd.DataFrame(serial[1]))
+        for expected, p in zip(serial[0], sharded[0]):
+            self.assertEqual(vars(p).keys(), vars(expected).keys())
+            for key, value in vars(expected).items():
+                if key != 'sketch':
+                    np.testing.assert_equal(getattr(p, key), value, f"{p.name}.{key}")
+
+    def test_serial_fallbacks(self):
+        with override_settings(PROFILING={'WORKERS': 1, 'MIN_CELLS': 0}):
+            self.assertIsNone(parallel.profiler_for(self.path))
+        with override_settings(PROFILING={'WORKERS': 4, 'MIN_CELLS': 0}):
+            self.assertIsNone(parallel.profiler_for(None))
+            self.assertIsNone(parallel.profiler_for(self.path.with_suffix(columnar.PICKLE_SUFFIX)))
+            self.assertIsInstance(parallel.profiler_for(self.path), parallel.ParallelProfiler)
+
+        # 셀 수가 MIN_CELLS보다 적으면 프로세스 풀을 띄우지 않습니다.
+        profiler = parallel.ParallelProfiler(self.path, workers=4, min_cells=10 ** 9)
+        with mock.patch.object(parallel._pool, 'get') as get_executor:
+            profiles, _ = profiling.profile_frame(self.df, profiler=profiler)
+        get_executor.assert_not_called()
+        self.assertEqual(len(profiles), len(self.df.columns))
+
+
+
+class PreprocessingPipelineTests(StoreTestMixin, TestCase):
+    def run_pipeline(self, dataset_id, steps):
+        response = self.post('pipeline', {'dataset_id': dataset_id, 'steps': steps})
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_pipeline_matches_single_actions(self):
+        dataset_id = self.upload(_sample_frame(), optimize='false')['datasetId']
+        data = self.run_pipeline(dataset_id, ['fill_na_median', {'action': 'drop_outliers'}, 'cap_outliers'])
+        self.assertEqual(data['pipeline'], [['fill_na'], ['drop_outliers'], ['cap_outliers']])
+
+        chained = dataset_id
+        for action in ('fill_na_median', 'drop_outliers', 'cap_outliers'):
+            chained = self.process(chained, action)['datasetId']
+        store = dataset_store.get_dataset_store()
+        pd.testing.assert_frame_equal(store.get(data['datasetId']), store.get(chained))
+
+    def test_fused_steps_with_parameters(self):
+        df = _sample_frame()
+        dataset_id = self.upload(df, optimize='false')['datasetId']
+        data = self.run_pipeline(dataset_id, [
+            {'action': 'fill_na', 'strategy': {'age': 'median', 'income': 'constant'}, 'value': -1},
+            {'action': 'fill_na', 'columns': ['score'], 'strategy': 'zero'},
+            {'action': 'drop_outliers', 'columns': ['income'], 'iqr_multiplier': 3},
+            {'action': 'drop_na'},
+        ])
+        # 이어지는 채우기/행 삭제 단계는 한 번에 실행합니다.
+        self.assertEqual(data['pipeline'], [['fill_na', 'fill_na'], ['drop_outliers', 'drop_na']])
+
+        expected = df.copy()
+        expected['age'] = expected['age'].fillna(expected['age'].median())
+        expected['income'] = expected['income'].fillna(-1)
+        q1, q3 = expected['income'].quantile([0.25, 0.75])
+        iqr = q3 - q1
+        expected = expected[expected['income'].between(q1 - 3 * iqr, q3 + 3 * iqr)].dropna()
+        result = dataset_store.get_dataset_store().get(data['datasetId'])
+        pd.testing.assert_frame_equal(result.reset_index(drop=True), expected.reset_index(drop=True),
+                                      check_dtype=False)
+
+    def test_invalid_steps_are_rejected(self):
+        dataset_id = self.upload(_sample_frame())['datasetId']
+        for steps, message in (
+            ([], '비어'),
+            (['explode'], "알 수 없는 작업 'explode'"),
+            ([{'action': 'fill_na', 'strategy': 'max'}], '채우기 방식'),
+            ([{'action': 'fill_na', 'strategy': 'constant'}], 'value'),
+            ([{'action': 'drop_outliers', 'iqr_multiplier': 0}], 'iqr_multiplier'),
+            ([{'action': 'drop_na', 'columns': 'age'}], 'columns'),
+        ):
+            response = self.post('pipeline', {'dataset_id': dataset_id, 'steps': steps})
+            self.assertEqual(response.status_code, 400, steps)
+            self.assertIn(message, response.json()['error'])
+
+
+class TrainingJobTests(JobTestMixin, TransactionTestCase):
+    def blocked_job(self, params=None):
+        """load_dataframe가 release될 때까지 멈춰 있는 작업을 넣고 (job, 시작됨 Event, release Event)를 반환합니다."""
+        started, release = threading.Event(), threading.Event()
+        self.addCleanup(release.set)
+        df = _sample_frame()
+
+        def load_dataframe():
+            started.set()
+            release.wait(30)
+            return df
+
+        job = jobs.submit(load_dataframe, params or {'dataset_id': None, 'target': 'target', 'model_name': 'rf'})
+        return job, started, release
+
+    def test_job_reports_progress_and_result(self):
+        dataset_id = self.upload(_sample_frame())['datasetId']
+        submitted = self.train(dataset_id=dataset_id, target='target', model_name='gb')
+        self.assertIn(submitted['status'], TrainingJob.ACTIVE_STATUSES)
+
+        data = self.wait_for_job(submitted['jobId'])
+        self.assertEqual((data['status'], data['progress'], data['message']), ('succeeded', 100, '완료'))
+        self.assertIn('Accuracy (정확도)', data['result']['metrics'])
+        self.assertTrue(TrainedModel.objects.filter(pk=data['result']['modelId'], job_id=data['jobId']).exists())
+        self.assertEqual(jobs._active, {})
+
+    def test_cancel_running_and_queued_jobs(self):
+        with self.settings(TRAINING=dict(settings.TRAINING, WORKERS=1)):
+            running, started, release = self.blocked_job()
+            queued = jobs.submit(lambda: _sample_frame(), {'dataset_id': None, 'target': 'target', 'model_name': 'rf'})
+            self.assertTrue(started.wait(10))
+
+            # 대기 중인 작업은 바로 취소됩니다.
+            data = self.client.post(reverse('train-job-cancel', args=[queued.id])).json()
+            self.assertEqual(data['status'], 'cancelled')
+            # 실행 중인 작업은 다음 진행률 보고 시점에 멈춥니다.
+            data = self.client.post(reverse('train-job-cancel', args=[running.id])).json()
+            self.assertEqual((data['status'], data['message']), ('running', '취소 요청됨'))
+            release.set()
+            self.assertEqual(self.wait_for_job(running.id)['status'], 'cancelled')
+        self.assertFalse(TrainedModel.objects.exists())
+        self.assertEqual(self.client.get(reverse('train-job', args=[uuid.uuid4()])).status_code, 404)
+
+    def test_queue_is_bounded(self):
+        dataset_id = self.upload(_sample_frame())['datasetId']
+        with self.settings(TRAINING=dict(settings.TRAINING, WORKERS=1, MAX_PENDING=0)):
+            _, started, release = self.blocked_job()
+            self.assertTrue(started.wait(10))
+            response = self.post('train-model', {'dataset_id': dataset_id, 'target': 'target', 'model_name': 'rf'})
+            self.assertEqual(response.status_code, 503)
+            release.set()
+
+    def test_jobs_left_by_a_dead_worker_are_failed(self):
+        job = TrainingJob.objects.create(params={}, owner=jobs._OWNER, status=TrainingJob.RUNNING)
+        data = self.client.get(reverse('train-job', args=[job.id])).json()
+        self.assertEqual(data['status'], 'failed')
+        self.assertIn('서버가 재시작', data['error'])
+        # 다른 호스트의 작업은 그 호스트에서 실행 중일 수 있으므로 건드리지 않습니다.
+        other = TrainingJob.objects.create(params={}, owner='other-host:1', status=TrainingJob.RUNNING)
+        self.assertEqual(jobs.get(other.id).status, 'running')
+
+
+class ModelCompareTests(JobTestMixin, TransactionTestCase):
+    MODELS = ['rf', 'gb', 'logistic', 'svm']
+
+    def leaderboard(self, workers, df=None):
+        with self.settings(TRAINING=dict(settings.TRAINING, COMPARE_WORKERS=workers)):
+            result, fitted = compare.compare(df if df is not None else _sample_frame(), 'target', self.MODELS)
+        return result, fitted
+
+    def test_process_pool_matches_serial_training(self):
+        self.addCleanup(compare._pool.reset)
+        serial, serial_models = self.leaderboard(1)
+        parallel_result, parallel_models = self.leaderboard(2)
+        self.assertIsNotNone(compare._pool.executor)
+        strip = lambda rows: [{k: v for k, v in row.items() if not k.endswith('Seconds')} for row in rows]
+        self.assertEqual(strip(parallel_result['leaderboard']), strip(serial['leaderboard']))
+        self.assertEqual(set(parallel_models), set(serial_models))
+
+        df = _sample_frame().drop(columns='target')
+        for name in self.MODELS:
+            np.testing.assert_array_equal(parallel_models[name].predict(df, 64), serial_models[name].predict(df, 64))
+
+    def test_leaderboard_is_ranked_and_failures_go_last(self):
+        original = training.build_model
+
+        def build_model(model_name, *args, **kwargs):
+            if model_name == 'gb':
+                raise ValueError("학습 불가")
+            return original(model_name, *args, **kwargs)
+
+        with mock.patch.object(compare, 'build_model', build_model):
+            result, fitted = self.leaderboard(1)
+        rows = result['leaderboard']
+        self.assertEqual([row['rank'] for row in rows], [1, 2, 3, 4])
+        self.assertEqual(rows[-1], {'model': 'gb', 'error': 'ValueError: 학습 불가', 'rank': 4})
+        scores = [row['score'] for row in rows[:-1]]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual(result['best'], rows[0]['model'])
+        self.assertNotIn('gb', fitted)
+        for row in rows[:-1]:
+            self.assertGreaterEqual(row['fitSeconds'], 0)
+            self.assertGreaterEqual(row['predictSeconds'], 0)
+
+    def test_compare_job_registers_every_fitted_model(self):
+        dataset_id = self.upload(_sample_frame())['datasetId']
+        with self.settings(TRAINING=dict(settings.TRAINING, COMPARE_WORKERS=1)):
+            job = self.train(dataset_id=dataset_id, target='target', models=['rf', 'linear', 'rf'])
+            data = self.wait_for_job(job['jobId'])
+        self.assertEqual(data['params']['models'], ['rf', 'linear'])
+        self.assertEqual(data['result']['mode'], 'compare')
+        entries = {str(m.id): m for m in TrainedModel.objects.filter(job_id=job['jobId'])}
+        self.assertEqual({row['modelId'] for row in data['result']['leaderboard']}, set(entries))
+
+        self.assertIn('지원하지 않는 모델', self.train(400, dataset_id=dataset_id, target='target',
+                                                     models=['rf', 'xgb'])['error'])
+        self.assertIn('models', self.train(400, dataset_id=dataset_id, target='target', models=[])['error'])
+
+
+class TuningTests(JobTestMixin, TransactionTestCase):
+    def setUp(self):
+        super().setUp()
+        override = override_settings(TUNING=dict(settings.TUNING, N_JOBS=1, FACTOR=3, MIN_SAMPLES=200))
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def test_schedule_grows_samples_until_full_data(self):
+        self.assertEqual(tuning._schedule(27, 2000, 200, 3), [222, 666, 2000])
+        self.assertEqual(tuning._schedule(1, 2000, 200, 3), [2000])
+        # 표본을 더 늘릴 수 없으면 라운드 수를 줄입니다.
+        self.assertEqual(tuning._schedule(27, 300, 200, 3), [300])
+
+    def test_successive_halving_prunes_and_caches_scores(self):
+        df = _sample_frame(rows=1800)
+        result, fitted = tuning.tune(df, 'target', 'svm', folds=3)
+        search = result['search']
+        rounds = search['rounds']
+        self.assertEqual([r['samples'] for r in rounds], [480, 1440])
+        self.assertEqual([(r['candidates'], r['kept']) for r in rounds], [(16, 6), (6, 6)])
+        self.assertEqual((search['evaluated'], search['cached']), ((16 + 6) * 3, 0))
+        self.assertIn(result['bestParams'], tuning._candidates(tuning.SEARCH_SPACES['svm']))
+        # 마지막 라운드(전체 데이터)에서 가장 좋은 후보가 선택됩니다.
+        final = [row for row in result['leaderboard'] if row['samples'] == 1440]
+        self.assertEqual(final[0]['params'], result['bestParams'])
+        self.assertEqual(final[0]['cvScore'], result['cvScore'])
+
+        # 내용이 같은 데이터는 fold 점수를 다시 계산하지 않습니다.
+        again, _ = tuning.tune(df.copy(), 'target', 'svm', folds=3)
+        self.assertEqual((again['search']['evaluated'], again['search']['cached']), (0, (16 + 6) * 3))
+        self.assertEqual((again['bestParams'], again['cvScore']), (result['bestParams'], result['cvScore']))
+
+        changed = df.assign(score=df['score'] + 1)
+        self.assertEqual(tuning.tune(changed, 'target', 'svm', folds=3)[0]['search']['cached'], 0)
+
+    def test_tune_job_registers_best_params(self):
+        dataset_id = self.upload(_sample_frame())['datasetId']
+        job = self.train(dataset_id=dataset_id, target='target', model_name='linear', tune=True, cv=3)
+        data = self.wait_for_job(job['jobId'])
+        self.assertEqual((data['status'], data['result']['mode']), ('succeeded', 'tune'))
+        entry = TrainedModel.objects.get(pk=data['result']['modelId'])
+        self.assertEqual(entry.params['model_params'], data['result']['bestParams'])
+
+        for bad in (1, 11, 'x'):
+            self.assertIn('cv', self.train(400, dataset_id=dataset_id, target='target', tune=True, cv=bad)['error'])
+
+
+class FeatureEncodingTests(TestCase):
+    def setUp(self):
+        df = _sample_frame(rows=600)
+        rng = np.random.default_rng(3)
+        # 희귀 범주가 섞인 컬럼과, onehot 기준보다 범주가 많은 컬럼
+        df['plan'] = rng.choice(['basic', 'pro', 'team', 'edu', 'gov'], len(df), p=[0.6, 0.3, 0.08, 0.01, 0.01])
+        df['zip'] = rng.integers(0, 20, len(df)).astype(str)
+        self.X = df.drop(columns='target')
+        self.y = (df['target'] == 'yes').astype(int).to_numpy()
+
+    def test_ordinal_codes_match_label_order(self):
+        pre = encoding.TabularPreprocessor('ordinal')
+        out = pre.fit_transform(self.X)
+        for col in ('city', 'plan', 'zip'):
+            labels = np.sort(self.X[col].astype(str).unique())
+            self.assertEqual(list(pre.categories[col]), list(labels))
+            self.assertEqual(out[col].astype(int).tolist(), np.searchsorted(labels, self.X[col].astype(str)).tolist())
+        self.assertEqual(out['age'].isna().sum(), 0)
+        self.assertAlmostEqual(pre.fill_values['age'], self.X['age'].mean())
+
+        new = self.X.head(3).assign(city=['Jeju', 'Seoul', None])
+        codes = pre.transform(new)['city'].astype(int).tolist()
+        # 학습 때 없던 값은 -1, 결측치는 최빈값으로 채운 뒤 번호를 매깁니다.
+        mode_code = list(pre.categories['city']).index(self.X['city'].mode()[0])
+        self.assertEqual(codes, [-1, list(pre.categories['city']).index('Seoul'), mode_code])
+
+    def test_onehot_and_rare_buckets(self):
+        pre = encoding.TabularPreprocessor('onehot', rare_min_count=20, onehot_max_categories=10)
+        out = pre.fit_transform(self.X)
+        self.assertEqual(pre.onehot_columns, ['city', 'plan'])
+        self.assertIn('zip', out.columns)  # 범주가 많은 컬럼은 번호 인코딩
+        self.assertEqual(sorted(pre.categories['plan']), sorted(['basic', 'pro', 'team', encoding.RARE_CATEGORY]))
+        plan = out[[f"plan={c}" for c in pre.categories['plan']]]
+        self.assertTrue((plan.sum(axis=1) == 1).all())
+        self.assertEqual(int(out[f"plan={encoding.RARE_CATEGORY}"].sum()), int(self.X['plan'].isin(['edu', 'gov']).sum()))
+
+        unseen = pre.transform(self.X.head(1).assign(plan='enterprise'))
+        self.assertEqual(unseen[f"plan={encoding.RARE_CATEGORY}"].iloc[0], 1)
+        self.assertEqual(list(unseen.columns), pre.output_columns)
+
+    def test_target_encoding_cross_fits_training_rows(self):
+        fit_rows = np.arange(400)
+        pre = encoding.TabularPreprocessor('target')
+        out = pre.fit_transform(self.X, self.y, fit_rows=fit_rows)
+        self.assertEqual(pre.target_columns, ['city', 'plan', 'zip'])
+        self.assertTrue(pd.api.types.is_float_dtype(out['city']))
+        # 학습에 쓰지 않은 행은 학습 행 전체로 계산한 평균, 학습 행은 교차 적합한 값
+        np.testing.assert_allclose(out.iloc[400:][pre.target_columns].to_numpy(),
+                                   pre.transform(self.X.iloc[400:])[pre.target_columns].to_numpy())
+        self.assertFalse(np.allclose(out.iloc[:400][pre.target_columns].to_numpy(),
+                                     pre.transform(self.X.iloc[:400])[pre.target_columns].to_numpy()))
+        with self.assertRaises(encoding.EncodingError):
+            encoding.TabularPreprocessor('target').fit_transform(self.X)
+
+    def test_chunked_fit_matches_full_fit(self):
+        for method in ('ordinal', 'onehot'):
+            with self.subTest(method=method):
+                full = encoding.TabularPreprocessor(method, rare_min_count=5)
+                expected = full.fit_transform(self.X)
+                chunked = encoding.TabularPreprocessor(method, rare_min_count=5)
+                chunked.fit_chunks(self.X.iloc[i:i + 150] for i in range(0, len(self.X), 150))
+                self.assertEqual(chunked.output_columns, full.output_columns)
+                pd.testing.assert_frame_equal(chunked.transform(self.X), expected, check_exact=False)
+
+    def test_missing_columns_and_unknown_method_are_errors(self):
+        pre = encoding.TabularPreprocessor()
+        pre.fit_transform(self.X)
+        with self.assertRaisesRegex(encoding.EncodingError, 'city'):
+            pre.transform(self.X.drop(columns='city'))
+        with self.assertRaises(encoding.EncodingError):
+            encoding.TabularPreprocessor('hashing')
+
+
+class ChartDataTests(StoreTestMixin, TestCase):
+    def chart(self, status=200, **params):
+        response = self.client.get(reverse('chart-data'), params)
+        self.assertEqual(response.status_code, status, response.content)
+        return response.json()
+
+    def test_charts_are_computed_from_every_row(self):
+        df = _sample_frame(rows=5000)
+        dataset_id = self.upload(df)['datasetId']
+
+        data = self.chart(dataset_id=dataset_id, kind='histogram', column='age', bins=15)
+        counts, edges = np.histogram(df['age'].dropna(), bins=15)
+        self.assertEqual(data['counts'], counts.tolist())
+        np.testing.assert_allclose(data['edges'], edges)
+        self.assertEqual((data['count'], data['missing']), (df['age'].notna().sum(), df['age'].isna().sum()))
+
+        data = self.chart(dataset_id=dataset_id, kind='counts', column='city', top=2)
+        expected = df['city'].value_counts()
+        self.assertEqual(data['labels'], expected.index[:2].tolist())
+        self.assertEqual(data['counts'], expected.iloc[:2].tolist())
+        self.assertEqual((data['other'], data['distinct']), (expected.iloc[2:].sum(), 4))
+
+        data = self.chart(dataset_id=dataset_id, kind='correlation', columns='age,score,income')
+        expected = df[['age', 'score', 'income']].corr().to_numpy()
+        np.testing.assert_allclose(data['matrix'], expected)
+
+    def test_scatter_is_downsampled(self):
+        df = _sample_frame(rows=5000)
+        dataset_id = self.upload(df)['datasetId']
+        both = df[['age', 'income']].dropna()
+        for sampling in ('lttb', 'stratified'):
+            with self.subTest(sampling=sampling):
+                data = self.chart(dataset_id=dataset_id, kind='scatter', column='age', y='income', points=500,
+                                  sampling=sampling)
+                self.assertEqual((len(data['x']), data['count'], data['sampled']), (500, len(both), True))
+                self.assertAlmostEqual(data['pearson'], both['age'].corr(both['income']))
+                self.assertEqual(data['x'], sorted(data['x']))
+                points = set(zip(both['age'], both['income']))
+                self.assertTrue(set(zip(data['x'], data['y'])) <= points)
+
+    def test_lttb_keeps_extremes(self):
+        x = np.arange(10_000, dtype=float)
+        y = np.sin(x / 500)
+        y[7777] = 50.0
+        keep = charts.lttb_indices(x, y, 200)
+        self.assertEqual((len(keep), keep[0], keep[-1]), (200, 0, 9999))
+        self.assertIn(7777, keep)
+        self.assertTrue((np.diff(keep) > 0).all())
+
+    def test_unchanged_columns_reuse_cached_charts(self):
+        dataset_id = self.upload(_sample_frame())['datasetId']
+        self.assertFalse(self.chart(dataset_id=dataset_id, kind='counts', column='city')['cached'])
+        self.assertTrue(self.chart(dataset_id=dataset_id, kind='counts', column='city')['cached'])
+
+        filled = self.process(dataset_id, 'fill_na_mean')['datasetId']
+        # city는 값이 바뀌지 않았으므로 다음 버전에서도 캐시를 씁니다. age는 바뀌었으므로 다시 계산
+        self.assertTrue(self.chart(dataset_id=filled, kind='counts', column='city')['cached'])
+        self.chart(dataset_id=dataset_id, kind='histogram', column='age')
+        self.assertFalse(self.chart(dataset_id=filled, kind='histogram', column='age')['cached'])
+
+    def test_invalid_requests(self):
+        dataset_id = self.upload(_sample_frame())['datasetId']
+        self.chart(400, dataset_id=dataset_id, kind='pie', column='age')
+        self.chart(400, dataset_id=dataset_id, kind='histogram')
+        self.chart(400, dataset_id=dataset_id, kind='histogram', column='age', bins=0)
+        self.chart(400, dataset_id=dataset_id, kind='scatter', column='age', y='income', sampling='random')
+        self.chart(400, dataset_id=dataset_id, kind='histogram', column='nope')
+        self.chart(400, dataset_id=dataset_id, kind='histogram', column='city')
+        self.chart(404, dataset_id='0' * 32, kind='histogram', column='age')
+
+
+class RowWindowTests(StoreTestMixin, TestCase):
+    def window(self, status=200, **data):
+        response = self.post('row-window', data)
+        self.assertEqual(response.status_code, status, response.content)
+        return response.json()
+
+    def page_frame(self, data):
+        return pd.read_json(io.StringIO(data['tableData']), orient='split')
+
+    def test_sort_filter_and_page(self):
+        df = _sample_frame(rows=1000)
+        dataset_id = self.upload(df)['datasetId']
+        filters = [{'column': 'city', 'op': '==', 'value': 'Seoul'}, {'column': 'score', 'op': '>=', 'value': 40}]
+        expected = df[(df['city'] == 'Seoul') & (df['score'] >= 40)]
+        expected = expected.sort_values('age', ascending=False, kind='stable', na_position='last')
+
+        pages = []
+        for offset in range(0, len(expected), 50):
+            data = self.window(dataset_id=dataset_id, sort='age', order='desc', filters=filters, offset=offset,
+                               limit=50)
+            self.assertEqual((data['total'], data['matched'], data['offset']), (1000, len(expected), offset))
+            pages.append(self.page_frame(data))
+        result = pd.concat(pages)
+        self.assertEqual(list(result.index), list(expected.index))
+        # 결측치는 미리보기 표와 같이 '-'로 표시됩니다. (정렬하면 맨 뒤)
+        self.assertEqual(result['age'].tolist(), expected['age'].astype(object).fillna('-').tolist())
+
+    def test_window_keeps_dataset_row_index(self):
+        df = _sample_frame()
+        dropped = self.process(self.upload(df)['datasetId'], 'drop_na')['datasetId']
+        data = self.window(dataset_id=dropped, offset=10, limit=5)
+        self.assertEqual(list(self.page_frame(data).index), list(df.dropna().index[10:15]))
+
+        data = self.window(dataset_id=dropped, filters=[{'column': 'city', 'op': 'contains', 'value': 'san'}])
+        self.assertEqual(data['matched'], int(df.dropna()['city'].eq('Busan').sum()))
+
+    def test_invalid_queries(self):
+        dataset_id = self.upload(_sample_frame())['datasetId']
+        for data in (
+            {'limit': 0}, {'offset': -1}, {'order': 'up'}, {'filters': 'city'},
+            {'sort': 'nope'}, {'filters': [{'column': 'city', 'op': '~'}]},
+            {'filters': [{'column': 'city', 'op': '<', 'value': 'B'}]},
+            {'filters': [{'column': 'age', 'op': '>', 'value': 'old'}]},
+        ):
+            with self.subTest(data=data):
+                self.window(400, dataset_id=dataset_id, **data)
+        self.window(404, dataset_id='0' * 32)
+
+
+class ResponseFormatTests(StoreTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.df = _sample_frame(rows=300)
+        self.dataset_id = self.upload(self.df)['datasetId']
+
+    def rows(self, query='', **headers):
+        return self.client.post(reverse('row-window') + query, {'dataset_id': self.dataset_id, 'limit': 200},
+                                format='json', **headers)
+
+    def test_json_tables_are_split_strings(self):
+        data = self.rows().json()
+        table = json.loads(data['tableData'])
+        self.assertEqual(table['columns'], list(self.df.columns))
+        self.assertEqual(len(table['data']), 200)
+
+    @skipIf(renderers.msgpack is None, "msgpack이 설치되어 있지 않음")
+    def test_msgpack_tables_are_values(self):
+        response = self.rows(HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        data = renderers.msgpack.unpackb(response.content)
+        expected = self.rows().json()
+        self.assertEqual(data['tableData'], json.loads(expected['tableData']))
+        self.assertEqual({k: v for k, v in data.items() if k != 'tableData'},
+                         {k: v for k, v in expected.items() if k != 'tableData'})
+
+    def test_arrow_stream_keeps_types_and_nulls(self):
+        response = self.rows('?format=arrow')
+        self.assertEqual(response['Content-Type'], 'application/vnd.apache.arrow.stream')
+        table = columnar.pa.ipc.open_stream(response.content).read_all()
+        metadata = table.schema.metadata
+        self.assertEqual(metadata[b'frame'], b'tableData')
+        self.assertEqual(json.loads(metadata[b'response'])['total'], 300)
+        frame = table.to_pandas()
+        expected = self.df.head(200)
+        pd.testing.assert_series_equal(frame['age'], expected['age'])
+        self.assertEqual(frame['city'].tolist(), expected['city'].tolist())
+
+    def test_compression_follows_accept_encoding(self):
+        plain = self.rows()
+        self.assertNotIn('Content-Encoding', plain)
+
+        response = self.rows(HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        self.assertLess(len(response.content), len(plain.content))
+
+        if 'zstd' in middleware._COMPRESSORS:
+            response = self.rows(HTTP_ACCEPT_ENCODING='gzip, zstd')
+            self.assertEqual(response['Content-Encoding'], 'zstd')
+            codec = columnar.pa.Codec('zstd')
+            self.assertEqual(codec.decompress(response.content, len(plain.content), asbytes=True), plain.content)
+
+        self.assertNotIn('Content-Encoding', self.rows(HTTP_ACCEPT_ENCODING='gzip;q=0'))
+        small = self.client.get(reverse('version-graph'), {'dataset_id': 'x'}, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertNotIn('Content-Encoding', small)
+
+    def test_choose_encoding(self):
+        self.assertEqual(middleware.choose_encoding('br, gzip;q=0.5', ('zstd', 'gzip')), 'gzip')
+        self.assertEqual(middleware.choose_encoding('*', ('gzip',)), 'gzip')
+        self.assertIsNone(middleware.choose_encoding('br', ('zstd', 'gzip')))
+        self.assertIsNone(middleware.choose_encoding(None, ('gzip',)))
+
+
+class BenchmarkCommandTests(TestCase):
+    RESULTS = {
+        'upload': {'seconds': 1.0, 'peak_rss_mb': 200.0, 'request_bytes': 10, 'response_bytes': 5000, 'runs': [1.0]},
+        'process': {'seconds': 0.5, 'peak_rss_mb': 210.0, 'request_bytes': 10, 'response_bytes': 4000, 'runs': [0.5]},
+    }
+
+    def setUp(self):
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp, ignore_errors=True)
+        self.baseline = str(tmp / 'baseline.json')
+
+    def call(self, results, *args):
+        out = io.StringIO()
+        with mock.patch.object(benchmark, 'run', return_value=results) as run:
+            call_command('benchmark', '--rows', '500', '--stages', 'upload', 'process', '--repeat', '1',
+                         '--baseline', self.baseline, *args, stdout=out, stderr=io.StringIO())
+        df = run.call_args.args[0]
+        self.assertEqual(df.shape, (500, 14))
+        return out.getvalue()
+
+    def test_synthetic_frame_is_deterministic(self):
+        df = benchmark.synthetic_frame(1000, numeric=3, categorical=2, null_rate=0.1, cardinality=5)
+        pd.testing.assert_frame_equal(df, benchmark.synthetic_frame(1000, numeric=3, categorical=2, null_rate=0.1,
+                                                                    cardinality=5))
+        self.assertEqual(list(df.columns), ['row_id', 'num_0', 'num_1', 'num_2', 'cat_0', 'cat_1', 'target'])
+        self.assertAlmostEqual(df['num_0'].isna().mean(), 0.1, delta=0.03)
+        self.assertEqual(df['target'].isna().sum(), 0)
+        self.assertLessEqual(df['cat_0'].nunique(), 5)
+
+    def test_regressions_beyond_tolerance_fail(self):
+        self.assertIn('기준선을 저장했습니다', self.call(self.RESULTS, '--save-baseline'))
+        saved = benchmark.load_baseline(self.baseline)
+        self.assertEqual(list(saved['scenarios'].values()), [self.RESULTS])
+
+        # 측정 잡음(최소 차이 이하)은 저하로 보지 않습니다.
+        noisy = json.loads(json.dumps(self.RESULTS))
+        noisy['process']['seconds'] = 0.54
+        self.assertNotIn('저하', self.call(noisy))
+
+        slower = json.loads(json.dumps(self.RESULTS))
+        slower['upload']['seconds'] = 2.0
+        with self.assertRaisesRegex(CommandError, r'upload\.seconds \+100\.0%'):
+            self.call(slower)
+
+    def test_compare_ignores_stages_without_baseline(self):
+        rows = benchmark.compare(self.RESULTS, {'upload': self.RESULTS['upload']}, settings.BENCHMARK['TOLERANCE'])
+        self.assertEqual({row['stage'] for row in rows}, {'upload'})
+        self.assertFalse(any(row['regression'] for row in rows))
+
+
+class BenchmarkRunTests(JobTestMixin, TransactionTestCase):
+    def test_repeats_do_not_reuse_cached_results(self):
+        df = benchmark.synthetic_frame(300, numeric=2, categorical=1)
+        # 💡 테스트 DB 안에서 실행하므로 벤치마크용 테스트 DB는 만들지 않습니다.
+        with mock.patch.object(benchmark, '_test_environment', contextlib.nullcontext), \
+                mock.patch.object(jobs, 'submit', wraps=jobs.submit) as submit:
+            results = benchmark.run(df, stages=('process', 'train'), repeat=2)
+        self.assertEqual(submit.call_count, 2)
+        self.assertEqual(TrainingJob.objects.filter(status=TrainingJob.SUCCEEDED).count(), 2)
+        self.assertEqual(len(results['train']['runs']), 2)
+        # 실제 결과 캐시 파일에는 쓰지 않습니다.
+        self.assertFalse(Path(settings.RESULT_CACHE['PATH']).exists())
+
+
+class ModelScalingTests(StoreTestMixin, TestCase):
+    def test_backend_follows_row_thresholds(self):
+        with self.settings(MODEL_SCALING=dict(settings.MODEL_SCALING, THRESHOLDS={'gb': 1000, 'svm': 500})):
+            self.assertEqual(training.resolve_backend('gb', 999), 'exact')
+            self.assertEqual(training.resolve_backend('gb', 1000), 'scalable')
+            self.assertEqual(training.resolve_backend('svm', 10_000, 'exact'), 'exact')
+            self.assertEqual(training.resolve_backend('svm', 10, 'scalable'), 'scalable')
+            # 큰 데이터용 모델이 없는 모델은 항상 기본 모델
+            self.assertEqual(training.resolve_backend('rf', 10 ** 7, 'scalable'), 'exact')
+
+    def test_scalable_models_accept_tuned_params(self):
+        gb = training.build_model('gb', False, {'n_estimators': 30}, backend='scalable')
+        self.assertEqual((training.estimator_name(gb), gb.max_iter), ('HistGradientBoostingClassifier', 30))
+        svm = training.build_model('svm', True, {'C': 10, 'gamma': 'scale'}, backend='scalable')
+        self.assertEqual(training.estimator_name(svm), 'StandardScaler + Nystroem + LinearSVR')
+        self.assertEqual((svm.get_params()['svm__C'], svm.get_params()['nystroem__gamma']), (10, None))
+
+    def test_sample_order_keeps_class_ratio(self):
+        y = np.array(['a'] * 900 + ['b'] * 100)
+        order = training.sample_order(y, is_regression=False)
+        self.assertEqual(sorted(order.tolist()), list(range(1000)))
+        for size in (10, 50, 200):
+            self.assertEqual((y[order[:size]] == 'b').sum(), size // 10)
+
+    def test_sample_rows_limits_training_rows(self):
+        df = _sample_frame(rows=1000)
+        result, _ = training.train(df, 'target', 'svm', scaling={'backend': 'scalable', 'sample_rows': 300})
+        backend = result['backend']
+        self.assertEqual((backend['name'], backend['trainRows'], backend['sampleRows']), ('scalable', 800, 300))
+        self.assertEqual(backend['estimator'], 'StandardScaler + Nystroem + LinearSVC')
+
+        result, _ = training.train(df, 'target', 'rf')
+        self.assertEqual((result['backend']['name'], result['backend']['sampleRows']), ('exact', 800))
+
+    def test_scalable_gb_with_many_categories(self):
+        df = _sample_frame(rows=3000)
+        df['name'] = [f'name_{i % 1500}' for i in range(len(df))]
+        result, fitted = training.train(df, 'target', 'gb', scaling={'backend': 'scalable'})
+        self.assertEqual(result['backend']['estimator'], 'HistGradientBoostingClassifier')
+        self.assertEqual(len(fitted.predict(df, 1000)), len(df))
+
+    def test_time_budget_trains_growing_samples(self):
+        rng = np.random.default_rng(0)
+        X = pd.DataFrame({'a': rng.normal(size=4000), 'b': rng.normal(size=4000)})
+        y = (X['a'] > 0).astype(int).to_numpy()
+        self.assertEqual(training._sample_sizes(4000, 500), [500, 1000, 2000, 4000])
+        with self.settings(MODEL_SCALING=dict(settings.MODEL_SCALING, MIN_SAMPLE_ROWS=500)):
+            _, used = training.fit_model('linear', False, X, y, lambda *a: None,
+                                         scaling={'sample_rows': None, 'time_budget': 60})
+            self.assertEqual(used, 4000)
+            # 예산을 넘길 것 같으면 마지막으로 학습한 모델을 씁니다. (첫 표본은 항상 학습)
+            with mock.patch.object(training, '_estimate_seconds', return_value=120):
+                _, used = training.fit_model('linear', False, X, y, lambda *a: None,
+                                             scaling={'sample_rows': None, 'time_budget': 60})
+            self.assertEqual(used, 500)
+
+    def test_invalid_scaling_requests(self):
+        dataset_id = self.upload(_sample_frame())['datasetId']
+        base = {'dataset_id': dataset_id, 'target': 'target', 'model_name': 'svm'}
+        for extra in ({'backend': 'gpu'}, {'sample_rows': 50}, {'sample_rows': 'all'}, {'time_budget': 0},
+                      {'time_budget': 5, 'models': ['rf', 'gb']}):
+            with self.subTest(extra=extra):
+                self.assertEqual(self.post('train-model', dict(base, **extra)).status_code, 400)
+
+
+class IncrementalTrainingTests(JobTestMixin, TransactionTestCase):
+    def setUp(self):
+        super().setUp()
+        rng = np.random.default_rng(3)
+        df = _sample_frame(rows=1200, seed=3)
+        # 💡 학습이 실제로 되는지 보려고 목표 변수를 특성에서 만듭니다.
+        df['target'] = np.where(df['score'] + rng.normal(0, 5, len(df)) > 50, 'yes', 'no')
+        self.df = df
+        self.dataset_id = self.upload(df)['datasetId']
+        self.path = dataset_store.get_dataset_store().locate(self.dataset_id)
+
+    def incremental_settings(self, chunk_rows):
+        return self.settings(INCREMENTAL_TRAINING=dict(settings.INCREMENTAL_TRAINING, CHUNK_ROWS=chunk_rows))
+
+    def test_models_train_in_chunks(self):
+        with self.incremental_settings(250):
+            for model_name in incremental.MODELS:
+                with self.subTest(model=model_name):
+                    result, fitted = incremental.train(self.path, 'target', model_name)
+                    self.assertEqual((result['mode'], result['type']), ('incremental', 'classification'))
+                    info = result['incremental']
+                    epochs = 1 if model_name == 'nb' else settings.INCREMENTAL_TRAINING['EPOCHS']
+                    self.assertEqual((info['chunks'], info['epochs']), (5, epochs))
+                    self.assertEqual(result['backend']['trainRows'] + info['testRows'], len(self.df))
+                    self.assertGreater(float(result['metrics']['Accuracy (정확도)'].rstrip('%')), 70)
+                    predicted = fitted.predict(self.df.drop(columns='target'), 500)
+                    self.assertEqual(len(predicted), len(self.df))
+                    self.assertTrue(set(predicted) <= {'yes', 'no'})
+
+    def test_holdout_rows_do_not_depend_on_chunk_size(self):
+        reader = incremental._ChunkReader(columnar.open_table(self.path), 'target', 100, 0.2)
+        rows = np.arange(len(self.df))
+        holdout = reader.holdout(rows)
+        self.assertAlmostEqual(holdout.mean(), 0.2, delta=0.04)
+        np.testing.assert_array_equal(np.concatenate([reader.holdout(part) for part in np.array_split(rows, 7)]),
+                                      holdout)
+
+        results = []
+        for chunk_rows in (100, 700):
+            with self.incremental_settings(chunk_rows):
+                results.append(incremental.train(self.path, 'target', 'nb')[0])
+        self.assertEqual(results[0]['incremental']['testRows'], results[1]['incremental']['testRows'])
+        self.assertEqual(results[0]['metrics'], results[1]['metrics'])
+
+    def test_stage_times_are_not_counted_twice(self):
+        transform = encoding.TabularPreprocessor.transform
+
+        def slow_transform(preprocessor, df):
+            time.sleep(0.02)
+            return transform(preprocessor, df)
+
+        with self.incremental_settings(300), \
+                mock.patch.object(encoding.TabularPreprocessor, 'transform', slow_transform), \
+                metrics.scope('training') as timings:
+            incremental.train(self.path, 'target', 'sgd')
+        self.assertEqual(set(timings.stages), {'encode', 'fit', 'predict'})
+        # 조각 인코딩 시간이 fit/predict에도 들어가면 단계 합계가 전체 시간보다 커집니다.
+        self.assertLessEqual(sum(timings.stages.values()), timings.elapsed)
+
+    def test_regression_target(self):
+        df = self.df.assign(target=self.df['score'] * 2.5 + 1)
+        path = dataset_store.get_dataset_store().locate(self.upload(df)['datasetId'])
+        with self.incremental_settings(400):
+            result, _ = incremental.train(path, 'target', 'sgd')
+            self.assertEqual(result['type'], 'regression')
+            with self.assertRaisesRegex(training.TrainingError, '분류 문제에만'):
+                incremental.train(path, 'target', 'nb')
+
+    def test_invalid_inputs_raise_training_error(self):
+        with self.assertRaisesRegex(training.TrainingError, '지원하지 않는 모델'):
+            incremental.train(self.path, 'target', 'rf')
+        with self.assertRaisesRegex(training.TrainingError, "'missing'"):
+            incremental.train(self.path, 'missing', 'sgd')
+        pickle_path = self.tmp / 'data.pkl'
+        self.df.to_pickle(pickle_path)
+        with self.assertRaisesRegex(training.TrainingError, 'Arrow'):
+            incremental.train(pickle_path, 'target', 'sgd')
+
+    def test_invalid_incremental_requests(self):
+        base = {'dataset_id': self.dataset_id, 'target': 'target', 'model_name': 'sgd', 'incremental': True}
+        for data in (dict(base, tune=True), dict(base, model_name=None, models=['sgd', 'nb']),
+                     dict(base, model_name='rf'), dict(base, encoding={'method': 'target'}),
+                     {k: v for k, v in base.items() if k != 'dataset_id'}):
+            with self.subTest(data=data):
+                data = {k: v for k, v in data.items() if v is not None}
+                self.assertEqual(self.post('train-model', data).status_code, 400)
+        self.assertEqual(self.post('train-model', dict(base, dataset_id=uuid.uuid4().hex)).status_code, 404)
+
+    def test_incremental_job_registers_model(self):
+        with self.incremental_settings(300):
+            job = self.train(dataset_id=self.dataset_id, target='target', model_name='sgd', incremental='true')
+            data = self.wait_for_job(job['jobId'])
+        self.assertEqual(data['status'], TrainingJob.SUCCEEDED, data)
+        result = data['result']
+        self.assertEqual((result['mode'], result['incremental']['chunks']), ('incremental', 4))
+        entry, fitted = get_model_registry().get(result['modelId'])
+        self.assertTrue(entry.params['incremental'])
+        self.assertEqual(len(fitted.predict(self.df, 500)), len(self.df))
+
+
+class ResultCacheTests(JobTestMixin, TransactionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.dataset_id = self.upload(_sample_frame())['datasetId']
+
+    def cache_counts(self):
+        """{(kind, result): 조회 수}"""
+        return {labels: value for _, labels, _, value in metrics.get_metrics().cache_requests.samples()}
+
+    def test_process_result_is_reused(self):
+        first = self.process(self.dataset_id, 'cap_outliers')
+        self.assertNotIn('cached', first)
+        again = self.process(self.dataset_id, 'cap_outliers')
+        self.assertTrue(again['cached'])
+        self.assertEqual(again['datasetId'], first['datasetId'])
+        self.assertEqual(again['statsData'], first['statsData'])
+        # 다른 단계나 다른 epsilon은 다른 키
+        self.assertNotIn('cached', self.process(self.dataset_id, 'drop_outliers'))
+        self.assertNotIn('cached', self.process(self.dataset_id, 'cap_outliers', approximate=True, epsilon=0.01))
+
+        # cache=false이면 다시 계산합니다. (결과는 다시 저장)
+        fresh = self.process(self.dataset_id, 'cap_outliers', cache='false')
+        self.assertNotIn('cached', fresh)
+        self.assertNotEqual(fresh['datasetId'], first['datasetId'])
+        self.assertEqual(self.process(self.dataset_id, 'cap_outliers')['datasetId'], fresh['datasetId'])
+        self.assertEqual(self.cache_counts(), {('process', 'hit'): 2, ('process', 'miss'): 3})
+
+        with self.settings(RESULT_CACHE=dict(settings.RESULT_CACHE, ENABLED=False)):
+            self.assertNotIn('cached', self.process(self.dataset_id, 'cap_outliers'))
+
+    def test_process_key_follows_dataset_content(self):
+        # 💡 dataset_id가 달라도 내용(컬럼 지문)이 같으면 같은 결과를 씁니다.
+        filled = [self.process(self.dataset_id, 'fill_na_mean', cache='false')['datasetId'] for _ in range(2)]
+        self.assertNotEqual(*filled)
+        store = dataset_store.get_dataset_store()
+        self.assertEqual(*[result_cache.dataset_key(store, dataset_id) for dataset_id in filled])
+        first = self.process(filled[0], 'drop_outliers')
+        again = self.process(filled[1], 'drop_outliers')
+        self.assertEqual((again['cached'], again['datasetId']), (True, first['datasetId']))
+
+    def test_missing_result_dataset_is_recomputed(self):
+        first = self.process(self.dataset_id, 'cap_outliers')
+        dataset_store.get_dataset_store().delete(first['datasetId'])
+        again = self.process(self.dataset_id, 'cap_outliers')
+        self.assertNotIn('cached', again)
+        self.assertNotEqual(again['datasetId'], first['datasetId'])
+        self.assertEqual(self.cache_counts(), {('process', 'miss'): 2})
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = result_cache.ResultCache(self.tmp / 'small.sqlite3', max_bytes=3000)
+        for key in ('a', 'b', 'c'):
+            cache.put(result_cache.PROCESS, key, 'x' * 900)
+        cache.get('a')
+        cache.put(result_cache.PROCESS, 'd', 'x' * 900)
+        self.assertEqual([key for key in 'abcd' if cache.get(key) is not None], ['a', 'c', 'd'])
+        # 최대 크기보다 큰 값은 저장하지 않습니다.
+        cache.put(result_cache.PROCESS, 'e', 'x' * 4000)
+        self.assertIsNone(cache.get('e'))
+        self.assertIsNotNone(cache.get('a'))
+
+    def test_running_and_finished_training_jobs_are_reused(self):
+        started, release = threading.Event(), threading.Event()
+        self.addCleanup(release.set)
+        load = views._load_training_dataframe
+
+        def blocked_load(dataset_id):
+            started.set()
+            release.wait(30)
+            return load(dataset_id)
+
+        request = {'dataset_id': self.dataset_id, 'target': 'target', 'model_name': 'rf'}
+        with mock.patch.object(views, '_load_training_dataframe', blocked_load):
+            job = self.train(**request)
+            self.assertTrue(started.wait(10))
+            # 실행 중인 같은 요청은 새 작업을 만들지 않습니다.
+            running = self.train(**request)
+            self.assertEqual((running['jobId'], running['cached']), (job['jobId'], True))
+            release.set()
+            self.assertEqual(self.wait_for_job(job['jobId'])['status'], TrainingJob.SUCCEEDED)
+
+        done = self.train(status=200, **request)
+        self.assertEqual((done['jobId'], done['status'], done['cached']), (job['jobId'], 'succeeded', True))
+        self.assertEqual(TrainingJob.objects.count(), 1)
+        # 다른 설정은 다른 키
+        other = self.train(**dict(request, model_name='linear'))
+        self.assertNotEqual(other['jobId'], job['jobId'])
+        self.wait_for_job(other['jobId'])
+        self.assertEqual(self.cache_counts(), {('train', 'hit'): 2, ('train', 'miss'): 2})
+
+    def test_deleted_model_or_failed_job_is_retrained(self):
+        request = {'dataset_id': self.dataset_id, 'target': 'target', 'model_name': 'rf'}
+        job = self.wait_for_job(self.train(**request)['jobId'])
+        response = self.client.delete(reverse('model-detail', args=[job['result']['modelId']]))
+        self.assertEqual(response.status_code, 204)
+        retrained = self.train(**request)
+        self.assertNotIn('cached', retrained)
+        self.assertNotEqual(retrained['jobId'], job['jobId'])
+        self.wait_for_job(retrained['jobId'])
+        self.assertEqual(self.train(status=200, **request)['jobId'], retrained['jobId'])
+
+        with mock.patch.object(views, '_load_training_dataframe', side_effect=training.TrainingError("실패")):
+            failed = self.wait_for_job(self.train(**dict(request, model_name='linear'))['jobId'])
+        self.assertEqual(failed['status'], TrainingJob.FAILED)
+        self.assertNotEqual(self.train(**dict(request, model_name='linear'))['jobId'], failed['jobId'])
+
+    def test_cache_false_starts_new_training_job(self):
+        request = {'dataset_id': self.dataset_id, 'target': 'target', 'model_name': 'rf'}
+        job = self.wait_for_job(self.train(**request)['jobId'])
+        fresh = self.train(cache='false', **request)
+        self.assertNotEqual(fresh['jobId'], job['jobId'])
+        self.wait_for_job(fresh['jobId'])
+        self.assertEqual(self.train(status=200, **request)['jobId'], fresh['jobId'])
@@ -0,0 +1,573 @@
+# backend/core/training.py
+
+"""
+모델 학습 (TrainModelView의 학습 로직).
+
+학습 작업 큐(core/jobs.py)의 워커 스레드에서 실행됩니다.
+- progress(진행률 0~100, 메시지) 콜백을 단계마다 호출합니다. 콜백이 예외를 발생시키면(작업 취소) 학습을 중단합니다.
+- 💡 RandomForest는 나무를 묶음 단위로 이어서 학습(warm_start)하고, GradientBoosting은 부스팅 단계마다
+     monitor로 진행률을 보고하므로 학습 도중에도 진행률 확인/취소가 가능합니다. (SVM/선형 모델은 fit 전후만)
+- 큰 데이터 (settings.MODEL_SCALING): 학습 행 수가 모델별 기준 이상이면 같은 종류의 확장성 있는 모델로 바꿉니다.
+  gb -> HistGradientBoosting (값을 구간으로 묶어 학습, 행 수에 거의 선형),
+  svm -> Nystroem 커널 근사 + 선형 SVM (커널 SVM은 행 수의 제곱 이상으로 느려짐).
+  학습 행 수 상한(sample_rows)이나 시간 예산(time_budget)을 주면 학습 행의 일부만 뽑아 학습합니다.
+  (분류는 클래스 비율을 유지) 실제로 쓴 모델과 행 수는 결과의 backend에 기록합니다.
+"""
+
+import math
+import time
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from sklearn.ensemble import (
+    GradientBoostingClassifier, GradientBoostingRegressor, HistGradientBoostingClassifier,
+    HistGradientBoostingRegressor, RandomForestClassifier, RandomForestRegressor,
+)
+from sklearn.kernel_approximation import Nystroem
+from sklearn.linear_model import LinearRegression, LogisticRegression
+from sklearn.metrics import accuracy_score, mean_squared_error, r2_score
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+from sklearn.svm import SVC, SVR, LinearSVC, LinearSVR
+
+from .metrics import stage
+from .encoding import TabularPreprocessor, id_like_columns
+
+# RandomForest를 나눠 학습할 때 한 번에 추가하는 나무 수
+_FOREST_CHUNK = 10
+
+# 모델 선택 방식: auto(학습 행 수로 결정) / exact(항상 기본 모델) / scalable(항상 큰 데이터용 모델)
+BACKENDS = ('auto', 'exact', 'scalable')
+# 큰 데이터용 모델로 바꿀 때 하이퍼파라미터 이름 (튜닝 결과 등 기본 모델 기준 이름 -> 큰 데이터용 모델의 이름)
+_SCALABLE_PARAMS = {
+    'gb': {'n_estimators': 'max_iter'},
+    'svm': {'C': 'svm__C', 'gamma': 'nystroem__gamma'},
+}
+
+
+class TrainingError(ValueError):
+    """학습 요청이 잘못된 경우 (목표 컬럼 없음 등)"""
+
+
+def train(df, target_col, model_name='rf', progress=None, encoding=None, scaling=None):
+    """
+    df로 model_name 모델을 학습합니다.
+    반환: (결과(성능 지표, 중요 변수, 설명, 예측 샘플), FittedModel)
+    - model_name: rf / gb / linear(분류면 LogisticRegression) / svm
+    - encoding: 특성 인코딩 설정 (prepare 참고)
+    - scaling: 큰 데이터 학습 설정 (scaling_options 참고)
+    """
+    progress = progress or _no_progress
+    data = prepare(df, target_col, progress, encoding)
+    return train_prepared(data, target_col, model_name, progress, scaling=scaling)
+
+
+def train_prepared(data, target_col, model_name='rf', progress=None, model_params=None, scaling=None):
+    """
+    prepare()로 준비한 데이터로 학습합니다. (train()과 같은 결과)
+    - model_params: 기본 설정 대신 쓸 하이퍼파라미터 (튜닝 결과, core/tuning.py)
+    """
+    progress = progress or _no_progress
+    X, is_regression, le_y, preprocessor = data.X, data.is_regression, data.le_y, data.preprocessor
+    y_test = data.y_test
+    scaling = scaling_options(scaling)
+    backend = resolve_backend(model_name, len(data.X_train), scaling['backend'])
+
+    # 6. 💡 모델 선택 및 학습 (분기 처리)
+    progress(20, "모델 학습 중")
+    with stage('fit'):
+        model, sample_rows = fit_model(model_name, is_regression, data.X_train, data.y_train, progress,
+                                       model_params, backend, scaling)
+    progress(90, "평가 중")
+    with stage('predict'):
+        y_pred = model.predict(data.X_test)
+
+    metrics, score = evaluate(is_regression, y_test, y_pred)
+    result_data = {
+        "type": "regression" if is_regression else "classification",
+        "model": model_name,
+        "metrics": metrics,
+        "encoding": preprocessor.summary(),
+        "backend": {
+            "name": backend,
+            "estimator": estimator_name(model),
+            "trainRows": len(data.X_train),
+            "sampleRows": sample_rows,
+            "timeBudget": scaling['time_budget'],
+        },
+    }
+
+    describe(result_data, model, X.columns, target_col, score, y_test, y_pred, le_y)
+
+    fitted = FittedModel(model, preprocessor, target_col, result_data["type"],
+                         target_classes=le_y.classes_ if le_y is not None else None)
+    return result_data, fitted
+
+
+def describe(result_data, model, columns, target_col, score, y_test, y_pred, le_y):
+    """결과에 중요 변수, 해석(설명), 실제값/예측값 샘플을 추가합니다."""
+    is_regression = result_data["type"] == "regression"
+
+    # 7. 💡 중요 변수 추출 (모델별 속성 차이 처리)
+    importances = {}
+
+    # (1) 트리 기반 모델 (feature_importances_)
+    if hasattr(model, 'feature_importances_'):
+        importances = dict(zip(columns, model.feature_importances_))
+
+    # (2) 선형 모델 (coef_) - 절대값 크기로 중요도 가늠
+    elif hasattr(model, 'coef_'):
+        # 다중 클래스일 경우 첫 번째 클래스 기준 혹은 평균 사용 등 복잡하지만, 여기선 단순화
+        coefs = model.coef_
+        if coefs.ndim > 1: 
+            coefs = coefs[0] # 첫 번째 클래스 또는 차원
+        importances = dict(zip(columns, np.abs(coefs)))
+
+    # (3) SVM 등 지원하지 않는 경우 -> 빈 딕셔너리
+
+    if importances:
+        sorted_importances = dict(sorted(importances.items(), key=lambda item: item[1], reverse=True))
+        result_data["feature_importances"] = sorted_importances
+    else:
+        result_data["feature_importances"] = {}
+
+
+    # 💡 [신규 기능] 결과 해석 및 설명 생성 로직
+    explanation = []
+
+    # 1. 성능 평가 해석
+    if is_regression:
+        r2_val = score
+        if r2_val >= 0.8:
+            grade = "아주 훌륭해요! 🌟"
+            desc = f"AI가 데이터의 패턴을 아주 잘 파악했습니다. (설명력: {r2_val*100:.1f}%)<br>이 모델은 실전에서 사용해도 좋을 만큼 믿음직스럽습니다."
+        elif r2_val >= 0.5:
+            grade = "준수합니다. ✅"
+            desc = f"데이터의 흐름을 절반 이상 파악했습니다. (설명력: {r2_val*100:.1f}%)<br>더 많은 데이터를 모으면 성능이 훨씬 좋아질 거예요."
+        else:
+            grade = "노력이 필요해요. 😅"
+            desc = f"아직 예측력이 다소 낮습니다. (설명력: {r2_val*100:.1f}%)<br>데이터 전처리를 다시 하거나, 이상치를 제거해 보세요."
+
+        explanation.append(f"<strong>[{grade}]</strong> {desc}")
+
+    else: # 분류 (Classification)
+        acc_val = score * 100
+        if acc_val >= 90:
+            grade = "천재적인 수준이에요! 🚀"
+            desc = f"정답률이 {acc_val:.1f}%입니다.<br>거의 모든 케이스를 정확하게 맞추고 있네요!"
+        elif acc_val >= 70:
+            grade = "쓸만하네요! 👍"
+            desc = f"정답률이 {acc_val:.1f}%입니다.<br>기본적인 분류는 잘 해내고 있습니다."
+        else:
+            grade = "조금 아쉬워요. 🤔"
+            desc = f"정답률이 {acc_val:.1f}%입니다.<br>동전 던지기보다는 낫지만, 개선이 필요해 보입니다."
+
+        explanation.append(f"<strong>[{grade}]</strong> {desc}")
+
+    # 2. 중요 변수 해석
+    if result_data.get("feature_importances"):
+        top_3 = list(result_data["feature_importances"].keys())[:3]
+        # 변수 이름들을 강조하기 위해 []로 감싸기
+        top_3_str = ", ".join([f"<b>[{f}]</b>" for f in top_3])
+
+        insight = f"<br><br>💡 <b>분석 팁</b>: 결과('{target_col}')를 결정짓는 가장 핵심적인 요인은 {top_3_str} 순서입니다."
+        insight += f"<br>특히 <b>'{top_3[0]}'</b> 데이터가 변하면 결과도 크게 달라질 가능성이 높으니 주목하세요!"
+        explanation.append(insight)
+    else:
+        explanation.append("<br><br>⚠️ 이 모델은 변수 중요도를 제공하지 않아, 어떤 요인이 중요한지 파악하기 어렵습니다.")
+
+    # 결과 데이터에 설명 추가
+    result_data["explanation"] = "".join(explanation)
+
+    # 💡 [신규 기능] 실제값 vs 예측값 비교 샘플 데이터 생성 (최대 10개)
+    sample_size = 10
+    # 인덱스 리셋을 위해 DataFrame/Series로 변환 보장
+    y_test_reset = pd.Series(y_test).reset_index(drop=True)
+    y_pred_reset = pd.Series(y_pred).reset_index(drop=True)
+
+    samples = []
+
+    # (1) 분류 문제일 경우: 라벨 복원 (0, 1 -> 'Yes', 'No')
+    if not is_regression and le_y is not None:
+        # LabelEncoder가 있다면 원래 문자열로 복구
+        actual_values = le_y.inverse_transform(y_test_reset[:sample_size].astype(int))
+        pred_values = le_y.inverse_transform(y_pred_reset[:sample_size].astype(int))
+    else:
+        # 회귀거나 인코딩 안 된 경우 그대로 사용
+        actual_values = y_test_reset[:sample_size].values
+        pred_values = y_pred_reset[:sample_size].values
+
+    # (2) 샘플 리스트 생성
+    for i in range(min(len(actual_values), sample_size)):
+        actual = actual_values[i]
+        pred = pred_values[i]
+
+        # 회귀의 경우 소수점 정리
+        if is_regression:
+            actual = round(float(actual), 2)
+            pred = round(float(pred), 2)
+            diff = round(abs(actual - pred), 2) # 오차
+            is_correct = diff  # 회귀에서는 오차값 자체
+        else:
+            # 분류는 맞음/틀림 여부 (True/False)
+            is_correct = (str(actual) == str(pred))
+
+        samples.append({
+            "id": i + 1,
+            "actual": actual,
+            "predicted": pred,
+            "is_correct": is_correct # 분류: bool, 회귀: 오차값(float)
+        })
+
+    result_data["samples"] = samples
+
+
+class TrainingData:
+    """prepare()의 결과: 인코딩된 특성(X), 학습/평가 분리, 목표 변수 정보"""
+
+    def __init__(self, X, X_train, X_test, y_train, y_test, is_regression, preprocessor, le_y):
+        self.X = X
+        self.X_train = X_train
+        self.X_test = X_test
+        self.y_train = y_train
+        self.y_test = y_test
+        self.is_regression = is_regression
+        self.preprocessor = preprocessor
+        self.le_y = le_y
+
+
+def prepare(df, target_col, progress=None, encoding=None):
+    """
+    학습 데이터 준비: ID 컬럼 제거 -> 목표 변수 분리/타입 판단 -> 결측치 대체/인코딩 -> 학습/평가 분리
+    - encoding: {'method', 'rare_min_count', 'onehot_max_categories'} 중 바꿀 값 (나머지는 settings.FEATURE_ENCODING)
+    """
+    progress = progress or _no_progress
+
+    # 2. 데이터 전처리 (ID 컬럼 제거 및 결측치 처리)
+    progress(5, "데이터 전처리 중")
+    cols_to_drop = id_like_columns(df.columns)
+    df_clean = df.drop(columns=cols_to_drop, errors='ignore')
+
+    if target_col in df_clean.columns:
+        df_clean = df_clean.dropna(subset=[target_col])
+
+    if target_col not in df_clean.columns:
+        raise TrainingError(f"목표 컬럼 '{target_col}'을 찾을 수 없습니다.")
+
+    # 3. 목표 변수(y) 분리 및 타입 판단
+    y = df_clean[target_col]
+    X = df_clean.drop(columns=[target_col])
+
+    is_regression = False
+    if pd.api.types.is_numeric_dtype(y):
+        if pd.api.types.is_float_dtype(y) or y.nunique() > 20:
+            is_regression = True
+
+    # 4. 결측치 대체 및 인코딩 (수치형이면 평균, 아니면 최빈값 / 범주형은 번호로)
+    # 💡 대체값과 범주 목록을 기억해 두었다가 예측할 때 똑같이 적용합니다.
+    progress(15, "인코딩 중")
+    le_y = None
+    # 💡 메모리 최적화된 데이터셋의 문자열 목표값은 category / string dtype입니다.
+    if not is_regression and not pd.api.types.is_numeric_dtype(y):
+        le_y = LabelEncoder()
+        y = le_y.fit_transform(y.astype(str))
+
+    preprocessor = TabularPreprocessor(**encoding_options(encoding))
+    fit_rows = None
+    if preprocessor.method == 'target':
+        # 💡 목표값 평균은 학습 행으로만 계산합니다. (아래 분리와 같은 행: 같은 행 수와 random_state)
+        fit_rows, _ = train_test_split(np.arange(len(X)), test_size=0.2, random_state=42)
+    with stage('encode'):
+        X = preprocessor.fit_transform(X, y, fit_rows=fit_rows, is_regression=is_regression)
+
+    # 5. 데이터 분리
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    return TrainingData(X, X_train, X_test, y_train, y_test, is_regression, preprocessor, le_y)
+
+
+def encoding_options(encoding=None):
+    """settings.FEATURE_ENCODING 기본값에 요청한 인코딩 설정을 덮어쓴 TabularPreprocessor 인자"""
+    config = settings.FEATURE_ENCODING
+    options = {
+        'method': config['METHOD'],
+        'rare_min_count': config['RARE_MIN_COUNT'],
+        'onehot_max_categories': config['ONEHOT_MAX_CATEGORIES'],
+    }
+    options.update({key: value for key, value in (encoding or {}).items() if key in options})
+    return options
+
+
+def scaling_options(scaling=None):
+    """settings.MODEL_SCALING 기본값에 요청한 값을 덮어쓴 큰 데이터 학습 설정 {'backend', 'sample_rows', 'time_budget'}"""
+    config = settings.MODEL_SCALING
+    options = {
+        'backend': config['BACKEND'],
+        'sample_rows': config['SAMPLE_ROWS'],
+        'time_budget': config['TIME_BUDGET_SECONDS'],
+    }
+    options.update({key: value for key, value in (scaling or {}).items() if key in options})
+    return options
+
+
+def resolve_backend(model_name, n_rows, requested='auto'):
+    """
+    학습 행 수가 n_rows일 때 쓸 모델 방식 ('exact' 또는 'scalable')
+    💡 큰 데이터용 모델이 없는 모델(rf / linear)은 항상 'exact'입니다.
+    """
+    if model_name not in _SCALABLE_PARAMS or requested == 'exact':
+        return 'exact'
+    if requested == 'scalable':
+        return 'scalable'
+    threshold = settings.MODEL_SCALING['THRESHOLDS'].get(model_name)
+    return 'scalable' if threshold is not None and n_rows >= threshold else 'exact'
+
+
+def build_model(model_name, is_regression, model_params=None, backend='exact'):
+    """
+    model_name(rf / gb / linear / svm)에 해당하는 회귀/분류 모델을 만듭니다. (model_params가 있으면 덮어씀)
+    - backend: 'scalable'이면 큰 데이터용 모델 (model_params는 기본 모델 기준 이름이어도 됨)
+    """
+    if backend == 'scalable' and model_name in _SCALABLE_PARAMS:
+        model = _scalable_model(model_name, is_regression)
+        model_params = _scalable_params(model_name, model_params)
+    else:
+        model = _default_model(model_name, is_regression)
+    if model_params:
+        model.set_params(**model_params)
+    return model
+
+
+def estimator_name(model):
+    """결과에 보여 줄 모델 클래스 이름 (Pipeline은 단계 이름을 +로 연결)"""
+    if isinstance(model, Pipeline):
+        return " + ".join(type(step).__name__ for _, step in model.steps)
+    return type(model).__name__
+
+
+def _default_model(model_name, is_regression):
+    if is_regression:
+        # --- 회귀 (Regression) ---
+        if model_name == 'linear':
+            return LinearRegression()
+        elif model_name == 'gb':
+            return GradientBoostingRegressor(n_estimators=100, random_state=42)
+        elif model_name == 'svm':
+            return SVR()
+        else: # default 'rf'
+            return RandomForestRegressor(n_estimators=100, random_state=42)
+
+    # --- [CASE 2] 분류 (Classification) ---
+    # 💡 핵심: 프론트에서 'linear'라고 보내도, 분류 문제라면 -> LogisticRegression 실행
+    if model_name == 'linear' or model_name == 'logistic':
+        return LogisticRegression(max_iter=1000)
+    elif model_name == 'gb':
+        return GradientBoostingClassifier(n_estimators=100, random_state=42)
+    elif model_name == 'svm':
+        return SVC()
+    else: # default 'rf'
+        return RandomForestClassifier(n_estimators=100, random_state=42)
+
+
+def _scalable_model(model_name, is_regression):
+    if model_name == 'gb':
+        # 💡 GradientBoosting과 같은 부스팅 단계 수. 값을 최대 255개 구간으로 묶어 분할 지점을 찾으므로
+        #    행 수가 많아도 빠르고, 1만 행이 넘으면 검증용 행으로 조기 종료합니다.
+        # 💡 categorical_features=None: 인코딩한 category 컬럼도 번호(수치)로 학습합니다.
+        #    (기본값 'from_dtype'은 범주가 255개를 넘으면 오류이고, 실수 배열로 학습하는 비교/튜닝 교차 검증과 모델이 달라짐)
+        if is_regression:
+            return HistGradientBoostingRegressor(max_iter=100, categorical_features=None, random_state=42)
+        return HistGradientBoostingClassifier(max_iter=100, categorical_features=None, random_state=42)
+
+    # svm: RBF 커널을 기준점 NYSTROEM_COMPONENTS개로 근사한 특성에 선형 SVM을 학습합니다.
+    # 💡 Nystroem의 gamma=None은 1/특성 수이므로, 표준화한 특성에서는 SVC의 gamma='scale'과 같습니다.
+    svm = LinearSVR(random_state=42) if is_regression else LinearSVC(random_state=42)
+    return Pipeline([
+        ('scale', StandardScaler()),
+        ('nystroem', Nystroem(n_components=settings.MODEL_SCALING['NYSTROEM_COMPONENTS'], random_state=42)),
+        ('svm', svm),
+    ])
+
+
+def _scalable_params(model_name, model_params):
+    if not model_params:
+        return model_params
+    names = _SCALABLE_PARAMS[model_name]
+    params = {names.get(key, key): value for key, value in model_params.items()}
+    if params.get('nystroem__gamma') == 'scale':
+        params['nystroem__gamma'] = None
+    return params
+
+
+def fit_model(model_name, is_regression, X, y, progress, model_params=None, backend='exact', scaling=None):
+    """
+    모델을 만들어 학습합니다. 반환: (학습한 모델, 학습에 쓴 행 수)
+    - scaling['sample_rows']: 학습에 쓸 최대 행 수 (None이면 전체)
+    - scaling['time_budget']: 시간 예산(초). 표본을 두 배씩 늘려 가며 학습하고,
+      지금까지의 학습 시간으로 추정한 다음 학습이 남은 예산 안에 끝나지 않으면 멈춥니다. (마지막 모델을 사용)
+    """
+    scaling = scaling or scaling_options()
+    n_rows = len(X)
+    limit = min(n_rows, scaling['sample_rows'] or n_rows)
+    budget = scaling['time_budget']
+    if limit >= n_rows and not budget:
+        model = build_model(model_name, is_regression, model_params, backend)
+        _fit(model, X, y, progress)
+        return model, n_rows
+
+    order = sample_order(y, is_regression)
+    if not budget:
+        model = build_model(model_name, is_regression, model_params, backend)
+        _fit(model, _take(X, order[:limit]), _take(y, order[:limit]), progress)
+        return model, limit
+
+    sizes = _sample_sizes(limit, settings.MODEL_SCALING['MIN_SAMPLE_ROWS'])
+    deadline = time.perf_counter() + budget
+    model, used, history = None, 0, []
+    for step, size in enumerate(sizes):
+        # 💡 첫 표본은 예산과 관계없이 학습합니다. (모델이 하나는 있어야 하므로)
+        if model is not None and _estimate_seconds(history, size) > deadline - time.perf_counter():
+            break
+        progress(20 + 65 * step / len(sizes), f"모델 학습 중 (표본 {size:,}/{n_rows:,}행)")
+        candidate = build_model(model_name, is_regression, model_params, backend)
+        start = time.perf_counter()
+        _fit(candidate, _take(X, order[:size]), _take(y, order[:size]), _no_progress)
+        history.append((size, time.perf_counter() - start))
+        model, used = candidate, size
+    progress(85, "모델 학습 완료")
+    return model, used
+
+
+def sample_order(y, is_regression, random_state=42):
+    """
+    행 번호를 섞은 순서. 분류는 어느 앞부분을 잘라도 클래스 비율이 전체와 같도록 클래스를 고르게 섞습니다.
+    💡 클래스 안에서 섞은 순번을 클래스 크기로 나눈 값(0~1)으로 정렬하면, 각 클래스가 비율대로 번갈아 나옵니다.
+    """
+    rng = np.random.RandomState(random_state)
+    n_rows = len(y)
+    if is_regression:
+        return rng.permutation(n_rows)
+    _, codes, counts = np.unique(np.asarray(y), return_inverse=True, return_counts=True)
+    position = np.empty(n_rows, dtype=np.float64)
+    for label, count in enumerate(counts):
+        rows = np.flatnonzero(codes == label)
+        position[rng.permutation(rows)] = (np.arange(count) + rng.uniform()) / count
+    return np.argsort(position, kind='stable')
+
+
+def _sample_sizes(limit, min_rows):
+    """시간 예산 모드의 표본 크기: min_rows부터 두 배씩, 마지막은 limit"""
+    sizes = []
+    size = min(min_rows, limit)
+    while size < limit:
+        sizes.append(size)
+        size *= 2
+    sizes.append(limit)
+    return sizes
+
+
+def _estimate_seconds(history, size):
+    """
+    지금까지의 (표본 크기, 학습 시간)으로 size행 학습 시간을 추정합니다.
+    💡 마지막 두 번의 학습으로 행 수에 대한 증가 차수를 구하고(1~2 사이), 한 번뿐이면 행 수에 비례한다고 봅니다.
+    """
+    last_size, last_seconds = history[-1]
+    exponent = 1.0
+    if len(history) >= 2:
+        prev_size, prev_seconds = history[-2]
+        if prev_seconds > 0 and last_seconds > 0:
+            exponent = min(2.0, max(1.0, math.log(last_seconds / prev_seconds) / math.log(last_size / prev_size)))
+    return last_seconds * (size / last_size) ** exponent
+
+
+def _take(values, rows):
+    return values.iloc[rows] if hasattr(values, 'iloc') else values[rows]
+
+
+def evaluate(is_regression, y_test, y_pred):
+    """성능 지표(표시용 문자열)와 점수(회귀: R2, 분류: 정확도)를 반환합니다."""
+    if is_regression:
+        mse = mean_squared_error(y_test, y_pred)
+        r2 = r2_score(y_test, y_pred)
+        return metric_summary(True, r2, mse), r2
+
+    accuracy = accuracy_score(y_test, y_pred)
+    return metric_summary(False, accuracy), accuracy
+
+
+def metric_summary(is_regression, score, mse=None):
+    """성능 지표 표시용 문자열 (점수: 회귀는 R2, 분류는 정확도)"""
+    if is_regression:
+        return {
+            "R2 Score (설명력)": f"{score:.4f}",
+            "MSE (오차제곱평균)": f"{mse:.4f}"
+        }
+    return {
+        "Accuracy (정확도)": f"{score * 100:.2f}%"
+    }
+
+
+class FittedModel:
+    """
+    학습된 모델과 전처리 상태. 모델 레지스트리(core/registry.py)에 그대로 저장됩니다.
+    - target_classes: 분류 목표값을 번호로 바꿨다면 원래 값 목록 (예측 결과를 원래 값으로 복원)
+    """
+
+    def __init__(self, model, preprocessor, target, task, target_classes=None):
+        self.model = model
+        self.preprocessor = preprocessor
+        self.target = target
+        self.task = task
+        self.target_classes = target_classes
+
+    def predict(self, df, batch_size):
+        """df의 예측값 배열을 반환합니다. batch_size 행씩 나눠 변환/예측하여 임시 메모리를 제한합니다."""
+        predictions = []
+        for start in range(0, len(df), batch_size):
+            with stage('encode'):
+                X = self.preprocessor.transform(df.iloc[start:start + batch_size])
+            # 💡 비교 모드(core/compare.py)의 모델은 컬럼 이름 없는 행렬로 학습했으므로 행렬로 넘깁니다.
+            if not hasattr(self.model, 'feature_names_in_'):
+                X = X.to_numpy(dtype=np.float64)
+            with stage('predict'):
+                predictions.append(self.model.predict(X))
+        if not predictions:
+            return np.array([])
+        predictions = np.concatenate(predictions)
+        if self.target_classes is not None:
+            predictions = self.target_classes[predictions.astype(int)]
+        return predictions
+
+
+def _no_progress(percent, message):
+    pass
+
+
+def _fit(model, X, y, progress):
+    """모델을 학습하면서 진행률(20% ~ 85%)을 보고합니다."""
+    if isinstance(model, (RandomForestClassifier, RandomForestRegressor)):
+        # 💡 random_state가 같으면 나무를 나눠 이어서 학습해도 한 번에 학습한 결과와 같습니다.
+        total = model.n_estimators
+        model.set_params(warm_start=True)
+        for n_estimators in range(_FOREST_CHUNK, total + _FOREST_CHUNK, _FOREST_CHUNK):
+            n_estimators = min(n_estimators, total)
+            model.set_params(n_estimators=n_estimators)
+            model.fit(X, y)
+            progress(20 + 65 * n_estimators / total, f"모델 학습 중 ({n_estimators}/{total})")
+        model.set_params(warm_start=False)
+
+    elif isinstance(model, (GradientBoostingClassifier, GradientBoostingRegressor)):
+        def monitor(i, estimator, _locals):
+            progress(20 + 65 * (i + 1) / estimator.n_estimators, f"모델 학습 중 ({i + 1}/{estimator.n_estimators})")
+            return False  # True를 반환하면 조기 종료
+
+        model.fit(X, y, monitor=monitor)
+
+    else:
+        if isinstance(model, Pipeline) and 'nystroem' in model.named_steps:
+            # 기준점 수는 학습 행 수보다 많을 수 없습니다. (작은 표본)
+            n_components = model.named_steps['nystroem'].n_components
+            model.set_params(nystroem__n_components=min(n_components, len(X)))
+        model.fit(X, y)
+        progress(85, "모델 학습 완료")
@@ -0,0 +1,287 @@
+# backend/core/tuning.py
+
+"""
+하이퍼파라미터 튜닝 (교차 검증 + Successive Halving).
+
+기본 학습(training.train)은 고정된 설정(n_estimators=100 등)과 한 번의 학습/평가 분리로만 평가합니다.
+튜닝 모드는 모델 종류마다 정해 둔 탐색 공간(SEARCH_SPACES)을 k-fold 교차 검증으로 비교하고,
+가장 좋은 설정으로 학습한 모델을 반환합니다.
+
+- Successive Halving: 첫 라운드는 모든 후보를 작은 표본(학습 데이터의 일부)으로 평가하고,
+  라운드마다 상위 1/FACTOR 후보만 남기면서 표본을 FACTOR배로 늘립니다.
+  (약한 설정은 적은 비용으로 일찍 탈락하고, 마지막 라운드만 전체 학습 데이터로 평가)
+- 병렬: 라운드 안의 (후보, fold) 평가를 joblib으로 여러 CPU 코어에 나눠 실행합니다. (settings.TUNING['N_JOBS'])
+  💡 joblib은 큰 배열을 메모리 맵으로 워커에 넘기므로 fold마다 데이터를 복사하지 않습니다.
+- 캐시: fold 점수를 (데이터 지문, 모델, 하이퍼파라미터, 표본 수, fold)로 기억합니다.
+  같은 데이터로 다시 튜닝하면 이미 평가한 fold는 다시 학습하지 않습니다. (워커(프로세스)별 LRU)
+- 평가 점수: 회귀는 R2, 분류는 정확도 (training.evaluate와 같음)
+- 큰 데이터: 학습 행 수로 정한 모델 방식(training.resolve_backend)을 모든 라운드에 똑같이 씁니다.
+  (큰 데이터용 모델도 같은 탐색 공간을 쓰고, 하이퍼파라미터 이름은 build_model이 바꿉니다)
+"""
+
+import hashlib
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from joblib import Parallel, delayed
+from sklearn.model_selection import KFold, StratifiedKFold
+
+from .profile_cache import fingerprint
+from .training import TrainingError, build_model, evaluate, prepare, resolve_backend, scaling_options, train_prepared
+
+# 모델 종류별 탐색 공간 (값 목록의 모든 조합이 후보)
+# 💡 'linear'는 분류 문제이면 LogisticRegression이므로 회귀/분류 탐색 공간이 다릅니다.
+SEARCH_SPACES = {
+    'rf': {
+        'n_estimators': [50, 100, 200],
+        'max_depth': [None, 8, 16],
+        'min_samples_leaf': [1, 3, 5],
+    },
+    'gb': {
+        'n_estimators': [50, 100, 200],
+        'learning_rate': [0.05, 0.1, 0.2],
+        'max_depth': [2, 3, 4],
+    },
+    'svm': {
+        'C': [0.1, 1, 10, 100],
+        'gamma': ['scale', 0.001, 0.01, 0.1],
+    },
+    'linear': {
+        'fit_intercept': [True, False],
+    },
+    'logistic': {
+        'C': [0.01, 0.1, 1, 10, 100],
+    },
+}
+
+# 결과에 보여 줄 상위 후보 수
+_LEADERBOARD_SIZE = 10
+# 데이터 지문 재료에 넣는 분리/표본 방식 버전 (방식을 바꾸면 올려서 이전 캐시를 무효화)
+_SCHEME_VERSION = 1
+
+
+class ScoreCache:
+    """fold 점수 캐시 (워커 단위 LRU)"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._scores = OrderedDict()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._scores:
+                return None
+            self._scores.move_to_end(key)
+            return self._scores[key]
+
+    def put(self, key, score):
+        with self._lock:
+            self._scores[key] = score
+            self._scores.move_to_end(key)
+            while len(self._scores) > self.max_entries:
+                self._scores.popitem(last=False)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_score_cache():
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ScoreCache(settings.TUNING['CACHE_SIZE'])
+    return _cache
+
+
+def tune(df, target_col, model_name='rf', folds=None, progress=None, encoding=None, scaling=None):
+    """
+    model_name의 하이퍼파라미터를 교차 검증으로 탐색하고, 가장 좋은 설정으로 학습합니다.
+    반환: (training.train과 같은 결과 + 탐색 결과(bestParams, cvScore, search, leaderboard), FittedModel)
+    """
+    config = settings.TUNING
+    folds = folds or config['FOLDS']
+    progress = progress or (lambda percent, message: None)
+    data = prepare(df, target_col, progress, encoding)
+
+    space_name = 'logistic' if model_name == 'linear' and not data.is_regression else model_name
+    space = SEARCH_SPACES.get(space_name, SEARCH_SPACES['rf'])
+    candidates = _candidates(space)
+
+    X = data.X_train.to_numpy(dtype=np.float64)
+    y = np.asarray(data.y_train)
+    backend = resolve_backend(model_name, len(X), scaling_options(scaling)['backend'])
+    cache_space = space_name if backend == 'exact' else f'{space_name}:{backend}'
+    # 💡 라운드마다 같은 순서의 앞부분을 표본으로 쓰므로, 작은 표본은 큰 표본에 포함됩니다.
+    order = np.random.RandomState(42).permutation(len(X))
+    data_fp = fingerprint(_SCHEME_VERSION, target_col, _frame_digest(data.X, data.y_train))
+
+    schedule = _schedule(len(candidates), len(X), max(config['MIN_SAMPLES'], folds * 2), config['FACTOR'])
+    start = time.perf_counter()
+    cache = get_score_cache()
+    stats = {'evaluated': 0, 'cached': 0}
+    rounds, results = [], {}
+    alive = list(range(len(candidates)))
+    for round_no, n_samples in enumerate(schedule):
+        message = f"튜닝 {round_no + 1}/{len(schedule)}라운드 (후보 {len(alive)}개, 표본 {n_samples}행)"
+        report = _scaled(progress, 20 + 60 * round_no / len(schedule), 20 + 60 * (round_no + 1) / len(schedule))
+        report(0, message)
+        rows = order[:n_samples]
+        splits = _folds(y[rows], folds, data.is_regression)
+        keys = [_cache_key(data_fp, cache_space, candidates[i], n_samples, folds) for i in alive]
+        scores = _score_round(X[rows], y[rows], splits, [candidates[i] for i in alive], keys,
+                              model_name, backend, data.is_regression, cache, stats,
+                              lambda done, total: report(100 * done / total, message))
+        for i, fold_scores in zip(alive, scores):
+            results[i] = {'samples': n_samples, 'scores': fold_scores}
+
+        # 다음 라운드에는 상위 1/FACTOR만 남깁니다. (실패한 후보는 탈락)
+        ranked = sorted(alive, key=lambda i: _mean(results[i]['scores']), reverse=True)
+        keep = ranked if round_no == len(schedule) - 1 else ranked[:max(1, math.ceil(len(ranked) / config['FACTOR']))]
+        rounds.append({'round': round_no + 1, 'samples': n_samples, 'candidates': len(alive), 'kept': len(keep)})
+        alive = keep
+
+    best = alive[0]
+    if _mean(results[best]['scores']) == float('-inf'):
+        raise TrainingError("모든 하이퍼파라미터 후보의 교차 검증이 실패했습니다.")
+    best_params = candidates[best]
+    search_seconds = time.perf_counter() - start
+
+    # 💡 가장 좋은 설정으로 전체 학습 데이터를 다시 학습하고, 기본 학습과 같은 평가 데이터로 평가합니다.
+    result_data, fitted = train_prepared(data, target_col, model_name, _scaled(progress, 80, 95),
+                                         model_params=best_params, scaling=scaling)
+    leaderboard = sorted(results.items(), key=lambda item: (item[1]['samples'], _mean(item[1]['scores'])), reverse=True)
+    result_data.update({
+        "mode": "tune",
+        "bestParams": best_params,
+        "cvScore": _mean(results[best]['scores']),
+        "cvStd": _std(results[best]['scores']),
+        "search": {
+            "folds": folds,
+            "factor": config['FACTOR'],
+            "candidates": len(candidates),
+            "rounds": rounds,
+            "evaluated": stats['evaluated'],
+            "cached": stats['cached'],
+            "seconds": round(search_seconds, 3),
+        },
+        "leaderboard": [{
+            "params": candidates[i],
+            "samples": entry['samples'],
+            "cvScore": _json_score(_mean(entry['scores'])),
+            "cvStd": _std(entry['scores']),
+        } for i, entry in leaderboard[:_LEADERBOARD_SIZE]],
+    })
+    return result_data, fitted
+
+
+def _score_round(X, y, splits, candidates, keys, model_name, backend, is_regression, cache, stats, report):
+    """
+    후보마다 fold 점수 목록을 반환합니다. (캐시에 없는 fold만 병렬로 평가)
+    💡 report(끝난 수, 전체 수)가 예외(작업 취소)를 발생시키면 남은 평가를 멈춥니다.
+    """
+    scores = [[None] * len(splits) for _ in candidates]
+    tasks = []
+    for c, (params, key) in enumerate(zip(candidates, keys)):
+        for f, (train_idx, test_idx) in enumerate(splits):
+            cached = cache.get((key, f))
+            if cached is not None:
+                scores[c][f] = cached
+                stats['cached'] += 1
+            else:
+                tasks.append((c, f, params, train_idx, test_idx))
+
+    if tasks:
+        parallel = Parallel(n_jobs=settings.TUNING['N_JOBS'], return_as='generator_unordered')
+        results = parallel(delayed(_score_fold)(c, f, model_name, backend, is_regression, params, X, y, train_idx, test_idx)
+                           for c, f, params, train_idx, test_idx in tasks)
+        try:
+            for done, (c, f, score) in enumerate(results, start=1):
+                scores[c][f] = score
+                cache.put((keys[c], f), score)
+                stats['evaluated'] += 1
+                report(done, len(tasks))
+        finally:
+            results.close()
+    return scores
+
+
+def _score_fold(c, f, model_name, backend, is_regression, params, X, y, train_idx, test_idx):
+    """(joblib 워커) 후보 하나를 fold 하나로 학습/평가합니다. 학습할 수 없는 설정이면 -inf."""
+    try:
+        model = build_model(model_name, is_regression, params, backend)
+        model.fit(X[train_idx], y[train_idx])
+        _, score = evaluate(is_regression, y[test_idx], model.predict(X[test_idx]))
+    except Exception:
+        score = float('-inf')
+    return c, f, float(score)
+
+
+def _folds(y, folds, is_regression):
+    """k-fold 분리 (분류는 클래스 비율을 유지, 클래스별 행이 folds개보다 적으면 일반 k-fold)"""
+    if not is_regression and pd.Series(y).value_counts().min() >= folds:
+        splitter = StratifiedKFold(n_splits=folds, shuffle=True, random_state=42)
+    else:
+        splitter = KFold(n_splits=folds, shuffle=True, random_state=42)
+    return list(splitter.split(np.zeros(len(y)), y))
+
+
+def _schedule(n_candidates, n_samples, min_samples, factor):
+    """
+    라운드별 표본 수. 후보가 하나만 남을 때까지(또는 표본을 더 늘릴 수 없을 때까지) 라운드를 나누고,
+    마지막 라운드는 전체 학습 데이터를 씁니다.
+    """
+    required = 1 + int(math.floor(math.log(n_candidates, factor))) if n_candidates > 1 else 1
+    possible = 1 + int(math.floor(math.log(max(n_samples // max(min_samples, 1), 1), factor)))
+    n_rounds = max(1, min(required, possible))
+    first = max(n_samples // factor ** (n_rounds - 1), min(min_samples, n_samples))
+    return [min(first * factor ** i, n_samples) for i in range(n_rounds - 1)] + [n_samples]
+
+
+def _candidates(space):
+    """탐색 공간의 모든 조합 (값 목록 순서대로)"""
+    names = list(space)
+    combos = [{}]
+    for name in names:
+        combos = [dict(combo, **{name: value}) for combo in combos for value in space[name]]
+    return combos
+
+
+def _cache_key(data_fp, space_name, params, n_samples, folds):
+    return fingerprint(data_fp, space_name, json.dumps(params, sort_keys=True), n_samples, folds)
+
+
+def _frame_digest(X, y):
+    """인코딩한 특성/목표 값 내용의 지문 (데이터셋 ID가 달라도 내용이 같으면 같은 지문)"""
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(pd.util.hash_pandas_object(X, index=False).to_numpy().tobytes())
+    hasher.update(pd.util.hash_pandas_object(pd.Series(np.asarray(y)), index=False).to_numpy().tobytes())
+    return fingerprint(hasher.hexdigest(), list(X.columns))
+
+
+def _mean(scores):
+    return float(np.mean(scores)) if scores else float('-inf')
+
+
+def _std(scores):
+    if not scores or any(s == float('-inf') for s in scores):
+        return None
+    return float(np.std(scores))
+
+
+def _json_score(score):
+    # 💡 JSON은 -Infinity를 표현할 수 없으므로 실패한 후보는 null로 내보냅니다.
+    return None if score == float('-inf') else score
+
+
+def _scaled(progress, start, end):
+    """train_prepared의 진행률(0~100)을 start~end 구간으로 줄여서 보고합니다."""
+    return lambda percent, message: progress(start + (end - start) * percent / 100, message)
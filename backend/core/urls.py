@@ -1,9 +1,30 @@
 from django.urls import path
-from .views import FileUploadView, ProcessDataView, TrainModelView
+from .views import (FileUploadView, ProcessDataView, PipelineView, TrainModelView, TrainJobView, TrainJobCancelView,
+                    PredictView, ModelListView, ModelDetailView, ChartDataView, RowWindowView, MetricsView,
+                    VersionGraphView, VersionCheckoutView,
+                    upload_events, process_events, train_events, train_job_events)
 
 urlpatterns = [
     # 'upload/' 경로를 FileUploadView와 연결하는 설정
     path('upload/', FileUploadView.as_view(), name='file-upload'),
     path('process/', ProcessDataView.as_view(), name='process-data'),
+    path('pipeline/', PipelineView.as_view(), name='pipeline'),
+    # 데이터셋 버전 그래프 / 되돌리기, 다시 실행
+    path('versions/', VersionGraphView.as_view(), name='version-graph'),
+    path('versions/checkout/', VersionCheckoutView.as_view(), name='version-checkout'),
+    path('charts/', ChartDataView.as_view(), name='chart-data'),
+    path('rows/', RowWindowView.as_view(), name='row-window'),
     path('train/', TrainModelView.as_view(), name='train-model'),
+    path('train/jobs/<uuid:job_id>/', TrainJobView.as_view(), name='train-job'),
+    path('train/jobs/<uuid:job_id>/cancel/', TrainJobCancelView.as_view(), name='train-job-cancel'),
+    path('predict/', PredictView.as_view(), name='predict'),
+    path('models/', ModelListView.as_view(), name='model-list'),
+    path('models/<uuid:model_id>/', ModelDetailView.as_view(), name='model-detail'),
+    # Prometheus 수집 경로
+    path('metrics/', MetricsView.as_view(), name='metrics'),
+    # 진행 이벤트 스트림 (Server-Sent Events): 위 업로드/전처리/학습과 같은 요청을 받아 진행 상황을 보냄
+    path('upload/events/', upload_events, name='file-upload-events'),
+    path('process/events/', process_events, name='process-data-events'),
+    path('train/events/', train_events, name='train-model-events'),
+    path('train/jobs/<uuid:job_id>/events/', train_job_events, name='train-job-events'),
 ]
\ No newline at end of file
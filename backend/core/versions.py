@@ -0,0 +1,162 @@
+# backend/core/versions.py
+
+"""
+데이터셋 버전 그래프 (되돌리기 / 다시 실행 / 분기).
+
+전처리 요청(ProcessDataView / PipelineView)은 매번 새 데이터셋을 만듭니다. 그 결과를 입력 데이터셋의
+자식 버전(DatasetVersion)으로 기록해, 업로드한 데이터셋을 뿌리로 하는 트리를 만듭니다.
+
+- 되돌리기(undo): 부모 버전, 다시 실행(redo): 가장 최근에 만들었거나 방문한 자식 버전
+  같은 버전에 다른 작업을 하면 형제 버전(분기)이 생깁니다. (예: fill_na_mean과 fill_na_median 비교)
+- 버전 사이의 이동은 dataset_id만 바꾸므로 데이터를 다시 계산하거나 쓰지 않습니다.
+  (프로파일도 버전마다 저장된 캐시를 재사용, core/profile_cache.py)
+  💡 현재 버전은 클라이언트가 dataset_id로 들고 있으므로 서버에 '현재 위치'를 따로 저장하지 않습니다.
+     같은 파일(같은 dataset_id)을 올린 사용자끼리 그래프를 공유해도 서로의 위치에 영향이 없습니다.
+- 값이 바뀌지 않은 컬럼은 부모 파일의 버퍼를 공유합니다. (core/dataset_store.py, core/columnar.py)
+  버전이 따로 차지하는 용량(ownBytes)은 바뀐 컬럼 분량뿐입니다.
+- 만료: 버전 파일도 저장소 TTL로 만료됩니다. 버전에 접근하면 저장소가 조상 버전도 함께 touch하므로(dataset_store.put의 parent)
+  자식 버전을 쓰는 동안에는 되돌아갈 버전이 먼저 사라지지 않습니다.
+- 정리: 그래프의 버전이 MAX_VERSIONS개를 넘으면 가장 오래 쓰지 않은 잎(leaf) 버전부터 지웁니다.
+  (마지막 사용 시각: 방문 시각과 저장소 파일의 접근 시각 중 늦은 쪽. /rows/, /charts/, /train/ 등으로 읽기만 해도 사용)
+  💡 뿌리는 같은 파일을 올린 사용자끼리 공유하므로, 다른 사용자가 읽고 있는 잎 버전이 먼저 지워지지 않도록 합니다.
+  💡 잎만 지우므로 남은 버전이 공유하는 버퍼는 지워지지 않습니다. 저장소 TTL로 이미 사라진 잎 버전도 함께 정리합니다.
+- 설정: settings.DATASET_VERSIONS
+"""
+
+from collections import Counter
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import DatasetVersion
+
+UNDO = 'undo'
+REDO = 'redo'
+
+
+class VersionError(ValueError):
+    """되돌릴/다시 실행할 버전이 없거나, 같은 그래프의 버전이 아닌 경우 (400 응답)"""
+
+
+def enabled():
+    return settings.DATASET_VERSIONS['ENABLED']
+
+
+def share_columns():
+    """전처리 결과를 저장할 때 값이 바뀌지 않은 컬럼을 부모 파일과 공유할지"""
+    return enabled() and settings.DATASET_VERSIONS['SHARE_COLUMNS']
+
+
+def record(store, parent_id, dataset_id, action, lineage, df):
+    """
+    parent_id 데이터셋에 action을 적용해 만든 dataset_id(df)를 자식 버전으로 기록하고 DatasetVersion을 반환합니다.
+    parent_id가 아직 그래프에 없으면(업로드한 데이터셋) 뿌리 버전으로 먼저 기록합니다.
+    """
+    parent = DatasetVersion.objects.filter(pk=parent_id).first()
+    if parent is None:
+        own_bytes, _ = store.footprint(parent_id) or (0, [])
+        parent, _ = DatasetVersion.objects.get_or_create(
+            id=parent_id, defaults={'root': parent_id, 'own_bytes': own_bytes})
+
+    own_bytes, shared = store.footprint(dataset_id) or (0, [])
+    node = DatasetVersion.objects.create(
+        id=dataset_id,
+        root=parent.root,
+        parent=parent,
+        action=action,
+        changed_columns=[col for col in df.columns if col in lineage.fingerprints],
+        shared_columns=len(shared),
+        rows=len(df),
+        own_bytes=own_bytes,
+    )
+    prune(store, _graph_nodes(parent.root), keep=(dataset_id,))
+    return node
+
+
+def resolve(dataset_id, target):
+    """
+    dataset_id 버전에서 target(undo / redo / 같은 그래프의 버전 ID)으로 이동할 버전 ID를 반환합니다.
+    (이동한 버전은 방문 시각을 갱신하여 redo 대상과 정리 순서에 반영합니다)
+    """
+    node = DatasetVersion.objects.filter(pk=dataset_id).first()
+    if node is None:
+        raise VersionError("버전 기록이 없는 데이터셋입니다. (전처리를 실행한 데이터셋만 되돌릴 수 있습니다)")
+    nodes = _graph_nodes(node.root)
+
+    if target == UNDO:
+        target_id = node.parent_id
+        if target_id is None:
+            raise VersionError("되돌릴 이전 버전이 없습니다.")
+    elif target == REDO:
+        target_id = _redo_target(nodes, dataset_id)
+        if target_id is None:
+            raise VersionError("다시 실행할 버전이 없습니다.")
+    elif target in nodes:
+        target_id = target
+    else:
+        raise VersionError("같은 데이터셋의 버전이 아닙니다.")
+
+    visit(target_id)
+    return target_id
+
+
+def visit(dataset_id):
+    """dataset_id 버전으로 다시 이동한 것으로 기록합니다. (다른 경로로 같은 버전에 도착한 경우, 예: 결과 캐시)"""
+    DatasetVersion.objects.filter(pk=dataset_id).update(visited_at=timezone.now())
+
+
+def graph(dataset_id):
+    """dataset_id가 속한 버전 그래프 (전체 버전 목록과 현재 버전의 undo/redo 대상). 기록이 없으면 None"""
+    node = DatasetVersion.objects.filter(pk=dataset_id).first()
+    if node is None:
+        return None
+    nodes = _graph_nodes(node.root)
+    return {
+        'rootId': node.root,
+        'currentId': dataset_id,
+        'undoId': node.parent_id,
+        'redoId': _redo_target(nodes, dataset_id),
+        'versions': [n.to_dict() for n in nodes.values()],
+    }
+
+
+def prune(store, nodes, keep=()):
+    """
+    정리 정책에 따라 잎 버전을 지웁니다. (nodes: 같은 그래프의 버전 ID -> DatasetVersion)
+    1. 저장소에서 이미 만료된 잎 버전 (부모 없는 뿌리 하나만 남은 경우 포함)
+    2. 버전 수가 MAX_VERSIONS를 넘으면, 가장 오래 쓰지 않은(방문/데이터 접근) 잎 버전부터 (뿌리 제외)
+    """
+    max_versions = settings.DATASET_VERSIONS['MAX_VERSIONS']
+
+    def last_used(node):
+        return max(node.visited_at.timestamp(), store.accessed_at(node.id) or 0.0)
+
+    nodes = dict(nodes)
+    removed = []
+    while nodes:
+        children = Counter(n.parent_id for n in nodes.values())
+        leaves = [n for n in nodes.values() if not children[n.id] and n.id not in keep]
+        victims = [n for n in leaves if not store.exists(n.id)]
+        if not victims and len(nodes) > max_versions:
+            candidates = [n for n in leaves if n.parent_id is not None]
+            victims = [min(candidates, key=last_used)] if candidates else []
+        if not victims:
+            break
+        for n in victims:
+            del nodes[n.id]
+            removed.append(n.id)
+
+    for dataset_id in removed:
+        store.delete(dataset_id)
+    DatasetVersion.objects.filter(pk__in=removed).delete()
+    return removed
+
+
+def _graph_nodes(root):
+    return {n.id: n for n in DatasetVersion.objects.filter(root=root)}
+
+
+def _redo_target(nodes, dataset_id):
+    children = [n for n in nodes.values() if n.parent_id == dataset_id]
+    return max(children, key=lambda n: n.visited_at).id if children else None
+
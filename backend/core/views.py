@@ -1,5 +1,6 @@
 # backend/core/views.py
 
+import logging
 import pandas as pd
 import io
 import numpy as np
@@ -7,116 +8,169 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, JSONParser
 
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
-from sklearn.preprocessing import LabelEncoder
-from sklearn.metrics import accuracy_score, classification_report, mean_squared_error, r2_score
-
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor, GradientBoostingClassifier, GradientBoostingRegressor
-from sklearn.linear_model import LinearRegression, LogisticRegression
-from sklearn.svm import SVC, SVR
+from django.conf import settings
+from django.http import HttpResponse
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+
+from . import (
+    charts, columnar, events, incremental, ingest, jobs, lazy, memory, metrics, parallel, preprocessing, profile_cache,
+    result_cache, rows, training, versions,
+)
+from .dataset_store import get_dataset_store, DatasetNotFound
+from .encoding import METHODS as ENCODING_METHODS, EncodingError
+from .models import TrainedModel, TrainingJob
+from .registry import ModelNotFound, get_model_registry
+from .profile_cache import ColumnLineage
+from .profiling import SplitFrame, build_analysis, profile_frame, reprofile_frame
+from .renderers import DATA_RENDERERS
+
+logger = logging.getLogger(__name__)
 
 # --- 헬퍼 함수 ---
-def _analyze_dataframe(df):
+def _analyze_dataframe(df, dataset_id=None, epsilon=None, lineage=None):
     """
     주어진 DataFrame을 분석하여 table, stats, quality JSON을 반환합니다.
     **성능 최적화**: 프론트엔드 렌더링 부하를 줄이기 위해 tableData는 상위 100개 행만 반환합니다.
+    💡 describe/isnull/df.copy()/to_numeric/quantile을 따로 돌리지 않고,
+       profiling 엔진이 컬럼당 한 번의 벡터 연산으로 모든 통계를 계산합니다.
+    💡 epsilon(근사 모드)이면 분위수 스케치를 쓰고, 스케치를 데이터셋과 함께 저장합니다.
+    💡 lineage(전처리 결과)가 있으면 이전 데이터셋에서 값이 바뀐 컬럼만 다시 프로파일링합니다.
+    💡 저장소에 Arrow 파일로 저장된 큰 데이터셋은 컬럼을 프로세스 풀에 나눠 병렬로 계산합니다.
     """
-# --- 1. 전체 테이블 데이터 (Preview용 100개만) ---
-    # 💡 전체 데이터를 다 보내면 브라우저가 멈춥니다. 상위 100개만 자릅니다.
-    df_preview = df.head(100).copy()
-    
-    # 💡 [Warning 해결] fillna 대신 where를 사용하여 안전하게 문자열('-')로 변환
-    df_preview = df_preview.astype(object).where(pd.notnull(df_preview), '-')
-    
-    table_json = df_preview.to_json(orient='split', force_ascii=False)
-
-    # --- 2. 기초 통계량 데이터 ---
-    stats_df = df.describe(include='all')
-    
-    # (2) 데이터 타입(Data Type) 행 생성
-    # 각 컬럼이 수치형인지 아닌지 판별
-    dtype_data = {}
-    for col in df.columns:
-        if pd.api.types.is_numeric_dtype(df[col]):
-            dtype_data[col] = 'Numeric (수치형)'
+    profiler = parallel.profiler_for(get_dataset_store().locate(dataset_id)) if dataset_id else None
+    recomputed = None
+    with metrics.stage('profile'):
+        if lineage is not None:
+            profiles, quantiles, recomputed = reprofile_frame(
+                df, lineage.reusable(epsilon), epsilon=epsilon, removed=lineage.removed, profiler=profiler)
         else:
-            dtype_data[col] = 'Categorical (범주형)'
-            
-    # DataFrame으로 변환 (인덱스 이름은 'Data Type')
-    dtype_df = pd.DataFrame([dtype_data], index=['Data Type'])
-    stats_df = pd.concat([dtype_df, stats_df])
-    
-    stats_df = stats_df.reset_index()
-    stats_df.rename(columns={'index': '구분'}, inplace=True)
-    
-    # 💡 [Warning 해결] stats_df 처리
-    stats_df = stats_df.astype(object).where(pd.notnull(stats_df), '-')
-    stats_json = stats_df.to_json(orient='split', force_ascii=False)
-    # --------------------------------------
+            profiles, quantiles = profile_frame(df, epsilon=epsilon, profiler=profiler)
+        response_data = build_analysis(df.head(100), profiles, quantiles, len(df))
+    if dataset_id:
+        profile_cache.save(get_dataset_store(), dataset_id, lineage or ColumnLineage(dataset_id),
+                           profiles, quantiles, epsilon)
+    if epsilon and dataset_id:
+        _store_sketches(dataset_id, profiles)
+    response_data.update(_quantile_mode(epsilon))
+    if recomputed is not None:
+        response_data['reprofiledColumns'] = recomputed
+    return response_data
+
+
+def _quantile_epsilon(request):
+    """
+    근사 분위수 모드(approximate=true) 요청이면 허용 오차(epsilon)를, 아니면 None을 반환합니다.
+    epsilon이 0보다 크고 1보다 작은 숫자가 아니면 ValueError (400 응답)
+    """
+    if str(request.data.get('approximate', '')).lower() not in ('true', '1'):
+        return None
+    epsilon = request.data.get('epsilon')
+    if epsilon is None or epsilon == '':
+        return settings.QUANTILE_SKETCH['EPSILON']
+    try:
+        epsilon = float(epsilon)
+    except (TypeError, ValueError):
+        epsilon = 0.0
+    if not 0 < epsilon < 1:
+        raise ValueError("분위수 허용 오차(epsilon)는 0보다 크고 1보다 작은 숫자여야 합니다.")
+    return epsilon
+
+
+def _quantile_mode(epsilon):
+    """응답에 분위수 계산 방식(정확/근사)을 표시합니다."""
+    if epsilon:
+        return {'quantileMode': 'approximate', 'quantileEpsilon': epsilon}
+    return {'quantileMode': 'exact'}
+
+
+def _store_sketches(dataset_id, profiles):
+    """컬럼별 분위수 스케치를 데이터셋과 함께 저장합니다. (이후 이상치 처리에서 재사용)"""
+    sketches = {p.name: p.sketch.to_state() for p in profiles if p.sketch is not None and p.sketch.n}
+    get_dataset_store().put_artifact(dataset_id, 'sketches', sketches)
+
+
+def _load_dataframe(request):
+    """
+    요청 본문에서 DataFrame을 복원합니다.
+    💡 dataset_id(서버 저장소)를 우선 사용하고, 구버전 클라이언트를 위해 'dataframe' JSON도 허용합니다.
+    """
+    dataset_id = request.data.get('dataset_id')
+    if dataset_id:
+        return get_dataset_store().get(dataset_id)
+
+    df_json = request.data.get('dataframe')
+    if df_json:
+        with metrics.stage('parse'):
+            df = pd.read_json(io.StringIO(df_json), orient='split')
+        if memory.enabled(request.data.get('optimize')):
+            df, _ = memory.optimize_frame(df)
+        return df
 
-    # 3. 데이터 품질 데이터
-    total_rows = len(df)
-    missing_counts = df.isnull().sum()
+    return None
 
-    if total_rows > 0:
-        missing_percent = (missing_counts / total_rows * 100).round(2)
+
+def _dataset_response(df, legacy=False, epsilon=None, lineage=None):
+    """
+    DataFrame을 저장소에 보관하고, 분석 결과에 datasetId를 붙여 반환합니다.
+    💡 전처리 결과(lineage)면 입력 데이터셋을 부모로 기록하고(접근할 때 함께 touch),
+       값이 바뀌지 않은 컬럼은 입력 데이터셋의 파일을 공유합니다. (core/versions.py)
+    """
+    if lineage is not None and lineage.parent_id and versions.enabled():
+        shared = lineage.unchanged(df.columns) if versions.share_columns() else ()
+        dataset_id = get_dataset_store().put(df, parent=lineage.parent_id, shared=shared)
     else:
-        missing_percent = pd.Series(0.0, index=df.columns)
-    
-    outlier_counts = pd.Series('-', index=df.columns)
-    outlier_percent = pd.Series('-', index=df.columns)
-    
-    # 수치형 변환 시도 (이상치 계산을 위해)
-    # object 타입이라도 숫자로 변환 가능하다면 변환해서 계산
-    # 💡 수정: errors='ignore' 대신 coerce로 강제 변환 후 수치형만 선택
-    df_numeric = df.copy()
-    for col in df_numeric.columns:
+        dataset_id = get_dataset_store().put(df)
+    response_data = _analyze_dataframe(df, dataset_id=dataset_id, epsilon=epsilon, lineage=lineage)
+    response_data['datasetId'] = dataset_id
+    # 구버전 클라이언트('dataframe' 전송)에게만 전체 데이터를 돌려줍니다.
+    if legacy:
+        response_data['fullData'] = SplitFrame(df)
+    return response_data
+
+
+@metrics.stage('parse')
+def _parse_upload(file_obj):
+    """업로드된 CSV/Excel 파일을 DataFrame으로 읽습니다."""
+    # 💡 BytesIO로 한 번 더 복사하지 않고, 업로드 파일의 원본 파일 객체를 바로 읽습니다.
+    file_buffer = file_obj.file
+    file_buffer.seek(0)
+
+    if file_obj.name.endswith(('.xls', '.xlsx')):
+        df = pd.read_excel(file_buffer)
+    else:
+        # 💡 전체를 두 번 파싱하지 않도록 앞부분 샘플로 인코딩(utf-8/cp949)을 먼저 판별합니다.
+        encoding = ingest.detect_encoding(file_buffer)
         try:
-            df_numeric[col] = pd.to_numeric(df_numeric[col], errors='coerce')
-        except:
-            pass
-            
-    numeric_cols = df_numeric.select_dtypes(include=[np.number]).columns
-    
-    for col in numeric_cols:
-        Q1 = df_numeric[col].quantile(0.25)
-        Q3 = df_numeric[col].quantile(0.75)
-        IQR = Q3 - Q1
-        lower_bound = Q1 - (1.5 * IQR)
-        upper_bound = Q3 + (1.5 * IQR)
-        
-        count = ((df_numeric[col] < lower_bound) | (df_numeric[col] > upper_bound)).sum()
-        outlier_counts[col] = count
+            df = pd.read_csv(file_buffer, encoding=encoding)
+        except UnicodeDecodeError:
+            if encoding == 'cp949':
+                raise
+            file_buffer.seek(0)
+            df = pd.read_csv(file_buffer, encoding='cp949')
 
-        if total_rows > 0:
-            outlier_percent[col] = (count / total_rows * 100).round(2)
-        else:
-            outlier_percent[col] = 0.0
-        
-    quality_df = pd.DataFrame({
-        '결측치 개수': missing_counts,
-        '결측치 비율(%)': missing_percent,
-        '이상치 개수': outlier_counts,
-        '이상치 비율(%)': outlier_percent
-    })
-    
-    quality_df = quality_df.transpose().reset_index()
-    quality_df.rename(columns={'index': '구분'}, inplace=True)
+    # 💡 [수정 1] 데이터셋 특화 전처리: '?'를 NaN(결측치)으로 변환
+    df.replace('?', np.nan, inplace=True)
+    return df
+
+
+def _use_streaming(request, file_obj):
+    """CSV 업로드를 스트리밍 모드로 처리할지 결정합니다. (mode=stream 요청 또는 크기 기준)"""
+    if columnar.pa is None or not file_obj.name.endswith('.csv'):
+        return False
+    if request.data.get('mode') == 'stream':
+        return True
+    return file_obj.size >= settings.STREAM_UPLOAD['THRESHOLD_MB'] * 1024 * 1024
 
-    quality_df.replace(np.nan, '-', inplace=True)
-    
-    # 💡 수정: 경고 방지
-    quality_json = quality_df.astype(object).fillna('-').to_json(orient='split', force_ascii=False)
 
-    return {
-        'tableData': table_json,
-        'statsData': stats_json,
-        'qualityData': quality_json
-    }
+_DATASET_NOT_FOUND_MSG = "데이터셋이 만료되었거나 존재하지 않습니다. 파일을 다시 업로드해주세요."
+
 
 class FileUploadView(APIView):
     parser_classes = (MultiPartParser,)
+    # 💡 표(tableData 등)는 Accept 헤더에 맞는 형식(JSON/MessagePack/Arrow)으로 한 번만 직렬화합니다. (core/renderers.py)
+    renderer_classes = DATA_RENDERERS
 
     def post(self, request, *args, **kwargs):
         file_obj = request.FILES.get('file')
@@ -124,363 +178,689 @@ class FileUploadView(APIView):
         if not file_obj:
             return Response({"error": "파일이 없습니다."}, status=400)
 
-        try:
-            file_buffer = io.BytesIO(file_obj.read())
-
-            if file_obj.name.endswith(('.xls', '.xlsx')):
-                df = pd.read_excel(file_buffer)
-            elif file_obj.name.endswith('.csv'):
-                try:
-                    df = pd.read_csv(file_buffer)
-                except UnicodeDecodeError:
-                    file_buffer.seek(0)
-                    df = pd.read_csv(file_buffer, encoding='cp949')
-            else:
-                return Response({"error": "지원하지 않는 파일 형식입니다."}, status=400)
-            
-            # 💡 [수정 1] 데이터셋 특화 전처리: '?'를 NaN(결측치)으로 변환
-            df.replace('?', np.nan, inplace=True)
+        if not file_obj.name.endswith(('.xls', '.xlsx', '.csv')):
+            return Response({"error": "지원하지 않는 파일 형식입니다."}, status=400)
 
-            response_data = _analyze_dataframe(df)
-            response_data['fullData'] = df.to_json(orient='split', force_ascii=False)
+        try:
+            store = get_dataset_store()
+            streaming = _use_streaming(request, file_obj)
+            # 💡 메모리 최적화(dtype 축소)는 메모리에 읽는 업로드에만 적용합니다.
+            optimize = not streaming and memory.enabled(request.data.get('optimize'))
+            # 💡 파일 내용 해시를 dataset_id로 사용: 같은 파일을 다시 올리면
+            #    파싱/타입 추론 없이 컬럼형 캐시(mmap)에서 바로 복원합니다.
+            #    (최적화 여부에 따라 저장되는 dtype이 다르므로 다른 dataset_id)
+            try:
+                epsilon = _quantile_epsilon(request)
+            except ValueError as e:
+                return Response({"error": str(e)}, status=400)
+            dataset_id = columnar.content_hash(file_obj, file_obj.name, b'optimized' if optimize else b'')
+
+            # 💡 대용량 CSV는 스트리밍 모드: 청크 단위로 읽어 컬럼형 파일에 쓰면서 통계를 누적합니다.
+            if streaming:
+                chunk_rows = settings.STREAM_UPLOAD['CHUNK_ROWS']
+                path = store.locate(dataset_id)
+                # 💡 스트리밍 업로드는 청크마다 읽기와 프로파일링을 번갈아 하므로 한 단계(ingest)로 잽니다.
+                with metrics.stage('ingest'):
+                    if path is not None and path.suffix == columnar.ARROW_SUFFIX:
+                        response_data, profiles = ingest.analyze_arrow_file(path, chunk_rows, epsilon)
+                    else:
+                        response_data, profiles = ingest.stream_csv(
+                            file_obj.file, store.arrow_path(dataset_id), chunk_rows, epsilon)
+                if epsilon:
+                    _store_sketches(dataset_id, profiles)
+                response_data.update(_quantile_mode(epsilon))
+                response_data['datasetId'] = dataset_id
+                response_data['ingestMode'] = 'stream'
+                return Response(response_data)
+
+            memory_report = None
+            try:
+                df = store.get(dataset_id)
+                if optimize:
+                    memory_report = store.get_artifact(dataset_id, 'memory')
+            except DatasetNotFound:
+                df = _parse_upload(file_obj)
+                if optimize:
+                    df, memory_report = memory.optimize_frame(df)
+                store.put(df, dataset_id=dataset_id)
+                if optimize:
+                    store.put_artifact(dataset_id, 'memory', memory_report)
+
+            response_data = _analyze_dataframe(df, dataset_id=dataset_id, epsilon=epsilon)
+            # 💡 전체 데이터(fullData) 대신 서버 저장소의 dataset_id만 돌려줍니다.
+            response_data['datasetId'] = dataset_id
+            if memory_report is not None:
+                # 최적화 전/후 메모리 사용량 (바이트)과 dtype이 바뀐 컬럼
+                response_data['memory'] = memory_report
             
             return Response(response_data)
 
         except Exception as e:
             return Response({"error": f"파일 처리 중 서버 오류 발생: {str(e)}"}, status=500)
 
+def _run_preprocessing(request, steps, action):
+    """
+    요청의 데이터셋에 전처리 단계 목록을 실행하고, 결과 데이터셋의 분석 응답을 만듭니다.
+    (ProcessDataView / PipelineView 공통)
+    💡 결과는 입력 데이터셋의 자식 버전으로 기록합니다. (action: 버전 그래프에 표시할 작업, core/versions.py)
+    """
+    dataset_id = request.data.get('dataset_id')
+    try:
+        epsilon = _quantile_epsilon(request)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+
+    store = get_dataset_store()
+    # 💡 이전 데이터셋의 컬럼 프로파일을 재사용하기 위해 바뀐 컬럼/삭제된 행을 기록합니다.
+    lineage = ColumnLineage.load(store, dataset_id) if dataset_id else None
+
+    # 💡 같은 데이터에 같은 단계를 실행한 결과가 있으면 다시 계산하지 않습니다. (core/result_cache.py)
+    cache_key = None
+    if dataset_id and result_cache.enabled():
+        cache_key = result_cache.process_key(result_cache.dataset_key(store, dataset_id, lineage), steps, epsilon)
+        if result_cache.enabled(request):
+            cached = result_cache.lookup(result_cache.PROCESS, cache_key,
+                                         lambda data: data if store.locate(data['datasetId']) is not None else None)
+            if cached is not None:
+                return Response(_cached_dataset_response(store, cached))
+
+    try:
+        df = _run_lazy(store, dataset_id, steps, lineage, epsilon)
+        engine = 'polars'
+        if df is None:
+            # DataFrame 복원 (서버 저장소 또는 구버전 JSON)
+            try:
+                df = _load_dataframe(request)
+            except DatasetNotFound:
+                return Response({"error": _DATASET_NOT_FOUND_MSG}, status=404)
+            sketches = store.get_artifact(dataset_id, 'sketches', {}) if epsilon and dataset_id else None
+            df = preprocessing.run(df, steps, lineage=lineage, sketches=sketches, epsilon=epsilon)
+            engine = 'pandas'
+    except preprocessing.PipelineError as e:
+        return Response({"error": str(e)}, status=400)
+
+    response_data = _dataset_response(df, legacy=not dataset_id, epsilon=epsilon, lineage=lineage)
+    response_data['engine'] = engine
+    if cache_key is not None:
+        result_cache.save(result_cache.PROCESS, cache_key, response_data)
+    if dataset_id and versions.enabled():
+        versions.record(store, dataset_id, response_data['datasetId'], action, lineage, df)
+        response_data['versions'] = versions.graph(response_data['datasetId'])
+    return Response(response_data)
+
+
+def _cached_dataset_response(store, response_data):
+    """캐시된 전처리 응답 (결과 데이터셋은 그대로이고, 버전 그래프만 현재 상태로 다시 만듭니다)"""
+    dataset_id = response_data['datasetId']
+    response_data = dict(response_data, cached=True)
+    if versions.enabled():
+        versions.visit(dataset_id)
+        response_data['versions'] = versions.graph(dataset_id)
+    return response_data
+
+
+def _run_lazy(store, dataset_id, steps, lineage, epsilon):
+    """
+    Polars 지연 실행 엔진(core/lazy.py)으로 전처리를 실행합니다. 쓸 수 없으면 None (pandas 엔진 사용)
+    - settings.PIPELINE['ENGINE']이 'pandas'인 경우, 구버전 JSON 요청, 근사 모드(스케치 재사용은 pandas 엔진만 지원)
+    """
+    if settings.PIPELINE['ENGINE'] != 'auto' or not dataset_id or epsilon is not None or not lazy.available():
+        return None
+    try:
+        return lazy.run(store.locate(dataset_id), steps, lineage=lineage)
+    except lazy.Unsupported:
+        return None
+
+
 class ProcessDataView(APIView):
     parser_classes = (JSONParser,)
+    renderer_classes = DATA_RENDERERS
     
     def post(self, request, *args, **kwargs):
-        df_json = request.data.get('dataframe')
         action = request.data.get('action')
 
-        if not df_json:
+        if not request.data.get('dataset_id') and not request.data.get('dataframe'):
             return Response({"error": "DataFrame이 요청에 포함되지 않았습니다."}, status=400)
         
         try:
-            # DataFrame 복원
-            df = pd.read_json(io.StringIO(df_json), orient='split')
-            original_rows = len(df)
-            
-            # 1. 빈 문자열 -> NaN 치환
-            df.replace("", np.nan, inplace=True)
-            # 💡 [수정 2] '?' -> NaN 치환 추가
-            df.replace("?", np.nan, inplace=True)
+            # 💡 작업 이름(drop_na, fill_na_mean, ...)을 한 단계짜리 파이프라인으로 실행합니다.
+            #    (1. 빈 문자열 / '?' -> NaN 치환, 2. 수치형 변환은 preprocessing.run이 처리)
+            try:
+                steps = preprocessing.parse_action(action)
+            except preprocessing.PipelineError as e:
+                return Response({"error": str(e)}, status=400)
+            return _run_preprocessing(request, steps, action)
 
-            # 2. 수치형 변환 시도
-            for col in df.columns:
-                try:
-                    df[col] = pd.to_numeric(df[col])
-                except (ValueError, TypeError):
-                    pass
+        except Exception as e:
+            logger.exception("요청 처리 중 오류: %s", request.path)
+            return Response({"error": f"데이터 처리 중 서버 오류 발생: {str(e)}"}, status=500)
 
-            if action == 'drop_na':
-                df = df.dropna()
-                print(f"결측치 행 제거: {original_rows} -> {len(df)}")
-            
-            elif action == 'fill_na_mean':
-                numeric_cols = df.select_dtypes(include=[np.number]).columns
-                if len(numeric_cols) > 0:
-                    df[numeric_cols] = df[numeric_cols].fillna(df[numeric_cols].mean())
-                    print(f"수치형 컬럼 평균값 대체 완료: {list(numeric_cols)}")
-                # 💡 주의: 문자열 컬럼은 여기서 처리되지 않음
-
-            elif action == 'fill_na_median':
-                numeric_cols = df.select_dtypes(include=[np.number]).columns
-                if len(numeric_cols) > 0:
-                    df[numeric_cols] = df[numeric_cols].fillna(df[numeric_cols].median())
-                    print(f"수치형 컬럼 중앙값 대체 완료: {list(numeric_cols)}")
-
-            # --- 💡 [신규 추가] 최빈값(Mode)으로 채우기 ---
-            elif action == 'fill_na_mode':
-                # 모든 컬럼을 순회하며 결측치가 있으면 최빈값으로 채움
-                filled_cols = []
-                for col in df.columns:
-                    if df[col].isnull().sum() > 0:
-                        # 최빈값이 여러 개일 수 있으므로 첫 번째([0])를 선택
-                        mode_value = df[col].mode()[0]
-                        df[col] = df[col].fillna(mode_value)
-                        filled_cols.append(col)
-                print(f"최빈값 대체 완료 (대상 컬럼): {filled_cols}")
-
-            elif action == 'fill_na_zero':
-                df.fillna(0, inplace=True)
-                print("모든 컬럼 0으로 대체 완료")
-
-            # --- 💡 [신규 추가] 이상치 처리 로직 ---
-            elif action == 'drop_outliers':
-                # IQR 방식으로 이상치 식별 후 제거
-                numeric_cols = df.select_dtypes(include=[np.number]).columns
-                Q1 = df[numeric_cols].quantile(0.25)
-                Q3 = df[numeric_cols].quantile(0.75)
-                IQR = Q3 - Q1
-                
-                # 조건: (값 < Lower) 또는 (값 > Upper) 인 데이터가 하나라도 있는 행 제거
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                
-                # any(axis=1)은 "각 행에 대해 하나라도 True가 있으면 True"
-                outlier_condition = ((df[numeric_cols] < lower_bound) | (df[numeric_cols] > upper_bound)).any(axis=1)
-                
-                original_rows = len(df)
-                df = df[~outlier_condition] # Outlier가 아닌 것만 남김
-                print(f"이상치 포함 행 제거: {original_rows} -> {len(df)}")
-
-            elif action == 'cap_outliers':
-                # 윈저라이징 (Capping): 이상치를 상한값/하한값으로 대체
-                numeric_cols = df.select_dtypes(include=[np.number]).columns
-                Q1 = df[numeric_cols].quantile(0.25)
-                Q3 = df[numeric_cols].quantile(0.75)
-                IQR = Q3 - Q1
-                
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                
-                for col in numeric_cols:
-                    # 하한값보다 작은 값은 하한값으로 치환
-                    df[col] = np.where(df[col] < lower_bound[col], lower_bound[col], df[col])
-                    # 상한값보다 큰 값은 상한값으로 치환
-                    df[col] = np.where(df[col] > upper_bound[col], upper_bound[col], df[col])
-                print("이상치 윈저라이징(Capping) 완료")
-            
-            else:
-                return Response({"error": "알 수 없는 작업 요청입니다."}, status=400)
 
-            response_data = _analyze_dataframe(df)
-            response_data['fullData'] = df.to_json(orient='split', force_ascii=False)
-            
-            return Response(response_data)
+class PipelineView(APIView):
+    """
+    여러 전처리 단계를 한 번의 요청으로 실행합니다.
+    요청: {"dataset_id": ..., "steps": [{"action": "fill_na", "strategy": {"age": "median", "city": "mode"}},
+                                        {"action": "drop_outliers", "columns": ["income"], "iqr_multiplier": 3}, ...]}
+    💡 이어지는 채우기/행 삭제 단계는 묶어서 한 번에 실행하고, 프로파일링은 마지막에 한 번만 합니다.
+    """
+    parser_classes = (JSONParser,)
+    renderer_classes = DATA_RENDERERS
+
+    def post(self, request, *args, **kwargs):
+        if not request.data.get('dataset_id') and not request.data.get('dataframe'):
+            return Response({"error": "DataFrame이 요청에 포함되지 않았습니다."}, status=400)
+
+        try:
+            try:
+                steps = preprocessing.parse_steps(request.data.get('steps'))
+            except preprocessing.PipelineError as e:
+                return Response({"error": str(e)}, status=400)
+
+            response = _run_preprocessing(request, steps, request.data.get('steps'))
+            if response.status_code == 200:
+                response.data['pipeline'] = [
+                    [step.action for step in stage_steps] for _, stage_steps in preprocessing.plan(steps)
+                ]
+            return response
 
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            logger.exception("요청 처리 중 오류: %s", request.path)
             return Response({"error": f"데이터 처리 중 서버 오류 발생: {str(e)}"}, status=500)
 
+class VersionGraphView(APIView):
+    """
+    데이터셋이 속한 버전 그래프를 반환합니다. (core/versions.py)
+    요청: GET ?dataset_id=...
+    응답: {rootId, currentId, undoId, redoId, versions: [{versionId, parentId, action, changedColumns, sharedColumns, ownBytes, ...}]}
+    """
+
+    def get(self, request, *args, **kwargs):
+        dataset_id = request.query_params.get('dataset_id')
+        if not dataset_id:
+            return Response({"error": "데이터셋이 지정되지 않았습니다."}, status=400)
+        try:
+            graph = versions.graph(dataset_id)
+            if graph is None:
+                return Response({"error": "버전 기록이 없는 데이터셋입니다."}, status=404)
+            return Response(graph)
+
+        except Exception as e:
+            logger.exception("요청 처리 중 오류: %s", request.path)
+            return Response({"error": f"버전 조회 중 오류 발생: {str(e)}"}, status=500)
+
+
+class VersionCheckoutView(APIView):
+    """
+    다른 버전으로 이동하고(되돌리기 / 다시 실행 / 특정 버전), 그 버전의 분석 결과를 반환합니다.
+    요청: {"dataset_id": 현재 버전, "to": "undo" | "redo" | 버전 ID}
+    💡 이동한 버전의 데이터와 프로파일은 저장된 것을 그대로 쓰므로 전처리를 다시 실행하지 않습니다.
+    """
+    parser_classes = (JSONParser,)
+    renderer_classes = DATA_RENDERERS
+
+    def post(self, request, *args, **kwargs):
+        dataset_id = request.data.get('dataset_id')
+        target = request.data.get('to')
+        if not dataset_id or not target:
+            return Response({"error": "현재 데이터셋(dataset_id)과 이동할 버전(to)을 지정해야 합니다."}, status=400)
+
+        try:
+            epsilon = _quantile_epsilon(request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
+
+        try:
+            store = get_dataset_store()
+            try:
+                target_id = versions.resolve(dataset_id, target)
+                df = store.get(target_id)
+            except versions.VersionError as e:
+                return Response({"error": str(e)}, status=400)
+            except DatasetNotFound:
+                return Response({"error": _DATASET_NOT_FOUND_MSG}, status=404)
+
+            response_data = _analyze_dataframe(df, dataset_id=target_id, epsilon=epsilon,
+                                               lineage=ColumnLineage.load(store, target_id))
+            response_data['datasetId'] = target_id
+            response_data['versions'] = versions.graph(target_id)
+            return Response(response_data)
+
+        except Exception as e:
+            logger.exception("요청 처리 중 오류: %s", request.path)
+            return Response({"error": f"버전 이동 중 오류 발생: {str(e)}"}, status=500)
+
+
+class RowWindowView(APIView):
+    """
+    데이터셋의 행 구간(페이지)을 반환합니다. (core/rows.py)
+    요청: {"dataset_id": ..., "offset": 0, "limit": 100, "sort": "age", "order": "desc",
+           "filters": [{"column": "city", "op": "==", "value": "Seoul"}, {"column": "age", "op": ">=", "value": 30}]}
+    💡 정렬 순서는 컬럼별로 한 번만 계산해 두므로 다음 페이지부터는 구간만 잘라 읽습니다.
+    """
+    parser_classes = (JSONParser,)
+    renderer_classes = DATA_RENDERERS
+
+    def post(self, request, *args, **kwargs):
+        dataset_id = request.data.get('dataset_id')
+        if not dataset_id:
+            return Response({"error": "데이터셋이 지정되지 않았습니다."}, status=400)
+
+        config = settings.ROWS
+        try:
+            offset = int(request.data.get('offset', 0))
+            limit = int(request.data.get('limit', config['DEFAULT_LIMIT']))
+        except (TypeError, ValueError):
+            offset, limit = -1, -1
+        if offset < 0 or not 1 <= limit <= config['MAX_LIMIT']:
+            return Response({"error": f"offset은 0 이상, limit은 1~{config['MAX_LIMIT']} 사이의 정수여야 합니다."},
+                            status=400)
+        order = request.data.get('order', 'asc')
+        if order not in ('asc', 'desc'):
+            return Response({"error": "정렬 방향(order)은 asc 또는 desc여야 합니다."}, status=400)
+        filters = request.data.get('filters') or []
+        if not isinstance(filters, list):
+            return Response({"error": "필터(filters)는 목록이어야 합니다."}, status=400)
+
+        try:
+            store = get_dataset_store()
+            try:
+                response_data = rows.window(store, dataset_id, offset, limit, sort=request.data.get('sort') or None,
+                                            descending=order == 'desc', filters=filters)
+            except rows.RowQueryError as e:
+                return Response({"error": str(e)}, status=400)
+            except DatasetNotFound:
+                return Response({"error": _DATASET_NOT_FOUND_MSG}, status=404)
+            response_data['datasetId'] = dataset_id
+            return Response(response_data)
+
+        except Exception as e:
+            logger.exception("요청 처리 중 오류: %s", request.path)
+            return Response({"error": f"행 조회 중 오류 발생: {str(e)}"}, status=500)
+
+
+# 차트 옵션: 요청 파라미터 -> (charts 옵션 이름, settings.CHARTS 키, 최솟값, 최댓값)
+_CHART_LIMITS = {
+    'bins': ('bins', 'BINS', 1, 200),
+    'top': ('top', 'TOP', 1, 100),
+    'points': ('max_points', 'MAX_POINTS', 10, 20_000),
+}
+
+
+class ChartDataView(APIView):
+    """
+    차트 데이터를 전체 데이터셋으로 계산하여 반환합니다. (core/charts.py)
+    요청: GET ?dataset_id=...&kind=histogram|counts|scatter|line|correlation&column=...&y=...
+          (선택) bins, top, points, sampling=lttb|stratified, columns=a,b,c (correlation)
+    💡 같은 컬럼(값이 바뀌지 않은 컬럼)의 차트는 캐시된 결과를 돌려줍니다. (응답의 cached)
+    """
+
+    def get(self, request, *args, **kwargs):
+        params = request.query_params
+        dataset_id = params.get('dataset_id')
+        kind = params.get('kind', 'histogram')
+        if not dataset_id:
+            return Response({"error": "데이터셋이 지정되지 않았습니다."}, status=400)
+        if kind not in charts.KINDS:
+            return Response({"error": f"지원하지 않는 차트 종류입니다: {kind}"}, status=400)
+
+        if kind == 'correlation':
+            columns = [col for col in params.get('columns', '').split(',') if col]
+        elif kind == 'scatter':
+            columns = [params.get('column'), params.get('y')]
+        else:
+            columns = [params.get('column')]
+        if not all(columns):
+            return Response({"error": "차트에 사용할 컬럼이 지정되지 않았습니다."}, status=400)
+
+        config = settings.CHARTS
+        options = {'sampling': params.get('sampling') or config['SAMPLING']}
+        if options['sampling'] not in charts.SAMPLINGS:
+            return Response({"error": f"지원하지 않는 축소 방식입니다: {options['sampling']}"}, status=400)
+        for name, (option, setting, low, high) in _CHART_LIMITS.items():
+            value = params.get(name)
+            try:
+                options[option] = config[setting] if value in (None, '') else int(value)
+            except ValueError:
+                options[option] = None
+            if options[option] is None or not low <= options[option] <= high:
+                return Response({"error": f"{name} 값은 {low}~{high} 사이의 정수여야 합니다."}, status=400)
+
+        try:
+            store = get_dataset_store()
+            if store.locate(dataset_id) is None:
+                return Response({"error": _DATASET_NOT_FOUND_MSG}, status=404)
+            try:
+                result, cached = charts.chart(store, dataset_id, kind, columns, options)
+            except charts.ChartError as e:
+                return Response({"error": str(e)}, status=400)
+            except DatasetNotFound:
+                return Response({"error": _DATASET_NOT_FOUND_MSG}, status=404)
+            return Response(dict(result, kind=kind, cached=cached))
+
+        except Exception as e:
+            logger.exception("요청 처리 중 오류: %s", request.path)
+            return Response({"error": f"차트 데이터 계산 중 오류 발생: {str(e)}"}, status=500)
+
+
+# 비교 모드에서 받을 수 있는 모델 ('linear'는 분류 문제이면 로지스틱 회귀)
+_COMPARE_MODELS = ('rf', 'gb', 'linear', 'logistic', 'svm')
+
+
 class TrainModelView(APIView):
+    """
+    모델 학습 작업을 큐에 넣고 작업 ID를 바로 반환합니다. (202)
+    💡 학습은 작업 큐(core/jobs.py)의 워커 스레드에서 실행되며, 진행 상황과 결과는 TrainJobView로 조회합니다.
+    """
     parser_classes = (JSONParser,)
 
     def post(self, request, *args, **kwargs):
-        df_json = request.data.get('dataframe')
         target_col = request.data.get('target')
         model_name = request.data.get('model_name', 'rf') # 💡 기본값 'rf' (Random Forest)
+        # 💡 models 목록을 보내면 비교 모드: 모델들을 한 번에 학습하여 리더보드로 반환 (core/compare.py)
+        model_names = request.data.get('models')
 
-        if not df_json or not target_col:
+        dataset_id = request.data.get('dataset_id')
+        has_data = dataset_id or request.data.get('dataframe')
+        if not has_data or not target_col:
             return Response({"error": "데이터 또는 목표 컬럼이 지정되지 않았습니다."}, status=400)
 
+        params = {'dataset_id': dataset_id, 'target': target_col, 'model_name': model_name}
+        if model_names is not None:
+            if not isinstance(model_names, list) or not model_names:
+                return Response({"error": "비교할 모델 목록(models)이 비어 있거나 올바르지 않습니다."}, status=400)
+            unknown = [m for m in model_names if m not in _COMPARE_MODELS]
+            if unknown:
+                return Response({"error": f"지원하지 않는 모델입니다: {', '.join(map(str, unknown))}"}, status=400)
+            params = {'dataset_id': dataset_id, 'target': target_col, 'models': list(dict.fromkeys(model_names))}
+
+        # 💡 특성 인코딩 설정 (encoding: ordinal / onehot / target, rare_min_count: 희귀 범주 기준 횟수)
+        encoding = {}
+        if request.data.get('encoding'):
+            if request.data['encoding'] not in ENCODING_METHODS:
+                return Response({"error": f"지원하지 않는 인코딩 방식입니다: {request.data['encoding']}"}, status=400)
+            encoding['method'] = request.data['encoding']
+        if request.data.get('rare_min_count') is not None:
+            try:
+                encoding['rare_min_count'] = int(request.data['rare_min_count'])
+            except (TypeError, ValueError):
+                return Response({"error": "희귀 범주 기준(rare_min_count)은 0 이상의 정수여야 합니다."}, status=400)
+            if encoding['rare_min_count'] < 0:
+                return Response({"error": "희귀 범주 기준(rare_min_count)은 0 이상의 정수여야 합니다."}, status=400)
+        if encoding:
+            params['encoding'] = encoding
+
+        # 💡 큰 데이터 학습 설정 (backend: auto / exact / scalable, sample_rows: 학습 행 수 상한, time_budget: 학습 시간 예산(초))
+        scaling = {}
+        if request.data.get('backend'):
+            if request.data['backend'] not in training.BACKENDS:
+                return Response({"error": f"지원하지 않는 모델 방식입니다: {request.data['backend']}"}, status=400)
+            scaling['backend'] = request.data['backend']
+        if request.data.get('sample_rows') is not None:
+            try:
+                scaling['sample_rows'] = int(request.data['sample_rows'])
+            except (TypeError, ValueError):
+                scaling['sample_rows'] = 0
+            if scaling['sample_rows'] < 100:
+                return Response({"error": "학습 행 수 상한(sample_rows)은 100 이상의 정수여야 합니다."}, status=400)
+        if request.data.get('time_budget') is not None:
+            if model_names is not None:
+                return Response({"error": "모델 비교(models)에는 시간 예산(time_budget)을 쓸 수 없습니다."}, status=400)
+            try:
+                scaling['time_budget'] = float(request.data['time_budget'])
+            except (TypeError, ValueError):
+                scaling['time_budget'] = 0.0
+            if not scaling['time_budget'] > 0:
+                return Response({"error": "시간 예산(time_budget)은 0보다 큰 초 단위 숫자여야 합니다."}, status=400)
+        if scaling:
+            params['scaling'] = scaling
+
+        # 💡 tune=true이면 교차 검증으로 하이퍼파라미터를 탐색한 뒤 학습합니다 (core/tuning.py)
+        if str(request.data.get('tune', '')).lower() in ('true', '1'):
+            if model_names is not None:
+                return Response({"error": "모델 비교(models)와 튜닝(tune)은 함께 요청할 수 없습니다."}, status=400)
+            folds = request.data.get('cv')
+            if folds is not None:
+                try:
+                    folds = int(folds)
+                except (TypeError, ValueError):
+                    folds = 0
+                if not 2 <= folds <= 10:
+                    return Response({"error": "교차 검증 fold 수(cv)는 2~10 사이의 정수여야 합니다."}, status=400)
+            params.update(tune=True, cv=folds)
+
+        # 💡 incremental=true이면 데이터셋을 메모리에 올리지 않고 조각씩 읽어 학습합니다 (core/incremental.py)
+        is_incremental = str(request.data.get('incremental', '')).lower() in ('true', '1')
+        if is_incremental:
+            if model_names is not None or params.get('tune'):
+                return Response({"error": "조각 단위 학습(incremental)은 모델 비교/튜닝과 함께 요청할 수 없습니다."}, status=400)
+            if not dataset_id:
+                return Response({"error": "조각 단위 학습은 저장된 데이터셋(dataset_id)으로만 할 수 있습니다."}, status=400)
+            if model_name not in incremental.MODELS:
+                return Response({"error": f"조각 단위 학습을 지원하지 않는 모델입니다: {model_name} "
+                                          f"({', '.join(incremental.MODELS)})"}, status=400)
+            if encoding.get('method') == 'target':
+                return Response({"error": "조각 단위 학습에서는 target 인코딩을 쓸 수 없습니다."}, status=400)
+            params['incremental'] = True
+
         try:
-            # 1. 데이터 복원
-            df = pd.read_json(io.StringIO(df_json), orient='split')
-            
-            # 2. 데이터 전처리 (ID 컬럼 제거 및 결측치 처리)
-            cols_to_drop = [c for c in df.columns if 'ID' in c or 'id' in c or 'nbr' in c]
-            df_clean = df.drop(columns=cols_to_drop, errors='ignore')
+            if is_incremental:
+                # 💡 워커에는 DataFrame 대신 데이터셋 파일 경로를 넘깁니다.
+                if get_dataset_store().locate(dataset_id) is None:
+                    return Response({"error": _DATASET_NOT_FOUND_MSG}, status=404)
+                load_dataframe = lambda: _locate_training_dataset(dataset_id)
+            elif dataset_id:
+                # 데이터셋은 워커가 학습을 시작할 때 불러옵니다. (요청 스레드에서는 존재 여부만 확인)
+                if get_dataset_store().locate(dataset_id) is None:
+                    return Response({"error": _DATASET_NOT_FOUND_MSG}, status=404)
+                load_dataframe = lambda: _load_training_dataframe(dataset_id)
+            else:
+                # 구버전 JSON 요청은 요청 본문이 사라지기 전에 DataFrame으로 복원해 둡니다.
+                df = _load_dataframe(request)
+                load_dataframe = lambda: df
+
+            # 💡 같은 데이터/같은 설정의 학습 작업이 있으면 새로 학습하지 않고 그 작업을 돌려줍니다. (core/result_cache.py)
+            cache_key = None
+            if dataset_id and result_cache.enabled():
+                data_key = result_cache.dataset_key(get_dataset_store(), dataset_id)
+                cache_key = result_cache.train_key(data_key, params)
+                if result_cache.enabled(request):
+                    job = result_cache.lookup(result_cache.TRAIN, cache_key, _reusable_training_job)
+                    if job is not None:
+                        status = 200 if job.status == TrainingJob.SUCCEEDED else 202
+                        return Response(dict(job.to_dict(), cached=True), status=status)
+
+            try:
+                job = jobs.submit(load_dataframe, params)
+            except jobs.QueueFull:
+                return Response({"error": "학습 대기 중인 작업이 너무 많습니다. 잠시 후 다시 시도해주세요."}, status=503)
+            if cache_key is not None:
+                result_cache.save(result_cache.TRAIN, cache_key, str(job.id))
+            return Response(job.to_dict(), status=202)
 
-            if target_col in df_clean.columns:
-                df_clean = df_clean.dropna(subset=[target_col])
-            
-            for col in df_clean.columns:
-                if df_clean[col].isnull().sum() > 0:
-                    # 수치형이면 평균, 아니면 최빈값 (간단한 처리)
-                    if pd.api.types.is_numeric_dtype(df_clean[col]):
-                        df_clean[col] = df_clean[col].fillna(df_clean[col].mean())
-                    else:
-                        df_clean[col] = df_clean[col].fillna(df_clean[col].mode()[0])
+        except Exception as e:
+            logger.exception("요청 처리 중 오류: %s", request.path)
+            return Response({"error": f"학습 요청 중 오류 발생: {str(e)}"}, status=500)
 
-            if target_col not in df_clean.columns:
-                 return Response({"error": f"목표 컬럼 '{target_col}'을 찾을 수 없습니다."}, status=400)
 
-            # 3. 목표 변수(y) 분리 및 타입 판단
-            y = df_clean[target_col]
-            X = df_clean.drop(columns=[target_col])
+def _reusable_training_job(job_id):
+    """캐시된 학습 작업 중 다시 돌려줄 수 있는 작업 (실행 중이거나, 완료되어 모델이 레지스트리에 남아 있는 작업). 없으면 None"""
+    try:
+        job = jobs.get(job_id)
+    except TrainingJob.DoesNotExist:
+        return None
+    if job.status in TrainingJob.ACTIVE_STATUSES and not job.cancel_requested:
+        return job
+    if job.status == TrainingJob.SUCCEEDED and job.models.exists():
+        return job
+    return None
 
-            is_regression = False
-            if pd.api.types.is_numeric_dtype(y):
-                if pd.api.types.is_float_dtype(y) or y.nunique() > 20:
-                    is_regression = True
 
-            # 4. 인코딩
-            for col in X.select_dtypes(include=['object']).columns:
-                le = LabelEncoder()
-                X[col] = le.fit_transform(X[col].astype(str))
+def _locate_training_dataset(dataset_id):
+    """(학습 워커) 조각 단위 학습에 쓸 데이터셋 파일 경로"""
+    path = get_dataset_store().locate(dataset_id)
+    if path is None:
+        raise training.TrainingError(_DATASET_NOT_FOUND_MSG)
+    return path
 
-            if not is_regression and y.dtype == 'object':
-                le_y = LabelEncoder()
-                y = le_y.fit_transform(y.astype(str))
 
-            # 5. 데이터 분리
-            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+def _load_training_dataframe(dataset_id):
+    """(학습 워커) 저장소에서 학습할 데이터셋을 불러옵니다."""
+    try:
+        return get_dataset_store().get(dataset_id)
+    except DatasetNotFound:
+        raise training.TrainingError(_DATASET_NOT_FOUND_MSG)
 
-            # 6. 💡 모델 선택 및 학습 (분기 처리)
-            model = None
-            
-            if is_regression:
-                # --- 회귀 (Regression) ---
-                if model_name == 'linear':
-                    model = LinearRegression()
-                elif model_name == 'gb':
-                    model = GradientBoostingRegressor(n_estimators=100, random_state=42)
-                elif model_name == 'svm':
-                    model = SVR()
-                else: # default 'rf'
-                    model = RandomForestRegressor(n_estimators=100, random_state=42)
-                
-                model.fit(X_train, y_train)
-                y_pred = model.predict(X_test)
-                
-                mse = mean_squared_error(y_test, y_pred)
-                r2 = r2_score(y_test, y_pred)
-                
-                result_data = {
-                    "type": "regression",
-                    "model": model_name,
-                    "metrics": {
-                        "R2 Score (설명력)": f"{r2:.4f}",
-                        "MSE (오차제곱평균)": f"{mse:.4f}"
-                    }
-                }
-            else:
-                # --- [CASE 2] 분류 (Classification) ---
-                # 💡 핵심: 프론트에서 'linear'라고 보내도, 분류 문제라면 -> LogisticRegression 실행
-                if model_name == 'linear' or model_name == 'logistic':
-                    model = LogisticRegression(max_iter=1000)
-                elif model_name == 'gb':
-                    model = GradientBoostingClassifier(n_estimators=100, random_state=42)
-                elif model_name == 'svm':
-                    model = SVC()
-                else: # default 'rf'
-                    model = RandomForestClassifier(n_estimators=100, random_state=42)
-
-                # 학습 및 평가
-                model.fit(X_train, y_train)
-                y_pred = model.predict(X_test)
-                accuracy = accuracy_score(y_test, y_pred)
-                
-                result_data = {
-                    "type": "classification",
-                    "model": model_name,
-                    "metrics": {
-                        "Accuracy (정확도)": f"{accuracy * 100:.2f}%"
-                    }
-                }
-
-            # 7. 💡 중요 변수 추출 (모델별 속성 차이 처리)
-            importances = {}
-            
-            # (1) 트리 기반 모델 (feature_importances_)
-            if hasattr(model, 'feature_importances_'):
-                importances = dict(zip(X.columns, model.feature_importances_))
-            
-            # (2) 선형 모델 (coef_) - 절대값 크기로 중요도 가늠
-            elif hasattr(model, 'coef_'):
-                # 다중 클래스일 경우 첫 번째 클래스 기준 혹은 평균 사용 등 복잡하지만, 여기선 단순화
-                coefs = model.coef_
-                if coefs.ndim > 1: 
-                    coefs = coefs[0] # 첫 번째 클래스 또는 차원
-                importances = dict(zip(X.columns, np.abs(coefs)))
-            
-            # (3) SVM 등 지원하지 않는 경우 -> 빈 딕셔너리
 
-            if importances:
-                sorted_importances = dict(sorted(importances.items(), key=lambda item: item[1], reverse=True))
-                result_data["feature_importances"] = sorted_importances
-            else:
-                result_data["feature_importances"] = {}
+class TrainJobView(APIView):
+    """학습 작업의 상태/진행률을 반환합니다. 완료되면 학습 결과(result)를 포함합니다."""
 
+    def get(self, request, job_id, *args, **kwargs):
+        try:
+            job = jobs.get(job_id)
+        except TrainingJob.DoesNotExist:
+            return Response({"error": "학습 작업을 찾을 수 없습니다."}, status=404)
+        return Response(job.to_dict())
 
-            # 💡 [신규 기능] 결과 해석 및 설명 생성 로직
-            explanation = []
-            
-            # 1. 성능 평가 해석
-            if is_regression:
-                r2_val = r2 
-                if r2_val >= 0.8:
-                    grade = "아주 훌륭해요! 🌟"
-                    desc = f"AI가 데이터의 패턴을 아주 잘 파악했습니다. (설명력: {r2_val*100:.1f}%)<br>이 모델은 실전에서 사용해도 좋을 만큼 믿음직스럽습니다."
-                elif r2_val >= 0.5:
-                    grade = "준수합니다. ✅"
-                    desc = f"데이터의 흐름을 절반 이상 파악했습니다. (설명력: {r2_val*100:.1f}%)<br>더 많은 데이터를 모으면 성능이 훨씬 좋아질 거예요."
-                else:
-                    grade = "노력이 필요해요. 😅"
-                    desc = f"아직 예측력이 다소 낮습니다. (설명력: {r2_val*100:.1f}%)<br>데이터 전처리를 다시 하거나, 이상치를 제거해 보세요."
-                
-                explanation.append(f"<strong>[{grade}]</strong> {desc}")
-            
-            else: # 분류 (Classification)
-                acc_val = accuracy * 100
-                if acc_val >= 90:
-                    grade = "천재적인 수준이에요! 🚀"
-                    desc = f"정답률이 {acc_val:.1f}%입니다.<br>거의 모든 케이스를 정확하게 맞추고 있네요!"
-                elif acc_val >= 70:
-                    grade = "쓸만하네요! 👍"
-                    desc = f"정답률이 {acc_val:.1f}%입니다.<br>기본적인 분류는 잘 해내고 있습니다."
-                else:
-                    grade = "조금 아쉬워요. 🤔"
-                    desc = f"정답률이 {acc_val:.1f}%입니다.<br>동전 던지기보다는 낫지만, 개선이 필요해 보입니다."
-                
-                explanation.append(f"<strong>[{grade}]</strong> {desc}")
-
-            # 2. 중요 변수 해석
-            if result_data.get("feature_importances"):
-                top_3 = list(result_data["feature_importances"].keys())[:3]
-                # 변수 이름들을 강조하기 위해 []로 감싸기
-                top_3_str = ", ".join([f"<b>[{f}]</b>" for f in top_3])
-                
-                insight = f"<br><br>💡 <b>분석 팁</b>: 결과('{target_col}')를 결정짓는 가장 핵심적인 요인은 {top_3_str} 순서입니다."
-                insight += f"<br>특히 <b>'{top_3[0]}'</b> 데이터가 변하면 결과도 크게 달라질 가능성이 높으니 주목하세요!"
-                explanation.append(insight)
-            else:
-                explanation.append("<br><br>⚠️ 이 모델은 변수 중요도를 제공하지 않아, 어떤 요인이 중요한지 파악하기 어렵습니다.")
 
-            # 결과 데이터에 설명 추가
-            result_data["explanation"] = "".join(explanation)
+class TrainJobCancelView(APIView):
+    """학습 작업을 취소합니다. (실행 중인 작업은 다음 진행률 보고 시점에 멈춤)"""
 
-            # 💡 [신규 기능] 실제값 vs 예측값 비교 샘플 데이터 생성 (최대 10개)
-            sample_size = 10
-            # 인덱스 리셋을 위해 DataFrame/Series로 변환 보장
-            y_test_reset = pd.Series(y_test).reset_index(drop=True)
-            y_pred_reset = pd.Series(y_pred).reset_index(drop=True)
-            
-            samples = []
-            
-            # (1) 분류 문제일 경우: 라벨 복원 (0, 1 -> 'Yes', 'No')
-            if not is_regression and 'le_y' in locals() and le_y is not None:
-                # LabelEncoder가 있다면 원래 문자열로 복구
-                actual_values = le_y.inverse_transform(y_test_reset[:sample_size].astype(int))
-                pred_values = le_y.inverse_transform(y_pred_reset[:sample_size].astype(int))
+    def post(self, request, job_id, *args, **kwargs):
+        try:
+            job = jobs.cancel(job_id)
+        except TrainingJob.DoesNotExist:
+            return Response({"error": "학습 작업을 찾을 수 없습니다."}, status=404)
+        return Response(job.to_dict())
+
+
+class PredictView(APIView):
+    """
+    모델 레지스트리에 저장된 모델로 데이터셋을 예측합니다. (다시 학습하지 않음)
+    요청: {"model_id": ..., "dataset_id": ...} 또는 multipart(model_id, file)
+    💡 자주 쓰는 모델은 메모리(LRU)에 올라가 있고, 행을 PREDICT_BATCH_ROWS개씩 나눠 한 번에 변환/예측합니다.
+    """
+    parser_classes = (JSONParser, MultiPartParser)
+
+    def post(self, request, *args, **kwargs):
+        model_id = request.data.get('model_id')
+        file_obj = request.FILES.get('file')
+        if not model_id:
+            return Response({"error": "모델이 지정되지 않았습니다."}, status=400)
+        if not request.data.get('dataset_id') and not file_obj:
+            return Response({"error": "예측할 데이터 또는 파일이 없습니다."}, status=400)
+
+        try:
+            try:
+                entry, fitted = get_model_registry().get(model_id)
+            except (ModelNotFound, DjangoValidationError):
+                return Response({"error": "모델을 찾을 수 없습니다. 다시 학습해주세요."}, status=404)
+
+            if file_obj:
+                if not file_obj.name.endswith(('.xls', '.xlsx', '.csv')):
+                    return Response({"error": "지원하지 않는 파일 형식입니다."}, status=400)
+                df = _parse_upload(file_obj)
             else:
-                # 회귀거나 인코딩 안 된 경우 그대로 사용
-                actual_values = y_test_reset[:sample_size].values
-                pred_values = y_pred_reset[:sample_size].values
-
-            # (2) 샘플 리스트 생성
-            for i in range(min(len(actual_values), sample_size)):
-                actual = actual_values[i]
-                pred = pred_values[i]
-                
-                # 회귀의 경우 소수점 정리
-                if is_regression:
-                    actual = round(float(actual), 2)
-                    pred = round(float(pred), 2)
-                    diff = round(abs(actual - pred), 2) # 오차
-                    is_correct = diff  # 회귀에서는 오차값 자체
-                else:
-                    # 분류는 맞음/틀림 여부 (True/False)
-                    is_correct = (str(actual) == str(pred))
-                
-                samples.append({
-                    "id": i + 1,
-                    "actual": actual,
-                    "predicted": pred,
-                    "is_correct": is_correct # 분류: bool, 회귀: 오차값(float)
-                })
-
-            result_data["samples"] = samples
-
-            return Response(result_data)
+                try:
+                    df = get_dataset_store().get(request.data.get('dataset_id'))
+                except DatasetNotFound:
+                    return Response({"error": _DATASET_NOT_FOUND_MSG}, status=404)
+
+            try:
+                predictions = fitted.predict(df, settings.MODEL_REGISTRY['PREDICT_BATCH_ROWS'])
+            except EncodingError as e:
+                return Response({"error": str(e)}, status=400)
+
+            response_data = entry.to_dict()
+            response_data.update(target=fitted.target, rows=len(predictions), predictions=predictions.tolist())
+            return Response(response_data)
 
         except Exception as e:
-            import traceback
-            traceback.print_exc()
-            return Response({"error": f"학습 중 오류 발생: {str(e)}"}, status=500)
\ No newline at end of file
+            logger.exception("요청 처리 중 오류: %s", request.path)
+            return Response({"error": f"예측 중 오류 발생: {str(e)}"}, status=500)
+
+
+class ModelListView(APIView):
+    """모델 레지스트리의 모델 목록 (최근 순). ?name=rf:label 처럼 이름으로 거를 수 있습니다."""
+
+    def get(self, request, *args, **kwargs):
+        entries = TrainedModel.objects.all()
+        if request.query_params.get('name'):
+            entries = entries.filter(name=request.query_params['name'])
+        return Response({"models": [entry.to_dict() for entry in entries[:100]]})
+
+
+class ModelDetailView(APIView):
+    """모델 하나의 메타데이터 조회(GET) / 삭제(DELETE)"""
+
+    def get(self, request, model_id, *args, **kwargs):
+        try:
+            entry = TrainedModel.objects.get(pk=model_id)
+        except TrainedModel.DoesNotExist:
+            return Response({"error": "모델을 찾을 수 없습니다."}, status=404)
+        return Response(entry.to_dict())
+
+    def delete(self, request, model_id, *args, **kwargs):
+        try:
+            get_model_registry().delete(model_id)
+        except ModelNotFound:
+            return Response({"error": "모델을 찾을 수 없습니다."}, status=404)
+        return Response(status=204)
+
+
+class MetricsView(APIView):
+    """
+    요청 단계별 소요 시간/바이트/최대 RSS 지표를 Prometheus 텍스트 형식으로 반환합니다. (core/metrics.py)
+    💡 지표는 워커(프로세스)별로 모으므로, 여러 워커로 실행할 때는 워커마다 수집합니다.
+    """
+
+    def get(self, request, *args, **kwargs):
+        if not settings.METRICS['ENABLED']:
+            return Response({"error": "요청 계측이 꺼져 있습니다. (settings.METRICS['ENABLED'])"}, status=404)
+        return HttpResponse(metrics.get_metrics().render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+# --- 진행 이벤트 스트림 (Server-Sent Events, core/events.py) ---
+# 💡 기존 뷰와 같은 요청 본문을 받아 기존 뷰를 실행 풀에서 실행하고, 진행 이벤트와 마지막 결과를 text/event-stream으로 보냅니다.
+#    (CSRF는 기존 뷰(DRF)처럼 처리하므로 여기서는 검사하지 않음)
+
+@csrf_exempt
+@require_POST
+async def upload_events(request):
+    """업로드(FileUploadView): 읽은 바이트/처리한 행/프로파일링한 컬럼 이벤트 -> 분석 결과"""
+    return events.event_stream_response(events.run_view(FileUploadView.as_view(), request))
+
+
+@csrf_exempt
+@require_POST
+async def process_events(request):
+    """전처리(ProcessDataView): 단계별 이벤트 -> 전처리 후 분석 결과"""
+    return events.event_stream_response(events.run_view(ProcessDataView.as_view(), request))
+
+
+@csrf_exempt
+@require_POST
+async def train_events(request):
+    """학습(TrainModelView): 작업을 큐에 넣고, 작업의 진행률(학습한 나무 수 등) 이벤트 -> 학습 결과"""
+    return events.event_stream_response(_train_events(request))
+
+
+async def _train_events(request):
+    async for item in events.run_view(TrainModelView.as_view(), request):
+        if item is not None and item[0] == 'result':
+            # 작업을 큐에 넣는 요청(202)은 금방 끝나므로, 그 뒤로는 작업 상태를 읽어 보냅니다.
+            # (작업이 없는 응답이면 결과를 그대로 보냄)
+            body = item[1]['body']
+            job_id = body.get('jobId') if isinstance(body, dict) else None
+            if job_id is None:
+                yield item
+                return
+            async for job_item in events.job_events(job_id):
+                yield job_item
+            return
+        yield item
+
+
+@require_GET
+async def train_job_events(request, job_id):
+    """학습 작업 하나의 진행률 이벤트 (연결이 끊긴 클라이언트가 다시 구독할 때)"""
+    return events.event_stream_response(events.job_events(job_id))